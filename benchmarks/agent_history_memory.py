@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark memory retained by an agent run's step history.
+
+Runs ``Agent.multi_step_generate`` for a fixed number of steps against a
+local model that returns a reply and a raw provider payload of a given size,
+then reports the memory the returned steps keep alive:
+
+- copy per step: every step holds its own copy of the conversation (the
+  previous behaviour, emulated by materializing each step's messages)
+- shared log: steps reference the shared message log (the default)
+- shared log, no payloads: as above with ``keep_provider_payloads=False``
+
+Usage:
+    python benchmarks/agent_history_memory.py --steps 50 --context-messages 200
+"""
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+
+from ai_sdk.agent import Agent
+from ai_sdk.agent.agent import step_count_is
+from ai_sdk.providers.base import LanguageModel
+from ai_sdk.providers.types import FinishReason, GenerateResult, Message, TextContent, Usage
+
+
+class LocalModel(LanguageModel):
+    """Replies immediately with fixed-size text and a raw response payload."""
+
+    def __init__(self, reply_chars, payload_chars):
+        super().__init__(provider="local", model_id="local-model")
+        self.reply_chars = reply_chars
+        self.payload_chars = payload_chars
+
+    async def generate(self, options):
+        return GenerateResult(
+            content=[TextContent(text="r" * self.reply_chars)],
+            finish_reason=FinishReason.STOP,
+            usage=Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+            response_metadata={"body": "p" * self.payload_chars},
+        )
+
+    async def stream(self, options):
+        raise NotImplementedError
+        yield
+
+
+def retained_bytes(args, copy_per_step, keep_provider_payloads):
+    context = [
+        Message(role="user" if i % 2 == 0 else "assistant", content="c" * args.message_chars)
+        for i in range(args.context_messages)
+    ]
+    agent = Agent(
+        model=LocalModel(args.reply_chars, args.payload_kb * 1024),
+        stop_when=step_count_is(args.steps),
+        max_steps=args.steps,
+        keep_provider_payloads=keep_provider_payloads,
+        on_step_finish=(
+            (lambda step: setattr(step, "messages", step.materialize_messages()))
+            if copy_per_step
+            else None
+        ),
+    )
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    output = asyncio.run(agent.multi_step_generate(messages=context))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(output["steps"]) == args.steps
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--context-messages", type=int, default=200)
+    parser.add_argument("--message-chars", type=int, default=200)
+    parser.add_argument("--reply-chars", type=int, default=500)
+    parser.add_argument("--payload-kb", type=int, default=16)
+    args = parser.parse_args()
+
+    cases = [
+        ("copy per step", True, True),
+        ("shared log", False, True),
+        ("shared log, no payloads", False, False),
+    ]
+    print(f"{args.steps} steps, {args.context_messages} context messages, "
+          f"{args.payload_kb} KiB provider payload per step")
+    print(f"{'history':<26}{'retained KiB':>14}")
+    for name, copy_per_step, keep_payloads in cases:
+        retained = retained_bytes(args, copy_per_step, keep_payloads)
+        print(f"{name:<26}{retained / 1024:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
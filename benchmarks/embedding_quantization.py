@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark memory savings and recall loss of compact embedding storage.
+
+Uses synthetic Matryoshka-like vectors (variance decays across dimensions,
+so leading dimensions carry most of the signal) and compares recall@k of
+each storage format against exact float32 search.
+
+Usage:
+    python benchmarks/embedding_quantization.py --vectors 2000 --dimensions 256
+"""
+
+import argparse
+import random
+import time
+
+from ai_sdk.core.embed_quantization import (
+    FLOAT32_BYTES,
+    normalize_embedding,
+    quantize_binary,
+    quantize_int8,
+    truncate_embeddings,
+)
+
+
+def make_vectors(count, dimensions, clusters, rng):
+    """Clustered vectors with decaying per-dimension variance."""
+    scales = [1.0 / (1 + i / 16) for i in range(dimensions)]
+    centers = [[rng.gauss(0, s) for s in scales] for _ in range(clusters)]
+    vectors = []
+    for _ in range(count):
+        center = rng.choice(centers)
+        vectors.append(
+            normalize_embedding([c + rng.gauss(0, 1.5 * s) for c, s in zip(center, scales)])
+        )
+    return vectors
+
+
+def exact_top_k(query, vectors, k):
+    scores = [sum(q * v for q, v in zip(query, vector)) for vector in vectors]
+    return sorted(range(len(vectors)), key=scores.__getitem__, reverse=True)[:k]
+
+
+def recall(expected, found):
+    return len(set(expected) & set(found)) / len(expected)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=2000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vectors = make_vectors(args.vectors + args.queries, args.dimensions, 50, rng)
+    corpus, queries = vectors[:args.vectors], vectors[args.vectors:]
+    truth = [exact_top_k(q, corpus, args.top_k) for q in queries]
+    float_bytes = args.vectors * args.dimensions * FLOAT32_BYTES
+    half = args.dimensions // 2
+
+    truncated = truncate_embeddings(corpus, half)
+    truncated_queries = truncate_embeddings(queries, half)
+    int8 = quantize_int8(corpus)
+    binary = quantize_binary(corpus)
+    truncated_int8 = quantize_int8(truncated)
+
+    formats = [
+        ("float32", float_bytes,
+         lambda q, tq: exact_top_k(q, corpus, args.top_k)),
+        (f"truncated {half}d", args.vectors * half * FLOAT32_BYTES,
+         lambda q, tq: exact_top_k(tq, truncated, args.top_k)),
+        ("int8", int8.nbytes,
+         lambda q, tq: [i for i, _ in int8.search(q, args.top_k)]),
+        (f"int8 {half}d", truncated_int8.nbytes,
+         lambda q, tq: [i for i, _ in truncated_int8.search(tq, args.top_k)]),
+        ("binary", binary.nbytes,
+         lambda q, tq: [i for i, _ in binary.search(q, args.top_k)]),
+        ("binary + rerank", binary.nbytes,
+         lambda q, tq: [i for i, _ in binary.search(q, args.top_k, rerank_embeddings=corpus)]),
+    ]
+
+    print(f"{args.vectors} vectors x {args.dimensions} dims, "
+          f"{args.queries} queries, recall@{args.top_k}")
+    print(f"{'format':<18}{'bytes/vector':>14}{'savings':>10}{'recall':>9}{'ms/query':>10}")
+    for name, nbytes, search in formats:
+        start = time.perf_counter()
+        recalls = [recall(t, search(q, tq)) for t, q, tq in zip(truth, queries, truncated_queries)]
+        elapsed_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        print(f"{name:<18}{nbytes / args.vectors:>14.1f}{float_bytes / nbytes:>9.1f}x"
+              f"{sum(recalls) / len(recalls):>9.3f}{elapsed_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
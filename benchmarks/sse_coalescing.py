@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark SSE output with and without delta coalescing.
+
+Simulates a fast provider emitting small text deltas at a fixed rate and
+encodes them with ``JsonToSseTransformStream``. Reports frames written,
+frames per second, process CPU time (including the simulated provider, but
+not socket writes, which coalescing also reduces) and time to the first
+frame for each coalescing window.
+
+Usage:
+    python benchmarks/sse_coalescing.py --tokens 5000 --rate 1000
+"""
+
+import argparse
+import asyncio
+import time
+
+from ai_sdk.ui import JsonToSseTransformStream
+
+
+class TextDeltaChunk:
+    """UI message stream text delta, as written to the client."""
+
+    def __init__(self, delta):
+        self.type = "text-delta"
+        self.id = "text-1"
+        self.delta = delta
+
+
+async def provider(tokens, rate):
+    """Yield ``tokens`` deltas at about ``rate`` deltas per second."""
+    interval = 1 / rate if rate else 0
+    start = time.perf_counter()
+    for i in range(tokens):
+        if interval:
+            # Sleep to the schedule rather than per token, to hold the rate
+            delay = start + i * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        yield TextDeltaChunk(f"tok{i % 97} ")
+
+
+async def run(tokens, rate, window_ms):
+    transformer = JsonToSseTransformStream(coalesce_window_ms=window_ms)
+    frames = 0
+    size = 0
+    first_frame = None
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    async for frame in transformer.transform(provider(tokens, rate)):
+        if first_frame is None:
+            first_frame = time.perf_counter() - start
+        frames += 1
+        size += len(frame)
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    return frames, size, wall, cpu, first_frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=5000)
+    parser.add_argument("--rate", type=float, default=1000, help="deltas per second (0: unthrottled)")
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 5, 20, 50])
+    args = parser.parse_args()
+
+    print(
+        f"{'window ms':>10}{'frames':>9}{'frames/s':>10}{'bytes':>10}"
+        f"{'cpu ms':>9}{'wall s':>9}{'first frame ms':>16}"
+    )
+    for window in args.windows:
+        frames, size, wall, cpu, first = asyncio.run(run(args.tokens, args.rate, window))
+        print(
+            f"{window:>10g}{frames:>9}{frames / wall:>10.0f}{size:>10}"
+            f"{cpu * 1000:>9.0f}{wall:>9.2f}{first * 1000:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
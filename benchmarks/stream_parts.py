@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark per-token overhead of Pydantic vs slotted stream parts.
+
+Measures creating one part per token and reading it back the way a
+consumer does (``part.type`` and the delta attribute), plus a pass through
+``smooth_stream`` without delays.
+
+Usage:
+    python benchmarks/stream_parts.py --tokens 200000
+"""
+
+import argparse
+import asyncio
+import time
+
+from ai_sdk.providers.stream_parts import FastReasoningDelta, FastTextDelta, FastToolCallDelta
+from ai_sdk.providers.types import ReasoningDelta, TextDelta, ToolCallDelta
+from ai_sdk.streaming.smooth_stream import smooth_stream
+
+CASES = [
+    ("text-delta", lambda t: TextDelta(text_delta=t), lambda t: FastTextDelta(t), "text_delta"),
+    (
+        "tool-call-delta",
+        lambda t: ToolCallDelta(tool_call_id="call_1", args_delta=t),
+        lambda t: FastToolCallDelta("call_1", args_delta=t),
+        "args_delta",
+    ),
+    (
+        "reasoning-delta",
+        lambda t: ReasoningDelta(id="r1", delta=t),
+        lambda t: FastReasoningDelta("r1", t),
+        "delta",
+    ),
+]
+
+
+def per_token_ns(factory, attribute, tokens):
+    start = time.perf_counter()
+    total = 0
+    for token in tokens:
+        part = factory(token)
+        if part.type:
+            total += len(getattr(part, attribute))
+    return (time.perf_counter() - start) / len(tokens) * 1e9
+
+
+async def smooth_stream_ns(factory, tokens):
+    async def source():
+        for token in tokens:
+            yield factory(token)
+
+    transform = smooth_stream(delay_ms=None)
+    start = time.perf_counter()
+    async for _ in transform(source()):
+        pass
+    return (time.perf_counter() - start) / len(tokens) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=200_000)
+    args = parser.parse_args()
+
+    tokens = [f"tok{i % 97} " for i in range(args.tokens)]
+
+    print(f"{'part':<18}{'pydantic ns/token':>20}{'slotted ns/token':>20}{'speedup':>10}")
+    for name, pydantic_factory, fast_factory, attribute in CASES:
+        slow = per_token_ns(pydantic_factory, attribute, tokens)
+        fast = per_token_ns(fast_factory, attribute, tokens)
+        print(f"{name:<18}{slow:>20.0f}{fast:>20.0f}{slow / fast:>9.1f}x")
+
+    slow = asyncio.run(smooth_stream_ns(CASES[0][1], tokens))
+    fast = asyncio.run(smooth_stream_ns(CASES[0][2], tokens))
+    print(f"{'smooth_stream':<18}{slow:>20.0f}{fast:>20.0f}{slow / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
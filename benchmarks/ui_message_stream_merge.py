@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark UIMessageStream with many merged streams.
+
+Merges ``--streams`` sub-streams of ``--chunks`` chunks each and compares the
+previous merge loop (a new ``queue.get()`` task and an ``asyncio.wait`` over
+all merge tasks per chunk, unbounded queue) with the current bounded
+channel. Reports throughput with a fast consumer and peak memory with a slow
+one.
+
+Usage:
+    python benchmarks/ui_message_stream_merge.py --streams 50 --chunks 1000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from ai_sdk.ui import create_ui_message_stream
+
+
+class Chunk:
+    __slots__ = ("type", "delta")
+
+    def __init__(self, delta):
+        self.type = "text-delta"
+        self.delta = delta
+
+
+async def sub_stream(index, chunks):
+    for i in range(chunks):
+        await asyncio.sleep(0)
+        yield Chunk(f"{index}:{i} " * 8)
+
+
+async def legacy_merge(execute):
+    """The previous UIMessageStream loop, reduced to its merge logic."""
+    ongoing = []
+    queue = asyncio.Queue()
+
+    class Writer:
+        def write(self, chunk):
+            queue.put_nowait(chunk)
+
+        def merge(self, stream):
+            async def merge_task():
+                async for chunk in stream:
+                    queue.put_nowait(chunk)
+
+            ongoing.append(asyncio.create_task(merge_task()))
+
+    execute(Writer())
+    queue.put_nowait(None)
+
+    completion_signaled = False
+    while not completion_signaled or ongoing:
+        if ongoing:
+            done, pending = await asyncio.wait(
+                ongoing + [asyncio.create_task(queue.get())],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                if task in ongoing:
+                    ongoing.remove(task)
+                else:
+                    chunk = await task
+                    if chunk is None:
+                        completion_signaled = True
+                    else:
+                        yield chunk
+            for task in pending:
+                if task not in ongoing:
+                    task.cancel()
+        else:
+            chunk = await queue.get()
+            if chunk is None:
+                completion_signaled = True
+            else:
+                yield chunk
+
+    # The original loop returned here, losing chunks still queued when the
+    # last merge task finished; drain them so throughput compares fairly
+    while not queue.empty():
+        chunk = queue.get_nowait()
+        if chunk is not None:
+            yield chunk
+
+
+def current_merge(execute):
+    return create_ui_message_stream(execute=execute).__aiter__()
+
+
+async def consume(factory, streams, chunks, slow):
+    def execute(writer):
+        for index in range(streams):
+            writer.merge(sub_stream(index, chunks))
+
+    received = 0
+    start = time.perf_counter()
+    async for _ in factory(execute):
+        received += 1
+        if slow and received % 64 == 0:
+            await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    return received, elapsed
+
+
+def run(factory, streams, chunks, slow):
+    tracemalloc.start()
+    received, elapsed = asyncio.run(consume(factory, streams, chunks, slow))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return received, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--streams", type=int, default=50)
+    parser.add_argument("--chunks", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'loop':<10}{'consumer':<10}{'received':>10}{'chunks/s':>12}{'peak MiB':>10}")
+    for slow in (False, True):
+        for name, factory in (("legacy", legacy_merge), ("bounded", current_merge)):
+            received, elapsed, peak = run(factory, args.streams, args.chunks, slow)
+            print(
+                f"{name:<10}{'slow' if slow else 'fast':<10}{received:>10}"
+                f"{received / elapsed:>12.0f}{peak / 2**20:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,24 @@ def __getattr__(name: str):
     elif name == 'stream_object':
         from .core.generate_object import stream_object
         return stream_object
+    elif name == 'embed':
+        from .core.embed import embed
+        return embed
+    elif name == 'embed_many':
+        from .core.embed import embed_many
+        return embed_many
+    elif name == 'embed_stream':
+        from .core.embed import embed_stream
+        return embed_stream
+    elif name == 'cosine_similarity':
+        from .core.embed import cosine_similarity
+        return cosine_similarity
+    elif name == 'rerank':
+        from .core.rerank import rerank
+        return rerank
+    elif name == 'HybridRetriever':
+        from .core.retrieval import HybridRetriever
+        return HybridRetriever
     
     # Provider base classes
     elif name == 'Provider':
@@ -47,6 +65,9 @@ def __getattr__(name: str):
     elif name == 'ImageModel':
         from .providers.base import ImageModel
         return ImageModel
+    elif name == 'RerankingModel':
+        from .providers.base import RerankingModel
+        return RerankingModel
     
     # Provider types
     elif name == 'Usage':
@@ -220,12 +241,19 @@ __all__ = [
     'stream_text',
     'generate_object', 
     'stream_object',
+    'embed',
+    'embed_many',
+    'embed_stream',
+    'cosine_similarity',
+    'rerank',
+    'HybridRetriever',
     
     # Provider base classes
     'Provider',
     'LanguageModel',
     'EmbeddingModel',
     'ImageModel',
+    'RerankingModel',
     
     # Core types
     'Usage',
@@ -33,5 +33,39 @@ Example Usage:
 """
 
 from .agent import Agent, AgentSettings
+from .batch import (
+    BatchCheckpoint,
+    BatchProgress,
+    BatchSession,
+    BatchSessionResult,
+    FileBatchCheckpoint,
+    run_agent_batch,
+)
+from .context import (
+    ContextManager,
+    ContextStrategy,
+    DropOldToolResults,
+    SummarizeHistory,
+    TruncateToolResults,
+    estimate_tokens,
+)
+from .history import MessageLog, MessageView
 
-__all__ = ["Agent", "AgentSettings"]
\ No newline at end of file
+__all__ = [
+    "Agent",
+    "AgentSettings",
+    "BatchCheckpoint",
+    "BatchProgress",
+    "BatchSession",
+    "BatchSessionResult",
+    "FileBatchCheckpoint",
+    "run_agent_batch",
+    "ContextManager",
+    "ContextStrategy",
+    "DropOldToolResults",
+    "SummarizeHistory",
+    "TruncateToolResults",
+    "estimate_tokens",
+    "MessageLog",
+    "MessageView",
+]
\ No newline at end of file
@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union, TypeVar, Generic, Callable, Awaitable
-from pydantic import BaseModel, Field
+from typing import Any, AsyncGenerator, Dict, List, MutableSequence, Optional, Sequence, Union, TypeVar, Generic, Callable, Awaitable
+from pydantic import BaseModel, Field, field_serializer
 from abc import ABC, abstractmethod
 import asyncio
+import json
 import logging
+import time
 
 from ..providers.base import LanguageModel
-from ..providers.types import Message, ToolDefinition, ProviderMetadata
-from ..core.generate_text import generate_text, stream_text, GenerateTextResult, StreamTextResult
+from ..providers.stream_parts import to_stream_part_model
+from ..providers.types import (
+    FinishPart,
+    FinishReason,
+    Message,
+    ProviderMetadata,
+    StepFinishPart,
+    StepStartPart,
+    StreamPart,
+    TextContent,
+    ToolCallContent,
+    ToolDefinition,
+    ToolResultStreamPart,
+    Usage,
+)
+from ..core.generate_text import generate_text, stream_text, GenerateTextResult
 from ..tools import Tool, ToolRegistry
-from ..errors.base import AISDKError
+from ..tools.cache import run_tool_cached
+from ..tools.definitions import ToolDefinitionSet
+from ..tools.executors import run_tool_function
+from ..tools.limits import run_tool_with_limits
+from ..tools.speculative import SpeculativeToolExecution
+from ..errors.base import AISDKError, ToolTimeoutError
+from ..utils.abort import AbortSignal
+from .context import ContextManager
+from .history import MessageLog, MessageView
 
 # Type variable for tools
 TOOLS = TypeVar('TOOLS')
@@ -22,14 +46,41 @@ class StepResult(BaseModel):
     """Result of a single agent step."""
 
     step_number: int = Field(description="The step number")
-    messages: List[Message] = Field(description="Messages generated in this step")
+    messages: Union[MessageView, List[Message]] = Field(
+        description=(
+            "Conversation up to and including this step's reply; a view of "
+            "the run's shared history (materialize() returns a list)"
+        )
+    )
     result: Optional[GenerateTextResult] = Field(None, description="Generation result")
     tool_calls: List[Any] = Field(default_factory=list, description="Tool calls made in this step")
     tool_results: List[Any] = Field(default_factory=list, description="Tool results from this step")
+    timing: Dict[str, float] = Field(
+        default_factory=dict,
+        description=(
+            "Step timings in ms: generation_ms, and after tool execution "
+            "tool_wall_ms and tool_total_ms (sum of the individual tool call times)"
+        ),
+    )
+    context: Dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Context compaction before the step, in tokens: tokens_before, "
+            "tokens_after and tokens_saved (empty without a context manager)"
+        ),
+    )
 
     class Config:
         arbitrary_types_allowed = True
 
+    @field_serializer("messages")
+    def _serialize_messages(self, messages: Union[MessageView, List[Message]]) -> List[Dict[str, Any]]:
+        return [message.model_dump() for message in messages]
+
+    def materialize_messages(self) -> List[Message]:
+        """Return this step's conversation as a new list."""
+        return list(self.messages)
+
 
 class PrepareStepResult(BaseModel):
     """Result from a prepare step function."""
@@ -126,6 +177,29 @@ class AgentSettings(BaseModel):
     )
     max_steps: int = Field(10, description="Maximum number of steps the agent can take")
     context: Any = Field(None, description="Shared context for tool executions")
+    max_tool_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum tool calls of a step executed concurrently (None: no limit)"
+    )
+    context_manager: Optional[ContextManager] = Field(
+        None,
+        description="Keeps the conversation within a token budget before each step"
+    )
+    speculative_tools: bool = Field(
+        False,
+        description=(
+            "In stream(), start idempotent tools as soon as the model has streamed "
+            "their complete arguments, before the step ends"
+        )
+    )
+    keep_provider_payloads: bool = Field(
+        True,
+        description=(
+            "Keep provider, request and response metadata on step results; "
+            "disable to save memory on long runs (on_step_finish still sees them)"
+        )
+    )
 
     # Advanced agent settings
     active_tools: Optional[List[str]] = Field(
@@ -197,11 +271,12 @@ class Agent:
         self.settings = AgentSettings(**settings)
         self._tool_registry = ToolRegistry()
         self._logger = logging.getLogger("ai_sdk.agent")
+        self._tool_definition_set: Optional[ToolDefinitionSet] = None
 
         # Register tools if provided
         if self.settings.tools:
-            for name, tool in self.settings.tools.items():
-                self._tool_registry.register(name, tool)
+            for tool in self.settings.tools.values():
+                self._tool_registry.register(tool)
 
     async def multi_step_generate(
         self,
@@ -228,11 +303,11 @@ class Agent:
         Returns:
             Dict containing final result, steps, and metadata
         """
-        # Initialize conversation
+        # Initialize conversation; steps reference it instead of copying it
         if messages:
-            conversation = list(messages)
+            conversation = MessageLog(messages)
         elif prompt:
-            conversation = [Message(role="user", content=prompt)]
+            conversation = MessageLog([Message(role="user", content=prompt)])
         else:
             raise ValueError("Either 'prompt' or 'messages' must be provided")
 
@@ -255,7 +330,9 @@ class Agent:
             )
 
             # Execute generation step
+            compaction = step_settings.pop("context_compaction", None)
             try:
+                started = time.perf_counter()
                 result = await self._execute_step(
                     messages=conversation,
                     step_settings=step_settings,
@@ -264,33 +341,34 @@ class Agent:
                     **kwargs
                 )
 
+                # Add the model's reply, so the next step continues from it
+                reply = _assistant_message(result)
+                if reply is not None:
+                    conversation.append(reply)
+
                 # Create step result
+                tool_calls = _result_tool_calls(result)
                 step_result = StepResult(
                     step_number=step_number,
-                    messages=conversation.copy(),
+                    messages=conversation.view(),
                     result=result,
-                    tool_calls=getattr(result, 'tool_calls', []),
-                    tool_results=getattr(result, 'tool_results', [])
+                    tool_calls=tool_calls,
+                    tool_results=getattr(result, 'tool_results', []),
+                    timing={"generation_ms": _ms_since(started)},
+                    context=compaction or {},
                 )
 
                 steps.append(step_result)
+                await self._step_finished(step_result)
 
-                # Call step finish callback
-                if self.settings.on_step_finish:
-                    try:
-                        callback_result = self.settings.on_step_finish(step_result)
-                        if asyncio.iscoroutine(callback_result):
-                            await callback_result
-                    except Exception as e:
-                        self._logger.warning(f"Step finish callback failed: {e}")
-
-                # Check stop conditions
-                if self._should_stop(step_number, conversation):
+                # Check stop conditions; without tool calls there is nothing to continue from
+                if self._should_stop(step_number, conversation) or not tool_calls:
                     break
 
-                # Execute tools if present
-                if hasattr(result, 'tool_calls') and result.tool_calls:
-                    await self._execute_tools(result.tool_calls, conversation)
+                # Execute tools
+                step_result.timing.update(
+                    await self._execute_tools(tool_calls, conversation)
+                )
 
                 step_number += 1
 
@@ -301,15 +379,28 @@ class Agent:
         return {
             "final_result": steps[-1].result if steps else None,
             "steps": steps,
-            "conversation": conversation,
+            "conversation": conversation.materialize(),
             "total_steps": len(steps)
         }
 
+    async def _step_finished(self, step_result: StepResult) -> None:
+        """Call the step finish callback, then release provider payloads if configured."""
+        if self.settings.on_step_finish:
+            try:
+                callback_result = self.settings.on_step_finish(step_result)
+                if asyncio.iscoroutine(callback_result):
+                    await callback_result
+            except Exception as e:
+                self._logger.warning(f"Step finish callback failed: {e}")
+
+        if not self.settings.keep_provider_payloads:
+            _drop_provider_payloads(step_result.result)
+
     async def _prepare_step(
         self,
         steps: List[StepResult],
         step_number: int,
-        messages: List[Message],
+        messages: MutableSequence[Message],
         **kwargs: Any
     ) -> Dict[str, Any]:
         """Prepare settings for a specific step."""
@@ -336,7 +427,8 @@ class Agent:
                     "steps": steps,
                     "step_number": step_number,
                     "model": self.settings.model,
-                    "messages": messages
+                    # A copy; overrides are returned as PrepareStepResult.messages
+                    "messages": list(messages)
                 }
 
                 step_override = self.settings.prepare_step(context)
@@ -364,11 +456,23 @@ class Agent:
             except Exception as e:
                 self._logger.warning(f"Prepare step function failed: {e}")
 
+        # Keep the conversation within the token budget
+        if self.settings.context_manager:
+            compacted, compaction = await self.settings.context_manager.compact(messages)
+            if compacted is not messages:
+                messages[:] = compacted
+            base_settings["context_compaction"] = compaction
+            if compaction["tokens_saved"]:
+                self._logger.debug(
+                    f"Step {step_number}: compacted context from "
+                    f"{compaction['tokens_before']} to {compaction['tokens_after']} tokens"
+                )
+
         return base_settings
 
     async def _execute_step(
         self,
-        messages: List[Message],
+        messages: Sequence[Message],
         step_settings: Dict[str, Any],
         provider_metadata: Optional[ProviderMetadata] = None,
         provider_options: Optional[Dict[str, Any]] = None,
@@ -377,20 +481,13 @@ class Agent:
         """Execute a single generation step."""
         generation_options = {
             **step_settings,
-            "messages": messages
+            "messages": list(messages)
         }
 
         # Add tools if available
         tools_to_use = step_settings.get("active_tools", self.settings.tools)
         if tools_to_use:
-            tool_definitions = []
-            for name, tool in tools_to_use.items():
-                tool_definitions.append(ToolDefinition(
-                    name=name,
-                    description=tool.description,
-                    parameters=tool.parameters
-                ))
-            generation_options["tools"] = tool_definitions
+            generation_options["tools"] = self._tool_definitions(tools_to_use)
             generation_options["tool_choice"] = step_settings.get("tool_choice", self.settings.tool_choice)
 
         # Add provider options
@@ -401,66 +498,206 @@ class Agent:
 
         return await generate_text(**generation_options)
 
-    async def _execute_tools(self, tool_calls: List[Any], conversation: List[Message]) -> None:
-        """Execute tool calls and add results to conversation."""
-        for tool_call in tool_calls:
+    async def _execute_tools(
+        self,
+        tool_calls: List[Any],
+        conversation: MutableSequence[Message],
+        speculation: Optional[SpeculativeToolExecution] = None,
+        on_result: Optional[Callable[[Any, Any, bool], None]] = None,
+    ) -> Dict[str, float]:
+        """Execute tool calls and add results to conversation.
+
+        Independent calls run concurrently, up to ``max_tool_concurrency`` at
+        a time. Calls of a ``sequential`` tool run one at a time in call
+        order, and an ``exclusive`` tool's call runs alone. Tool messages are
+        appended in call order regardless of completion order.
+
+        Args:
+            tool_calls: Tool calls of the step
+            conversation: Conversation to add the tool messages to
+            speculation: Calls started while the step was streaming, reused
+                when a final call matches
+            on_result: Called with ``(tool_call, result, is_error)`` as each
+                call completes
+
+        Returns:
+            Timings in ms: ``tool_wall_ms`` for the whole execution and
+            ``tool_total_ms`` summed over the individual calls
+        """
+        semaphore = (
+            asyncio.Semaphore(self.settings.max_tool_concurrency)
+            if self.settings.max_tool_concurrency
+            else None
+        )
+        tool_locks: Dict[str, asyncio.Lock] = {}
+        durations: List[float] = []
+
+        async def run(tool_call: Any) -> List[Message]:
+            tool = self._tool_for(tool_call)
+            lock = None
+            if tool is not None and getattr(tool, "sequential", False):
+                lock = tool_locks.setdefault(_tool_call_name(tool_call), asyncio.Lock())
+            # Take the tool's lock before a concurrency slot, so queued
+            # sequential calls do not hold slots
+            if lock is not None:
+                await lock.acquire()
             try:
-                # Get the tool
-                tool_name = tool_call.get("name") or tool_call.get("function", {}).get("name")
-                if not tool_name or not self.settings.tools or tool_name not in self.settings.tools:
-                    continue
-
-                tool = self.settings.tools[tool_name]
-                args = tool_call.get("arguments") or tool_call.get("function", {}).get("arguments", {})
-
-                # Execute tool with context
-                if self.settings.experimental_context:
-                    result = await tool.execute(args, context=self.settings.experimental_context)
-                else:
-                    result = await tool.execute(args)
-
-                # Add tool result to conversation
-                conversation.append(Message(
-                    role="tool",
-                    content=str(result),
-                    tool_call_id=tool_call.get("id")
-                ))
+                if semaphore is not None:
+                    async with semaphore:
+                        return await self._run_tool_call(
+                            tool_call, conversation, durations, speculation, on_result
+                        )
+                return await self._run_tool_call(
+                    tool_call, conversation, durations, speculation, on_result
+                )
+            finally:
+                if lock is not None:
+                    lock.release()
+
+        started = time.perf_counter()
+        for batch in self._tool_batches(tool_calls):
+            if len(batch) == 1:
+                batch_messages = [await run(batch[0])]
+            else:
+                batch_messages = await asyncio.gather(*(run(call) for call in batch))
+            for messages in batch_messages:
+                conversation.extend(messages)
 
-            except Exception as e:
-                self._logger.error(f"Tool execution failed for {tool_name}: {e}")
-
-                # Try tool repair if configured
-                if self.settings.tool_call_repair:
-                    try:
-                        repair_context = {
-                            "toolCall": tool_call,
-                            "tools": self.settings.tools,
-                            "error": e,
-                            "system": self.settings.system,
-                            "messages": conversation
-                        }
+        return {
+            "tool_wall_ms": _ms_since(started),
+            "tool_total_ms": round(sum(durations) * 1000, 3),
+        }
 
-                        repaired_call = await self.settings.tool_call_repair(repair_context)
-                        if repaired_call:
-                            # Retry with repaired call
-                            await self._execute_tools([repaired_call], conversation)
-                            continue
-                    except Exception as repair_error:
-                        self._logger.error(f"Tool repair failed: {repair_error}")
-
-                # Add error result to conversation
-                conversation.append(Message(
-                    role="tool",
-                    content=f"Error: {str(e)}",
-                    tool_call_id=tool_call.get("id")
-                ))
+    def _tool_batches(self, tool_calls: List[Any]) -> List[List[Any]]:
+        """Split tool calls into batches that may run concurrently.
 
-    def _should_stop(self, step_number: int, messages: List[Message]) -> bool:
+        An exclusive tool's call forms a batch of its own; batches run in order.
+        """
+        batches: List[List[Any]] = []
+        current: List[Any] = []
+        for tool_call in tool_calls:
+            tool = self._tool_for(tool_call)
+            if tool is not None and getattr(tool, "exclusive", False):
+                if current:
+                    batches.append(current)
+                    current = []
+                batches.append([tool_call])
+            else:
+                current.append(tool_call)
+        if current:
+            batches.append(current)
+        return batches
+
+    def _tool_for(self, tool_call: Any) -> Optional[Tool]:
+        tool_name = _tool_call_name(tool_call)
+        if not tool_name or not self.settings.tools:
+            return None
+        return self.settings.tools.get(tool_name)
+
+    async def _run_tool_call(
+        self,
+        tool_call: Any,
+        conversation: Sequence[Message],
+        durations: List[float],
+        speculation: Optional[SpeculativeToolExecution] = None,
+        on_result: Optional[Callable[[Any, Any, bool], None]] = None,
+    ) -> List[Message]:
+        """Execute one tool call and return the messages to add for it."""
+        tool_name = _tool_call_name(tool_call)
+        tool = self._tool_for(tool_call)
+        if tool is None:
+            return []
+
+        started = time.perf_counter()
+        try:
+            args = tool_call.get("arguments") or tool_call.get("function", {}).get("arguments", {})
+
+            found = False
+            if speculation is not None:
+                found, result = await speculation.take(tool_call.get("id"), tool_name, args)
+            if not found:
+                result = await self._call_tool(tool, tool_name, args)
+
+            durations.append(time.perf_counter() - started)
+            if on_result is not None:
+                on_result(tool_call, result, False)
+            return [Message(
+                role="tool",
+                content=str(result),
+                tool_call_id=tool_call.get("id")
+            )]
+
+        except Exception as e:
+            durations.append(time.perf_counter() - started)
+            self._logger.error(f"Tool execution failed for {tool_name}: {e}")
+
+            # Try tool repair if configured; a timed out call is not malformed
+            if self.settings.tool_call_repair and not isinstance(e, ToolTimeoutError):
+                try:
+                    repair_context = {
+                        "toolCall": tool_call,
+                        "tools": self.settings.tools,
+                        "error": e,
+                        "system": self.settings.system,
+                        "messages": list(conversation)
+                    }
+
+                    repaired_call = await self.settings.tool_call_repair(repair_context)
+                    if repaired_call:
+                        # Retry with repaired call
+                        return await self._run_tool_call(
+                            repaired_call, conversation, durations, on_result=on_result
+                        )
+                except Exception as repair_error:
+                    self._logger.error(f"Tool repair failed: {repair_error}")
+
+            # Add error result to conversation
+            if on_result is not None:
+                on_result(tool_call, str(e), True)
+            return [Message(
+                role="tool",
+                content=f"Error: {str(e)}",
+                tool_call_id=tool_call.get("id")
+            )]
+
+    def _tool_definitions(self, tools: Dict[str, Tool]) -> List[ToolDefinition]:
+        """Definitions of tools for the model, named by their keys.
+
+        Definitions of the agent's tools are built once and reused by every
+        step and call until the tools change.
+        """
+        if not self.settings.tools:
+            return ToolDefinitionSet(tools).definitions
+        definition_set = self._tool_definition_set
+        if definition_set is None or not definition_set.matches(self.settings.tools):
+            definition_set = self._tool_definition_set = ToolDefinitionSet(self.settings.tools)
+        if tools is self.settings.tools:
+            return definition_set.definitions
+        return definition_set.select(tools)
+
+    async def _call_tool(self, tool: Tool, tool_name: str, args: Any) -> Any:
+        """Run a tool with the agent's context, within the tool's limits and
+        in its execution mode, reusing cached outputs."""
+        if self.settings.experimental_context:
+            call = lambda: run_tool_function(
+                tool, tool.execute, args, context=self.settings.experimental_context
+            )
+        else:
+            call = lambda: run_tool_function(tool, tool.execute, args)
+        result, _ = await run_tool_cached(
+            tool, args, lambda: run_tool_with_limits(tool, call, tool_name), tool_name
+        )
+        return result
+
+    def _should_stop(self, step_number: int, messages: Sequence[Message]) -> bool:
         """Check if any stop condition is met."""
         stop_conditions = self.settings.stop_when
         if not isinstance(stop_conditions, list):
             stop_conditions = [stop_conditions]
 
+        # Conditions get a list of their own, as before the shared history
+        messages = list(messages)
+
         for condition in stop_conditions:
             if condition(step_number + 1, messages):
                 return True
@@ -562,14 +799,7 @@ class Agent:
 
         # Add tools if available
         if tools_to_use:
-            tool_definitions = []
-            for name, tool in tools_to_use.items():
-                tool_definitions.append(ToolDefinition(
-                    name=name,
-                    description=tool.description,
-                    parameters=tool.parameters
-                ))
-            generation_options["tools"] = tool_definitions
+            generation_options["tools"] = self._tool_definitions(tools_to_use)
             generation_options["tool_choice"] = self.settings.tool_choice
 
         # Set prompt or messages
@@ -595,74 +825,164 @@ class Agent:
         messages: Optional[List[Message]] = None,
         provider_metadata: Optional[ProviderMetadata] = None,
         provider_options: Optional[Dict[str, Any]] = None,
+        abort_signal: Optional[AbortSignal] = None,
         **kwargs: Any
-    ) -> StreamTextResult:
-        """Stream a response from the agent.
+    ) -> AsyncGenerator[StreamPart, None]:
+        """Stream a multi-step response from the agent.
 
-        Similar to generate() but returns a streaming result for real-time
-        response processing.
+        Runs the same loop as multi_step_generate() on a single stream. Each
+        step starts with a ``step-start`` part, followed by the model's parts
+        and a ``step-finish`` part. The step's tool calls are then executed,
+        yielding a ``tool-result`` part as each call completes, and the next
+        step continues from the results. Idempotent tools start as soon as
+        their streamed arguments are complete. A final ``finish`` part
+        carries the usage of all steps.
 
         Args:
             prompt: Text prompt (alternative to messages)
             messages: List of messages for conversation
             provider_metadata: Provider-specific metadata
             provider_options: Provider-specific options
+            abort_signal: Signal that stops the stream and closes the
+                provider's HTTP response
             **kwargs: Additional generation parameters
 
         Returns:
-            Streaming result for real-time processing
+            Async generator of stream parts
         """
-        # Build the full options (same logic as generate)
-        generation_options = {
-            "model": self.settings.model,
-            "max_output_tokens": self.settings.resolved_max_tokens,
-            "temperature": self.settings.temperature,
-            "top_p": self.settings.top_p,
-            "top_k": self.settings.top_k,
-            "frequency_penalty": self.settings.frequency_penalty,
-            "presence_penalty": self.settings.presence_penalty,
-            "stop": self.settings.stop,
-            "seed": self.settings.seed,
-            "max_retries": self.settings.max_retries,
-            "headers": self.settings.headers,
-            "extra_body": self.settings.extra_body,
-            **kwargs
-        }
-
-        # Add system message if configured
-        if self.settings.system:
-            if messages:
-                messages = [Message(role="system", content=self.settings.system)] + messages
-            elif prompt:
-                generation_options["system"] = self.settings.system
-
-        # Add tools if available
-        if self.settings.tools:
-            tool_definitions = []
-            for name, tool in self.settings.tools.items():
-                tool_definitions.append(ToolDefinition(
-                    name=name,
-                    description=tool.description,
-                    parameters=tool.parameters
-                ))
-            generation_options["tools"] = tool_definitions
-            generation_options["tool_choice"] = self.settings.tool_choice
-
-        # Set prompt or messages
         if messages:
-            generation_options["messages"] = messages
+            conversation = MessageLog(messages)
         elif prompt:
-            generation_options["prompt"] = prompt
+            conversation = MessageLog([Message(role="user", content=prompt)])
         else:
             raise ValueError("Either 'prompt' or 'messages' must be provided")
 
-        # Add provider options
-        if provider_metadata:
-            generation_options["provider_metadata"] = provider_metadata
-        if provider_options:
-            generation_options["provider_options"] = provider_options
+        if self.settings.system:
+            conversation.insert(0, Message(role="system", content=self.settings.system))
+
+        return self._stream_steps(
+            conversation, provider_metadata, provider_options, abort_signal, kwargs
+        )
+
+    async def _stream_steps(
+        self,
+        conversation: MessageLog,
+        provider_metadata: Optional[ProviderMetadata],
+        provider_options: Optional[Dict[str, Any]],
+        abort_signal: Optional[AbortSignal],
+        kwargs: Dict[str, Any],
+    ) -> AsyncGenerator[StreamPart, None]:
+        """Run the agent loop, yielding the parts of every step."""
+        steps: List[StepResult] = []
+        usage = Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+        finish_reason = FinishReason.UNKNOWN
+        step_number = 0
+
+        while step_number < self.settings.max_steps:
+            step_settings = await self._prepare_step(
+                steps=steps,
+                step_number=step_number,
+                messages=conversation,
+                **kwargs
+            )
+            compaction = step_settings.pop("context_compaction", None)
+            tools = step_settings.pop("active_tools", self.settings.tools) or {}
+
+            generation_options = {**step_settings, "messages": list(conversation)}
+            if tools:
+                generation_options["tools"] = self._tool_definitions(tools)
+                generation_options["tool_choice"] = step_settings.get(
+                    "tool_choice", self.settings.tool_choice
+                )
+            if provider_metadata:
+                generation_options["provider_metadata"] = provider_metadata
+            if provider_options:
+                generation_options["provider_options"] = provider_options
+            if abort_signal is not None:
+                generation_options["abort_signal"] = abort_signal
+
+            speculation = self._speculation(tools) if self.settings.speculative_tools else None
+            step = _StreamedStep()
+            try:
+                yield StepStartPart(step_number=step_number)
+
+                started = time.perf_counter()
+                async for part in stream_text(**generation_options, fast_parts=True):
+                    if _part_field(part, "type") == "finish":
+                        step.finish(part)
+                        continue
+                    step.observe(part)
+                    if speculation is not None:
+                        speculation.observe(part)
+                    yield to_stream_part_model(part)
+
+                result = step.result()
+                reply = _assistant_message(result)
+                if reply is not None:
+                    conversation.append(reply)
 
-        return stream_text(**generation_options)
+                step_result = StepResult(
+                    step_number=step_number,
+                    messages=conversation.view(),
+                    result=result,
+                    tool_calls=step.tool_calls(),
+                    timing={"generation_ms": _ms_since(started)},
+                    context=compaction or {},
+                )
+                steps.append(step_result)
+                await self._step_finished(step_result)
+
+                finish_reason = result.finish_reason
+                usage = _add_usage(usage, result.usage)
+                yield StepFinishPart(
+                    step_number=step_number,
+                    finish_reason=result.finish_reason,
+                    usage=result.usage,
+                )
+
+                # The model answered without tools: nothing to continue from
+                if self._should_stop(step_number, conversation) or not step_result.tool_calls:
+                    break
+
+                # Stream tool results as the calls complete
+                results: asyncio.Queue = asyncio.Queue()
+                execution = asyncio.ensure_future(self._execute_tools(
+                    step_result.tool_calls,
+                    conversation,
+                    speculation,
+                    lambda call, output, is_error, results=results: results.put_nowait(
+                        ToolResultStreamPart(
+                            tool_call_id=call.get("id"),
+                            tool_name=_tool_call_name(call),
+                            result=output,
+                            is_error=is_error,
+                        )
+                    ),
+                ))
+                execution.add_done_callback(lambda _, results=results: results.put_nowait(None))
+                try:
+                    while True:
+                        tool_result = await results.get()
+                        if tool_result is None:
+                            break
+                        step_result.tool_results.append(tool_result)
+                        yield tool_result
+                    step_result.timing.update(execution.result())
+                finally:
+                    execution.cancel()
+            finally:
+                if speculation is not None:
+                    speculation.cancel()
+
+            step_number += 1
+
+        yield FinishPart(finish_reason=finish_reason, usage=usage)
+
+    def _speculation(self, tools: Dict[str, Tool]) -> SpeculativeToolExecution:
+        """Speculative execution of a streaming step's tools."""
+        return SpeculativeToolExecution(
+            tools, lambda call_id, name, args: self._call_tool(tools[name], name, args)
+        )
 
     def add_tool(self, name: str, tool: Tool) -> None:
         """Add a tool to the agent.
@@ -674,7 +994,8 @@ class Agent:
         if self.settings.tools is None:
             self.settings.tools = {}
         self.settings.tools[name] = tool
-        self._tool_registry.register(name, tool)
+        self._tool_registry.register(tool)
+        self._tool_definition_set = None
 
     def remove_tool(self, name: str) -> None:
         """Remove a tool from the agent.
@@ -685,6 +1006,7 @@ class Agent:
         if self.settings.tools and name in self.settings.tools:
             del self.settings.tools[name]
             self._tool_registry.unregister(name)
+            self._tool_definition_set = None
 
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get a tool by name.
@@ -720,3 +1042,129 @@ class Agent:
                 setattr(self.settings, key, value)
             else:
                 raise ValueError(f"Unknown setting: {key}")
+        self._tool_definition_set = None
+
+
+def _tool_call_name(tool_call: Any) -> Optional[str]:
+    return tool_call.get("name") or tool_call.get("function", {}).get("name")
+
+
+def _ms_since(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _assistant_message(result: Any) -> Optional[Message]:
+    """The assistant message for a step's result, or None if it is empty."""
+    content = list(getattr(result, "content", None) or [])
+    if any(getattr(part, "type", "text") != "text" for part in content):
+        return Message(role="assistant", content=content)
+    text = getattr(result, "text", "")
+    return Message(role="assistant", content=text) if text else None
+
+
+def _result_tool_calls(result: Any) -> List[Dict[str, Any]]:
+    """Tool calls in a step result's content, in the agent's ``id``/``name``/``arguments`` form."""
+    return [
+        {"id": part.tool_call_id, "name": part.tool_name, "arguments": part.args}
+        for part in getattr(result, "content", None) or []
+        if isinstance(part, ToolCallContent)
+    ]
+
+
+def _drop_provider_payloads(result: Any) -> None:
+    """Release the raw provider data a step result holds."""
+    for name in ("provider_metadata", "request_metadata", "response_metadata"):
+        if hasattr(result, name):
+            setattr(result, name, None)
+
+
+def _part_field(part: Any, name: str) -> Any:
+    if isinstance(part, dict):
+        return part.get(name)
+    return getattr(part, name, None)
+
+
+def _finish_reason(value: Any) -> FinishReason:
+    if value is None:
+        return FinishReason.UNKNOWN
+    try:
+        # OpenAI-style reasons use underscores ("tool_calls")
+        return FinishReason(str(getattr(value, "value", value)).replace("_", "-"))
+    except ValueError:
+        return FinishReason.OTHER
+
+
+def _add_usage(total: Usage, usage: Usage) -> Usage:
+    return Usage(
+        prompt_tokens=total.prompt_tokens + usage.prompt_tokens,
+        completion_tokens=total.completion_tokens + usage.completion_tokens,
+        total_tokens=total.total_tokens + usage.total_tokens,
+    )
+
+
+class _StreamedStep:
+    """Text, tool calls and finish information of a streaming step."""
+
+    def __init__(self) -> None:
+        self.text: List[str] = []
+        self.calls: Dict[str, Dict[str, Any]] = {}
+        self.last_call_id: Optional[str] = None
+        self.finish_reason = FinishReason.UNKNOWN
+        self.usage = Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+
+    def observe(self, part: Any) -> None:
+        part_type = _part_field(part, "type")
+        if part_type == "text-delta":
+            self.text.append(_part_field(part, "text_delta") or "")
+        elif part_type in ("tool-call-start", "tool-call-delta", "tool-call"):
+            # Providers send the ID (and name) with the first part of a call only
+            call_id = _part_field(part, "tool_call_id") or self.last_call_id
+            if call_id is None:
+                return
+            call = self.calls.setdefault(call_id, {"name": None, "chunks": [], "args": None})
+            call["name"] = call["name"] or _part_field(part, "tool_name")
+            self.last_call_id = call_id
+            if part_type == "tool-call-delta":
+                call["chunks"].append(_part_field(part, "args_delta") or "")
+            elif part_type == "tool-call":
+                args = _part_field(part, "args")
+                call["args"] = args if args is not None else _part_field(part, "input")
+
+    def finish(self, part: Any) -> None:
+        self.finish_reason = _finish_reason(_part_field(part, "finish_reason"))
+        usage = _part_field(part, "usage")
+        if isinstance(usage, dict):
+            usage = Usage(**usage)
+        if isinstance(usage, Usage):
+            self.usage = usage
+
+    def tool_calls(self) -> List[Dict[str, Any]]:
+        """Completed tool calls, in the agent's ``id``/``name``/``arguments`` form."""
+        tool_calls = []
+        for call_id, call in self.calls.items():
+            args = call["args"]
+            if args is None:
+                raw = "".join(call["chunks"])
+                try:
+                    args = json.loads(raw) if raw.strip() else {}
+                except ValueError:
+                    # Left for the tool (and tool_call_repair) to reject
+                    args = raw
+            tool_calls.append({"id": call_id, "name": call["name"], "arguments": args})
+        return tool_calls
+
+    def result(self) -> GenerateTextResult:
+        text = "".join(self.text)
+        content: List[Any] = [TextContent(text=text)] if text else []
+        for call in self.tool_calls():
+            content.append(ToolCallContent(
+                tool_call_id=call["id"],
+                tool_name=call["name"] or "",
+                args=call["arguments"] if isinstance(call["arguments"], dict) else {},
+            ))
+        finish_reason = self.finish_reason
+        if finish_reason == FinishReason.UNKNOWN and self.calls:
+            finish_reason = FinishReason.TOOL_CALLS
+        return GenerateTextResult(
+            text=text, content=content, finish_reason=finish_reason, usage=self.usage
+        )
@@ -0,0 +1,434 @@
+"""Running many agent sessions concurrently under global limits.
+
+:func:`run_agent_batch` runs a list of sessions (prompts or conversations)
+through an agent, e.g. for offline evaluation:
+
+- at most ``max_concurrency`` sessions run at a time
+- model calls to each provider go through that provider's
+  :class:`~ai_sdk.utils.concurrency.RateLimiter`
+- once ``max_total_tokens`` or ``max_cost`` is spent, no further sessions
+  start; the remaining ones are reported as skipped
+- ``on_progress`` is called as sessions finish
+- results are returned in session order
+- completed sessions are saved to a checkpoint as they finish, and a rerun
+  with the same checkpoint only runs the sessions still missing
+
+Example:
+    ```python
+    results = await run_agent_batch(
+        agent,
+        [BatchSession(id=case["id"], prompt=case["question"]) for case in cases],
+        max_concurrency=64,
+        rate_limits={"openai": RateLimiter(requests_per_minute=3_000)},
+        max_cost=50.0,
+        cost_function=lambda model, usage: usage.total_tokens * 2e-6,
+        checkpoint=FileBatchCheckpoint("eval-run.jsonl"),
+    )
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+
+from ..core.generate_text import GenerateTextResult
+from ..errors import InvalidArgumentError
+from ..providers.base import LanguageModel
+from ..providers.types import (
+    FinishReason,
+    GenerateOptions,
+    GenerateResult,
+    Message,
+    StreamOptions,
+    StreamPart,
+    Usage,
+)
+from ..utils.concurrency import RateLimiter, _provider_key
+from .agent import Agent
+
+# Cost of one model call: (model, usage) -> cost in any currency unit
+CostFunction = Callable[[LanguageModel, Usage], float]
+
+logger = logging.getLogger("ai_sdk.agent")
+
+
+class BatchSession(BaseModel):
+    """One agent session of a batch."""
+
+    id: Optional[str] = Field(
+        None,
+        description="Stable ID used to resume from a checkpoint (default: the session's index)"
+    )
+    prompt: Optional[str] = Field(None, description="Text prompt (alternative to messages)")
+    messages: Optional[List[Message]] = Field(None, description="Conversation to continue")
+    options: Dict[str, Any] = Field(
+        default_factory=dict, description="Additional Agent.generate() arguments"
+    )
+
+
+class BatchSessionResult(BaseModel):
+    """Outcome of one session of a batch."""
+
+    index: int = Field(description="Position of the session in the batch")
+    id: str = Field(description="Session ID")
+    status: Literal["completed", "failed", "skipped"] = Field(
+        description="completed, failed, or skipped because the budget was spent"
+    )
+    text: Optional[str] = Field(None, description="Final text of the agent")
+    finish_reason: Optional[FinishReason] = Field(None, description="Finish reason of the last step")
+    usage: Usage = Field(
+        default_factory=lambda: Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+        description="Token usage summed over the session's model calls"
+    )
+    cost: float = Field(0.0, description="Cost of the session's model calls")
+    error: Optional[str] = Field(None, description="Error message of a failed session")
+    duration_ms: float = Field(0.0, description="Wall time of the session in ms")
+    resumed: bool = Field(False, description="Loaded from the checkpoint instead of run")
+    result: Optional[GenerateTextResult] = Field(
+        None, exclude=True, description="Final generation result (not checkpointed)"
+    )
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class BatchProgress(BaseModel):
+    """Progress of a batch, passed to ``on_progress``."""
+
+    total: int = Field(description="Number of sessions")
+    completed: int = Field(0, description="Completed sessions, including resumed ones")
+    failed: int = Field(0, description="Failed sessions")
+    skipped: int = Field(0, description="Sessions not started because the budget was spent")
+    resumed: int = Field(0, description="Completed sessions loaded from the checkpoint")
+    in_flight: int = Field(0, description="Sessions running")
+    total_tokens: int = Field(0, description="Tokens spent, including resumed sessions")
+    cost: float = Field(0.0, description="Cost spent, including resumed sessions")
+    elapsed_s: float = Field(0.0, description="Seconds since the batch started")
+
+    @property
+    def finished(self) -> int:
+        """Sessions that will not run anymore."""
+        return self.completed + self.failed + self.skipped
+
+
+# Called with the batch progress as sessions finish
+ProgressCallback = Callable[[BatchProgress], Union[None, Awaitable[None]]]
+
+
+class BatchCheckpoint(ABC):
+    """Storage for the completed sessions of a batch.
+
+    Implement this to persist results in a database or object store.
+    """
+
+    @abstractmethod
+    async def load(self) -> Dict[str, BatchSessionResult]:
+        """Load the completed sessions saved so far, by session ID."""
+        pass
+
+    @abstractmethod
+    async def save(self, result: BatchSessionResult) -> None:
+        """Persist a completed session."""
+        pass
+
+
+class FileBatchCheckpoint(BatchCheckpoint):
+    """Checkpoint stored as a JSON Lines file, one completed session per line.
+
+    Every line is flushed to disk before the next session is reported, and
+    a line cut off by a crash is ignored when loading. File access runs in a
+    worker thread, off the event loop.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+
+    async def load(self) -> Dict[str, BatchSessionResult]:
+        return await asyncio.to_thread(self._read)
+
+    async def save(self, result: BatchSessionResult) -> None:
+        line = json.dumps(result.model_dump(mode="json", exclude={"resumed"}))
+        await asyncio.to_thread(self._append, line)
+
+    def _read(self) -> Dict[str, BatchSessionResult]:
+        results: Dict[str, BatchSessionResult] = {}
+        if not os.path.exists(self.path):
+            return results
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    result = BatchSessionResult.model_validate(json.loads(line))
+                except ValueError:
+                    continue
+                results[result.id] = result
+        return results
+
+    def _append(self, line: str) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class _BatchMeter:
+    """Tokens and cost spent by a batch."""
+
+    def __init__(self, cost_function: Optional[CostFunction]) -> None:
+        self.cost_function = cost_function
+        self.total_tokens = 0
+        self.cost = 0.0
+
+    def exhausted(self, max_total_tokens: Optional[int], max_cost: Optional[float]) -> bool:
+        return (max_total_tokens is not None and self.total_tokens >= max_total_tokens) or (
+            max_cost is not None and self.cost >= max_cost
+        )
+
+
+class _MeteredModel(LanguageModel):
+    """Language model wrapper applying a rate limit and recording usage and cost."""
+
+    def __init__(
+        self, model: LanguageModel, limiter: Optional[RateLimiter], meter: _BatchMeter
+    ) -> None:
+        super().__init__(provider=model.provider, model_id=model.model_id)
+        self.model = model
+        self.limiter = limiter
+        self.meter = meter
+        self.usage = Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+        self.cost = 0.0
+        self.error: Optional[BaseException] = None
+
+    async def generate(self, options: GenerateOptions) -> GenerateResult:
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        try:
+            result = await self.model.generate(options)
+        except Exception as e:
+            self.error = e
+            raise
+        # A retried call that succeeds is not an error
+        self.error = None
+        self._record(result.usage)
+        return result
+
+    async def stream(self, options: StreamOptions) -> AsyncGenerator[StreamPart, None]:
+        if self.limiter is not None:
+            await self.limiter.acquire()
+        try:
+            async for part in self.model.stream(options):
+                usage = getattr(part, "usage", None)
+                if getattr(part, "type", None) == "finish" and isinstance(usage, Usage):
+                    self._record(usage)
+                yield part
+        except Exception as e:
+            self.error = e
+            raise
+        self.error = None
+
+    def _record(self, usage: Optional[Usage]) -> None:
+        if usage is None:
+            return
+        self.usage = Usage(
+            prompt_tokens=self.usage.prompt_tokens + usage.prompt_tokens,
+            completion_tokens=self.usage.completion_tokens + usage.completion_tokens,
+            total_tokens=self.usage.total_tokens + usage.total_tokens,
+        )
+        self.meter.total_tokens += usage.total_tokens
+        if self.meter.cost_function is not None:
+            cost = self.meter.cost_function(self.model, usage)
+            self.cost += cost
+            self.meter.cost += cost
+        if self.limiter is not None:
+            self.limiter.record_tokens(usage.total_tokens)
+
+
+async def run_agent_batch(
+    agent: Union[Agent, Callable[[BatchSession], Agent]],
+    sessions: Sequence[Union[str, BatchSession]],
+    *,
+    max_concurrency: int = 16,
+    rate_limits: Optional[Dict[str, RateLimiter]] = None,
+    max_total_tokens: Optional[int] = None,
+    max_cost: Optional[float] = None,
+    cost_function: Optional[CostFunction] = None,
+    checkpoint: Optional[BatchCheckpoint] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> List[BatchSessionResult]:
+    """Run many agent sessions concurrently.
+
+    Sessions start in order as slots free up. Usage is metered per model
+    call, across all steps of a session, through the agent's model; models
+    swapped in by ``prepare_step`` are not metered or rate limited.
+
+    Args:
+        agent: Agent running every session, or a function creating the
+            agent for a session
+        sessions: Prompts or sessions to run
+        max_concurrency: Maximum number of sessions running at once
+        rate_limits: Rate limiters by provider name, applied to every model
+            call of that provider
+        max_total_tokens: Stop starting sessions once this many tokens are
+            spent (resumed sessions count)
+        max_cost: Stop starting sessions once this cost is spent (resumed
+            sessions count); requires ``cost_function``
+        cost_function: Cost of a model call from its usage
+        checkpoint: Store of completed sessions; sessions found in it are
+            not run again
+        on_progress: Called with a :class:`BatchProgress` whenever a session
+            finishes
+
+    Returns:
+        One result per session, in session order; sessions that ran out of
+        budget have status ``skipped``
+
+    Raises:
+        InvalidArgumentError: If arguments are invalid or session IDs repeat
+    """
+    if max_concurrency < 1:
+        raise InvalidArgumentError(
+            "max_concurrency must be at least 1",
+            argument="max_concurrency",
+            value=max_concurrency,
+        )
+    if max_cost is not None and cost_function is None:
+        raise InvalidArgumentError(
+            "max_cost requires a cost_function", argument="cost_function", value=None
+        )
+
+    batch = [_batch_session(session, index) for index, session in enumerate(sessions)]
+    ids = [session.id for session in batch]
+    if len(set(ids)) != len(ids):
+        raise InvalidArgumentError("Session IDs must be unique", argument="sessions", value=None)
+
+    started = time.perf_counter()
+    meter = _BatchMeter(cost_function)
+    progress = BatchProgress(total=len(batch))
+    results: List[Optional[BatchSessionResult]] = [None] * len(batch)
+
+    saved = await checkpoint.load() if checkpoint is not None else {}
+    pending: List[int] = []
+    for index, session in enumerate(batch):
+        result = saved.get(session.id)
+        if result is None or result.status != "completed":
+            pending.append(index)
+            continue
+        results[index] = result.model_copy(update={"index": index, "resumed": True})
+        progress.completed += 1
+        progress.resumed += 1
+        meter.total_tokens += result.usage.total_tokens
+        meter.cost += result.cost
+
+    async def report() -> None:
+        progress.total_tokens = meter.total_tokens
+        progress.cost = meter.cost
+        progress.elapsed_s = round(time.perf_counter() - started, 3)
+        if on_progress is None:
+            return
+        try:
+            callback_result = on_progress(progress)
+            if asyncio.iscoroutine(callback_result):
+                await callback_result
+        except Exception as e:
+            logger.warning(f"Batch progress callback failed: {e}")
+
+    queue = iter(pending)
+
+    async def worker() -> None:
+        # The iterator is shared: each session is taken by exactly one worker
+        for index in queue:
+            session = batch[index]
+            if meter.exhausted(max_total_tokens, max_cost):
+                results[index] = BatchSessionResult(index=index, id=session.id, status="skipped")
+                progress.skipped += 1
+                await report()
+                continue
+
+            progress.in_flight += 1
+            try:
+                result = await _run_session(agent, session, index, rate_limits, meter)
+            finally:
+                progress.in_flight -= 1
+            results[index] = result
+            if result.status == "completed":
+                progress.completed += 1
+                if checkpoint is not None:
+                    await checkpoint.save(result)
+            else:
+                progress.failed += 1
+            await report()
+
+    await report()
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(pending)))))
+    return results  # type: ignore[return-value]
+
+
+async def _run_session(
+    agent: Union[Agent, Callable[[BatchSession], Agent]],
+    session: BatchSession,
+    index: int,
+    rate_limits: Optional[Dict[str, RateLimiter]],
+    meter: _BatchMeter,
+) -> BatchSessionResult:
+    """Run one session and describe its outcome."""
+    started = time.perf_counter()
+    result: Optional[GenerateTextResult] = None
+    error: Optional[BaseException] = None
+    model: Optional[_MeteredModel] = None
+    try:
+        session_agent = agent if isinstance(agent, Agent) else agent(session)
+        base_model = session_agent.settings.model
+        limiter = (rate_limits or {}).get(_provider_key(base_model))
+        model = _MeteredModel(base_model, limiter, meter)
+        result = await session_agent.generate(
+            session.prompt, messages=session.messages, model=model, **session.options
+        )
+    except Exception as e:
+        error = e
+
+    # The agent logs failed steps instead of raising and returns the steps
+    # before the failure; the model saw the error
+    if error is None and model is not None and model.error is not None:
+        error = model.error
+    return BatchSessionResult(
+        index=index,
+        id=session.id,
+        status="completed" if result is not None and error is None else "failed",
+        text=result.text if result is not None else None,
+        finish_reason=result.finish_reason if result is not None else None,
+        usage=model.usage if model is not None else Usage(
+            prompt_tokens=0, completion_tokens=0, total_tokens=0
+        ),
+        cost=model.cost if model is not None else 0.0,
+        error=(str(error) or type(error).__name__) if error is not None else (
+            None if result is not None else "The agent produced no result"
+        ),
+        duration_ms=round((time.perf_counter() - started) * 1000, 3),
+        result=result,
+    )
+
+
+def _batch_session(session: Union[str, BatchSession], index: int) -> BatchSession:
+    if isinstance(session, str):
+        return BatchSession(id=str(index), prompt=session)
+    if session.id is None:
+        return session.model_copy(update={"id": str(index)})
+    return session
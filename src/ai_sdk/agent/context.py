@@ -0,0 +1,275 @@
+"""Token-budgeted context management for agents.
+
+An agent appends every tool result to its conversation and resends the whole
+history on each step, so prompt size and latency grow with every step. A
+:class:`ContextManager` keeps the conversation within a token budget: before
+each step, while the conversation is over budget, it applies its strategies
+in order:
+
+- :class:`TruncateToolResults`: shorten large tool outputs
+- :class:`DropOldToolResults`: replace old tool outputs with a placeholder
+- :class:`SummarizeHistory`: replace earlier turns with a summary written by
+  a (cheaper) model
+
+Token counts are estimated from the text length unless a ``count_tokens``
+function is given.
+
+Example:
+    ```python
+    agent = Agent(
+        model=model,
+        tools=tools,
+        context_manager=ContextManager(
+            max_tokens=16_000,
+            strategies=[
+                TruncateToolResults(max_tokens_per_result=2_000),
+                DropOldToolResults(keep_last=4),
+                SummarizeHistory(cheap_model),
+            ],
+        ),
+    )
+    ```
+"""
+
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..core.generate_text import generate_text
+from ..errors import InvalidArgumentError
+from ..providers.base import LanguageModel
+from ..providers.types import Message
+
+# Counts the tokens of a list of messages
+TokenCounter = Callable[[Sequence[Message]], int]
+
+# Rough average for English text and JSON with common tokenizers
+CHARS_PER_TOKEN = 4
+
+# Role, separators and other per-message framing
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def message_text(message: Message) -> str:
+    """Return the text of a message; non-text parts are rendered as JSON."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    texts = []
+    for part in content:
+        text = getattr(part, "text", None)
+        if isinstance(text, str):
+            texts.append(text)
+        else:
+            texts.append(json.dumps(part.model_dump(mode="json"), default=str))
+    return "\n".join(texts)
+
+
+def estimate_tokens(messages: Sequence[Message]) -> int:
+    """Estimate the prompt tokens of messages from their text length."""
+    return sum(
+        MESSAGE_OVERHEAD_TOKENS + -(-len(message_text(message)) // CHARS_PER_TOKEN)
+        for message in messages
+    )
+
+
+class ContextStrategy(ABC):
+    """A way of shrinking a conversation."""
+
+    @abstractmethod
+    async def compact(
+        self, messages: Sequence[Message], max_tokens: int, count_tokens: TokenCounter
+    ) -> List[Message]:
+        """Return a smaller version of ``messages``.
+
+        Args:
+            messages: The conversation, which is over budget
+            max_tokens: Token budget of the conversation
+            count_tokens: Function counting the tokens of messages
+
+        Returns:
+            The compacted conversation (``messages`` itself is not modified)
+        """
+
+
+class TruncateToolResults(ContextStrategy):
+    """Shortens tool outputs longer than a limit, keeping their beginning."""
+
+    def __init__(self, max_tokens_per_result: int = 1000, keep_last: int = 0) -> None:
+        """Initialize the strategy.
+
+        Args:
+            max_tokens_per_result: Tokens kept of each tool output
+            keep_last: Number of most recent tool outputs left intact
+        """
+        self.max_tokens_per_result = max_tokens_per_result
+        self.keep_last = keep_last
+
+    async def compact(
+        self, messages: Sequence[Message], max_tokens: int, count_tokens: TokenCounter
+    ) -> List[Message]:
+        max_chars = self.max_tokens_per_result * CHARS_PER_TOKEN
+        compacted = list(messages)
+        for index in _tool_result_indexes(messages, self.keep_last):
+            content = messages[index].content
+            if isinstance(content, str) and len(content) > max_chars:
+                removed = len(content) - max_chars
+                compacted[index] = messages[index].model_copy(
+                    update={"content": f"{content[:max_chars]}\n[... {removed} characters truncated]"}
+                )
+        return compacted
+
+
+class DropOldToolResults(ContextStrategy):
+    """Replaces the oldest tool outputs with a placeholder until the conversation fits.
+
+    The tool messages themselves stay, so every tool call keeps its result.
+    """
+
+    def __init__(
+        self,
+        keep_last: int = 3,
+        placeholder: str = "[Tool output removed to save context]",
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            keep_last: Number of most recent tool outputs never removed
+            placeholder: Text replacing a removed output
+        """
+        self.keep_last = keep_last
+        self.placeholder = placeholder
+
+    async def compact(
+        self, messages: Sequence[Message], max_tokens: int, count_tokens: TokenCounter
+    ) -> List[Message]:
+        compacted = list(messages)
+        tokens = count_tokens(compacted)
+        for index in _tool_result_indexes(messages, self.keep_last):
+            if tokens <= max_tokens:
+                break
+            if messages[index].content == self.placeholder:
+                continue
+            before = count_tokens([compacted[index]])
+            compacted[index] = messages[index].model_copy(update={"content": self.placeholder})
+            tokens -= before - count_tokens([compacted[index]])
+        return compacted
+
+
+class SummarizeHistory(ContextStrategy):
+    """Replaces earlier turns with a summary written by a language model."""
+
+    DEFAULT_INSTRUCTIONS = (
+        "Summarize the following conversation between a user, an assistant and "
+        "its tools. Keep every fact, decision, open question and tool result the "
+        "assistant may still need; leave out pleasantries and repetition."
+    )
+
+    def __init__(
+        self,
+        model: LanguageModel,
+        keep_last: int = 6,
+        max_summary_tokens: int = 500,
+        instructions: Optional[str] = None,
+    ) -> None:
+        """Initialize the strategy.
+
+        Args:
+            model: Model writing the summary; usually a cheaper one than the
+                agent's
+            keep_last: Number of most recent messages kept verbatim
+            max_summary_tokens: Maximum tokens of the summary
+            instructions: System prompt for the summary
+        """
+        self.model = model
+        self.keep_last = keep_last
+        self.max_summary_tokens = max_summary_tokens
+        self.instructions = instructions or self.DEFAULT_INSTRUCTIONS
+
+    async def compact(
+        self, messages: Sequence[Message], max_tokens: int, count_tokens: TokenCounter
+    ) -> List[Message]:
+        start = 0
+        while start < len(messages) and messages[start].role == "system":
+            start += 1
+        end = max(start, len(messages) - self.keep_last)
+        # Keep tool results together with the assistant message calling them
+        while start < end < len(messages) and messages[end].role == "tool":
+            end -= 1
+        if end - start < 2:
+            return list(messages)
+
+        transcript = "\n\n".join(
+            f"{message.role}: {message_text(message)}" for message in messages[start:end]
+        )
+        result = await generate_text(
+            self.model,
+            system=self.instructions,
+            prompt=transcript,
+            max_output_tokens=self.max_summary_tokens,
+        )
+        summary = Message(
+            role="system", content=f"Summary of the earlier conversation:\n{result.text}"
+        )
+        return [*messages[:start], summary, *messages[end:]]
+
+
+class ContextManager:
+    """Keeps a conversation within a token budget."""
+
+    def __init__(
+        self,
+        max_tokens: int,
+        strategies: Optional[List[ContextStrategy]] = None,
+        count_tokens: Optional[TokenCounter] = None,
+    ) -> None:
+        """Initialize the context manager.
+
+        Args:
+            max_tokens: Token budget of the conversation sent to the model
+            strategies: Strategies applied in order while the conversation is
+                over budget (default: truncate large tool outputs, then drop
+                old ones)
+            count_tokens: Function counting the tokens of messages (default:
+                :func:`estimate_tokens`)
+        """
+        if max_tokens < 1:
+            raise InvalidArgumentError(
+                "max_tokens must be at least 1", argument="max_tokens", value=max_tokens
+            )
+        self.max_tokens = max_tokens
+        self.strategies = (
+            strategies
+            if strategies is not None
+            else [TruncateToolResults(), DropOldToolResults()]
+        )
+        self.count_tokens = count_tokens or estimate_tokens
+
+    async def compact(
+        self, messages: Sequence[Message]
+    ) -> Tuple[Sequence[Message], Dict[str, int]]:
+        """Shrink a conversation to the budget, as far as the strategies can.
+
+        Returns:
+            The compacted conversation (``messages`` itself if it fits), and
+            ``tokens_before``, ``tokens_after`` and ``tokens_saved``
+        """
+        tokens_before = tokens = self.count_tokens(messages)
+        for strategy in self.strategies:
+            if tokens <= self.max_tokens:
+                break
+            messages = await strategy.compact(messages, self.max_tokens, self.count_tokens)
+            tokens = self.count_tokens(messages)
+        return messages, {
+            "tokens_before": tokens_before,
+            "tokens_after": tokens,
+            "tokens_saved": tokens_before - tokens,
+        }
+
+
+def _tool_result_indexes(messages: Sequence[Message], keep_last: int) -> List[int]:
+    """Indexes of tool messages, oldest first, without the last ``keep_last``."""
+    indexes = [index for index, message in enumerate(messages) if message.role == "tool"]
+    return indexes[: max(0, len(indexes) - keep_last)]
@@ -0,0 +1,147 @@
+"""Shared message history of an agent run.
+
+Each step of an agent run records the messages it was generated from. Copying
+the conversation for every step keeps one list per step alive, so memory
+grows quadratically with the number of steps. Instead, the agent keeps its
+conversation in a :class:`MessageLog` and steps hold a :class:`MessageView`:
+the log's list and an end offset.
+
+Appending to the log is in place, which views never see past their offset.
+Any other change (inserting, replacing or removing messages, e.g. by context
+compaction or a ``prepare_step`` override) moves the log to a new list, so
+existing views keep the messages they were taken from.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, MutableSequence, Sequence, Union, overload
+
+from ..providers.types import Message
+
+
+class MessageView(Sequence[Message]):
+    """Read-only prefix of a message log, as seen by one step."""
+
+    __slots__ = ("_messages", "_end")
+
+    def __init__(self, messages: List[Message], end: int) -> None:
+        self._messages = messages
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._end
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Message]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Message, List[Message]]:
+        if isinstance(index, slice):
+            return self._messages[: self._end][index]
+        if index < 0:
+            index += self._end
+        if not 0 <= index < self._end:
+            raise IndexError("message index out of range")
+        return self._messages[index]
+
+    def __iter__(self) -> Iterator[Message]:
+        messages = self._messages
+        for index in range(self._end):
+            yield messages[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (MessageView, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessageView({self.materialize()!r})"
+
+    def materialize(self) -> List[Message]:
+        """Return the messages as a new list."""
+        return self._messages[: self._end]
+
+
+class MessageLog(MutableSequence[Message]):
+    """Conversation that steps reference by offset instead of copying."""
+
+    __slots__ = ("_messages",)
+
+    def __init__(self, messages: Iterable[Message] = ()) -> None:
+        self._messages: List[Message] = list(messages)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Message]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Message, List[Message]]:
+        return self._messages[index]
+
+    @overload
+    def __setitem__(self, index: int, value: Message) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Message]) -> None: ...
+
+    def __setitem__(
+        self, index: Union[int, slice], value: Union[Message, Iterable[Message]]
+    ) -> None:
+        messages = list(self._messages)
+        if isinstance(index, slice) and not isinstance(value, Message):
+            messages[index] = value
+        elif isinstance(index, int) and isinstance(value, Message):
+            messages[index] = value
+        else:
+            raise TypeError("a message log holds messages")
+        self._messages = messages
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        messages = list(self._messages)
+        del messages[index]
+        self._messages = messages
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MessageLog):
+            return self._messages == other._messages
+        if isinstance(other, list):
+            return self._messages == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessageLog({self._messages!r})"
+
+    def append(self, message: Message) -> None:
+        """Add a message at the end."""
+        self._messages.append(message)
+
+    def extend(self, messages: Iterable[Message]) -> None:
+        """Add messages at the end."""
+        self._messages.extend(messages)
+
+    def clear(self) -> None:
+        """Remove all messages."""
+        self._messages = []
+
+    def insert(self, index: int, message: Message) -> None:
+        """Insert a message before ``index``."""
+        messages = list(self._messages)
+        messages.insert(index, message)
+        self._messages = messages
+
+    def view(self) -> MessageView:
+        """Return a view of the current messages that later changes do not affect."""
+        return MessageView(self._messages, len(self._messages))
+
+    def materialize(self) -> List[Message]:
+        """Return the messages as a new list."""
+        return list(self._messages)
@@ -1,5 +1,8 @@
 """Core functionality for AI SDK Python."""
 
+# Provider modules import from ``core``; load them first so importing a core
+# submodule directly does not hit a partially initialized module.
+from .. import providers as _providers  # noqa: F401
 from .generate_text import generate_text, stream_text
 from .generate_object import (
     generate_object,
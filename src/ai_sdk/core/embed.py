@@ -3,13 +3,35 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional, TypeVar, Union, Generic
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from ..errors import InvalidArgumentError, APIError
 from ..providers.base import EmbeddingModel
 from ..providers.types import ProviderMetadata
+from ..utils.concurrency import AdaptiveConcurrencyLimiter, get_concurrency_limiter
 from ..utils.json import ensure_json_parsable
 
+if TYPE_CHECKING:
+    from .embed_quantization import QuantizationMethod, QuantizedEmbeddings
+
 # Type variable for embedding values (usually string, but could be other types)
 VALUE = TypeVar('VALUE', bound=Any)
 
@@ -29,13 +51,29 @@ class EmbedOptions:
 class EmbeddingUsage:
     """Token usage information for embeddings."""
     
-    def __init__(self, tokens: int) -> None:
+    def __init__(
+        self,
+        tokens: int,
+        billed_values: Optional[int] = None,
+        logical_values: Optional[int] = None,
+    ) -> None:
         """Initialize embedding usage.
         
         Args:
-            tokens: Number of input tokens used
+            tokens: Number of input tokens used (as billed by the provider)
+            billed_values: Number of values sent to the provider
+            logical_values: Number of values requested, including duplicates
         """
         self.tokens = tokens
+        self.billed_values = billed_values
+        self.logical_values = logical_values if logical_values is not None else billed_values
+    
+    @property
+    def deduplicated_values(self) -> int:
+        """Number of requested values served without a provider call."""
+        if self.billed_values is None or self.logical_values is None:
+            return 0
+        return self.logical_values - self.billed_values
 
 
 class EmbedResult(Generic[VALUE]):
@@ -90,6 +128,28 @@ class EmbedManyResult(Generic[VALUE]):
         self.usage = usage
         self.provider_metadata = provider_metadata
         self.response = response
+    
+    def truncate(self, dimensions: int, *, normalize: bool = True) -> "EmbedManyResult[VALUE]":
+        """Return a copy with embeddings truncated to ``dimensions``.
+        
+        Intended for Matryoshka-trained models; vectors are renormalized to
+        unit length unless ``normalize`` is False.
+        """
+        from .embed_quantization import truncate_embeddings
+        
+        return EmbedManyResult(
+            values=self.values,
+            embeddings=truncate_embeddings(self.embeddings, dimensions, normalize=normalize),
+            usage=self.usage,
+            provider_metadata=self.provider_metadata,
+            response=self.response,
+        )
+    
+    def quantize(self, method: "QuantizationMethod" = "int8") -> "QuantizedEmbeddings":
+        """Quantize the embeddings ("int8" or "binary") for compact storage."""
+        from .embed_quantization import quantize_embeddings
+        
+        return quantize_embeddings(self.embeddings, method)
 
 
 async def embed(
@@ -142,7 +202,9 @@ async def embed_many(
     values: List[VALUE],
     *,
     max_retries: int = 2,
-    max_parallel_calls: int = float('inf'),
+    max_parallel_calls: Optional[int] = None,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    deduplicate: bool = True,
     headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, Any]] = None,
 ) -> EmbedManyResult[VALUE]:
@@ -151,11 +213,23 @@ async def embed_many(
     This function automatically handles batching and parallel processing
     based on the model's capabilities and limits.
     
+    Repeated values are embedded once and their vector is copied to every
+    position; ``usage.billed_values`` and ``usage.logical_values`` report
+    how many values were sent versus requested.
+    
+    When ``max_parallel_calls`` is not set, calls are scheduled through the
+    adaptive concurrency limiter shared by every call to the model's provider
+    (see :func:`~ai_sdk.utils.concurrency.get_concurrency_limiter`), so
+    parallelism grows while the provider is healthy and backs off on 429s,
+    5xx errors and rising latency.
+    
     Args:
         model: The embedding model to use
         values: The values to embed (usually strings)
         max_retries: Maximum number of retries on failure
-        max_parallel_calls: Maximum number of parallel API calls
+        max_parallel_calls: Fixed maximum number of parallel API calls
+        concurrency_limiter: Adaptive limiter to schedule calls through
+        deduplicate: Embed identical (hashable) values only once
         headers: Additional HTTP headers  
         extra_body: Additional request body parameters
         
@@ -172,24 +246,39 @@ async def embed_many(
     if any(v is None for v in values):
         raise InvalidArgumentError("Values cannot contain None")
     
+    positions: Optional[List[int]] = None
+    unique_values = values
+    if deduplicate:
+        unique_values, positions = _deduplicate(values)
+    
     # Get model limits
     max_embeddings_per_call = getattr(model, 'max_embeddings_per_call', 1000)
     supports_parallel_calls = getattr(model, 'supports_parallel_calls', True)
     
-    # If all values fit in one call, use simple approach
-    if len(values) <= max_embeddings_per_call:
-        return await _embed_batch(
-            model=model,
-            values=values,
-            max_retries=max_retries,
-            headers=headers,
-            extra_body=extra_body,
-        )
+    limiter = concurrency_limiter
+    if limiter is None and max_parallel_calls is None:
+        limiter = get_concurrency_limiter(model)
     
     # Split into batches
-    batches = _split_into_batches(values, max_embeddings_per_call)
+    batches = _split_into_batches(unique_values, max_embeddings_per_call)
+    
+    if max_parallel_calls is None:
+        # The adaptive limiter bounds the actual parallelism
+        max_parallel_calls = len(batches)
     
-    if supports_parallel_calls and max_parallel_calls > 1:
+    if len(batches) == 1:
+        # All values fit in one call
+        batch_results = [
+            await _embed_batch(
+                model=model,
+                values=batches[0],
+                max_retries=max_retries,
+                headers=headers,
+                extra_body=extra_body,
+                limiter=limiter,
+            )
+        ]
+    elif supports_parallel_calls and max_parallel_calls > 1:
         # Process batches in parallel
         batch_results = await _embed_batches_parallel(
             model=model,
@@ -198,6 +287,7 @@ async def embed_many(
             max_retries=max_retries,
             headers=headers,
             extra_body=extra_body,
+            limiter=limiter,
         )
     else:
         # Process batches sequentially
@@ -209,6 +299,7 @@ async def embed_many(
                 max_retries=max_retries,
                 headers=headers,
                 extra_body=extra_body,
+                limiter=limiter,
             )
             batch_results.append(result)
     
@@ -223,10 +314,17 @@ async def embed_many(
         if result.provider_metadata and result.provider_metadata.data:
             combined_metadata.update(result.provider_metadata.data)
     
+    if positions is not None:
+        all_embeddings = _expand_embeddings(all_embeddings, positions)
+    
     return EmbedManyResult(
         values=values,
         embeddings=all_embeddings,
-        usage=EmbeddingUsage(tokens=total_tokens),
+        usage=EmbeddingUsage(
+            tokens=total_tokens,
+            billed_values=len(unique_values),
+            logical_values=len(values),
+        ),
         provider_metadata=ProviderMetadata(data=combined_metadata) if combined_metadata else None,
         response=batch_results[0].response if batch_results else None,
     )
@@ -238,49 +336,17 @@ async def _embed_batch(
     max_retries: int,
     headers: Optional[Dict[str, str]],
     extra_body: Optional[Dict[str, Any]],
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
 ) -> EmbedManyResult[VALUE]:
     """Embed a single batch of values."""
     
     # Call the model's embedding method with retry logic
     for attempt in range(max_retries + 1):
         try:
-            # Check if model has modern doEmbed interface or legacy embed_many
-            if hasattr(model, 'do_embed'):
-                # Modern interface matching TypeScript SDK
-                result = await model.do_embed(
-                    values=values,
-                    headers=headers or {},
-                    extra_body=extra_body or {},
-                )
-                
-                usage = EmbeddingUsage(tokens=result.get('usage', {}).get('tokens', 0))
-                provider_metadata = None
-                if 'provider_metadata' in result:
-                    provider_metadata = ProviderMetadata(data=result['provider_metadata'])
-                
-                return EmbedManyResult(
-                    values=values,
-                    embeddings=result['embeddings'],
-                    usage=usage,
-                    provider_metadata=provider_metadata,
-                    response=result.get('response'),
-                )
-            else:
-                # Legacy interface - convert strings for now  
-                string_values = [str(v) for v in values]
-                embeddings = await model.embed_many(string_values)
-                
-                # Estimate token usage (rough approximation)
-                total_chars = sum(len(str(v)) for v in values)
-                estimated_tokens = max(1, total_chars // 4)  # Rough token estimation
-                
-                return EmbedManyResult(
-                    values=values,
-                    embeddings=embeddings,
-                    usage=EmbeddingUsage(tokens=estimated_tokens),
-                    provider_metadata=None,
-                    response=None,
-                )
+            if limiter is None:
+                return await _embed_batch_once(model, values, headers, extra_body)
+            async with limiter.slot():
+                return await _embed_batch_once(model, values, headers, extra_body)
                 
         except Exception as e:
             if attempt == max_retries:
@@ -297,6 +363,52 @@ async def _embed_batch(
     raise APIError("Embedding failed unexpectedly")
 
 
+async def _embed_batch_once(
+    model: EmbeddingModel,
+    values: List[VALUE],
+    headers: Optional[Dict[str, str]],
+    extra_body: Optional[Dict[str, Any]],
+) -> EmbedManyResult[VALUE]:
+    """Make a single embedding call for a batch of values."""
+    # Check if model has modern doEmbed interface or legacy embed_many
+    if hasattr(model, 'do_embed'):
+        # Modern interface matching TypeScript SDK
+        result = await model.do_embed(
+            values=values,
+            headers=headers or {},
+            extra_body=extra_body or {},
+        )
+        
+        usage = EmbeddingUsage(tokens=result.get('usage', {}).get('tokens', 0))
+        provider_metadata = None
+        if 'provider_metadata' in result:
+            provider_metadata = ProviderMetadata(data=result['provider_metadata'])
+        
+        return EmbedManyResult(
+            values=values,
+            embeddings=result['embeddings'],
+            usage=usage,
+            provider_metadata=provider_metadata,
+            response=result.get('response'),
+        )
+    
+    # Legacy interface - convert strings for now  
+    string_values = [str(v) for v in values]
+    embeddings = await model.embed_many(string_values)
+    
+    # Estimate token usage (rough approximation)
+    total_chars = sum(len(str(v)) for v in values)
+    estimated_tokens = max(1, total_chars // 4)  # Rough token estimation
+    
+    return EmbedManyResult(
+        values=values,
+        embeddings=embeddings,
+        usage=EmbeddingUsage(tokens=estimated_tokens),
+        provider_metadata=None,
+        response=None,
+    )
+
+
 async def _embed_batches_parallel(
     model: EmbeddingModel,
     batches: List[List[VALUE]],
@@ -304,6 +416,7 @@ async def _embed_batches_parallel(
     max_retries: int,
     headers: Optional[Dict[str, str]],
     extra_body: Optional[Dict[str, Any]],
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
 ) -> List[EmbedManyResult[VALUE]]:
     """Process multiple batches in parallel with concurrency limiting."""
     
@@ -317,6 +430,7 @@ async def _embed_batches_parallel(
                 max_retries=max_retries,
                 headers=headers,
                 extra_body=extra_body,
+                limiter=limiter,
             )
     
     # Create tasks for all batches
@@ -326,6 +440,57 @@ async def _embed_batches_parallel(
     return await asyncio.gather(*tasks)
 
 
+def _deduplicate(values: List[VALUE]) -> Tuple[List[VALUE], Optional[List[int]]]:
+    """Collapse repeated values.
+    
+    Returns the unique values in first-seen order and, when duplicates were
+    found, the index into that list for every input position. Unhashable
+    values are never treated as duplicates.
+    """
+    unique: List[VALUE] = []
+    positions: List[int] = []
+    seen: Dict[Any, int] = {}
+    
+    for value in values:
+        # Keyed by type as well so that e.g. 1, 1.0 and True stay distinct
+        key: Any = (type(value), value)
+        try:
+            index = seen.get(key)
+        except TypeError:
+            index = None
+            key = None
+        
+        if index is None:
+            index = len(unique)
+            unique.append(value)
+            if key is not None:
+                seen[key] = index
+        positions.append(index)
+    
+    if len(unique) == len(values):
+        return values, None
+    return unique, positions
+
+
+def _expand_embeddings(
+    embeddings: List[List[float]],
+    positions: List[int],
+) -> List[List[float]]:
+    """Fan unique embeddings back out to every input position.
+    
+    Repeated positions get their own copy so callers can modify vectors in place.
+    """
+    expanded: List[List[float]] = []
+    used = set()
+    for index in positions:
+        if index in used:
+            expanded.append(list(embeddings[index]))
+        else:
+            used.add(index)
+            expanded.append(embeddings[index])
+    return expanded
+
+
 def _split_into_batches(values: List[VALUE], batch_size: int) -> List[List[VALUE]]:
     """Split values into batches of specified size."""
     batches = []
@@ -334,6 +499,296 @@ def _split_into_batches(values: List[VALUE], batch_size: int) -> List[List[VALUE
     return batches
 
 
+class EmbedStreamItem(NamedTuple):
+    """A single embedding produced by :func:`embed_stream`.
+
+    Unpacks as ``(index, value, embedding)``.
+    """
+
+    index: int
+    value: Any
+    embedding: List[float]
+
+
+class EmbedStreamCheckpointState:
+    """Progress of an :func:`embed_stream` run.
+
+    Every index below ``next_index`` has been committed. Batches that were
+    committed out of order (unordered mode) are kept in ``committed_ranges``
+    as half-open ``[start, end)`` ranges until the gap before them closes.
+    """
+
+    def __init__(
+        self,
+        next_index: int = 0,
+        committed_ranges: Optional[List[Tuple[int, int]]] = None,
+    ) -> None:
+        self.next_index = next_index
+        self.committed_ranges: List[Tuple[int, int]] = sorted(
+            (int(start), int(end)) for start, end in (committed_ranges or [])
+        )
+
+    def is_committed(self, index: int) -> bool:
+        """Return whether the value at ``index`` has already been committed."""
+        if index < self.next_index:
+            return True
+        return any(start <= index < end for start, end in self.committed_ranges)
+
+    def commit(self, indices: List[int]) -> None:
+        """Mark the given indices as committed and advance ``next_index``."""
+        ranges = list(self.committed_ranges)
+        for index in sorted(indices):
+            if ranges and ranges[-1][1] == index:
+                ranges[-1] = (ranges[-1][0], index + 1)
+            else:
+                ranges.append((index, index + 1))
+        ranges.sort()
+
+        merged: List[Tuple[int, int]] = []
+        for start, end in ranges:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        while merged and merged[0][0] <= self.next_index:
+            self.next_index = max(self.next_index, merged.pop(0)[1])
+        self.committed_ranges = merged
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the state to a JSON-compatible dictionary."""
+        return {
+            "next_index": self.next_index,
+            "committed_ranges": [list(r) for r in self.committed_ranges],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EmbedStreamCheckpointState":
+        """Create a state from :meth:`to_dict` output."""
+        return cls(
+            next_index=int(data.get("next_index", 0)),
+            committed_ranges=[tuple(r) for r in data.get("committed_ranges", [])],
+        )
+
+
+class EmbedStreamCheckpoint(ABC):
+    """Storage for :func:`embed_stream` progress.
+
+    Implement this to persist checkpoints in a database or object store.
+    """
+
+    @abstractmethod
+    async def load(self) -> Optional[EmbedStreamCheckpointState]:
+        """Load the last saved state, or ``None`` when starting fresh."""
+        pass
+
+    @abstractmethod
+    async def save(self, state: EmbedStreamCheckpointState) -> None:
+        """Persist the given state."""
+        pass
+
+
+class InMemoryEmbedStreamCheckpoint(EmbedStreamCheckpoint):
+    """Checkpoint kept in process memory (useful for retries within a process)."""
+
+    def __init__(self) -> None:
+        self._data: Optional[Dict[str, Any]] = None
+
+    async def load(self) -> Optional[EmbedStreamCheckpointState]:
+        if self._data is None:
+            return None
+        return EmbedStreamCheckpointState.from_dict(self._data)
+
+    async def save(self, state: EmbedStreamCheckpointState) -> None:
+        self._data = state.to_dict()
+
+
+class FileEmbedStreamCheckpoint(EmbedStreamCheckpoint):
+    """Checkpoint stored as a JSON file, replaced atomically on every save."""
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        self.path = os.fspath(path)
+
+    async def load(self) -> Optional[EmbedStreamCheckpointState]:
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r", encoding="utf-8") as f:
+            return EmbedStreamCheckpointState.from_dict(json.load(f))
+
+    async def save(self, state: EmbedStreamCheckpointState) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state.to_dict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+async def embed_stream(
+    model: EmbeddingModel,
+    values: Union[Iterable[VALUE], AsyncIterable[VALUE]],
+    *,
+    batch_size: Optional[int] = None,
+    max_parallel_calls: int = 4,
+    max_buffered_batches: Optional[int] = None,
+    ordered: bool = True,
+    checkpoint: Optional[EmbedStreamCheckpoint] = None,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    max_retries: int = 2,
+    headers: Optional[Dict[str, str]] = None,
+    extra_body: Optional[Dict[str, Any]] = None,
+) -> AsyncGenerator[EmbedStreamItem, None]:
+    """Embed a (possibly unbounded) stream of values.
+
+    Values are read lazily from ``values``, grouped into batches and embedded
+    with at most ``max_parallel_calls`` requests in flight. At most
+    ``max_parallel_calls + max_buffered_batches`` batches are held in memory
+    at any time, so the input can be far larger than memory.
+
+    A batch is committed to ``checkpoint`` once all of its items have been
+    consumed. When the same input is streamed again with the same checkpoint,
+    committed values are skipped, so a crashed job resumes from the last
+    committed batch.
+
+    Args:
+        model: The embedding model to use
+        values: Sync or async iterable of values to embed
+        batch_size: Values per provider call (defaults to the model limit)
+        max_parallel_calls: Maximum number of concurrent provider calls
+        max_buffered_batches: Completed batches that may wait for the
+            consumer (defaults to ``max_parallel_calls``)
+        ordered: Yield results in input order; otherwise as batches complete
+        checkpoint: Optional checkpoint store for resumable runs
+        concurrency_limiter: Adaptive limiter to schedule calls through,
+            within the ``max_parallel_calls`` bound
+        max_retries: Maximum number of retries per batch
+        headers: Additional HTTP headers
+        extra_body: Additional request body parameters
+
+    Yields:
+        EmbedStreamItem tuples of ``(index, value, embedding)``
+
+    Raises:
+        InvalidArgumentError: If arguments are invalid
+        APIError: If a batch fails after all retries
+    """
+    model_limit = getattr(model, 'max_embeddings_per_call', 1000)
+    batch_size = batch_size or model_limit
+    if batch_size < 1 or batch_size > model_limit:
+        raise InvalidArgumentError(
+            f"batch_size must be between 1 and {model_limit}",
+            argument="batch_size",
+            value=batch_size,
+        )
+    if max_parallel_calls < 1:
+        raise InvalidArgumentError(
+            "max_parallel_calls must be at least 1",
+            argument="max_parallel_calls",
+            value=max_parallel_calls,
+        )
+    if not getattr(model, 'supports_parallel_calls', True):
+        max_parallel_calls = 1
+    if max_buffered_batches is None:
+        max_buffered_batches = max_parallel_calls
+    window = max_parallel_calls + max(0, max_buffered_batches)
+
+    state = EmbedStreamCheckpointState()
+    if checkpoint is not None:
+        state = await checkpoint.load() or state
+
+    semaphore = asyncio.Semaphore(max_parallel_calls)
+
+    async def _run_batch(batch: List[Tuple[int, VALUE]]) -> List[List[float]]:
+        async with semaphore:
+            result = await _embed_batch(
+                model=model,
+                values=[value for _, value in batch],
+                max_retries=max_retries,
+                headers=headers,
+                extra_body=extra_body,
+                limiter=concurrency_limiter,
+            )
+        if len(result.embeddings) != len(batch):
+            raise APIError(
+                f"Expected {len(batch)} embeddings, got {len(result.embeddings)}"
+            )
+        return result.embeddings
+
+    batches = _iterate_batches(values, batch_size, state)
+    pending: Dict[int, Tuple[List[Tuple[int, VALUE]], asyncio.Task]] = {}
+    next_seq = 0
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    batch = await batches.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending[next_seq] = (batch, asyncio.ensure_future(_run_batch(batch)))
+                next_seq += 1
+
+            if not pending:
+                break
+
+            if ordered:
+                seq = min(pending)
+            else:
+                done, _ = await asyncio.wait(
+                    [task for _, task in pending.values()],
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                seq = min(s for s, (_, task) in pending.items() if task in done)
+
+            batch, task = pending.pop(seq)
+            embeddings = await task
+            for (index, value), embedding in zip(batch, embeddings):
+                yield EmbedStreamItem(index, value, embedding)
+
+            if checkpoint is not None:
+                state.commit([index for index, _ in batch])
+                await checkpoint.save(state)
+    finally:
+        for _, task in pending.values():
+            task.cancel()
+        await batches.aclose()
+
+
+async def _iterate_batches(
+    values: Union[Iterable[VALUE], AsyncIterable[VALUE]],
+    batch_size: int,
+    state: EmbedStreamCheckpointState,
+) -> AsyncIterator[List[Tuple[int, VALUE]]]:
+    """Group values into ``(index, value)`` batches, skipping committed ones."""
+    batch: List[Tuple[int, VALUE]] = []
+    index = 0
+    async for value in _aiterate(values):
+        if value is None:
+            raise InvalidArgumentError("Values cannot contain None")
+        if not state.is_committed(index):
+            batch.append((index, value))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        index += 1
+    if batch:
+        yield batch
+
+
+async def _aiterate(
+    values: Union[Iterable[VALUE], AsyncIterable[VALUE]],
+) -> AsyncIterator[VALUE]:
+    """Iterate a sync or async iterable asynchronously."""
+    if hasattr(values, '__aiter__'):
+        async for value in values:  # type: ignore[union-attr]
+            yield value
+    else:
+        for value in values:  # type: ignore[union-attr]
+            yield value
+
+
 # Convenience function for cosine similarity (commonly used with embeddings)
 def cosine_similarity(a: List[float], b: List[float]) -> float:
     """Calculate cosine similarity between two embedding vectors.
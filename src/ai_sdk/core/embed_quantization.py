@@ -0,0 +1,287 @@
+"""Compact storage for embeddings: truncation and quantization.
+
+Matryoshka-trained models (e.g. OpenAI ``text-embedding-3-*``) keep most of
+their quality when vectors are cut to a prefix of their dimensions and
+renormalized. Scalar ``int8`` quantization stores one byte per dimension and
+``binary`` quantization one bit, with similarity search over the compact
+form and optional re-ranking of the best candidates with float vectors.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import List, Literal, Optional, Sequence, Tuple
+
+from ..errors import InvalidArgumentError
+
+QuantizationMethod = Literal["int8", "binary"]
+
+FLOAT32_BYTES = 4
+
+
+def normalize_embedding(embedding: Sequence[float]) -> List[float]:
+    """Scale a vector to unit length (zero vectors are returned unchanged).
+
+    Args:
+        embedding: The vector to normalize
+
+    Returns:
+        The normalized vector
+    """
+    norm = math.sqrt(sum(x * x for x in embedding))
+    if norm == 0:
+        return list(embedding)
+    return [x / norm for x in embedding]
+
+
+def truncate_embedding(
+    embedding: Sequence[float],
+    dimensions: int,
+    *,
+    normalize: bool = True,
+) -> List[float]:
+    """Keep the first ``dimensions`` values of a vector.
+
+    Args:
+        embedding: The vector to truncate
+        dimensions: Number of leading dimensions to keep
+        normalize: Renormalize the truncated vector to unit length
+
+    Returns:
+        The truncated vector
+
+    Raises:
+        InvalidArgumentError: If dimensions is not between 1 and the vector size
+    """
+    if dimensions < 1 or dimensions > len(embedding):
+        raise InvalidArgumentError(
+            f"dimensions must be between 1 and {len(embedding)}",
+            argument="dimensions",
+            value=dimensions,
+        )
+    truncated = list(embedding[:dimensions])
+    return normalize_embedding(truncated) if normalize else truncated
+
+
+def truncate_embeddings(
+    embeddings: Sequence[Sequence[float]],
+    dimensions: int,
+    *,
+    normalize: bool = True,
+) -> List[List[float]]:
+    """Truncate every vector in a list (see :func:`truncate_embedding`)."""
+    return [
+        truncate_embedding(embedding, dimensions, normalize=normalize)
+        for embedding in embeddings
+    ]
+
+
+class QuantizedEmbeddings:
+    """A set of quantized embedding vectors supporting similarity search.
+
+    Create instances with :func:`quantize_int8` or :func:`quantize_binary`.
+    """
+
+    def __init__(
+        self,
+        method: QuantizationMethod,
+        dimensions: int,
+        *,
+        int8_codes: Optional[List["array[int]"]] = None,
+        scales: Optional["array[float]"] = None,
+        binary_codes: Optional[List[int]] = None,
+    ) -> None:
+        """Initialize quantized embeddings.
+
+        Args:
+            method: Quantization method ("int8" or "binary")
+            dimensions: Dimensions of the original vectors
+            int8_codes: One ``array('b')`` per vector (int8)
+            scales: Per-vector scale factors (int8)
+            binary_codes: One packed sign-bit ``int`` per vector (binary)
+        """
+        self.method = method
+        self.dimensions = dimensions
+        self.int8_codes: List["array[int]"] = int8_codes if int8_codes is not None else []
+        self.scales: "array[float]" = scales if scales is not None else array("f")
+        self.binary_codes: List[int] = binary_codes if binary_codes is not None else []
+
+    def __len__(self) -> int:
+        if self.method == "int8":
+            return len(self.int8_codes)
+        return len(self.binary_codes)
+
+    @property
+    def nbytes(self) -> int:
+        """Storage size of the quantized vectors in bytes."""
+        if self.method == "int8":
+            return len(self) * self.dimensions + len(self.scales) * self.scales.itemsize
+        return len(self) * ((self.dimensions + 7) // 8)
+
+    @property
+    def float32_nbytes(self) -> int:
+        """Storage size of the same vectors as float32, in bytes."""
+        return len(self) * self.dimensions * FLOAT32_BYTES
+
+    @property
+    def compression_ratio(self) -> float:
+        """How many times smaller the quantized vectors are than float32."""
+        return self.float32_nbytes / self.nbytes if self.nbytes else 0.0
+
+    def to_bytes(self, index: int) -> bytes:
+        """Serialize one quantized vector for storage."""
+        if self.method == "int8":
+            return self.int8_codes[index].tobytes()
+        return self.binary_codes[index].to_bytes((self.dimensions + 7) // 8, "big")
+
+    def dequantize(self, index: int) -> List[float]:
+        """Approximately reconstruct one float vector."""
+        if self.method == "int8":
+            scale = self.scales[index]
+            return [value * scale for value in self.int8_codes[index]]
+        code = self.binary_codes[index]
+        return [
+            1.0 if (code >> (self.dimensions - 1 - i)) & 1 else -1.0
+            for i in range(self.dimensions)
+        ]
+
+    def similarities(self, query: Sequence[float]) -> List[float]:
+        """Approximate similarity of ``query`` to every stored vector.
+
+        For int8 this is the dot product with the dequantized vectors (equal
+        to cosine similarity for unit-length inputs). For binary it is the
+        fraction of matching sign bits mapped to ``[-1, 1]``.
+        """
+        self._check_query(query)
+        if self.method == "int8":
+            return [
+                scale * sum(q * c for q, c in zip(query, code))
+                for code, scale in zip(self.int8_codes, self.scales)
+            ]
+
+        query_bits = _pack_signs(query)
+        dims = self.dimensions
+        return [1.0 - 2.0 * _popcount(query_bits ^ code) / dims for code in self.binary_codes]
+
+    def search(
+        self,
+        query: Sequence[float],
+        top_k: int = 10,
+        *,
+        rerank_embeddings: Optional[Sequence[Sequence[float]]] = None,
+        rerank_multiplier: int = 4,
+    ) -> List[Tuple[int, float]]:
+        """Find the stored vectors most similar to ``query``.
+
+        Args:
+            query: Float query vector (same dimensions as the stored vectors)
+            top_k: Number of results to return
+            rerank_embeddings: Optional float vectors (in storage order) used to
+                re-score the best ``top_k * rerank_multiplier`` candidates
+                with exact cosine similarity
+            rerank_multiplier: Candidate oversampling factor for re-ranking
+
+        Returns:
+            ``(index, score)`` pairs sorted by descending score
+        """
+        scores = self.similarities(query)
+        candidate_count = top_k * rerank_multiplier if rerank_embeddings is not None else top_k
+        candidates = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        candidates = candidates[:candidate_count]
+
+        if rerank_embeddings is None:
+            return [(i, scores[i]) for i in candidates]
+
+        from ..utils.cosine_similarity import cosine_similarity
+
+        query_vector = list(query)
+        rescored = [
+            (i, cosine_similarity(query_vector, list(rerank_embeddings[i]))) for i in candidates
+        ]
+        rescored.sort(key=lambda item: item[1], reverse=True)
+        return rescored[:top_k]
+
+    def _check_query(self, query: Sequence[float]) -> None:
+        if len(query) != self.dimensions:
+            raise InvalidArgumentError(
+                f"Query has {len(query)} dimensions, expected {self.dimensions}",
+                argument="query",
+                value=len(query),
+            )
+
+
+def quantize_int8(embeddings: Sequence[Sequence[float]]) -> QuantizedEmbeddings:
+    """Quantize vectors to int8 with a symmetric per-vector scale.
+
+    Args:
+        embeddings: Float vectors of equal length
+
+    Returns:
+        QuantizedEmbeddings storing one byte per dimension
+    """
+    dimensions = _check_embeddings(embeddings)
+    codes: List["array[int]"] = []
+    scales: "array[float]" = array("f")
+    for embedding in embeddings:
+        max_abs = max((abs(x) for x in embedding), default=0.0)
+        scale = max_abs / 127.0 if max_abs else 1.0
+        codes.append(array("b", (int(round(x / scale)) for x in embedding)))
+        scales.append(scale)
+    return QuantizedEmbeddings("int8", dimensions, int8_codes=codes, scales=scales)
+
+
+def quantize_binary(embeddings: Sequence[Sequence[float]]) -> QuantizedEmbeddings:
+    """Quantize vectors to one sign bit per dimension.
+
+    Args:
+        embeddings: Float vectors of equal length
+
+    Returns:
+        QuantizedEmbeddings storing one bit per dimension
+    """
+    dimensions = _check_embeddings(embeddings)
+    return QuantizedEmbeddings(
+        "binary",
+        dimensions,
+        binary_codes=[_pack_signs(embedding) for embedding in embeddings],
+    )
+
+
+def quantize_embeddings(
+    embeddings: Sequence[Sequence[float]],
+    method: QuantizationMethod = "int8",
+) -> QuantizedEmbeddings:
+    """Quantize vectors with the given method ("int8" or "binary")."""
+    if method == "int8":
+        return quantize_int8(embeddings)
+    if method == "binary":
+        return quantize_binary(embeddings)
+    raise InvalidArgumentError(
+        f"Unknown quantization method: {method}",
+        argument="method",
+        value=method,
+    )
+
+
+def _check_embeddings(embeddings: Sequence[Sequence[float]]) -> int:
+    if not embeddings:
+        raise InvalidArgumentError("Embeddings list cannot be empty")
+    dimensions = len(embeddings[0])
+    if dimensions == 0 or any(len(e) != dimensions for e in embeddings):
+        raise InvalidArgumentError("Embeddings must be non-empty and of equal length")
+    return dimensions
+
+
+def _pack_signs(embedding: Sequence[float]) -> int:
+    bits = 0
+    for x in embedding:
+        bits = (bits << 1) | (1 if x > 0 else 0)
+    return bits
+
+
+def _popcount(value: int) -> int:
+    try:
+        return value.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(value).count("1")
@@ -14,6 +14,7 @@ from ..providers.base import (
     GeneratedFile,
 )
 from ..errors.base import AISDKError
+from ..utils.concurrency import AdaptiveConcurrencyLimiter, get_concurrency_limiter
 from ..utils.http import retry_with_exponential_backoff
 
 
@@ -77,10 +78,14 @@ async def generate_image(
     provider_options: Optional[Dict[str, Any]] = None,
     max_retries: int = 2,
     headers: Optional[Dict[str, str]] = None,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
 ) -> GenerateImageResult:
     """
     Generate images using an image model.
     
+    When ``n`` requires several API calls, they are scheduled through the
+    adaptive concurrency limiter shared by every call to the model's provider.
+    
     Args:
         model: The image model to use
         prompt: The prompt for image generation
@@ -92,6 +97,8 @@ async def generate_image(
         provider_options: Provider-specific options
         max_retries: Maximum number of retries (default: 2)
         headers: Additional HTTP headers
+        concurrency_limiter: Adaptive limiter to schedule calls through
+            (defaults to the limiter shared by the model's provider)
         
     Returns:
         GenerateImageResult containing generated images and metadata
@@ -113,18 +120,24 @@ async def generate_image(
             remainder = n % max_images_per_call_default
             call_image_counts.append(remainder if remainder > 0 else max_images_per_call_default)
     
+    limiter = concurrency_limiter or get_concurrency_limiter(model)
+    
     # Create retry function
     async def make_call(call_image_count: int):
+        async def attempt():
+            async with limiter.slot():
+                return await model.do_generate(
+                    prompt=prompt,
+                    n=call_image_count,
+                    size=size,
+                    aspect_ratio=aspect_ratio,
+                    seed=seed,
+                    provider_options=provider_options or {},
+                    headers=headers or {},
+                )
+        
         return await retry_with_exponential_backoff(
-            lambda: model.do_generate(
-                prompt=prompt,
-                n=call_image_count,
-                size=size,
-                aspect_ratio=aspect_ratio,
-                seed=seed,
-                provider_options=provider_options or {},
-                headers=headers or {},
-            ),
+            attempt,
             max_retries=max_retries,
         )
     
@@ -177,6 +190,7 @@ def generate_image_sync(
     provider_options: Optional[Dict[str, Any]] = None,
     max_retries: int = 2,
     headers: Optional[Dict[str, str]] = None,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
 ) -> GenerateImageResult:
     """Synchronous version of generate_image."""
     import asyncio
@@ -191,6 +205,7 @@ def generate_image_sync(
         provider_options=provider_options,
         max_retries=max_retries,
         headers=headers,
+        concurrency_limiter=concurrency_limiter,
     ))
 
 
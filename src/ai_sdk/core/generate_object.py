@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional, TypeVar, Union, Generic, Type, Asy
 
 from pydantic import BaseModel, ValidationError
 
-from ..errors.base import AISDKError, NoObjectGeneratedError
+from ..errors.base import AbortError, AISDKError, NoObjectGeneratedError
 from ..providers.base import LanguageModel
 from ..providers.types import (
     Message,
@@ -16,6 +16,8 @@ from ..providers.types import (
     ToolDefinition,
     Content,
 )
+from ..utils.abort import AbortSignal
+from ..utils.partial_json import IncrementalJSONParser
 from .generate_text import generate_text, stream_text, GenerateTextResult
 
 T = TypeVar("T", bound=BaseModel)
@@ -33,7 +35,12 @@ class ObjectPart(ObjectStreamPart):
 
     type: str = "object"
     object: Dict[str, Any]
-    """The partial object data."""
+    """The partial object data. Nested objects and arrays that are still
+    open are shared with later parts and keep growing."""
+
+    patch: Optional[List[Dict[str, Any]]] = None
+    """JSON-patch style operations since the previous object part
+    (only when ``stream_object`` is called with ``include_patches=True``)."""
 
 
 class TextDeltaPart(ObjectStreamPart):
@@ -412,6 +419,8 @@ async def stream_object(
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
     headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, Any]] = None,
+    include_patches: bool = False,
+    abort_signal: Optional[AbortSignal] = None,
 ) -> AsyncGenerator[ObjectStreamPart, None]:
     """Stream a structured, typed object for a given prompt and schema using a language model.
 
@@ -439,6 +448,10 @@ async def stream_object(
         tool_choice: How the model should choose tools.
         headers: Additional HTTP headers.
         extra_body: Additional request body parameters.
+        include_patches: Attach the JSON-patch style operations since the
+            previous object part to each ``ObjectPart``.
+        abort_signal: Signal that stops the stream and closes the provider's
+            HTTP response.
 
     Yields:
         ObjectStreamPart: Stream parts containing partial objects, text deltas, or finish/error events.
@@ -447,6 +460,7 @@ async def stream_object(
         AISDKError: If object generation fails.
         NoObjectGeneratedError: If no valid object could be generated.
         ValidationError: If the final object doesn't match the schema.
+        AbortError: If abort_signal is aborted.
     """
     # Validate input
     if prompt is not None and messages is not None:
@@ -510,6 +524,8 @@ Only return the JSON object, no additional text or formatting."""
             tool_choice=tool_choice,
             headers=headers,
             extra_body=extra_body,
+            include_patches=include_patches,
+            abort_signal=abort_signal,
         ):
             yield part
         return
@@ -520,8 +536,12 @@ Only return the JSON object, no additional text or formatting."""
     
     resolved_max_tokens = max_output_tokens if max_output_tokens is not None else max_tokens
 
-    # Stream text and parse JSON incrementally
-    accumulated_text = ""
+    # Stream text and parse JSON incrementally: each delta is consumed once
+    # instead of re-parsing the accumulated text per token
+    text_deltas: List[str] = []
+    parser = IncrementalJSONParser(
+        skip_until="{", allow_trailing_text=True, track_patches=include_patches
+    )
     current_partial = {}
     
     try:
@@ -543,30 +563,36 @@ Only return the JSON object, no additional text or formatting."""
             tool_choice=tool_choice,
             headers=headers,
             extra_body=extra_body,
+            abort_signal=abort_signal,
+            fast_parts=True,
         ):
-            if hasattr(text_part, 'delta'):
-                delta = text_part.delta
-                accumulated_text += delta
+            if getattr(text_part, 'type', None) == 'text-delta':
+                delta = getattr(text_part, 'text_delta', None) or getattr(text_part, 'delta', '')
+                text_deltas.append(delta)
                 
                 # Yield text delta
                 yield TextDeltaPart(text_delta=delta)
                 
-                # Try to parse partial JSON
-                partial_object = _parse_partial_json(accumulated_text)
-                if partial_object is not None and partial_object != current_partial:
-                    current_partial = partial_object
-                    yield ObjectPart(object=partial_object)
+                if parser.feed(delta) and isinstance(parser.value, dict):
+                    current_partial = parser.value
+                    yield ObjectPart(
+                        object=current_partial,
+                        patch=parser.take_patches() if include_patches else None,
+                    )
             
             elif hasattr(text_part, 'finish_reason'):
                 # Final parsing and validation
-                json_text = _extract_json(accumulated_text)
-                
-                if not json_text:
-                    yield ErrorPart(error=f"No valid JSON found in response: {accumulated_text[:200]}...")
-                    return
+                accumulated_text = "".join(text_deltas)
                 
                 try:
-                    final_json = json.loads(json_text)
+                    if parser.done and isinstance(parser.value, dict):
+                        final_json = parser.value
+                    else:
+                        json_text = _extract_json(accumulated_text)
+                        if not json_text:
+                            yield ErrorPart(error=f"No valid JSON found in response: {accumulated_text[:200]}...")
+                            return
+                        final_json = json.loads(json_text)
                     validated_object = schema.model_validate(final_json)
                     
                     # Yield final object if different from last partial
@@ -586,6 +612,8 @@ Only return the JSON object, no additional text or formatting."""
                 except (json.JSONDecodeError, ValidationError) as e:
                     yield ErrorPart(error=f"Failed to parse or validate final object: {e}")
                     
+    except AbortError:
+        raise
     except Exception as e:
         yield ErrorPart(error=f"Failed to stream object: {e}")
 
@@ -652,79 +680,6 @@ async def collect_stream_object(
     )
 
 
-def _parse_partial_json(text: str) -> Optional[Dict[str, Any]]:
-    """Parse partial JSON, returning the most complete valid object possible."""
-    # Clean the text first
-    text = text.strip()
-    
-    # Look for JSON start
-    start_idx = text.find('{')
-    if start_idx == -1:
-        return None
-    
-    text = text[start_idx:]
-    
-    # Try to parse the text as-is first
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-    
-    # Try to find a valid partial JSON by closing braces/quotes
-    # This is a simplified approach - a full implementation would be more sophisticated
-    
-    # Count braces to try to balance them
-    open_braces = 0
-    open_quotes = False
-    escape_next = False
-    valid_end = -1
-    
-    for i, char in enumerate(text):
-        if escape_next:
-            escape_next = False
-            continue
-            
-        if char == '\\':
-            escape_next = True
-            continue
-            
-        if not open_quotes:
-            if char == '{':
-                open_braces += 1
-            elif char == '}':
-                open_braces -= 1
-                if open_braces == 0:
-                    valid_end = i + 1
-                    break
-        
-        if char == '"' and not escape_next:
-            open_quotes = not open_quotes
-    
-    # Try parsing up to the valid end point
-    if valid_end > 0:
-        try:
-            return json.loads(text[:valid_end])
-        except json.JSONDecodeError:
-            pass
-    
-    # Try adding closing braces if we have unmatched opens
-    if open_braces > 0:
-        # Close any open quotes first
-        partial_text = text
-        if open_quotes:
-            partial_text += '"'
-        
-        # Add closing braces
-        partial_text += '}' * open_braces
-        
-        try:
-            return json.loads(partial_text)
-        except json.JSONDecodeError:
-            pass
-    
-    return None
-
-
 # Convenience function for synchronous usage
 def generate_object_sync(
     model: LanguageModel,
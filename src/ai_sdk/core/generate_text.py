@@ -17,6 +17,8 @@ from ..providers.types import (
     ToolDefinition,
     Usage,
 )
+from ..providers.stream_parts import FastStreamPart, to_stream_part_model
+from ..utils.abort import AbortSignal, abortable_stream
 
 
 class GenerateTextOptions:
@@ -242,17 +244,26 @@ async def stream_text(
     max_retries: int = 2,
     headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, Any]] = None,
-) -> AsyncGenerator[StreamPart, None]:
+    abort_signal: Optional[AbortSignal] = None,
+    fast_parts: bool = False,
+) -> AsyncGenerator[Union[StreamPart, FastStreamPart], None]:
     """Stream text generation using a language model.
     
     Args:
-        Same as generate_text()
+        Same as generate_text(), plus:
+        abort_signal: Signal that stops the stream and closes the provider's
+            HTTP response, e.g. when the client disconnects
+        fast_parts: Yield the providers' slotted per-token parts (see
+            :mod:`ai_sdk.providers.stream_parts`) instead of converting them
+            to Pydantic models; for consumers that only read ``part.type``
+            and the part's fields
         
     Yields:
         StreamPart objects containing incremental generation results
         
     Raises:
         Same as generate_text()
+        AbortError: If abort_signal is aborted
     """
     # Create options and validate
     options = GenerateTextOptions(
@@ -280,8 +291,8 @@ async def stream_text(
     provider_options = _convert_to_stream_options(options)
     
     # Stream from the model
-    async for part in model.stream(provider_options):
-        yield part
+    async for part in abortable_stream(model.stream(provider_options), abort_signal):
+        yield part if fast_parts else to_stream_part_model(part)
 
 
 def _convert_to_provider_options(options: GenerateTextOptions) -> GenerateOptions:
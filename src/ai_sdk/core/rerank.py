@@ -0,0 +1,223 @@
+"""Document reranking functionality for AI SDK Python."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from ..errors import InvalidArgumentError
+from ..providers.base import RerankingModel
+from ..utils.concurrency import AdaptiveConcurrencyLimiter, get_concurrency_limiter
+from ..utils.http import retry_with_exponential_backoff
+
+
+class RankedDocument:
+    """A document with its relevance score."""
+
+    def __init__(self, index: int, document: Any, score: float) -> None:
+        """Initialize a ranked document.
+
+        Args:
+            index: Position of the document in the input list
+            document: The document itself
+            score: Relevance score assigned by the model
+        """
+        self.index = index
+        self.document = document
+        self.score = score
+
+    def __repr__(self) -> str:
+        return f"RankedDocument(index={self.index}, score={self.score:.4f})"
+
+
+class RerankResult:
+    """Result from reranking documents."""
+
+    def __init__(
+        self,
+        query: str,
+        ranking: List[RankedDocument],
+        usage: Optional[Dict[str, Any]] = None,
+        cached_documents: int = 0,
+        responses: Optional[List[Any]] = None,
+    ) -> None:
+        """Initialize rerank result.
+
+        Args:
+            query: The query documents were ranked against
+            ranking: Documents sorted by descending relevance
+            usage: Provider usage information summed over all calls
+            cached_documents: Number of scores served from the cache
+            responses: Raw response data from each provider call
+        """
+        self.query = query
+        self.ranking = ranking
+        self.usage = usage or {}
+        self.cached_documents = cached_documents
+        self.responses = responses or []
+
+    @property
+    def documents(self) -> List[Any]:
+        """Documents in ranked order."""
+        return [ranked.document for ranked in self.ranking]
+
+
+class RerankCache:
+    """Bounded LRU cache of relevance scores keyed by model, query and document."""
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached scores
+        """
+        self.max_size = max_size
+        self._scores: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[float]:
+        """Return a cached score, or ``None``."""
+        score = self._scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._scores.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def set(self, key: Hashable, score: float) -> None:
+        """Store a score, evicting the least recently used entries."""
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.max_size:
+            self._scores.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached scores."""
+        self._scores.clear()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+
+async def rerank(
+    model: RerankingModel,
+    query: str,
+    documents: Sequence[Any],
+    *,
+    top_n: Optional[int] = None,
+    cache: Optional[RerankCache] = None,
+    max_retries: int = 2,
+    concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    provider_options: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> RerankResult:
+    """Rank documents by relevance to a query.
+
+    Documents beyond the model's ``max_documents_per_call`` are split into
+    batches that are scored concurrently (through the provider's shared
+    adaptive concurrency limiter) and merged. With a ``cache``, previously
+    scored (query, document) pairs are not sent to the provider again.
+
+    Args:
+        model: The reranking model to use
+        query: Search query
+        documents: Documents to rank (converted with ``str()``)
+        top_n: Number of documents to return (default: all)
+        cache: Optional score cache shared across calls
+        max_retries: Maximum number of retries per call
+        concurrency_limiter: Adaptive limiter to schedule calls through
+            (defaults to the limiter shared by the model's provider)
+        provider_options: Provider-specific options
+        headers: Additional HTTP headers
+
+    Returns:
+        RerankResult with documents sorted by descending relevance
+
+    Raises:
+        InvalidArgumentError: If arguments are invalid
+        APIError: If a provider call fails
+    """
+    if not query:
+        raise InvalidArgumentError("Query cannot be empty", argument="query")
+    if top_n is not None and top_n < 1:
+        raise InvalidArgumentError("top_n must be at least 1", argument="top_n", value=top_n)
+    if not documents:
+        return RerankResult(query=query, ranking=[])
+
+    texts = [str(document) for document in documents]
+    scores: Dict[int, float] = {}
+    cache_prefix = (model.provider_name, model.model_id, query)
+
+    # Collect documents that still need scoring, once per distinct text
+    pending: Dict[str, List[int]] = {}
+    cached_documents = 0
+    for index, text in enumerate(texts):
+        cached = cache.get(cache_prefix + (text,)) if cache is not None else None
+        if cached is not None:
+            scores[index] = cached
+            cached_documents += 1
+        else:
+            pending.setdefault(text, []).append(index)
+
+    usage: Dict[str, Any] = {}
+    responses: List[Any] = []
+    if pending:
+        pending_texts = list(pending)
+        batch_size = max(1, getattr(model, "max_documents_per_call", 1000))
+        batches = [
+            pending_texts[i:i + batch_size]
+            for i in range(0, len(pending_texts), batch_size)
+        ]
+        # Provider-side truncation is only safe when every score is not needed
+        provider_top_n = top_n if len(batches) == 1 and cache is None else None
+        limiter = concurrency_limiter or get_concurrency_limiter(model)
+
+        async def score_batch(batch: List[str]) -> Tuple[List[str], Dict[str, Any]]:
+            async def attempt() -> Dict[str, Any]:
+                async with limiter.slot():
+                    return await model.do_rerank(
+                        query=query,
+                        documents=batch,
+                        top_n=provider_top_n,
+                        provider_options=provider_options or {},
+                        headers=headers or {},
+                    )
+
+            return batch, await retry_with_exponential_backoff(attempt, max_retries=max_retries)
+
+        for batch, result in await asyncio.gather(*[score_batch(b) for b in batches]):
+            for entry in result.get("ranking", []):
+                text = batch[entry["index"]]
+                score = float(entry["relevance_score"])
+                for index in pending[text]:
+                    scores[index] = score
+                if cache is not None:
+                    cache.set(cache_prefix + (text,), score)
+            _add_usage(usage, result.get("usage"))
+            responses.append(result.get("response"))
+
+    ranking = [
+        RankedDocument(index=index, document=documents[index], score=score)
+        for index, score in scores.items()
+    ]
+    ranking.sort(key=lambda ranked: (-ranked.score, ranked.index))
+    if top_n is not None:
+        ranking = ranking[:top_n]
+
+    return RerankResult(
+        query=query,
+        ranking=ranking,
+        usage=usage,
+        cached_documents=cached_documents,
+        responses=responses,
+    )
+
+
+def _add_usage(total: Dict[str, Any], usage: Optional[Dict[str, Any]]) -> None:
+    """Sum numeric usage fields into ``total``."""
+    for key, value in (usage or {}).items():
+        if isinstance(value, (int, float)):
+            total[key] = total.get(key, 0) + value
@@ -0,0 +1,355 @@
+"""Hybrid lexical + embedding retrieval for AI SDK Python.
+
+Combines a BM25 index with embedding similarity over the same documents,
+fused with reciprocal rank fusion or weighted scores, and optionally
+reranked with a provider reranking model.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple
+
+from ..errors import InvalidArgumentError
+from ..providers.base import EmbeddingModel, RerankingModel
+from ..utils.cosine_similarity import cosine_similarity
+from .embed import embed, embed_many
+from .rerank import RerankCache, rerank
+
+FusionMethod = Literal["rrf", "weighted"]
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class BM25Index:
+    """In-memory Okapi BM25 index."""
+
+    def __init__(
+        self,
+        documents: Optional[Sequence[str]] = None,
+        *,
+        k1: float = 1.5,
+        b: float = 0.75,
+        tokenizer: Callable[[str], List[str]] = tokenize,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            documents: Initial documents to index
+            k1: Term frequency saturation
+            b: Document length normalization
+            tokenizer: Function splitting text into terms
+        """
+        self.k1 = k1
+        self.b = b
+        self.tokenizer = tokenizer
+        self._term_frequencies: List[Counter] = []
+        self._lengths: List[int] = []
+        self._document_frequencies: Counter = Counter()
+        # term -> document indices, so queries only touch matching documents
+        self._postings: Dict[str, List[int]] = {}
+        if documents:
+            self.add(documents)
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, documents: Sequence[str]) -> None:
+        """Index additional documents (indices continue from the current size)."""
+        for document in documents:
+            index = len(self._lengths)
+            frequencies = Counter(self.tokenizer(str(document)))
+            self._term_frequencies.append(frequencies)
+            self._lengths.append(sum(frequencies.values()))
+            for term in frequencies:
+                self._document_frequencies[term] += 1
+                self._postings.setdefault(term, []).append(index)
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """BM25 score of every document containing at least one query term."""
+        count = len(self._lengths)
+        if count == 0:
+            return {}
+        average_length = sum(self._lengths) / count or 1.0
+
+        scores: Dict[int, float] = {}
+        for term in set(self.tokenizer(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = self._document_frequencies[term]
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for index in postings:
+                tf = self._term_frequencies[index][term]
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[index] / average_length)
+                scores[index] = scores.get(index, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
+
+    def search(self, query: str, top_k: int = 10) -> List[Tuple[int, float]]:
+        """Return the ``top_k`` ``(index, score)`` pairs for a query."""
+        return _top(self.scores(query), top_k)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[int]],
+    *,
+    k: int = 60,
+    weights: Optional[Sequence[float]] = None,
+) -> List[Tuple[int, float]]:
+    """Fuse ranked lists of document indices with reciprocal rank fusion.
+
+    Args:
+        rankings: Ranked lists of document indices (best first)
+        k: Rank smoothing constant
+        weights: Optional weight per ranking
+
+    Returns:
+        ``(index, score)`` pairs sorted by descending fused score
+    """
+    weights = weights or [1.0] * len(rankings)
+    scores: Dict[int, float] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, index in enumerate(ranking):
+            scores[index] = scores.get(index, 0.0) + weight / (k + rank + 1)
+    return _top(scores, len(scores))
+
+
+class RetrievedDocument:
+    """A document returned by :class:`HybridRetriever`."""
+
+    def __init__(
+        self,
+        index: int,
+        document: Any,
+        score: float,
+        lexical_score: Optional[float] = None,
+        vector_score: Optional[float] = None,
+        rerank_score: Optional[float] = None,
+    ) -> None:
+        self.index = index
+        self.document = document
+        self.score = score
+        self.lexical_score = lexical_score
+        self.vector_score = vector_score
+        self.rerank_score = rerank_score
+
+    def __repr__(self) -> str:
+        return f"RetrievedDocument(index={self.index}, score={self.score:.4f})"
+
+
+class HybridRetriever:
+    """Retrieve documents with BM25 and embedding similarity combined.
+
+    Example:
+        ```python
+        retriever = HybridRetriever(openai.embedding_model("text-embedding-3-small"))
+        await retriever.add_documents(chunks)
+        results = await retriever.search("how do I reset my password?", top_k=5)
+        ```
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        *,
+        fusion: FusionMethod = "rrf",
+        lexical_weight: float = 0.5,
+        rrf_k: int = 60,
+        candidate_count: int = 50,
+        reranking_model: Optional[RerankingModel] = None,
+        rerank_cache: Optional[RerankCache] = None,
+        query_cache_size: int = 1024,
+        tokenizer: Callable[[str], List[str]] = tokenize,
+    ) -> None:
+        """Initialize the retriever.
+
+        Args:
+            embedding_model: Model used to embed documents and queries
+            fusion: "rrf" (reciprocal rank fusion) or "weighted" scores
+            lexical_weight: Weight of the lexical side (0..1)
+            rrf_k: Rank smoothing constant for reciprocal rank fusion
+            candidate_count: Candidates taken from each side before fusion
+            reranking_model: Optional model to rerank fused candidates
+            rerank_cache: Score cache for reranking (created if omitted)
+            query_cache_size: Number of query embeddings to keep
+            tokenizer: Function splitting text into BM25 terms
+        """
+        if fusion not in ("rrf", "weighted"):
+            raise InvalidArgumentError(
+                f"Unknown fusion method: {fusion}", argument="fusion", value=fusion
+            )
+        if not 0.0 <= lexical_weight <= 1.0:
+            raise InvalidArgumentError(
+                "lexical_weight must be between 0 and 1",
+                argument="lexical_weight",
+                value=lexical_weight,
+            )
+
+        self.embedding_model = embedding_model
+        self.fusion = fusion
+        self.lexical_weight = lexical_weight
+        self.rrf_k = rrf_k
+        self.candidate_count = candidate_count
+        self.reranking_model = reranking_model
+        self.rerank_cache = rerank_cache if rerank_cache is not None else RerankCache()
+        self.query_cache_size = query_cache_size
+
+        self.documents: List[Any] = []
+        self.embeddings: List[List[float]] = []
+        self.index = BM25Index(tokenizer=tokenizer)
+        self._query_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    async def add_documents(
+        self,
+        documents: Sequence[Any],
+        embeddings: Optional[Sequence[List[float]]] = None,
+    ) -> None:
+        """Index documents for both lexical and vector search.
+
+        Args:
+            documents: Documents to add (converted with ``str()`` for indexing)
+            embeddings: Precomputed embeddings; computed with ``embed_many`` if omitted
+        """
+        if not documents:
+            return
+        if embeddings is None:
+            result = await embed_many(
+                model=self.embedding_model, values=[str(d) for d in documents]
+            )
+            embeddings = result.embeddings
+        if len(embeddings) != len(documents):
+            raise InvalidArgumentError("Embeddings must match documents in length")
+
+        self.documents.extend(documents)
+        self.embeddings.extend(embeddings)
+        self.index.add([str(d) for d in documents])
+
+    async def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        *,
+        rerank_results: Optional[bool] = None,
+    ) -> List[RetrievedDocument]:
+        """Find the documents most relevant to a query.
+
+        Args:
+            query: Search query
+            top_k: Number of documents to return
+            rerank_results: Rerank fused candidates (default: when a
+                reranking model is configured)
+
+        Returns:
+            Documents sorted by descending relevance
+        """
+        if not self.documents:
+            return []
+
+        lexical_scores = self.index.scores(query)
+        lexical = _top(lexical_scores, self.candidate_count)
+
+        query_embedding = await self._embed_query(query)
+        vector_scores = {
+            i: cosine_similarity(query_embedding, embedding)
+            for i, embedding in enumerate(self.embeddings)
+        }
+        vector = _top(vector_scores, self.candidate_count)
+
+        if self.fusion == "rrf":
+            fused = reciprocal_rank_fusion(
+                [[i for i, _ in lexical], [i for i, _ in vector]],
+                k=self.rrf_k,
+                weights=[self.lexical_weight, 1.0 - self.lexical_weight],
+            )
+        else:
+            fused = self._weighted_fusion(lexical, vector)
+
+        use_reranker = self.reranking_model is not None if rerank_results is None else rerank_results
+        if use_reranker and self.reranking_model is None:
+            raise InvalidArgumentError("rerank_results requires a reranking_model")
+
+        if not use_reranker:
+            return [
+                self._retrieved(i, score, lexical_scores, vector_scores)
+                for i, score in fused[:top_k]
+            ]
+
+        candidates = [i for i, _ in fused[:self.candidate_count]]
+        reranked = await rerank(
+            self.reranking_model,
+            query,
+            [self.documents[i] for i in candidates],
+            top_n=top_k,
+            cache=self.rerank_cache,
+        )
+        results = []
+        for ranked in reranked.ranking:
+            index = candidates[ranked.index]
+            retrieved = self._retrieved(index, ranked.score, lexical_scores, vector_scores)
+            retrieved.rerank_score = ranked.score
+            results.append(retrieved)
+        return results
+
+    async def _embed_query(self, query: str) -> List[float]:
+        cached = self._query_embeddings.get(query)
+        if cached is not None:
+            self._query_embeddings.move_to_end(query)
+            return cached
+
+        embedding = (await embed(model=self.embedding_model, value=query)).embedding
+        self._query_embeddings[query] = embedding
+        while len(self._query_embeddings) > self.query_cache_size:
+            self._query_embeddings.popitem(last=False)
+        return embedding
+
+    def _weighted_fusion(
+        self,
+        lexical: List[Tuple[int, float]],
+        vector: List[Tuple[int, float]],
+    ) -> List[Tuple[int, float]]:
+        """Combine min-max normalized scores from both sides."""
+        normalized_lexical = _min_max(dict(lexical))
+        normalized_vector = _min_max(dict(vector))
+        scores: Dict[int, float] = {}
+        for index in set(normalized_lexical) | set(normalized_vector):
+            scores[index] = (
+                self.lexical_weight * normalized_lexical.get(index, 0.0)
+                + (1.0 - self.lexical_weight) * normalized_vector.get(index, 0.0)
+            )
+        return _top(scores, len(scores))
+
+    def _retrieved(
+        self,
+        index: int,
+        score: float,
+        lexical_scores: Dict[int, float],
+        vector_scores: Dict[int, float],
+    ) -> RetrievedDocument:
+        return RetrievedDocument(
+            index=index,
+            document=self.documents[index],
+            score=score,
+            lexical_score=lexical_scores.get(index, 0.0),
+            vector_score=vector_scores.get(index),
+        )
+
+
+def _top(scores: Dict[int, float], count: int) -> List[Tuple[int, float]]:
+    """Highest scoring ``(index, score)`` pairs, ties broken by index."""
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:count]
+
+
+def _min_max(scores: Dict[int, float]) -> Dict[int, float]:
+    if not scores:
+        return {}
+    low, high = min(scores.values()), max(scores.values())
+    if high == low:
+        return {index: 1.0 for index in scores}
+    return {index: (score - low) / (high - low) for index, score in scores.items()}
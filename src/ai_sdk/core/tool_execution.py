@@ -4,11 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import traceback
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from ..errors import AISDKError
+from ..errors import AISDKError, ToolTimeoutError
 from ..providers.types import Message
 from ..tools.core import Tool, ToolCall, ToolResult
+from ..tools.cache import run_tool_cached
+from ..tools.executors import run_tool_function
+from ..tools.limits import run_tool_with_limits
+from ..tools.speculative import SpeculativeToolExecution
 
 
 class ToolExecutionError(AISDKError):
@@ -36,6 +40,7 @@ async def execute_tools(
     messages: List[Message],
     context: Optional[Any] = None,
     abort_signal: Optional[Any] = None,
+    speculation: Optional[SpeculativeToolExecution] = None,
 ) -> List[ToolResult]:
     """Execute a list of tool calls and return their results.
     
@@ -45,11 +50,16 @@ async def execute_tools(
         messages: Current message history
         context: Optional context passed to tools
         abort_signal: Optional abort signal for cancellation
+        speculation: Calls started while the step was streaming (see
+            :func:`speculative_tool_execution`); matching results are reused
+            and the others discarded
         
     Returns:
         List of tool results
     """
     if not tool_calls:
+        if speculation is not None:
+            speculation.cancel()
         return []
     
     # Execute all tool calls in parallel
@@ -73,13 +83,18 @@ async def execute_tools(
                     tools=tools,
                     messages=messages,
                     context=context,
-                    abort_signal=abort_signal
+                    abort_signal=abort_signal,
+                    speculation=speculation,
                 )
             )
             tasks.append(task)
     
     # Wait for all executions to complete
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if speculation is not None:
+            speculation.cancel()
     
     # Convert exceptions to error results
     final_results = []
@@ -112,6 +127,7 @@ async def _execute_single_tool(
     messages: List[Message],
     context: Optional[Any] = None,
     abort_signal: Optional[Any] = None,
+    speculation: Optional[SpeculativeToolExecution] = None,
 ) -> ToolResult:
     """Execute a single tool call."""
     tool = tools.get(tool_call.tool_name)
@@ -137,14 +153,6 @@ async def _execute_single_tool(
         )
     
     try:
-        # Prepare execution context
-        execution_context = {
-            'tool_call_id': tool_call.tool_call_id,
-            'messages': messages,
-            'abort_signal': abort_signal,
-            'context': context,
-        }
-        
         # Call onInputAvailable if the tool has it
         if hasattr(tool, 'on_input_available') and tool.on_input_available:
             await tool.on_input_available(
@@ -155,11 +163,28 @@ async def _execute_single_tool(
                 context=context
             )
         
-        # Execute the tool
-        if asyncio.iscoroutinefunction(tool.execute):
-            output = await tool.execute(tool_call.input, **execution_context)
-        else:
-            output = tool.execute(tool_call.input, **execution_context)
+        # Reuse the result of a call started while the model was streaming
+        metadata: Dict[str, Any] = {}
+        found = False
+        if speculation is not None:
+            found, outcome = await speculation.take(
+                tool_call.tool_call_id, tool_call.tool_name, tool_call.input
+            )
+            if found:
+                output, cache_status = outcome
+                metadata["speculative"] = True
+        if not found:
+            output, cache_status = await _run_tool(
+                tool,
+                tool_call.tool_call_id,
+                tool_call.tool_name,
+                tool_call.input,
+                messages,
+                context,
+                abort_signal,
+            )
+        if cache_status:
+            metadata["cache"] = cache_status
         
         return ToolResult(
             type="result",
@@ -167,13 +192,14 @@ async def _execute_single_tool(
             tool_name=tool_call.tool_name,
             input=tool_call.input,
             output=output,
-            dynamic=tool_call.dynamic
+            dynamic=tool_call.dynamic,
+            metadata=metadata or None,
         )
         
     except Exception as e:
         # Create detailed error information
         error_message = str(e)
-        if hasattr(e, '__traceback__'):
+        if hasattr(e, '__traceback__') and not isinstance(e, ToolTimeoutError):
             error_message += f"\n\nTraceback:\n{''.join(traceback.format_tb(e.__traceback__))}"
         
         return ToolResult(
@@ -186,6 +212,65 @@ async def _execute_single_tool(
         )
 
 
+async def _run_tool(
+    tool: Tool,
+    tool_call_id: str,
+    tool_name: str,
+    input: Any,
+    messages: List[Message],
+    context: Optional[Any],
+    abort_signal: Optional[Any],
+) -> Tuple[Any, Optional[str]]:
+    """Run a tool call within the tool's limits, through its result cache.
+    
+    Returns:
+        The output and the cache outcome (None for tools that are not cached)
+    """
+    execution_context = {
+        'tool_call_id': tool_call_id,
+        'messages': messages,
+        'abort_signal': abort_signal,
+        'context': context,
+    }
+    
+    async def call() -> Any:
+        return await run_tool_function(tool, tool.execute, input, **execution_context)
+    
+    # Idempotent tools reuse cached outputs for the same input
+    return await run_tool_cached(
+        tool,
+        input,
+        lambda: run_tool_with_limits(tool, call, tool_name),
+        tool_name,
+    )
+
+
+def speculative_tool_execution(
+    tools: Dict[str, Tool],
+    messages: List[Message],
+    context: Optional[Any] = None,
+    abort_signal: Optional[Any] = None,
+) -> SpeculativeToolExecution:
+    """Create speculative execution for a streamed step.
+    
+    Feed the step's stream parts to ``observe()`` and pass the result to
+    :func:`execute_tools` as ``speculation``; idempotent tool calls then
+    start as soon as their arguments are complete.
+    
+    Args:
+        tools: Dictionary of available tools
+        messages: Message history the step was generated from
+        context: Optional context passed to tools
+        abort_signal: Optional abort signal for cancellation
+    """
+    async def execute(tool_call_id: str, tool_name: str, input: Any) -> Tuple[Any, Optional[str]]:
+        return await _run_tool(
+            tools[tool_name], tool_call_id, tool_name, input, messages, context, abort_signal
+        )
+    
+    return SpeculativeToolExecution(tools, execute)
+
+
 def parse_tool_calls_from_content(
     content: List[Any],  # List[Content] - avoiding circular import
     tools: Dict[str, Tool],
@@ -12,6 +12,10 @@ from .base import (
     ContentFilterError,
     NoObjectGeneratedError,
     LoadAPIKeyError,
+    SlowConsumerError,
+    StreamResumeError,
+    AbortError,
+    ToolTimeoutError,
 )
 
 # Aliases for compatibility
@@ -32,4 +36,8 @@ __all__ = [
     "ContentFilterError",
     "NoObjectGeneratedError",
     "LoadAPIKeyError",
+    "SlowConsumerError",
+    "StreamResumeError",
+    "AbortError",
+    "ToolTimeoutError",
 ]
\ No newline at end of file
@@ -267,4 +267,91 @@ class LoadAPIKeyError(AISDKError):
             },
         )
         self.environment_variable = environment_variable
-        self.parameter_name = parameter_name
\ No newline at end of file
+        self.parameter_name = parameter_name
+
+class SlowConsumerError(AISDKError):
+    """Error for stream consumers detached for falling behind."""
+    
+    def __init__(
+        self,
+        message: str,
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        """Initialize the slow consumer error.
+        
+        Args:
+            message: Error message
+            buffer_size: Size of the buffer that filled up
+        """
+        super().__init__(message, metadata={"buffer_size": buffer_size})
+        self.buffer_size = buffer_size
+
+
+class StreamResumeError(AISDKError):
+    """Error for streams that cannot be resumed."""
+    
+    def __init__(
+        self,
+        message: str,
+        stream_id: Optional[str] = None,
+        last_event_id: Optional[int] = None,
+    ) -> None:
+        """Initialize the stream resume error.
+        
+        Args:
+            message: Error message
+            stream_id: ID of the stream that was requested
+            last_event_id: Last event ID the client had received
+        """
+        super().__init__(
+            message,
+            metadata={"stream_id": stream_id, "last_event_id": last_event_id},
+        )
+        self.stream_id = stream_id
+        self.last_event_id = last_event_id
+
+
+class AbortError(AISDKError):
+    """Error for operations stopped through an abort signal."""
+    
+    def __init__(
+        self,
+        message: str = "The operation was aborted",
+        reason: Optional[Any] = None,
+    ) -> None:
+        """Initialize the abort error.
+        
+        Args:
+            message: Error message
+            reason: Reason passed to ``AbortController.abort()``
+        """
+        super().__init__(message, metadata={"reason": reason})
+        self.reason = reason
+
+
+class ToolTimeoutError(AISDKError):
+    """Error for tool calls that exceeded their time limits."""
+    
+    def __init__(
+        self,
+        message: str,
+        tool_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+        phase: str = "execution",
+    ) -> None:
+        """Initialize the tool timeout error.
+        
+        Args:
+            message: Error message
+            tool_name: Name of the tool that timed out
+            timeout: Limit that was exceeded, in seconds
+            phase: "queue" if the call waited too long for a free slot,
+                "execution" if the tool ran too long
+        """
+        super().__init__(
+            message,
+            metadata={"tool_name": tool_name, "timeout": timeout, "phase": phase},
+        )
+        self.tool_name = tool_name
+        self.timeout = timeout
+        self.phase = phase
@@ -5,20 +5,30 @@ to make it easier to build AI-powered web applications.
 """
 
 # FastAPI integration (always available)
-from .fastapi import fastapi_ai_middleware, AIFastAPI, streaming_chat_endpoint, websocket_chat_endpoint
+from .fastapi import (
+    fastapi_ai_middleware,
+    AIFastAPI,
+    streaming_chat_endpoint,
+    resumable_streaming_response,
+    abort_on_disconnect,
+    websocket_chat_endpoint,
+)
 
 # Flask integration (always available)
-from .flask import AIFlask, ai_blueprint, streaming_response_wrapper
+from .flask import AIFlask, ai_blueprint, streaming_response_wrapper, resumable_stream_response
 
 __all__ = [
     # FastAPI
     "fastapi_ai_middleware",
     "AIFastAPI",
     "streaming_chat_endpoint",
+    "resumable_streaming_response",
+    "abort_on_disconnect",
     "websocket_chat_endpoint",
     
     # Flask
     "AIFlask", 
     "ai_blueprint",
     "streaming_response_wrapper",
+    "resumable_stream_response",
 ]
\ No newline at end of file
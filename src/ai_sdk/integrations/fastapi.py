@@ -6,7 +6,8 @@ with streaming responses, WebSocket support, and middleware integration.
 
 import json
 import asyncio
-from typing import Any, Dict, List, Optional, AsyncGenerator, Union, Callable
+import inspect
+from typing import Any, AsyncIterator, Dict, List, Optional, AsyncGenerator, Union, Callable
 from contextlib import asynccontextmanager
 
 try:
@@ -30,7 +31,11 @@ from ..providers.base import LanguageModel
 from ..providers.types import Message
 from ..core.generate_text import stream_text, generate_text
 from ..core.generate_object import generate_object, stream_object
+from ..errors import AbortError, InvalidArgumentError, StreamResumeError
 from ..schemas import BaseSchema
+from ..streaming.coalesce import coalesce_deltas
+from ..streaming.resumable import ResumableStreamManager, format_sse, parse_last_event_id
+from ..utils.abort import AbortController
 
 
 class AIFastAPIMiddleware(BaseHTTPMiddleware):
@@ -146,7 +151,8 @@ class AIFastAPI:
         self,
         path: str = "/chat/stream", 
         provider: Optional[LanguageModel] = None,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        coalesce_window_ms: Optional[float] = None,
     ):
         """Decorator to create a streaming chat endpoint.
         
@@ -154,14 +160,24 @@ class AIFastAPI:
             path: API endpoint path
             provider: Language model provider
             system_prompt: Default system prompt
+            coalesce_window_ms: If set, merge text chunks yielded within this
+                window into one SSE frame (see ``coalesce_deltas``)
+            
+        If the decorated function accepts an ``abort_signal`` keyword, it
+        receives a signal that is aborted when the client disconnects; pass it
+        on to ``stream_text`` to stop the generation.
             
         Example:
             @ai_app.streaming_chat_endpoint("/stream")
-            async def stream_chat(model, messages):
-                async for chunk in stream_text(model=model, messages=messages):
+            async def stream_chat(model, messages, abort_signal=None):
+                async for chunk in stream_text(
+                    model=model, messages=messages, abort_signal=abort_signal
+                ):
                     yield chunk.text_delta
         """
         def decorator(func):
+            accepts_signal = "abort_signal" in inspect.signature(func).parameters
+            
             async def wrapper(request: Request):
                 try:
                     data = await request.json()
@@ -178,11 +194,26 @@ class AIFastAPI:
                     
                     # Create streaming generator
                     async def generate():
-                        async for chunk in func(model, messages):
-                            # Format as Server-Sent Events
-                            if chunk:
-                                yield f"data: {json.dumps({'text': chunk})}\n\n"
-                        yield "data: [DONE]\n\n"
+                        async with abort_on_disconnect(request) as controller:
+                            if accepts_signal:
+                                source = func(model, messages, abort_signal=controller.signal)
+                            else:
+                                source = func(model, messages)
+                            chunks = source
+                            if coalesce_window_ms:
+                                chunks = coalesce_deltas(window_ms=coalesce_window_ms)(chunks)
+                            try:
+                                async for chunk in chunks:
+                                    # Format as Server-Sent Events
+                                    if chunk:
+                                        yield f"data: {json.dumps({'text': chunk})}\n\n"
+                                yield "data: [DONE]\n\n"
+                            except AbortError:
+                                # The client disconnected
+                                pass
+                            finally:
+                                # Close the user's generator now, not at garbage collection
+                                await _aclose(chunks, source)
                     
                     return StreamingResponse(
                         generate(),
@@ -283,10 +314,71 @@ def fastapi_ai_middleware(app: FastAPI, default_provider: Optional[LanguageModel
     app.add_middleware(AIFastAPIMiddleware, default_provider=default_provider)
 
 
+@asynccontextmanager
+async def abort_on_disconnect(
+    request: Optional[Request],
+    poll_interval: float = 0.25,
+) -> AsyncIterator[AbortController]:
+    """Abort a controller when the client of ``request`` disconnects.
+    
+    The server only notices a disconnect when it next writes to the socket,
+    which can be long after the client left if the model is slow. This
+    polls the connection instead, so the upstream stream is closed within
+    ``poll_interval`` seconds. The controller is also aborted when the
+    block exits early, e.g. because the response generator was closed.
+    
+    Args:
+        request: Incoming request (None: only abort on early exit)
+        poll_interval: Seconds between connection checks
+        
+    Yields:
+        AbortController to pass to ``stream_text`` as ``abort_signal=controller.signal``
+    
+    Example:
+        ```python
+        async def generate():
+            async with abort_on_disconnect(request) as controller:
+                async for part in stream_text(
+                    model, messages=messages, abort_signal=controller.signal
+                ):
+                    yield part.text_delta or ""
+        ```
+    """
+    controller = AbortController()
+    
+    async def watch() -> None:
+        while not await request.is_disconnected():
+            await asyncio.sleep(poll_interval)
+        controller.abort("client disconnected")
+    
+    watcher = asyncio.ensure_future(watch()) if request is not None else None
+    completed = False
+    try:
+        yield controller
+        completed = True
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        if not completed:
+            controller.abort("response closed")
+
+
+async def _aclose(*streams: Any) -> None:
+    """Close async generators, outermost first."""
+    closed = set()
+    for stream in streams:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None and id(stream) not in closed:
+            closed.add(id(stream))
+            await aclose()
+
+
 async def streaming_chat_endpoint(
     messages: List[Message],
     model: LanguageModel,
-    system_prompt: Optional[str] = None
+    system_prompt: Optional[str] = None,
+    coalesce_window_ms: Optional[float] = None,
+    request: Optional[Request] = None,
 ) -> StreamingResponse:
     """Create a streaming response for chat messages.
     
@@ -294,6 +386,10 @@ async def streaming_chat_endpoint(
         messages: List of chat messages
         model: Language model to use
         system_prompt: Optional system prompt
+        coalesce_window_ms: If set, merge text deltas arriving within this
+            window into one SSE frame (see ``coalesce_deltas``)
+        request: Incoming request; if given, the generation is aborted and
+            the provider connection closed when the client disconnects
         
     Returns:
         StreamingResponse with Server-Sent Events
@@ -306,13 +402,25 @@ async def streaming_chat_endpoint(
         messages.insert(0, {"role": "system", "content": system_prompt})
     
     async def generate():
-        try:
-            async for chunk in stream_text(model=model, messages=messages):
-                if chunk.text_delta:
-                    yield f"data: {json.dumps({'text': chunk.text_delta})}\n\n"
-            yield "data: [DONE]\n\n"
-        except Exception as e:
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        async with abort_on_disconnect(request) as controller:
+            source = stream_text(
+                model=model, messages=messages, abort_signal=controller.signal, fast_parts=True
+            )
+            parts = source
+            if coalesce_window_ms:
+                parts = coalesce_deltas(window_ms=coalesce_window_ms)(parts)
+            try:
+                async for chunk in parts:
+                    if chunk.text_delta:
+                        yield f"data: {json.dumps({'text': chunk.text_delta})}\n\n"
+                yield "data: [DONE]\n\n"
+            except AbortError:
+                # The client is gone, there is nobody to report to
+                pass
+            except Exception as e:
+                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            finally:
+                await _aclose(parts, source)
     
     return StreamingResponse(
         generate(),
@@ -324,6 +432,58 @@ async def streaming_chat_endpoint(
     )
 
 
+async def resumable_streaming_response(
+    request: Request,
+    manager: ResumableStreamManager,
+    stream_id: str,
+    source_factory: Optional[Callable[[], AsyncIterator[Any]]] = None,
+    encode: Optional[Callable[[Any], str]] = None,
+) -> StreamingResponse:
+    """Create a streaming response that clients can resume with Last-Event-ID.
+    
+    The first request for ``stream_id`` starts the generation from
+    ``source_factory``; it keeps running if the client disconnects. A request
+    with a ``Last-Event-ID`` header receives the events after that id, then
+    the live ones.
+    
+    Args:
+        request: Incoming request
+        manager: Manager holding the resumable streams
+        stream_id: Stream to serve (e.g. the chat id)
+        source_factory: Function starting the generation (e.g. a ``stream_text``
+            call); without it, only existing streams can be served
+        encode: Function turning a part into the SSE data payload (default: JSON)
+        
+    Returns:
+        StreamingResponse with Server-Sent Events carrying event ids
+        
+    Raises:
+        HTTPException: 400 for an invalid Last-Event-ID, 404 for an unknown
+            or expired stream
+    """
+    if not FASTAPI_AVAILABLE:
+        raise ImportError("FastAPI is required for resumable_streaming_response")
+    
+    try:
+        last_event_id = parse_last_event_id(request.headers.get("last-event-id"))
+        stream = await manager.open(
+            stream_id, last_event_id=last_event_id, source_factory=source_factory
+        )
+    except InvalidArgumentError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except StreamResumeError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    
+    return StreamingResponse(
+        format_sse(stream.events(last_event_id), encode),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        }
+    )
+
+
 async def websocket_chat_endpoint(
     websocket: WebSocket,
     model: LanguageModel,
@@ -340,7 +500,7 @@ async def websocket_chat_endpoint(
         raise ImportError("FastAPI is required for websocket_chat_endpoint")
     
     try:
-        async for chunk in stream_text(model=model, messages=messages):
+        async for chunk in stream_text(model=model, messages=messages, fast_parts=True):
             if chunk.text_delta:
                 await websocket.send_json({
                     "type": "text_delta",
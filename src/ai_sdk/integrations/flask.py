@@ -6,7 +6,9 @@ with streaming responses and blueprint integration.
 
 import json
 import asyncio
-from typing import Any, Dict, List, Optional, Generator, Union, Callable
+import inspect
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Generator, Union, Callable
 from functools import wraps
 
 try:
@@ -28,7 +30,11 @@ from ..providers.base import LanguageModel
 from ..providers.types import Message
 from ..core.generate_text import stream_text, generate_text
 from ..core.generate_object import generate_object, stream_object
+from ..errors import InvalidArgumentError, StreamResumeError
 from ..schemas import BaseSchema
+from ..streaming.coalesce import coalesce_deltas
+from ..streaming.resumable import ResumableStreamManager, format_sse, parse_last_event_id
+from ..utils.abort import AbortController
 
 
 class AIFlask:
@@ -276,11 +282,25 @@ def ai_blueprint(
     return bp
 
 
-def streaming_response_wrapper(generator: Union[Generator, Callable]) -> Response:
+def streaming_response_wrapper(
+    generator: Union[Generator, Callable],
+    coalesce_window_ms: Optional[float] = None,
+    abort_controller: Optional[AbortController] = None,
+) -> Response:
     """Wrap an async generator for Flask streaming response.
     
+    When the client disconnects, the WSGI server closes the response and the
+    async generator is closed right away, which closes the provider's HTTP
+    response.
+    
     Args:
         generator: Async generator or callable that returns one
+        coalesce_window_ms: If set, merge text chunks from an async generator
+            yielded within this window into one SSE frame (see
+            ``coalesce_deltas``)
+        abort_controller: Controller aborted when the response is closed
+            before the generator finished, e.g. the one whose signal was
+            passed to ``stream_text``
         
     Returns:
         Flask streaming response
@@ -297,19 +317,34 @@ def streaming_response_wrapper(generator: Union[Generator, Callable]) -> Respons
     
     def sync_generator():
         """Convert async generator to sync for Flask."""
-        if asyncio.iscoroutinefunction(generator):
-            # If generator is a coroutine function, run it
+        if (
+            asyncio.iscoroutinefunction(generator)
+            or inspect.isasyncgenfunction(generator)
+            or inspect.isasyncgen(generator)
+        ):
+            # Drive the async generator on a private event loop
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
+            async_gen = None
+            finished = False
             try:
-                async_gen = generator()
+                async_gen = generator if inspect.isasyncgen(generator) else generator()
+                if coalesce_window_ms:
+                    async_gen = coalesce_deltas(window_ms=coalesce_window_ms)(async_gen)
                 while True:
                     try:
                         chunk = loop.run_until_complete(async_gen.__anext__())
                         yield f"data: {json.dumps({'text': chunk})}\n\n"
                     except StopAsyncIteration:
+                        finished = True
                         break
             finally:
+                if not finished and abort_controller is not None:
+                    abort_controller.abort("response closed")
+                # Close the upstream stream now rather than at garbage collection
+                if async_gen is not None:
+                    loop.run_until_complete(async_gen.aclose())
+                loop.run_until_complete(loop.shutdown_asyncgens())
                 loop.close()
         else:
             # Assume it's already a sync generator
@@ -331,6 +366,96 @@ def streaming_response_wrapper(generator: Union[Generator, Callable]) -> Respons
     )
 
 
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop in a daemon thread, shared by resumable stream responses.
+    
+    Flask handlers are synchronous, so generations that must outlive a
+    request run on this loop instead of a per-request one.
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="ai-sdk-resumable-streams", daemon=True
+            )
+            thread.start()
+            _background_loop = loop
+        return _background_loop
+
+
+def resumable_stream_response(
+    manager: ResumableStreamManager,
+    stream_id: str,
+    source_factory: Optional[Callable[[], AsyncIterator[Any]]] = None,
+    encode: Optional[Callable[[Any], str]] = None,
+) -> Response:
+    """Create a streaming response that clients can resume with Last-Event-ID.
+    
+    The generation runs on a shared background event loop, so it keeps
+    running when the client disconnects and a later request with a
+    ``Last-Event-ID`` header continues after that event. Use one manager
+    only with this function.
+    
+    Args:
+        manager: Manager holding the resumable streams
+        stream_id: Stream to serve (e.g. the chat id)
+        source_factory: Function starting the generation; without it, only
+            existing streams can be served
+        encode: Function turning a part into the SSE data payload (default: JSON)
+        
+    Returns:
+        Flask streaming response, or an error response (400 for an invalid
+        Last-Event-ID, 404 for an unknown or expired stream)
+    """
+    if not FLASK_AVAILABLE:
+        raise ImportError("Flask is required for resumable_stream_response")
+    
+    loop = _get_background_loop()
+    try:
+        last_event_id = parse_last_event_id(request.headers.get("Last-Event-ID"))
+        stream = asyncio.run_coroutine_threadsafe(
+            manager.open(stream_id, last_event_id=last_event_id, source_factory=source_factory),
+            loop,
+        ).result()
+    except InvalidArgumentError as e:
+        return jsonify({"error": str(e)}), 400
+    except StreamResumeError as e:
+        return jsonify({"error": str(e)}), 404
+    
+    frames = format_sse(stream.events(last_event_id), encode)
+    
+    async def next_frame():
+        return await frames.__anext__()
+    
+    async def close_frames():
+        await frames.aclose()
+    
+    def sync_generator():
+        try:
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(next_frame(), loop).result()
+                except StopAsyncIteration:
+                    break
+        finally:
+            # Only this reader stops; the generation keeps running
+            asyncio.run_coroutine_threadsafe(close_frames(), loop)
+    
+    return Response(
+        sync_generator(),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        }
+    )
+
+
 def async_route(func: Callable) -> Callable:
     """Decorator to handle async functions in Flask routes.
     
@@ -19,7 +19,17 @@ from typing import Optional, Dict, Any, Union, List
 from datetime import datetime, timedelta
 
 from ..providers.base import LanguageModel
-from ..providers.types import Content, TextContent, ReasoningContent
+from ..providers.stream_parts import FastReasoningDelta, FastTextDelta
+from ..providers.types import (
+    Content,
+    ProviderMetadata,
+    ReasoningContent,
+    ReasoningEnd,
+    ReasoningStart,
+    TextContent,
+    Usage,
+)
+from ..utils.stream_timing import StreamTimer
 from ..utils.text_utils import get_potential_start_index
 from .types import GenerateTextParams, GenerateTextResult, StreamTextResult
 from .base import SimpleMiddleware, LanguageModelMiddleware
@@ -276,6 +286,12 @@ def telemetry_middleware(
     request counts, token usage, timing, and error rates. Data can be
     sent to external monitoring systems via the callback function.
     
+    Streams are reported when they end. With ``track_timing``, the data
+    includes time to first byte and first token, an inter-token latency
+    histogram, tokens per second and the total duration (see
+    :class:`~ai_sdk.utils.stream_timing.StreamTimer`); the same metrics are
+    added to the finish part as ``provider_metadata.data["stream_timing"]``.
+    
     Args:
         track_requests: Whether to track request counts
         track_tokens: Whether to track token usage
@@ -357,8 +373,17 @@ def telemetry_middleware(
             
             raise
     
+    async def report_stream(telemetry_data, label):
+        if callback:
+            try:
+                await callback(telemetry_data) if asyncio.iscoroutinefunction(callback) else callback(telemetry_data)
+            except Exception as e:
+                logger.warning(f"Failed to send {label.lower()} data: {e}")
+        else:
+            logger.info(f"{label}: {telemetry_data}")
+    
     async def wrap_stream(*, do_stream, params, model):
-        start_time = time.time() if track_timing else None
+        timer = StreamTimer() if track_timing else None
         
         telemetry_data = {
             "provider": model.provider,
@@ -366,41 +391,58 @@ def telemetry_middleware(
             "operation": "stream",
             "timestamp": datetime.utcnow().isoformat(),
         }
+        if track_requests:
+            telemetry_data["request_count"] = 1
         
         try:
             result = await do_stream()
-            
-            telemetry_data["status"] = "success"
-            
-            if track_timing and start_time:
-                telemetry_data["duration_ms"] = int((time.time() - start_time) * 1000)
-            
-            if track_requests:
-                telemetry_data["request_count"] = 1
-            
-            if callback:
-                try:
-                    await callback(telemetry_data) if asyncio.iscoroutinefunction(callback) else callback(telemetry_data)
-                except Exception as e:
-                    logger.warning(f"Failed to send stream telemetry data: {e}")
-            else:
-                logger.info(f"Stream Telemetry: {telemetry_data}")
-            
-            return result
-            
         except Exception as e:
             telemetry_data["status"] = "error"
             telemetry_data["error"] = str(e)
-            
-            if callback:
-                try:
-                    await callback(telemetry_data) if asyncio.iscoroutinefunction(callback) else callback(telemetry_data)
-                except Exception as cb_e:
-                    logger.warning(f"Failed to send stream error telemetry: {cb_e}")
-            else:
-                logger.info(f"Stream Error Telemetry: {telemetry_data}")
-            
+            if timer:
+                telemetry_data.update(timer.metrics())
+            await report_stream(telemetry_data, "Stream Error Telemetry")
             raise
+        
+        # do_stream() returns before the first token; measure while the
+        # stream is consumed and report when it ends
+        async def instrumented(stream):
+            usage = None
+            try:
+                async for part in stream:
+                    if timer:
+                        timer.observe(part)
+                    if _stream_part_type(part) == "finish":
+                        usage = _stream_part_usage(part)
+                        if timer:
+                            part = _with_stream_timing(
+                                part, timer.metrics(usage.completion_tokens if usage else None)
+                            )
+                    yield part
+                telemetry_data["status"] = "success"
+            except (asyncio.CancelledError, GeneratorExit):
+                telemetry_data["status"] = "aborted"
+                raise
+            except Exception as e:
+                telemetry_data["status"] = "error"
+                telemetry_data["error"] = str(e)
+                raise
+            finally:
+                if timer:
+                    timer.finish()
+                    telemetry_data.update(
+                        timer.metrics(usage.completion_tokens if usage else None)
+                    )
+                if track_tokens and usage:
+                    telemetry_data["input_tokens"] = usage.prompt_tokens
+                    telemetry_data["output_tokens"] = usage.completion_tokens
+                    telemetry_data["total_tokens"] = usage.total_tokens
+                await report_stream(telemetry_data, "Stream Telemetry")
+        
+        if isinstance(result, StreamTextResult):
+            result.stream = instrumented(result.stream)
+            return result
+        return instrumented(result)
     
     middleware = SimpleMiddleware()
     middleware.wrapGenerate = wrap_generate
@@ -408,6 +450,31 @@ def telemetry_middleware(
     return middleware
 
 
+def _stream_part_type(part: Any) -> Optional[str]:
+    if isinstance(part, dict):
+        return part.get("type")
+    return getattr(part, "type", None)
+
+
+def _stream_part_usage(part: Any) -> Optional[Usage]:
+    usage = part.get("usage") if isinstance(part, dict) else getattr(part, "usage", None)
+    if isinstance(usage, dict):
+        usage = Usage(**usage)
+    return usage
+
+
+def _with_stream_timing(part: Any, metrics: Dict[str, Any]) -> Any:
+    """Return a finish part with stream timing added to its provider metadata."""
+    if isinstance(part, dict):
+        metadata = dict(part.get("provider_metadata") or {})
+        metadata["stream_timing"] = metrics
+        return {**part, "provider_metadata": metadata}
+    existing = part.provider_metadata.data if part.provider_metadata else {}
+    return part.model_copy(
+        update={"provider_metadata": ProviderMetadata(data={**existing, "stream_timing": metrics})}
+    )
+
+
 def extract_reasoning_middleware(
     tag_name: str,
     separator: str = "\n",
@@ -419,6 +486,11 @@ def extract_reasoning_middleware(
     from the generated text and exposes them as separate reasoning content parts.
     This is useful for models that include their reasoning process in the response.
     
+    When streaming, text deltas are split into text deltas and
+    reasoning-start/-delta/-end parts as they arrive. Only a trailing piece
+    of a delta that could be the start of a tag is held back until the
+    next delta, so text without tags streams with no added latency.
+    
     Args:
         tag_name: The XML tag name to extract reasoning from (e.g., "thinking")
         separator: Separator to use between reasoning and text sections
@@ -498,15 +570,148 @@ def extract_reasoning_middleware(
         result.content = transformed_content
         return result
     
-    # Note: Stream processing for reasoning extraction would be complex
-    # due to the need to handle partial tags across stream chunks.
-    # For now, we only support generate mode.
+    async def wrap_stream(*, do_stream, params, model):
+        result = await do_stream()
+        
+        async def extract(stream):
+            splitter = _ReasoningSplitter(
+                opening_tag, closing_tag, separator, start_with_reasoning
+            )
+            async for part in stream:
+                if _stream_part_type(part) != "text-delta":
+                    # Text ended; release a held-back partial tag first
+                    for out in splitter.flush():
+                        yield out
+                    yield part
+                    continue
+                for out in splitter.feed(part):
+                    yield out
+            for out in splitter.flush():
+                yield out
+        
+        if isinstance(result, StreamTextResult):
+            result.stream = extract(result.stream)
+            return result
+        return extract(result)
     
     middleware = SimpleMiddleware()
     middleware.wrapGenerate = wrap_generate
+    middleware.wrapStream = wrap_stream
     return middleware
 
 
+class _ReasoningSplitter:
+    """Splits streamed text deltas into text and reasoning parts.
+    
+    Only a suffix that could be the start of the next tag is held back;
+    everything before it is emitted with the delta that completed it.
+    """
+    
+    def __init__(
+        self,
+        opening_tag: str,
+        closing_tag: str,
+        separator: str,
+        start_with_reasoning: bool,
+    ) -> None:
+        self.opening_tag = opening_tag
+        self.closing_tag = closing_tag
+        self.separator = separator
+        self.is_reasoning = start_with_reasoning
+        self.buffer = ""
+        self.after_switch = False
+        self.first_text = True
+        self.first_reasoning = True
+        self.reasoning_id: Optional[str] = None
+        self.reasoning_count = 0
+        # Last text delta; output parts are built in the same form (dict,
+        # fast part or model)
+        self.template: Any = None
+    
+    def feed(self, part: Any) -> List[Any]:
+        """Process a text delta part."""
+        out: List[Any] = []
+        self.template = part
+        self.buffer += _text_delta_of(part)
+        while True:
+            tag = self.closing_tag if self.is_reasoning else self.opening_tag
+            index = get_potential_start_index(self.buffer, tag)
+            if index is None:
+                self._publish(self.buffer, out)
+                self.buffer = ""
+                break
+            self._publish(self.buffer[:index], out)
+            end = index + len(tag)
+            if end > len(self.buffer):
+                # Possibly a partial tag: wait for the next delta
+                self.buffer = self.buffer[index:]
+                break
+            self.buffer = self.buffer[end:]
+            if self.is_reasoning:
+                self._end_reasoning(out)
+            self.is_reasoning = not self.is_reasoning
+            self.after_switch = True
+        return out
+    
+    def flush(self) -> List[Any]:
+        """Emit held-back text and close an open reasoning section."""
+        out: List[Any] = []
+        if self.buffer:
+            self._publish(self.buffer, out)
+            self.buffer = ""
+        self._end_reasoning(out)
+        return out
+    
+    def _publish(self, text: str, out: List[Any]) -> None:
+        if not text:
+            return
+        first = self.first_reasoning if self.is_reasoning else self.first_text
+        prefix = self.separator if self.after_switch and not first else ""
+        self.after_switch = False
+        if self.is_reasoning:
+            self.first_reasoning = False
+            if self.reasoning_id is None:
+                self.reasoning_count += 1
+                self.reasoning_id = f"reasoning-{self.reasoning_count}"
+                out.append(self._part("reasoning-start", ReasoningStart, id=self.reasoning_id))
+            out.append(self._part(
+                "reasoning-delta", FastReasoningDelta, id=self.reasoning_id, delta=prefix + text
+            ))
+        else:
+            self.first_text = False
+            out.append(_text_delta_like(self.template, prefix + text))
+    
+    def _end_reasoning(self, out: List[Any]) -> None:
+        if self.reasoning_id is not None:
+            out.append(self._part("reasoning-end", ReasoningEnd, id=self.reasoning_id))
+            self.reasoning_id = None
+    
+    def _part(self, part_type: str, part_class: type, **fields: Any) -> Any:
+        if isinstance(self.template, dict):
+            return {"type": part_type, **fields}
+        return part_class(**fields)
+
+
+def _text_delta_of(part: Any) -> str:
+    if isinstance(part, dict):
+        return part.get("text_delta") or part.get("delta") or ""
+    return getattr(part, "text_delta", None) or getattr(part, "delta", None) or ""
+
+
+def _text_delta_like(part: Any, text: str) -> Any:
+    """Return a text delta of the same kind as ``part`` with new text."""
+    if _text_delta_of(part) == text:
+        return part
+    if isinstance(part, dict):
+        field = "text_delta" if "text_delta" in part else "delta"
+        return {**part, field: text}
+    if isinstance(part, FastTextDelta):
+        return FastTextDelta(text, part.id)
+    if hasattr(part, "model_copy"):
+        return part.model_copy(update={"text_delta": text})
+    return FastTextDelta(text)
+
+
 def simulate_streaming_middleware() -> LanguageModelMiddleware:
     """Create a middleware that simulates streaming from a generate call.
     
@@ -8,6 +8,7 @@ from .base import (
     ImageModel,
     SpeechModel,
     TranscriptionModel,
+    RerankingModel,
 )
 from .types import (
     GenerateOptions,
@@ -60,6 +61,7 @@ __all__ = [
     "ImageModel",
     "SpeechModel",
     "TranscriptionModel",
+    "RerankingModel",
     "GenerateOptions",
     "StreamOptions",
     "GenerateResult",
@@ -18,6 +18,7 @@ from ...core.types import (
 )
 from ...providers.base import BaseLanguageModel
 from ...providers.types import ProviderSettings
+from ...providers.stream_parts import FastTextDelta
 from ...errors.base import AISDKError, APIError
 from ...utils.http import make_request, stream_request
 from ...utils.json import safe_json_parse
@@ -289,7 +290,7 @@ class AnthropicLanguageModel(BaseLanguageModel):
     
     def _convert_chunk_to_stream_part(
         self, chunk_data: Dict[str, Any]
-    ) -> Optional[TextStreamPart]:
+    ) -> Optional[Union[TextStreamPart, FastTextDelta]]:
         """
         Convert Anthropic API chunk to TextStreamPart.
         
@@ -304,10 +305,7 @@ class AnthropicLanguageModel(BaseLanguageModel):
         if chunk_type == "content_block_delta":
             delta = chunk_data.get("delta", {})
             if delta.get("type") == "text_delta":
-                return TextStreamPart(
-                    type="text-delta",
-                    text_delta=delta.get("text", ""),
-                )
+                return FastTextDelta(delta.get("text", ""))
         
         elif chunk_type == "message_start":
             message = chunk_data.get("message", {})
@@ -10,6 +10,7 @@ from ...errors import APIError, NetworkError
 from ...utils.http import create_http_client
 from ...utils.json import secure_json_parse
 from ..openai.language_model import OpenAIChatLanguageModel
+from ..stream_parts import FastTextDelta
 from ..types import StreamPart
 
 
@@ -127,8 +128,7 @@ class AzureOpenAIChatLanguageModel(OpenAIChatLanguageModel):
                                         delta = choice["delta"]
                                         
                                         if "content" in delta and delta["content"]:
-                                            from ..types import TextDelta
-                                            yield TextDelta(text=delta["content"])
+                                            yield FastTextDelta(delta["content"])
                                         
                                         # Handle finish reason
                                         if choice.get("finish_reason"):
@@ -97,9 +97,11 @@ class LanguageModel(ABC):
         pass
     
     @abstractmethod
-    async def stream(self, options: StreamOptions) -> AsyncGenerator[StreamPart, None]:
+    def stream(self, options: StreamOptions) -> AsyncGenerator[StreamPart, None]:
         """Generate text (streaming).
         
+        Implementations are async generators (``async def`` with ``yield``).
+        
         Args:
             options: Streaming options
             
@@ -467,6 +469,68 @@ class TranscriptionModel(ABC):
         pass
 
 
+class RerankingModel(ABC):
+    """Base class for document reranking models."""
+    
+    def __init__(
+        self,
+        provider: Provider,
+        model_id: str,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the reranking model.
+        
+        Args:
+            provider: Provider instance
+            model_id: Model identifier
+            **kwargs: Model-specific configuration
+        """
+        self.provider = provider
+        self.model_id = model_id
+        self.config = kwargs
+        
+        # Model capabilities (can be overridden by subclasses)
+        self.max_documents_per_call: int = 1000
+    
+    @property
+    def specification_version(self) -> str:
+        """Reranking model interface version."""
+        return "v1"
+    
+    @property
+    def provider_name(self) -> str:
+        """Name of the provider."""
+        return self.provider.name
+    
+    @abstractmethod
+    async def do_rerank(
+        self,
+        *,
+        query: str,
+        documents: List[str],
+        top_n: Optional[int] = None,
+        provider_options: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Score documents by relevance to a query.
+        
+        Args:
+            query: Search query
+            documents: Documents to score
+            top_n: Only return the best ``top_n`` documents
+            provider_options: Provider-specific options
+            headers: Additional HTTP headers
+            
+        Returns:
+            Dictionary containing:
+            - ranking: List of {"index": int, "relevance_score": float}
+              sorted by descending relevance, indices into ``documents``
+            - usage: Optional provider usage information
+            - response: Optional raw response data
+        """
+        pass
+
+
 # Aliases for backwards compatibility
 BaseProvider = Provider
 BaseLanguageModel = LanguageModel
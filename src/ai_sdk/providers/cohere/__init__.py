@@ -8,9 +8,11 @@ Supports advanced features like tool calling, document-aware chat, and search in
 from .provider import CohereProvider, create_cohere_provider, cohere_provider
 from .language_model import CohereLanguageModel
 from .embedding_model import CohereEmbeddingModel
+from .reranking_model import CohereRerankingModel
 from .types import (
     CohereChatModelId,
     CohereEmbeddingModelId, 
+    CohereRerankingModelId,
     CohereProviderSettings,
     CohereDocument,
     CohereTool,
@@ -32,10 +34,12 @@ __all__ = [
     # Model classes
     "CohereLanguageModel",
     "CohereEmbeddingModel",
+    "CohereRerankingModel",
     
     # Types
     "CohereChatModelId",
     "CohereEmbeddingModelId",
+    "CohereRerankingModelId",
     "CohereProviderSettings", 
     "CohereDocument",
     "CohereTool",
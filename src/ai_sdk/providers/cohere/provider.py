@@ -5,9 +5,10 @@ Cohere Provider implementation.
 from typing import Any, Dict
 from ai_sdk.core.types import Provider, LanguageModel, EmbeddingModel
 from ai_sdk.errors.base import AISDKError
-from .types import CohereChatModelId, CohereEmbeddingModelId, CohereProviderSettings
+from .types import CohereChatModelId, CohereEmbeddingModelId, CohereRerankingModelId, CohereProviderSettings
 from .language_model import CohereLanguageModel
 from .embedding_model import CohereEmbeddingModel
+from .reranking_model import CohereRerankingModel
 
 
 class CohereProvider(Provider):
@@ -76,6 +77,23 @@ class CohereProvider(Provider):
         """
         return CohereEmbeddingModel(model_id, self.settings)
     
+    def reranking_model(self, model_id: CohereRerankingModelId) -> CohereRerankingModel:
+        """
+        Create a Cohere rerank model for scoring documents against a query.
+        
+        Args:
+            model_id: The Cohere rerank model identifier (e.g., "rerank-v3.5")
+            
+        Returns:
+            CohereRerankingModel instance
+            
+        Example:
+            >>> provider = CohereProvider()
+            >>> model = provider.reranking_model("rerank-v3.5")
+            >>> result = await rerank(model, "query", ["doc one", "doc two"])
+        """
+        return CohereRerankingModel(model_id, self.settings)
+    
     def __call__(self, model_id: CohereChatModelId) -> LanguageModel:
         """
         Convenient method to create a language model.
@@ -182,7 +200,8 @@ class CohereProvider(Provider):
                 "json_mode",
                 "document_chat",
                 "citations",
-                "search_results"
+                "search_results",
+                "reranking"
             ],
             "supported_modalities": {
                 "input": ["text"],
@@ -0,0 +1,103 @@
+"""
+Cohere Reranking Model implementation.
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+from ai_sdk.providers.base import RerankingModel
+from ai_sdk.utils.http import make_request
+from ai_sdk.errors.base import AISDKError
+from .types import CohereRerankingModelId, CohereProviderSettings
+
+
+class CohereRerankingModel(RerankingModel):
+    """
+    Cohere rerank model implementation.
+    
+    Scores documents against a query with Cohere's Rerank models.
+    """
+    
+    def __init__(
+        self,
+        model_id: CohereRerankingModelId,
+        settings: CohereProviderSettings,
+    ):
+        self.model_id = model_id
+        self.settings = settings
+        self.config: Dict[str, Any] = {}
+        self._provider = "cohere"
+        
+        # Cohere recommends at most 1000 documents per request
+        self.max_documents_per_call = 1000
+    
+    @property
+    def provider(self) -> str:
+        return self._provider
+    
+    @property
+    def provider_name(self) -> str:
+        return self._provider
+    
+    async def do_rerank(
+        self,
+        *,
+        query: str,
+        documents: List[str],
+        top_n: Optional[int] = None,
+        provider_options: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Rerank documents using Cohere's rerank API."""
+        
+        request: Dict[str, Any] = {
+            "model": self.model_id,
+            "query": query,
+            "documents": documents,
+        }
+        if top_n is not None:
+            request["top_n"] = top_n
+        
+        cohere_options = (provider_options or {}).get("cohere", {})
+        if "max_tokens_per_doc" in cohere_options:
+            request["max_tokens_per_doc"] = cohere_options["max_tokens_per_doc"]
+        
+        request_headers = self._get_headers()
+        if headers:
+            request_headers.update(headers)
+        
+        response_data = await make_request(
+            url=f"{self.settings.base_url}/rerank",
+            method="POST",
+            headers=request_headers,
+            json_data=request,
+        )
+        
+        ranking = [
+            {"index": result["index"], "relevance_score": result["relevance_score"]}
+            for result in response_data.get("results", [])
+        ]
+        billed_units = response_data.get("meta", {}).get("billed_units", {})
+        
+        return {
+            "ranking": ranking,
+            "usage": {"search_units": billed_units.get("search_units", 0)},
+            "response": {"id": response_data.get("id"), "body": response_data},
+        }
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """Get headers for Cohere API requests."""
+        api_key = self.settings.api_key or os.getenv("COHERE_API_KEY")
+        if not api_key:
+            raise AISDKError("Cohere API key is required. Set COHERE_API_KEY environment variable or provide api_key in settings.")
+        
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "ai-sdk-python/1.0"
+        }
+        
+        if self.settings.headers:
+            headers.update(self.settings.headers)
+            
+        return headers
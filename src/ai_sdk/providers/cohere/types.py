@@ -38,6 +38,16 @@ CohereEmbeddingModelId = Union[
     str,  # Allow custom model IDs
 ]
 
+# Cohere Rerank Model IDs
+CohereRerankingModelId = Union[
+    Literal[
+        "rerank-v3.5",
+        "rerank-english-v3.0",
+        "rerank-multilingual-v3.0",
+    ],
+    str,  # Allow custom model IDs
+]
+
 
 class CohereProviderSettings(BaseModel):
     """Configuration settings for Cohere provider."""
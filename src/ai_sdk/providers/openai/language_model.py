@@ -8,9 +8,11 @@ from typing import Any, AsyncGenerator, Dict, List, Optional
 import httpx
 
 from ...errors import APIError, InvalidResponseError, NetworkError
+from ...tools.definitions import serialize_tool_definitions
 from ...utils.http import create_http_client
 from ...utils.json import secure_json_parse
 from ..base import LanguageModel, Provider
+from ..stream_parts import FastTextDelta
 from ..types import (
     Content,
     FinishReason,
@@ -21,7 +23,7 @@ from ..types import (
     StreamOptions,
     StreamPart,
     TextContent,
-    TextDelta,
+    ToolDefinition,
     Usage,
 )
 from .reasoning_models import (
@@ -147,17 +149,9 @@ class OpenAIChatLanguageModel(LanguageModel):
         
         # Handle tools if provided
         if options.tools:
-            request_body["tools"] = [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.parameters,
-                    },
-                }
-                for tool in options.tools
-            ]
+            request_body["tools"] = serialize_tool_definitions(
+                options.tools, "openai", _openai_tool
+            )
             if options.tool_choice:
                 request_body["tool_choice"] = options.tool_choice
         
@@ -326,7 +320,7 @@ class OpenAIChatLanguageModel(LanguageModel):
         
         # Handle text delta
         if "content" in delta and delta["content"]:
-            return TextDelta(text_delta=delta["content"])
+            return FastTextDelta(delta["content"])
         
         # Handle finish
         if choice.get("finish_reason"):
@@ -367,4 +361,15 @@ class OpenAIChatLanguageModel(LanguageModel):
                 }) if "model" in chunk_data else None
             )
         
-        return None
\ No newline at end of file
+        return None
+
+
+def _openai_tool(tool: ToolDefinition) -> Dict[str, Any]:
+    return {
+        "type": "function",
+        "function": {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.parameters,
+        },
+    }
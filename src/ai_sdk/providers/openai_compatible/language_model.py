@@ -12,6 +12,8 @@ from ..base import LanguageModel
 from ...core.generate_text import GenerateTextResult
 from ...core.step import Step, StepResult
 from ...streaming.base import StreamingTextResult, TextStreamChunk
+from ...tools.definitions import serialize_tool_definitions
+from ..stream_parts import FastTextDelta, FastToolCallDelta
 from ...utils.http import make_request
 from .types import OpenAICompatibleConfig, OpenAICompatibleChatModelId
 from .errors import as_openai_compatible_error
@@ -88,17 +90,9 @@ class OpenAICompatibleChatLanguageModel(LanguageModel):
         
         # Add tools if present
         if step.tools:
-            tools = []
-            for tool in step.tools:
-                tools.append({
-                    "type": "function",
-                    "function": {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.parameters
-                    }
-                })
-            body["tools"] = tools
+            body["tools"] = serialize_tool_definitions(
+                step.tools, "openai-compatible", _function_tool
+            )
             
         return body
     
@@ -170,10 +164,7 @@ class OpenAICompatibleChatLanguageModel(LanguageModel):
                     delta = choice.get("delta", {})
                     
                     if delta.get("content"):
-                        yield TextStreamChunk(
-                            type="text-delta",
-                            text_delta=delta["content"]
-                        )
+                        yield FastTextDelta(delta["content"])
                     
                     if choice.get("finish_reason"):
                         yield TextStreamChunk(
@@ -192,10 +183,9 @@ class OpenAICompatibleChatLanguageModel(LanguageModel):
                                 )
                             
                             if tool_call.get("function", {}).get("arguments"):
-                                yield TextStreamChunk(
-                                    type="tool-call-delta",
+                                yield FastToolCallDelta(
                                     tool_call_id=tool_call["id"],
-                                    arguments_delta=tool_call["function"]["arguments"]
+                                    args_delta=tool_call["function"]["arguments"],
                                 )
             
         except Exception as error:
@@ -352,10 +342,7 @@ class OpenAICompatibleCompletionLanguageModel(LanguageModel):
                     choice = chunk_data["choices"][0]
                     
                     if choice.get("text"):
-                        yield TextStreamChunk(
-                            type="text-delta",
-                            text_delta=choice["text"]
-                        )
+                        yield FastTextDelta(choice["text"])
                     
                     if choice.get("finish_reason"):
                         yield TextStreamChunk(
@@ -400,4 +387,15 @@ class OpenAICompatibleCompletionLanguageModel(LanguageModel):
                     "text": "",
                     "finish_reason": choice.get("finish_reason", "stop")
                 }]
-            }
\ No newline at end of file
+            }
+
+
+def _function_tool(tool: Any) -> Dict[str, Any]:
+    return {
+        "type": "function",
+        "function": {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.parameters
+        }
+    }
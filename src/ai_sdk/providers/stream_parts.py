@@ -0,0 +1,124 @@
+"""Lightweight stream parts for the per-token hot path.
+
+Streaming providers and transforms emit one part per token. Building and
+validating a Pydantic model for each of them is measurable CPU at high
+concurrency, so the per-token parts (text, tool call argument and reasoning
+deltas) are also available as plain slotted objects. They carry the same
+``type`` tags and attribute names as their Pydantic counterparts in
+:mod:`ai_sdk.providers.types`, so consumers reading ``part.type`` and
+``part.text_delta`` work with either, and convert to the Pydantic model
+only where one is needed (``to_model()`` or :func:`to_stream_part_model`).
+
+Public streams convert back: ``stream_text()`` and ``Agent.stream()`` yield
+the Pydantic models, and ``stream_text(..., fast_parts=True)`` passes the fast
+parts through for consumers that only read ``part.type`` and the fields.
+Note that ``isinstance(part, TextDelta)`` is False for a
+:class:`FastTextDelta`; check ``part.type`` instead.
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, ClassVar, Dict, Optional, Tuple, Type
+
+from .types import ReasoningDelta, StreamPart, TextDelta, ToolCallDelta
+
+
+class FastStreamPart:
+    """Base class for slotted stream parts."""
+
+    __slots__: ClassVar[Tuple[str, ...]] = ()
+
+    type: ClassVar[str]
+    model_class: ClassVar[Type[StreamPart]]
+
+    def to_model(self) -> StreamPart:
+        """Convert to the equivalent Pydantic stream part."""
+        return self.model_class(**self._fields())
+
+    def model_dump(self, *, exclude_none: bool = False, **kwargs: Any) -> Dict[str, Any]:
+        """Return the part as a dict, like ``BaseModel.model_dump``."""
+        data = {"type": self.type, **self._fields()}
+        if exclude_none:
+            data = {key: value for key, value in data.items() if value is not None}
+        return data
+
+    def _fields(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FastStreamPart):
+            return self.type == other.type and self._fields() == other._fields()
+        if isinstance(other, StreamPart):
+            return self.to_model() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._fields().items())
+        return f"{type(self).__name__}({fields})"
+
+
+class FastTextDelta(FastStreamPart):
+    """Text delta (fast counterpart of :class:`~ai_sdk.providers.types.TextDelta`)."""
+
+    __slots__ = ("text_delta", "id")
+
+    type = "text-delta"
+    model_class = TextDelta
+
+    def __init__(self, text_delta: str, id: Optional[str] = None) -> None:
+        self.text_delta = text_delta
+        self.id = id
+
+    def to_model(self) -> TextDelta:
+        return TextDelta(text_delta=self.text_delta)
+
+
+class FastToolCallDelta(FastStreamPart):
+    """Tool call argument delta (fast counterpart of ``ToolCallDelta``)."""
+
+    __slots__ = ("tool_call_id", "tool_name", "args_delta")
+
+    type = "tool-call-delta"
+    model_class = ToolCallDelta
+
+    def __init__(
+        self,
+        tool_call_id: str,
+        tool_name: Optional[str] = None,
+        args_delta: Optional[str] = None,
+    ) -> None:
+        self.tool_call_id = tool_call_id
+        self.tool_name = tool_name
+        self.args_delta = args_delta
+
+
+class FastReasoningDelta(FastStreamPart):
+    """Reasoning delta (fast counterpart of ``ReasoningDelta``)."""
+
+    __slots__ = ("id", "delta")
+
+    type = "reasoning-delta"
+    model_class = ReasoningDelta
+
+    def __init__(self, id: str, delta: str) -> None:
+        self.id = id
+        self.delta = delta
+
+
+def to_stream_part_model(part: Any) -> Any:
+    """Convert a fast stream part to its Pydantic model; other parts pass through."""
+    if isinstance(part, FastStreamPart):
+        return part.to_model()
+    return part
+
+
+async def to_stream_part_models(stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """Convert every fast part in a stream to its Pydantic model.
+
+    Use at API boundaries that require Pydantic instances (e.g. ``isinstance``
+    checks or schema-driven serialization).
+    """
+    async for part in stream:
+        yield to_stream_part_model(part)
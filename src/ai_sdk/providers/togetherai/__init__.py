@@ -10,11 +10,13 @@ on top of the OpenAICompatibleProvider for maximum compatibility.
 
 from .provider import TogetherAIProvider, create_together
 from .image_model import TogetherAIImageModel
+from .reranking_model import TogetherAIRerankingModel
 from .types import (
     TogetherAIChatModelId,
     TogetherAICompletionModelId,
     TogetherAIEmbeddingModelId,
     TogetherAIImageModelId,
+    TogetherAIRerankingModelId,
     TogetherAIProviderSettings
 )
 
@@ -22,9 +24,11 @@ __all__ = [
     "TogetherAIProvider",
     "create_together",
     "TogetherAIImageModel",
+    "TogetherAIRerankingModel",
     "TogetherAIChatModelId",
     "TogetherAICompletionModelId", 
     "TogetherAIEmbeddingModelId",
     "TogetherAIImageModelId",
+    "TogetherAIRerankingModelId",
     "TogetherAIProviderSettings"
 ]
\ No newline at end of file
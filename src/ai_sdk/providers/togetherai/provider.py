@@ -12,11 +12,13 @@ from typing import Optional, Dict, Any
 from ..base import BaseProvider
 from ..openai_compatible import create_openai_compatible, OpenAICompatibleProviderSettings
 from .image_model import TogetherAIImageModel
+from .reranking_model import TogetherAIRerankingModel
 from .types import (
     TogetherAIChatModelId,
     TogetherAICompletionModelId,
     TogetherAIEmbeddingModelId,
     TogetherAIImageModelId,
+    TogetherAIRerankingModelId,
     TogetherAIProviderSettings
 )
 
@@ -135,6 +137,26 @@ class TogetherAIProvider(BaseProvider):
         
         return TogetherAIImageModel(model_id, config)
     
+    def reranking_model(self, model_id: TogetherAIRerankingModelId, **kwargs):
+        """
+        Create a reranking model instance.
+        
+        Args:
+            model_id: Together AI rerank model identifier (e.g. "Salesforce/Llama-Rank-V1")
+            **kwargs: Additional model configuration
+            
+        Returns:
+            Reranking model instance
+        """
+        config = {
+            'provider': 'togetherai.rerank',
+            'base_url': self.settings.base_url or "https://api.together.xyz/v1",
+            'headers': self._get_headers,
+            **kwargs,
+        }
+        
+        return TogetherAIRerankingModel(model_id, config)
+    
     def _get_api_key(self) -> Optional[str]:
         """Get API key from settings or environment"""
         return (
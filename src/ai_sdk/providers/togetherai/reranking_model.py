@@ -0,0 +1,85 @@
+"""
+TogetherAI Reranking Model implementation
+"""
+
+from typing import Dict, Any, List, Optional
+
+from ..base import RerankingModel
+from ...utils.http import make_request
+from .types import TogetherAIRerankingModelId
+
+
+class TogetherAIRerankingModel(RerankingModel):
+    """TogetherAI rerank model (e.g. Salesforce/Llama-Rank-V1)."""
+    
+    def __init__(self, model_id: TogetherAIRerankingModelId, config: Dict[str, Any]):
+        self.model_id = model_id
+        self.config = config
+        self.max_documents_per_call = config.get('max_documents_per_call', 1000)
+    
+    @property
+    def provider(self) -> str:
+        return self.config.get('provider', 'togetherai.rerank')
+    
+    @property
+    def provider_name(self) -> str:
+        return self.provider
+    
+    def _get_base_url(self) -> str:
+        """Get the base URL for API calls."""
+        return self.config.get('base_url', 'https://api.together.xyz/v1').rstrip('/')
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """Get headers for API calls."""
+        headers = {
+            'Content-Type': 'application/json',
+        }
+        
+        if 'headers' in self.config and callable(self.config['headers']):
+            headers.update(self.config['headers']())
+        elif 'headers' in self.config and isinstance(self.config['headers'], dict):
+            headers.update(self.config['headers'])
+        
+        return headers
+    
+    async def do_rerank(
+        self,
+        *,
+        query: str,
+        documents: List[str],
+        top_n: Optional[int] = None,
+        provider_options: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Rerank documents using TogetherAI's rerank API."""
+        body: Dict[str, Any] = {
+            'model': self.model_id,
+            'query': query,
+            'documents': documents,
+            'return_documents': False,
+        }
+        if top_n is not None:
+            body['top_n'] = top_n
+        body.update((provider_options or {}).get('togetherai', {}))
+        
+        request_headers = self._get_headers()
+        if headers:
+            request_headers.update(headers)
+        
+        response_data = await make_request(
+            url=f"{self._get_base_url()}/rerank",
+            method="POST",
+            headers=request_headers,
+            json_data=body,
+        )
+        
+        ranking = [
+            {'index': result['index'], 'relevance_score': result['relevance_score']}
+            for result in response_data.get('results', [])
+        ]
+        
+        return {
+            'ranking': ranking,
+            'usage': response_data.get('usage') or {},
+            'response': {'id': response_data.get('id'), 'body': response_data},
+        }
@@ -11,6 +11,7 @@ TogetherAIChatModelId: TypeAlias = str
 TogetherAICompletionModelId: TypeAlias = str
 TogetherAIEmbeddingModelId: TypeAlias = str
 TogetherAIImageModelId: TypeAlias = str
+TogetherAIRerankingModelId: TypeAlias = str
 
 # Popular Together AI model IDs
 TOGETHER_CHAT_MODELS = {
@@ -113,6 +113,7 @@ class ToolDefinition(BaseModel):
     name: str
     description: str
     parameters: Dict[str, Any]  # JSON schema for parameters
+    fingerprint: Optional[str] = None  # Hash of the definition, for reusing serialized forms
     
 
 class GenerateOptions(BaseModel):
@@ -152,6 +153,9 @@ class GenerateResult(BaseModel):
 class StreamPart(BaseModel):
     """A part of a streaming response."""
     
+    # Generic parts (e.g. from the gateway) carry type-specific fields
+    model_config = {"extra": "allow"}
+    
     type: str
     
 
@@ -203,6 +207,32 @@ class FinishPart(StreamPart):
     provider_metadata: Optional[ProviderMetadata] = None
 
 
+class StepStartPart(StreamPart):
+    """Start of an agent step in streaming response."""
+
+    type: Literal["step-start"] = "step-start"
+    step_number: int
+
+
+class StepFinishPart(StreamPart):
+    """End of an agent step's generation in streaming response."""
+
+    type: Literal["step-finish"] = "step-finish"
+    step_number: int
+    finish_reason: FinishReason
+    usage: Usage
+
+
+class ToolResultStreamPart(StreamPart):
+    """Result of a tool call executed by an agent in streaming response."""
+
+    type: Literal["tool-result"] = "tool-result"
+    tool_call_id: Optional[str] = None
+    tool_name: str
+    result: Any
+    is_error: bool = False
+
+
 class StreamResult(BaseModel):
     """Result from streaming text generation."""
     
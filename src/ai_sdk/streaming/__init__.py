@@ -1,12 +1,49 @@
 """Streaming utilities for AI SDK Python."""
 
-from .smooth_stream import smooth_stream, ChunkDetector
+from .smooth_stream import (
+    smooth_stream,
+    ChunkDetector,
+    word_chunker,
+    sentence_chunker,
+    character_chunker,
+)
+from .coalesce import coalesce_deltas
+from .broadcast import (
+    StreamBroadcast,
+    BroadcastConsumer,
+    SlowConsumerPolicy,
+    tee_stream,
+)
+from .resumable import (
+    ResumableStreamManager,
+    ResumableStream,
+    ResumableStreamStore,
+    InMemoryStreamStore,
+    StreamEvent,
+    format_sse,
+    parse_last_event_id,
+)
 from .stream import Stream, AsyncStream, create_stream, create_async_stream
 from .base import BaseStream, BaseAsyncStream, StreamableValue, StreamingTextResult, TextStreamChunk
 
 __all__ = [
     "smooth_stream",
     "ChunkDetector",
+    "word_chunker",
+    "sentence_chunker",
+    "character_chunker",
+    "coalesce_deltas",
+    "StreamBroadcast",
+    "BroadcastConsumer",
+    "SlowConsumerPolicy",
+    "tee_stream",
+    "ResumableStreamManager",
+    "ResumableStream",
+    "ResumableStreamStore",
+    "InMemoryStreamStore",
+    "StreamEvent",
+    "format_sse",
+    "parse_last_event_id",
     "Stream",
     "AsyncStream", 
     "create_stream",
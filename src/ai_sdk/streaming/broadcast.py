@@ -0,0 +1,280 @@
+"""Fan-out of one stream to several consumers.
+
+``stream_text`` and friends return single-consumer async iterators. A
+:class:`StreamBroadcast` reads the source once and delivers every part to
+each subscribed consumer through its own bounded buffer. Parts are not
+copied: all consumers receive the same objects, so they must treat them as
+read-only.
+
+When a consumer's buffer is full, its slow-consumer policy decides what
+happens to the next part:
+
+- ``"block"``: wait until the consumer catches up (backpressure on the source)
+- ``"drop"``: skip the part for that consumer and count it in ``dropped``
+- ``"detach"``: unsubscribe the consumer; it raises
+  :class:`SlowConsumerError` once its buffer is drained
+
+Example:
+    ```python
+    client, log, cache = tee_stream(stream_text(model, prompt="Hi"), 3)
+    # or, with per-consumer policies:
+    broadcast = StreamBroadcast(stream_text(model, prompt="Hi"))
+    client = broadcast.subscribe()                        # block
+    log = broadcast.subscribe(policy="drop", buffer_size=256)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Deque, Generic, List, Literal, Optional, TypeVar
+
+from ..errors import InvalidArgumentError, SlowConsumerError
+
+T = TypeVar("T")
+
+SlowConsumerPolicy = Literal["block", "drop", "detach"]
+
+_POLICIES = ("block", "drop", "detach")
+
+
+class BroadcastConsumer(Generic[T]):
+    """One consumer of a :class:`StreamBroadcast` (an async iterator)."""
+
+    def __init__(
+        self,
+        broadcast: "StreamBroadcast[T]",
+        buffer_size: int,
+        policy: SlowConsumerPolicy,
+        name: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.buffer_size = buffer_size
+        self.policy = policy
+        self.dropped = 0
+        self.detached = False
+
+        self._broadcast = broadcast
+        self._items: Deque[T] = deque()
+        self._getter: Optional[asyncio.Future] = None
+        self._putter: Optional[asyncio.Future] = None
+        self._closed = False
+
+    def __aiter__(self) -> "BroadcastConsumer[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        while True:
+            if self._items:
+                item = self._items.popleft()
+                _wake(self._putter)
+                return item
+            if self.detached:
+                raise SlowConsumerError(
+                    f"Consumer {self.name or id(self)} was detached after its buffer "
+                    f"of {self.buffer_size} parts filled up",
+                    buffer_size=self.buffer_size,
+                )
+            if self._closed or self._broadcast._finished:
+                error = self._broadcast._error
+                if error is not None and not self._closed:
+                    raise error
+                raise StopAsyncIteration
+
+            self._broadcast._ensure_started()
+            self._getter = asyncio.get_running_loop().create_future()
+            try:
+                await self._getter
+            finally:
+                self._getter = None
+
+    async def aclose(self) -> None:
+        """Stop consuming; remaining buffered parts are discarded."""
+        if self._closed:
+            return
+        self._closed = True
+        self._items.clear()
+        _wake(self._putter)
+        _wake(self._getter)
+        await self._broadcast._unsubscribe(self)
+
+    async def _offer(self, item: T) -> None:
+        """Deliver a part, applying the slow-consumer policy when full."""
+        while len(self._items) >= self.buffer_size and not self._closed:
+            if self.policy == "drop":
+                self.dropped += 1
+                return
+            if self.policy == "detach":
+                self.detached = True
+                self._broadcast._consumers.remove(self)
+                _wake(self._getter)
+                return
+            self._putter = asyncio.get_running_loop().create_future()
+            try:
+                await self._putter
+            finally:
+                self._putter = None
+        if self._closed:
+            return
+        self._items.append(item)
+        _wake(self._getter)
+
+
+class StreamBroadcast(Generic[T]):
+    """Read an async iterator once and fan its parts out to many consumers.
+
+    Reading from the source starts when any consumer first awaits a part, so
+    subscribe all consumers before iterating. Consumers subscribed later only
+    receive parts from that point on.
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterator[T],
+        *,
+        buffer_size: int = 64,
+        policy: SlowConsumerPolicy = "block",
+    ) -> None:
+        """Initialize the broadcast.
+
+        Args:
+            source: The stream to fan out
+            buffer_size: Default per-consumer buffer size (in parts)
+            policy: Default slow-consumer policy ("block", "drop" or "detach")
+        """
+        _validate(buffer_size, policy)
+        self.buffer_size = buffer_size
+        self.policy = policy
+
+        self._source = source
+        self._consumers: List[BroadcastConsumer[T]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._finished = False
+        self._error: Optional[BaseException] = None
+
+    @property
+    def consumers(self) -> List[BroadcastConsumer[T]]:
+        """Currently subscribed consumers."""
+        return list(self._consumers)
+
+    def subscribe(
+        self,
+        *,
+        buffer_size: Optional[int] = None,
+        policy: Optional[SlowConsumerPolicy] = None,
+        name: Optional[str] = None,
+    ) -> BroadcastConsumer[T]:
+        """Add a consumer.
+
+        Args:
+            buffer_size: Buffer size for this consumer (default: broadcast default)
+            policy: Slow-consumer policy for this consumer
+            name: Optional name used in error messages
+
+        Returns:
+            An async iterator over the source's parts
+        """
+        buffer_size = self.buffer_size if buffer_size is None else buffer_size
+        policy = policy or self.policy
+        _validate(buffer_size, policy)
+        consumer = BroadcastConsumer(self, buffer_size, policy, name)
+        if self._finished:
+            consumer._closed = True
+        else:
+            self._consumers.append(consumer)
+        return consumer
+
+    async def aclose(self) -> None:
+        """Stop reading the source and end all consumers."""
+        for consumer in list(self._consumers):
+            await consumer.aclose()
+        await self._stop()
+
+    def _ensure_started(self) -> None:
+        if self._task is None and not self._finished:
+            self._task = asyncio.ensure_future(self._pump())
+
+    async def _pump(self) -> None:
+        try:
+            async for item in self._source:
+                for consumer in list(self._consumers):
+                    await consumer._offer(item)
+                if not self._consumers:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._error = e
+        finally:
+            self._finished = True
+            for consumer in self._consumers:
+                _wake(consumer._getter)
+            await _close_source(self._source)
+
+    async def _unsubscribe(self, consumer: BroadcastConsumer[T]) -> None:
+        if consumer in self._consumers:
+            self._consumers.remove(consumer)
+        if not self._consumers and self._task is not None:
+            await self._stop()
+
+    async def _stop(self) -> None:
+        task = self._task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if task is None:
+            self._finished = True
+            await _close_source(self._source)
+
+
+def tee_stream(
+    source: AsyncIterator[T],
+    n: int = 2,
+    *,
+    buffer_size: int = 64,
+    policy: SlowConsumerPolicy = "block",
+) -> List[BroadcastConsumer[T]]:
+    """Split one stream into ``n`` independent consumers.
+
+    Args:
+        source: The stream to split
+        n: Number of consumers
+        buffer_size: Per-consumer buffer size (in parts)
+        policy: Slow-consumer policy ("block", "drop" or "detach")
+
+    Returns:
+        ``n`` async iterators that each receive every part
+    """
+    if n < 1:
+        raise InvalidArgumentError("n must be at least 1", argument="n", value=n)
+    broadcast = StreamBroadcast(source, buffer_size=buffer_size, policy=policy)
+    return [broadcast.subscribe() for _ in range(n)]
+
+
+def _wake(future: Optional[asyncio.Future]) -> None:
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
+def _validate(buffer_size: int, policy: str) -> None:
+    if buffer_size < 1:
+        raise InvalidArgumentError(
+            "buffer_size must be at least 1", argument="buffer_size", value=buffer_size
+        )
+    if policy not in _POLICIES:
+        raise InvalidArgumentError(
+            f"Unknown slow-consumer policy: {policy}", argument="policy", value=policy
+        )
+
+
+async def _close_source(source: AsyncIterator) -> None:
+    aclose = getattr(source, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
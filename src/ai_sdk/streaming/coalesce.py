@@ -0,0 +1,262 @@
+"""Coalescing of small stream deltas before encoding.
+
+Fast providers emit hundreds of tiny deltas per second, and each one becomes
+its own SSE frame, ``json.dumps`` call and socket write downstream.
+:func:`coalesce_deltas` merges adjacent deltas of the same kind into one part.
+
+Merging works like a throttle. A delta that arrives after a quiet period is
+passed through at once, so first-token latency does not change. Deltas that
+follow within ``window_ms`` are collected and emitted together when the
+window closes, or earlier once ``max_chars`` characters are collected. Parts
+are never reordered: a part of another kind or id ends the merged delta, and
+no part is held back by more than about ``window_ms``.
+
+Example:
+    ```python
+    coalesce = coalesce_deltas(window_ms=20)
+    async for part in coalesce(stream_text(model, prompt="Hi")):
+        ...
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, List, Optional, Tuple
+
+from ..errors import InvalidArgumentError
+
+# Mergeable part types: type -> (attributes holding the delta text, attribute
+# identifying the part a delta belongs to). Both stream parts and UI message
+# chunks are covered.
+_DELTA_FIELDS = {
+    "text-delta": (("text_delta", "delta"), "id"),
+    "reasoning-delta": (("delta",), "id"),
+    "tool-call-delta": (("args_delta",), "tool_call_id"),
+    "tool-input-delta": (("input_text_delta", "inputTextDelta"), "tool_call_id"),
+}
+
+
+def coalesce_deltas(
+    *,
+    window_ms: float = 20.0,
+    max_chars: int = 2048,
+) -> Callable[[AsyncIterator[Any]], AsyncIterator[Any]]:
+    """Create a transform that merges adjacent deltas.
+
+    Text, reasoning and tool call argument deltas (stream parts or UI message
+    chunks) are merged when they belong to the same part. Plain strings, as
+    yielded by text generators, are concatenated. All other parts pass
+    through unchanged and in order.
+
+    Args:
+        window_ms: Maximum time a delta may be held back to merge it with
+            later ones. 0 disables merging.
+        max_chars: Emit the merged delta once it holds this many characters
+
+    Returns:
+        A function that transforms an async stream
+
+    Raises:
+        InvalidArgumentError: If window_ms is negative or max_chars is below 1
+    """
+    if window_ms < 0:
+        raise InvalidArgumentError(
+            "window_ms must not be negative", argument="window_ms", value=window_ms
+        )
+    if max_chars < 1:
+        raise InvalidArgumentError(
+            "max_chars must be at least 1", argument="max_chars", value=max_chars
+        )
+    window = window_ms / 1000
+
+    async def transform(stream: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        if window == 0:
+            async for part in stream:
+                yield part
+            return
+
+        reader = _Reader(stream)
+        merged: Optional[_MergedDelta] = None
+        last_emit = float("-inf")
+
+        try:
+            while True:
+                if reader.items:
+                    # Drain everything that arrived while we were waiting
+                    items = reader.items
+                    while items:
+                        part = items.popleft()
+                        key = _delta_key(part)
+                        if merged is not None and key != merged.key:
+                            yield merged.build()
+                            merged = None
+                            last_emit = time.monotonic()
+
+                        if key is None:
+                            yield part
+                            continue
+                        if merged is None:
+                            now = time.monotonic()
+                            if now - last_emit >= window:
+                                # Leading edge: nothing was sent recently, send at once
+                                yield part
+                                last_emit = now
+                                continue
+                            merged = _MergedDelta(part, key)
+                        else:
+                            merged.add(part)
+                        if merged.size >= max_chars:
+                            yield merged.build()
+                            merged = None
+                            last_emit = time.monotonic()
+                    reader.resume()
+                elif reader.finished:
+                    break
+
+                if merged is None:
+                    if not reader.items and not reader.finished:
+                        await reader.wait(None, notify_items=True)
+                    continue
+                if reader.finished:
+                    continue
+                timeout = last_emit + window - time.monotonic()
+                if timeout > 0:
+                    # New deltas only join the merged one, no need to wake for them
+                    await reader.wait(timeout, notify_items=False)
+                if time.monotonic() - last_emit >= window and not reader.items:
+                    yield merged.build()
+                    merged = None
+                    last_emit = time.monotonic()
+
+            if merged is not None:
+                yield merged.build()
+            if reader.error is not None:
+                raise reader.error
+        finally:
+            await reader.aclose()
+
+    return transform
+
+
+class _Reader:
+    """Reads the source in a task so merged deltas can be flushed on time."""
+
+    # Parts read ahead before waiting for the consumer to drain them
+    HIGH_WATER = 256
+
+    def __init__(self, stream: AsyncIterator[Any]) -> None:
+        self.items: Deque[Any] = deque()
+        self.finished = False
+        self.error: Optional[BaseException] = None
+        self._stream = stream
+        self._waiter: Optional[asyncio.Future] = None
+        self._space: Optional[asyncio.Future] = None
+        self._notify_items = True
+        self._task = asyncio.ensure_future(self._read())
+
+    async def wait(self, timeout: Optional[float], *, notify_items: bool) -> None:
+        """Wait for the end of the source, a full buffer or the timeout.
+
+        With ``notify_items``, any new part also ends the wait.
+        """
+        self._notify_items = notify_items
+        self._waiter = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait({self._waiter}, timeout=timeout)
+        finally:
+            self._waiter = None
+
+    def resume(self) -> None:
+        """Let the reader continue after the consumer drained the items."""
+        _wake(self._space)
+
+    async def aclose(self) -> None:
+        if not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _read(self) -> None:
+        try:
+            async for part in self._stream:
+                self.items.append(part)
+                if self._notify_items:
+                    _wake(self._waiter)
+                if len(self.items) >= self.HIGH_WATER:
+                    _wake(self._waiter)
+                    self._space = asyncio.get_running_loop().create_future()
+                    try:
+                        await self._space
+                    finally:
+                        self._space = None
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished = True
+            _wake(self._waiter)
+
+
+def _wake(future: Optional[asyncio.Future]) -> None:
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
+class _MergedDelta:
+    """Deltas of one part collected for merging."""
+
+    __slots__ = ("key", "size", "_first", "_field", "_pieces")
+
+    def __init__(self, part: Any, key: Tuple[Any, ...]) -> None:
+        self.key = key
+        self._first = part
+        self._field = _text_field(part)
+        text = _delta_text(part, self._field)
+        self._pieces: List[str] = [text]
+        self.size = len(text)
+
+    def add(self, part: Any) -> None:
+        text = _delta_text(part, self._field)
+        self._pieces.append(text)
+        self.size += len(text)
+
+    def build(self) -> Any:
+        """Return the first part with the merged text."""
+        if len(self._pieces) == 1:
+            return self._first
+        text = "".join(self._pieces)
+        if self._field is None:
+            return text
+        if hasattr(self._first, "model_copy"):
+            return self._first.model_copy(update={self._field: text})
+        part = copy.copy(self._first)
+        setattr(part, self._field, text)
+        return part
+
+
+def _delta_key(part: Any) -> Optional[Tuple[Any, ...]]:
+    """Key shared by deltas that can be merged, or None for other parts."""
+    if isinstance(part, str):
+        return ("str",)
+    fields = _DELTA_FIELDS.get(getattr(part, "type", None))
+    if fields is None or _text_field(part) is None:
+        return None
+    return (part.type, type(part), getattr(part, fields[1], None))
+
+
+def _text_field(part: Any) -> Optional[str]:
+    if isinstance(part, str):
+        return None
+    for name in _DELTA_FIELDS[part.type][0]:
+        if isinstance(getattr(part, name, None), str):
+            return name
+    return None
+
+
+def _delta_text(part: Any, field: Optional[str]) -> str:
+    return part if field is None else getattr(part, field)
@@ -0,0 +1,360 @@
+"""Resumable streams with Last-Event-ID replay.
+
+A client that loses its connection mid-generation would otherwise have to
+start the whole generation again. A :class:`ResumableStreamManager` runs
+each generation in a background task, independent of any connection, and
+numbers its parts with increasing event ids. The parts go into a bounded
+per-stream replay buffer. A reconnecting client sends the last id it
+received (the SSE ``Last-Event-ID`` header) and gets the parts it missed,
+then the live parts as they arrive. Buffers expire ``ttl`` seconds after the
+generation completes.
+
+Buffers are kept by a :class:`ResumableStreamStore`. The default
+:class:`InMemoryStreamStore` keeps them in process; implement the interface
+to keep them in an external store.
+
+Example:
+    ```python
+    manager = ResumableStreamManager()
+
+    async def chat(chat_id, last_event_id=None):
+        stream = await manager.open(
+            chat_id,
+            last_event_id=last_event_id,
+            source_factory=lambda: stream_text(model, prompt="Hi"),
+        )
+        async for frame in format_sse(stream.events(last_event_id)):
+            yield frame
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+from ..errors import InvalidArgumentError, StreamResumeError
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """A stream part with its event id."""
+
+    id: int
+    data: Any
+
+
+class ResumableStreamStore(ABC):
+    """Storage for the replay buffers of resumable streams.
+
+    Event ids of a stream are consecutive integers starting at 1. A store may
+    evict old events to bound its size.
+    """
+
+    @abstractmethod
+    async def append(self, stream_id: str, event: StreamEvent) -> None:
+        """Add an event to a stream's buffer, creating the buffer if needed."""
+        pass
+
+    @abstractmethod
+    async def read(self, stream_id: str, after: int) -> List[StreamEvent]:
+        """Return the buffered events of a stream with ids above ``after``.
+
+        Args:
+            stream_id: Stream to read
+            after: Last event id the reader already has
+
+        Returns:
+            Events in id order (empty if the stream is unknown or expired)
+        """
+        pass
+
+    @abstractmethod
+    async def complete(self, stream_id: str, ttl: float) -> None:
+        """Mark a stream as completed; its buffer expires after ``ttl`` seconds."""
+        pass
+
+    @abstractmethod
+    async def delete(self, stream_id: str) -> None:
+        """Remove a stream's buffer."""
+        pass
+
+
+class InMemoryStreamStore(ResumableStreamStore):
+    """Replay buffers kept in process memory."""
+
+    def __init__(self, max_events: int = 1000):
+        """Initialize the store.
+
+        Args:
+            max_events: Events kept per stream; older events are evicted
+        """
+        if max_events < 1:
+            raise InvalidArgumentError(
+                "max_events must be at least 1", argument="max_events", value=max_events
+            )
+        self.max_events = max_events
+        self._buffers: Dict[str, Deque[StreamEvent]] = {}
+        self._expires_at: Dict[str, float] = {}
+
+    async def append(self, stream_id: str, event: StreamEvent) -> None:
+        self._expire()
+        buffer = self._buffers.get(stream_id)
+        if buffer is None:
+            buffer = self._buffers[stream_id] = deque(maxlen=self.max_events)
+        buffer.append(event)
+
+    async def read(self, stream_id: str, after: int) -> List[StreamEvent]:
+        self._expire()
+        buffer = self._buffers.get(stream_id)
+        if not buffer:
+            return []
+        # Ids are consecutive, so the first wanted event is found by offset
+        start = max(0, after + 1 - buffer[0].id)
+        if start == 0:
+            return list(buffer)
+        if start >= len(buffer):
+            return []
+        return [buffer[i] for i in range(start, len(buffer))]
+
+    async def complete(self, stream_id: str, ttl: float) -> None:
+        if stream_id in self._buffers:
+            self._expires_at[stream_id] = time.monotonic() + ttl
+
+    async def delete(self, stream_id: str) -> None:
+        self._buffers.pop(stream_id, None)
+        self._expires_at.pop(stream_id, None)
+
+    def _expire(self) -> None:
+        if not self._expires_at:
+            return
+        now = time.monotonic()
+        for stream_id in [s for s, at in self._expires_at.items() if at <= now]:
+            self._buffers.pop(stream_id, None)
+            del self._expires_at[stream_id]
+
+
+class ResumableStream:
+    """A generation running in the background, readable from any event id."""
+
+    def __init__(
+        self,
+        stream_id: str,
+        source: AsyncIterator[Any],
+        store: ResumableStreamStore,
+        ttl: float,
+        on_expire: Optional[Callable[[str], None]] = None,
+    ):
+        self.id = stream_id
+        self.last_event_id = 0
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+        self._source = source
+        self._store = store
+        self._ttl = ttl
+        self._on_expire = on_expire
+        self._changed: Optional[asyncio.Future] = None
+        self._task = asyncio.ensure_future(self._run())
+
+    async def events(self, last_event_id: Optional[int] = None) -> AsyncIterator[StreamEvent]:
+        """Iterate over the events after ``last_event_id``, then the live ones.
+
+        Args:
+            last_event_id: Last event id the client received (None: from the start)
+
+        Yields:
+            StreamEvent objects in id order
+
+        Raises:
+            StreamResumeError: If events after ``last_event_id`` were evicted
+        """
+        after = last_event_id or 0
+        if after > self.last_event_id and not self.done:
+            raise StreamResumeError(
+                f"Event {after} of stream {self.id} has not been sent yet",
+                stream_id=self.id,
+                last_event_id=last_event_id,
+            )
+        while True:
+            if after < self.last_event_id:
+                events = await self._store.read(self.id, after)
+                if not events or events[0].id != after + 1:
+                    raise StreamResumeError(
+                        f"Events after {after} of stream {self.id} are no longer buffered",
+                        stream_id=self.id,
+                        last_event_id=last_event_id,
+                    )
+                for event in events:
+                    yield event
+                after = events[-1].id
+                continue
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            if self._changed is None or self._changed.done():
+                self._changed = asyncio.get_running_loop().create_future()
+            await asyncio.shield(self._changed)
+
+    async def cancel(self) -> None:
+        """Stop the generation."""
+        if not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        try:
+            async for item in self._source:
+                event = StreamEvent(self.last_event_id + 1, item)
+                await self._store.append(self.id, event)
+                self.last_event_id = event.id
+                self._notify()
+        except asyncio.CancelledError:
+            self.error = StreamResumeError(
+                f"Stream {self.id} was cancelled", stream_id=self.id
+            )
+            raise
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._notify()
+            await self._store.complete(self.id, self._ttl)
+            if self._on_expire is not None:
+                asyncio.get_running_loop().call_later(self._ttl, self._on_expire, self.id)
+
+    def _notify(self) -> None:
+        changed = self._changed
+        if changed is not None and not changed.done():
+            changed.set_result(None)
+
+
+class ResumableStreamManager:
+    """Starts resumable streams and looks them up for reconnecting clients."""
+
+    def __init__(
+        self,
+        store: Optional[ResumableStreamStore] = None,
+        *,
+        ttl: float = 300.0,
+    ):
+        """Initialize the manager.
+
+        Args:
+            store: Replay buffer storage (default: InMemoryStreamStore())
+            ttl: Seconds a completed stream stays resumable
+        """
+        if ttl < 0:
+            raise InvalidArgumentError("ttl must not be negative", argument="ttl", value=ttl)
+        self.store = store or InMemoryStreamStore()
+        self.ttl = ttl
+        self._streams: Dict[str, ResumableStream] = {}
+
+    def start(self, stream_id: str, source: AsyncIterator[Any]) -> ResumableStream:
+        """Start reading ``source`` in the background as stream ``stream_id``.
+
+        Raises:
+            InvalidArgumentError: If a stream with this id is still resumable
+        """
+        if stream_id in self._streams:
+            raise InvalidArgumentError(
+                f"Stream {stream_id} already exists", argument="stream_id", value=stream_id
+            )
+        stream = ResumableStream(stream_id, source, self.store, self.ttl, self._expire)
+        self._streams[stream_id] = stream
+        return stream
+
+    def get(self, stream_id: str) -> Optional[ResumableStream]:
+        """Return a stream that is running or still resumable."""
+        return self._streams.get(stream_id)
+
+    async def open(
+        self,
+        stream_id: str,
+        *,
+        last_event_id: Optional[int] = None,
+        source_factory: Optional[Callable[[], AsyncIterator[Any]]] = None,
+    ) -> ResumableStream:
+        """Return the stream to serve a request, starting it if needed.
+
+        A request with ``last_event_id`` resumes an existing stream. Without
+        it, an existing stream is replayed from the start, or a new one is
+        started from ``source_factory``.
+
+        Raises:
+            StreamResumeError: If the stream is unknown and cannot be started
+        """
+        stream = self._streams.get(stream_id)
+        if stream is not None:
+            return stream
+        if last_event_id is not None or source_factory is None:
+            raise StreamResumeError(
+                f"Stream {stream_id} does not exist or has expired",
+                stream_id=stream_id,
+                last_event_id=last_event_id,
+            )
+        return self.start(stream_id, source_factory())
+
+    async def close(self) -> None:
+        """Cancel all running streams and drop their buffers."""
+        for stream in list(self._streams.values()):
+            await stream.cancel()
+            await self.store.delete(stream.id)
+        self._streams.clear()
+
+    def _expire(self, stream_id: str) -> None:
+        self._streams.pop(stream_id, None)
+
+
+def parse_last_event_id(value: Optional[str]) -> Optional[int]:
+    """Parse a ``Last-Event-ID`` header value.
+
+    Raises:
+        InvalidArgumentError: If the value is not a non-negative integer
+    """
+    if value is None or not value.strip():
+        return None
+    try:
+        event_id = int(value)
+    except ValueError:
+        event_id = -1
+    if event_id < 0:
+        raise InvalidArgumentError(
+            "Last-Event-ID must be a non-negative integer", argument="last_event_id", value=value
+        )
+    return event_id
+
+
+async def format_sse(
+    events: AsyncIterator[StreamEvent],
+    encode: Optional[Callable[[Any], str]] = None,
+) -> AsyncIterator[str]:
+    """Format events as SSE frames with ``id:`` fields.
+
+    Args:
+        events: Events, e.g. from :meth:`ResumableStream.events`
+        encode: Function turning a part into the ``data:`` payload (default: JSON)
+
+    Yields:
+        SSE-formatted strings
+    """
+    encode = encode or _encode_json
+    async for event in events:
+        yield f"id: {event.id}\ndata: {encode(event.data)}\n\n"
+
+
+def _encode_json(data: Any) -> str:
+    if isinstance(data, str):
+        return json.dumps({"text": data})
+    if hasattr(data, "model_dump"):
+        return json.dumps(data.model_dump(exclude_none=True), default=str)
+    return json.dumps(vars(data), default=str)
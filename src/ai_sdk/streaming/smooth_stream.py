@@ -7,8 +7,10 @@ and chunking strategies for better user experience.
 
 import asyncio
 import re
-from typing import AsyncGenerator, Callable, Optional, Union
+import time
+from typing import AsyncGenerator, Callable, Iterator, List, Optional, Union
 
+from ..providers.stream_parts import FastTextDelta
 from ..providers.types import StreamPart
 
 
@@ -18,6 +20,14 @@ CHUNKING_PATTERNS = {
     "line": re.compile(r"\n+", re.MULTILINE),
 }
 
+# Boundary patterns used by the built-in strategies. They find the same chunk
+# ends as CHUNKING_PATTERNS, but can resume a failed search near the end of
+# the buffer instead of rescanning it: (pattern, characters to look back)
+_BOUNDARY_PATTERNS = {
+    "word": (re.compile(r"\S\s+"), 1),
+    "line": (re.compile(r"\n+"), 0),
+}
+
 # Type for custom chunk detection functions
 ChunkDetector = Callable[[str], Optional[str]]
 
@@ -26,6 +36,7 @@ def smooth_stream(
     *,
     delay_ms: Optional[int] = 10,
     chunking: Union[str, re.Pattern, ChunkDetector] = "word",
+    adaptive: bool = False,
 ) -> Callable[[AsyncGenerator[StreamPart, None]], AsyncGenerator[StreamPart, None]]:
     """
     Create a smooth streaming transform that adds delays between text chunks.
@@ -34,14 +45,28 @@ def smooth_stream(
     to make it appear more naturally paced to users, rather than dumping
     all text at once.
     
+    Text is scanned by offset, so consumed text is never rescanned or copied
+    per chunk and long outputs without chunk boundaries (code, CJK text) stay
+    linear in length with the built-in strategies.
+    
+    With ``adaptive=True`` the upstream stream is read concurrently and the
+    delay between chunks follows the measured upstream rate: the text
+    buffered at any time is spread over one average upstream interval, so
+    output never falls behind the model, and everything left is flushed as
+    soon as the upstream finishes. Smoothing then never increases the time
+    to the last token.
+    
     Args:
         delay_ms: Delay in milliseconds between chunks. Set to None to disable.
-                 Defaults to 10ms for natural reading pace.
+                 Defaults to 10ms for natural reading pace. With adaptive
+                 pacing this is the maximum delay (None for no maximum).
         chunking: How to split text into chunks:
                  - "word": Stream word by word (default)
                  - "line": Stream line by line
                  - re.Pattern: Custom regex pattern for chunking
                  - Callable: Custom function that returns next chunk
+        adaptive: Pace output to the upstream token rate instead of
+                 sleeping a fixed delay after every chunk.
     
     Returns:
         A transform function that can be applied to a text stream
@@ -68,74 +93,267 @@ def smooth_stream(
     if isinstance(chunking, str):
         if chunking not in CHUNKING_PATTERNS:
             raise ValueError(f"Unknown chunking strategy: {chunking}. Use 'word', 'line', or provide custom pattern/function.")
-        pattern = CHUNKING_PATTERNS[chunking]
-        
-        def detect_chunk(buffer: str) -> Optional[str]:
-            match = pattern.search(buffer)
-            if not match:
-                return None
-            return buffer[:match.end()]
+        pattern, lookbehind = _BOUNDARY_PATTERNS[chunking]
+
+        def make_buffer() -> _ChunkBuffer:
+            return _ChunkBuffer(pattern=pattern, lookbehind=lookbehind)
     
     elif hasattr(chunking, 'search'):  # regex pattern
-        def detect_chunk(buffer: str) -> Optional[str]:
-            match = chunking.search(buffer)
-            if not match:
-                return None
-            return buffer[:match.end()]
+        def make_buffer() -> _ChunkBuffer:
+            return _ChunkBuffer(pattern=chunking)
     
     elif callable(chunking):  # custom function
-        detect_chunk = chunking
+        def make_buffer() -> _ChunkBuffer:
+            return _ChunkBuffer(detector=chunking)
     
     else:
         raise ValueError("chunking must be 'word', 'line', a regex pattern, or a callable")
     
+    delay = delay_ms / 1000.0 if delay_ms is not None and delay_ms > 0 else None
+    
     async def transform_stream(stream: AsyncGenerator[StreamPart, None]) -> AsyncGenerator[StreamPart, None]:
         """Transform the stream with smooth output"""
-        buffer = ""
+        buffer = make_buffer()
         current_id = ""
         
         async for part in stream:
             # Handle non-text parts immediately
             if part.type != "text-delta":
                 # Flush any remaining buffer first
-                if buffer:
-                    yield StreamPart(type="text-delta", text_delta=buffer, id=current_id)
-                    buffer = ""
+                rest = buffer.take_rest()
+                if rest:
+                    yield FastTextDelta(rest, id=current_id)
                 
                 yield part
                 continue
             
             # Handle text deltas with smoothing
-            text_delta = getattr(part, 'text_delta', getattr(part, 'text', ''))
+            text_delta = getattr(part, 'text_delta', None) or getattr(part, 'text', '') or ''
             part_id = getattr(part, 'id', '')
             
             # If ID changed, flush buffer and start fresh
-            if part_id != current_id and buffer:
-                yield StreamPart(type="text-delta", text_delta=buffer, id=current_id)
-                buffer = ""
+            if part_id != current_id:
+                rest = buffer.take_rest()
+                if rest:
+                    yield FastTextDelta(rest, id=current_id)
             
             current_id = part_id
-            buffer += text_delta
+            buffer.append(text_delta)
             
             # Extract chunks and stream them smoothly
+            for chunk in buffer.chunks():
+                yield FastTextDelta(chunk, id=current_id)
+                
+                # Add delay between chunks (if specified)
+                if delay is not None:
+                    await asyncio.sleep(delay)
+        
+        # Flush any remaining buffer
+        rest = buffer.take_rest()
+        if rest:
+            yield FastTextDelta(rest, id=current_id)
+    
+    async def adaptive_transform_stream(stream: AsyncGenerator[StreamPart, None]) -> AsyncGenerator[StreamPart, None]:
+        """Transform the stream, pacing output to the upstream rate"""
+        pacer = _AdaptivePacer(stream)
+        buffer = make_buffer()
+        current_id = ""
+        
+        try:
             while True:
-                chunk = detect_chunk(buffer)
-                if chunk is None:
+                part = await pacer.next_part()
+                if part is None:
                     break
                 
-                # Yield the chunk
-                yield StreamPart(type="text-delta", text_delta=chunk, id=current_id)
-                buffer = buffer[len(chunk):]
+                if part.type != "text-delta":
+                    rest = buffer.take_rest()
+                    if rest:
+                        yield FastTextDelta(rest, id=current_id)
+                    yield part
+                    continue
                 
-                # Add delay between chunks (if specified)
-                if delay_ms is not None and delay_ms > 0:
-                    await asyncio.sleep(delay_ms / 1000.0)
+                text_delta = getattr(part, 'text_delta', None) or getattr(part, 'text', '') or ''
+                part_id = getattr(part, 'id', '')
+                if part_id != current_id:
+                    rest = buffer.take_rest()
+                    if rest:
+                        yield FastTextDelta(rest, id=current_id)
+                
+                current_id = part_id
+                buffer.append(text_delta)
+                
+                for chunk in buffer.chunks():
+                    yield FastTextDelta(chunk, id=current_id)
+                    await pacer.pause(len(chunk), buffer.pending + pacer.queued_chars, delay)
+            
+            rest = buffer.take_rest()
+            if rest:
+                yield FastTextDelta(rest, id=current_id)
+        finally:
+            await pacer.aclose()
+    
+    return adaptive_transform_stream if adaptive else transform_stream
+
+
+class _ChunkBuffer:
+    """Text buffer that yields chunks without rescanning or copying consumed text.
+    
+    Unconsumed text is kept as pieces that were already searched without
+    finding a boundary, a short tail of them in which a boundary may still
+    start, and newly appended text. Each search covers only the tail and the
+    new text. Strategies that cannot resume a search (custom patterns and
+    functions) keep all unconsumed text in the tail.
+    """
+    
+    def __init__(
+        self,
+        *,
+        pattern: Optional[re.Pattern] = None,
+        lookbehind: Optional[int] = None,
+        detector: Optional[ChunkDetector] = None,
+    ) -> None:
+        self._pattern = pattern
+        self._lookbehind = lookbehind
+        self._detector = detector
+        self._scanned: List[str] = []
+        self._scanned_len = 0
+        self._tail = ""
+        self._new: List[str] = []
+        self._new_len = 0
+    
+    @property
+    def pending(self) -> int:
+        """Number of buffered characters not yet emitted."""
+        return self._scanned_len + len(self._tail) + self._new_len
+    
+    def append(self, text: str) -> None:
+        if text:
+            self._new.append(text)
+            self._new_len += len(text)
+    
+    def chunks(self) -> Iterator[str]:
+        """Yield every complete chunk currently in the buffer."""
+        if not self._new:
+            return
+        window = self._tail + "".join(self._new)
+        self._new = []
+        self._new_len = 0
+        self._tail = ""
         
-        # Flush any remaining buffer
-        if buffer:
-            yield StreamPart(type="text-delta", text_delta=buffer, id=current_id)
+        pos = 0
+        emitted = False
+        while True:
+            end = self._find(window, pos)
+            if end is None:
+                break
+            if emitted:
+                chunk = window[pos:end]
+            else:
+                chunk = "".join(self._scanned) + window[:end]
+                self._scanned = []
+                self._scanned_len = 0
+                emitted = True
+            pos = end
+            yield chunk
+        
+        # Keep the remainder, with a tail a later boundary may start in
+        remainder = window[pos:] if pos else window
+        keep = len(remainder) if self._lookbehind is None else min(self._lookbehind, len(remainder))
+        split = len(remainder) - keep
+        if split:
+            self._scanned.append(remainder[:split])
+            self._scanned_len += split
+        self._tail = remainder[split:]
+    
+    def take_rest(self) -> str:
+        """Return and clear all unemitted text."""
+        rest = "".join(self._scanned) + self._tail + "".join(self._new)
+        self._scanned = []
+        self._scanned_len = 0
+        self._tail = ""
+        self._new = []
+        self._new_len = 0
+        return rest
+    
+    def _find(self, window: str, pos: int) -> Optional[int]:
+        """End of the next chunk starting at ``pos``, or None."""
+        if pos >= len(window):
+            return None
+        if self._detector is not None:
+            chunk = self._detector(window[pos:])
+            return pos + len(chunk) if chunk else None
+        match = self._pattern.search(window, pos)
+        if match is None or match.end() <= pos:
+            return None
+        return match.end()
+
+
+class _AdaptivePacer:
+    """Reads the upstream concurrently and computes rate-based delays."""
+    
+    # Smoothing factor for the moving average of upstream intervals
+    ALPHA = 0.3
+    
+    def __init__(self, stream: AsyncGenerator[StreamPart, None]) -> None:
+        loop = asyncio.get_running_loop()
+        self.queued_chars = 0
+        self.average_interval: Optional[float] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._finished = loop.create_future()
+        self._last_arrival: Optional[float] = None
+        self._task = asyncio.ensure_future(self._read(stream))
+    
+    async def _read(self, stream: AsyncGenerator[StreamPart, None]) -> None:
+        try:
+            async for part in stream:
+                if part.type == "text-delta":
+                    now = time.monotonic()
+                    if self._last_arrival is not None:
+                        interval = now - self._last_arrival
+                        self.average_interval = (
+                            interval if self.average_interval is None
+                            else self.ALPHA * interval + (1 - self.ALPHA) * self.average_interval
+                        )
+                    self._last_arrival = now
+                    self.queued_chars += len(getattr(part, 'text_delta', None) or getattr(part, 'text', '') or '')
+                self._queue.put_nowait(part)
+            self._queue.put_nowait(None)
+        except Exception as e:
+            self._queue.put_nowait(e)
+        finally:
+            if not self._finished.done():
+                self._finished.set_result(None)
+    
+    async def next_part(self) -> Optional[StreamPart]:
+        """Next upstream part, or None at the end."""
+        item = await self._queue.get()
+        if isinstance(item, Exception):
+            raise item
+        if item is not None and item.type == "text-delta":
+            self.queued_chars -= len(getattr(item, 'text_delta', None) or getattr(item, 'text', '') or '')
+        return item
+    
+    async def pause(self, chunk_chars: int, backlog_chars: int, max_delay: Optional[float]) -> None:
+        """Wait before the next chunk, ending early when the upstream finishes."""
+        if self._finished.done():
+            return
+        if self.average_interval is None:
+            delay = max_delay or 0.0
+        else:
+            # Spread the current backlog (including this chunk) over one interval
+            delay = self.average_interval * chunk_chars / max(backlog_chars + chunk_chars, 1)
+            if max_delay is not None:
+                delay = min(delay, max_delay)
+        if delay > 0:
+            await asyncio.wait([self._finished], timeout=delay)
     
-    return transform_stream
+    async def aclose(self) -> None:
+        if not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
 
 
 def word_chunker(buffer: str) -> Optional[str]:
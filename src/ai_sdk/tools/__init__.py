@@ -1,5 +1,8 @@
 """Tool system for AI SDK Python."""
 
+# Load the providers package first: several providers import ai_sdk.tools.core,
+# which would otherwise be only partially initialized when they do
+from .. import providers as _providers  # noqa: F401
 from .core import (
     Tool,
     ToolCall,
@@ -8,11 +11,43 @@ from .core import (
     ToolExecuteFunction,
     tool,
     dynamic_tool,
+    simple_tool,
+    ToolRegistry,
 )
 from .execution import (
     execute_tools,
     execute_tool_call,
 )
+from .cache import (
+    ToolResultCache,
+    run_tool_cached,
+    tool_cache_key,
+)
+from .definitions import (
+    ToolDefinitionSet,
+    clear_serialized_tools,
+    get_serialized_tool_stats,
+    serialize_tool_definitions,
+    tool_definition_fingerprint,
+)
+from .executors import (
+    EXECUTION_MODES,
+    configure_tool_executors,
+    get_tool_executor,
+    run_in_tool_executor,
+    run_tool_function,
+    shutdown_tool_executors,
+    tool_cancelled,
+)
+from .limits import (
+    ToolBulkhead,
+    get_tool_bulkhead,
+    get_tool_metrics,
+    reset_tool_metrics,
+    run_tool_with_limits,
+    run_with_tool_limits,
+)
+from .speculative import SpeculativeToolExecution
 from .schema import (
     create_tool_schema,
     validate_tool_input,
@@ -49,6 +84,8 @@ __all__ = [
     "ToolExecuteFunction",
     "tool",
     "dynamic_tool",
+    "simple_tool",
+    "ToolRegistry",
     
     # Enhanced tool system
     "EnhancedTool",
@@ -62,6 +99,36 @@ __all__ = [
     "execute_tools",
     "execute_tool_call",
     
+    # Result caching
+    "ToolResultCache",
+    "run_tool_cached",
+    "tool_cache_key",
+    "ToolDefinitionSet",
+    "clear_serialized_tools",
+    "get_serialized_tool_stats",
+    "serialize_tool_definitions",
+    "tool_definition_fingerprint",
+    
+    # Thread and process pools
+    "EXECUTION_MODES",
+    "configure_tool_executors",
+    "get_tool_executor",
+    "run_in_tool_executor",
+    "run_tool_function",
+    "shutdown_tool_executors",
+    "tool_cancelled",
+    
+    # Execution limits and metrics
+    "ToolBulkhead",
+    "get_tool_bulkhead",
+    "get_tool_metrics",
+    "reset_tool_metrics",
+    "run_tool_with_limits",
+    "run_with_tool_limits",
+    
+    # Speculative execution
+    "SpeculativeToolExecution",
+    
     # Schema utilities
     "create_tool_schema",
     "validate_tool_input",
@@ -0,0 +1,212 @@
+"""Result cache for idempotent tools.
+
+A tool declared ``idempotent=True`` returns the same output for the same
+input, so repeated calls (across steps, agents and requests) can reuse an
+earlier output. Each tool has a cache of its own (unless it is given one to
+share), where outputs are kept under a hash of the tool name and the
+canonical JSON form of the validated input, for ``cache_ttl`` seconds. Identical calls
+that arrive while the first one is still running wait for it instead of
+running the tool again. Failed calls are not cached.
+
+Example:
+    ```python
+    weather = tool(
+        "get_weather", "Current weather", schema, execute=get_weather,
+        idempotent=True, cache_ttl=300,
+    )
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from ..errors import InvalidArgumentError
+from .schema import validate_tool_input
+
+T = TypeVar("T")
+
+# Cache outcome of a call, as reported in ToolResult.metadata["cache"]
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_SHARED = "shared"
+
+
+class ToolResultCache:
+    """Bounded LRU cache of tool outputs with per-entry expiry."""
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached outputs
+        """
+        if max_size < 1:
+            raise InvalidArgumentError(
+                "max_size must be at least 1", argument="max_size", value=max_size
+            )
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return ``(found, output)`` for a key; expired entries are dropped."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, output = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, output
+
+    def set(self, key: Hashable, output: Any, ttl: Optional[float] = None) -> None:
+        """Store an output for ``ttl`` seconds (None: until evicted)."""
+        expires_at = float("inf") if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires_at, output)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_run(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+        ttl: Optional[float] = None,
+    ) -> Tuple[T, str]:
+        """Return the cached output for ``key``, or run ``call`` and cache it.
+
+        A call with the same key that is already running is awaited instead
+        of starting another one.
+
+        Returns:
+            The output and how it was obtained: "hit", "shared" or "miss"
+        """
+        while True:
+            found, output = self.get(key)
+            if found:
+                self.hits += 1
+                return output, CACHE_HIT
+            pending = self._in_flight.get(key)
+            if pending is None:
+                break
+            try:
+                output = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The running call was cancelled, not us: run it ourselves
+                continue
+            self.shared += 1
+            return output, CACHE_SHARED
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            output = await call()
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Waiters re-raise it; don't warn when there are none
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+        self.set(key, output, ttl)
+        future.set_result(output)
+        return output, CACHE_MISS
+
+    def clear(self) -> None:
+        """Remove all cached outputs."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def tool_cache_key(tool_name: str, input: Any) -> str:
+    """Hash a tool name and input into a cache key.
+
+    Inputs that are equal as JSON (e.g. dicts with a different key order, or
+    a Pydantic model and its dict) get the same key.
+    """
+    canonical = json.dumps(
+        [tool_name, _to_json(input)],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {str(k): _to_json(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_to_json(v) for v in value), key=repr)
+    return value
+
+
+async def run_tool_cached(
+    tool: Any,
+    input: Any,
+    call: Callable[[], Awaitable[T]],
+    tool_name: Optional[str] = None,
+) -> Tuple[T, Optional[str]]:
+    """Run a tool call through the tool's result cache, if it has one.
+
+    Caching applies to tools with ``idempotent=True``; they may set
+    ``cache_ttl`` (seconds, None: until evicted) and ``cache`` (a
+    :class:`ToolResultCache`, default: one of the tool's own, created on
+    first use). Calls whose input fails the tool's validation run uncached.
+
+    Returns:
+        The output and the cache outcome ("hit", "shared", "miss", or None
+        for calls that are not cached)
+    """
+    if not getattr(tool, "idempotent", False):
+        return await call(), None
+    try:
+        input = _validated_input(tool, input)
+    except Exception:
+        return await call(), None
+    cache = getattr(tool, "cache", None)
+    if cache is None:
+        # Same-named tools must not share outputs, so each gets its own cache
+        cache = tool.cache = ToolResultCache()
+    name = tool_name or getattr(tool, "name", None) or type(tool).__name__
+    return await cache.get_or_run(
+        tool_cache_key(name, input), call, getattr(tool, "cache_ttl", None)
+    )
+
+
+def _validated_input(tool: Any, input: Any) -> Any:
+    """Return the input as the tool's validation normalizes it."""
+    validate = getattr(tool, "validate_input", None)
+    if callable(validate):
+        return validate(input)
+    schema = getattr(tool, "input_schema", None)
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_validate(input)
+    if isinstance(schema, dict):
+        return validate_tool_input(input, schema)
+    return input
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Callable, Dict, Generic, List, Optional, TypeVar, Union
+from typing import Any, AsyncGenerator, Callable, Dict, Generic, List, Literal, Optional, TypeVar, Union
 
 from pydantic import BaseModel, Field
 
 from ..providers.types import Message
+from .cache import ToolResultCache
+from .executors import run_tool_function
 
 # Type variables for input/output types
 INPUT = TypeVar("INPUT")
@@ -86,6 +87,9 @@ class ToolResult(BaseModel, Generic[T]):
     dynamic: bool = False
     """Whether the tool is dynamic."""
 
+    metadata: Optional[Dict[str, Any]] = None
+    """Execution details, e.g. ``{"cache": "hit"}`` for cached outputs."""
+
 
 # Tool execute function type
 ToolExecuteFunction = Callable[[INPUT, ToolCallOptions], Union[OUTPUT, AsyncGenerator[OUTPUT, None]]]
@@ -115,6 +119,37 @@ class Tool(BaseModel, Generic[INPUT, OUTPUT]):
     tool_type: str = "function"
     """Type of the tool ('function', 'dynamic', or 'provider-defined')."""
 
+    sequential: bool = False
+    """Run calls of this tool one at a time, in call order, when an agent
+    executes several tool calls concurrently."""
+
+    exclusive: bool = False
+    """Run calls of this tool alone: no other tool call of the step runs at
+    the same time."""
+
+    timeout: Optional[float] = None
+    """Seconds a call may run before it fails with a timeout error."""
+
+    max_concurrency: Optional[int] = None
+    """Calls of this tool allowed to run at once, across the whole process."""
+
+    max_queue_wait: Optional[float] = None
+    """Seconds a call may wait for a free slot under ``max_concurrency``."""
+
+    idempotent: bool = False
+    """Whether calls with the same input return the same output; enables
+    the result cache."""
+
+    cache_ttl: Optional[float] = None
+    """Seconds a cached output is reused (None: until evicted)."""
+
+    cache: Optional[ToolResultCache] = None
+    """Cache for this tool's outputs (default: one of its own)."""
+
+    execution_mode: Literal["inline", "thread", "process"] = "inline"
+    """Where a synchronous ``execute`` function runs: on the event loop, in
+    the shared thread pool or in the shared process pool."""
+
     # Callback functions for streaming
     on_input_start: Optional[Callable[[ToolCallOptions], Union[None, Any]]] = None
     """Called when argument streaming starts."""
@@ -142,7 +177,7 @@ class Tool(BaseModel, Generic[INPUT, OUTPUT]):
             raise ValueError(f"Tool '{self.name}' does not have an execute function")
 
         try:
-            result = self.execute(input_data, options)
+            result = await run_tool_function(self, self.execute, input_data, options)
             
             # Handle async generators
             if hasattr(result, '__aiter__'):
@@ -152,13 +187,7 @@ class Tool(BaseModel, Generic[INPUT, OUTPUT]):
                     results.append(item)
                 return results[-1] if results else None
             
-            # Handle regular coroutines
-            elif asyncio.iscoroutine(result):
-                return await result
-            
-            # Handle sync results
-            else:
-                return result
+            return result
                 
         except Exception as e:
             raise ValueError(f"Tool execution failed: {e}") from e
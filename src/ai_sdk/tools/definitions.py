@@ -0,0 +1,186 @@
+"""Precomputed tool definitions.
+
+An agent sends the same tools with every step, and providers convert each
+tool's JSON schema to their request format every time. A
+:class:`ToolDefinitionSet` builds the definitions of a tool set once,
+together with a fingerprint of every definition (a hash of its name,
+description and schema). Providers pass definitions through
+:func:`serialize_tool_definitions`, which keeps the provider-specific form
+of each fingerprinted definition, so later steps, sessions and agents using
+the same tool reuse it.
+
+Example:
+    ```python
+    definitions = ToolDefinitionSet(tools)
+    result = await generate_text(model, prompt=prompt, tools=definitions.definitions)
+
+    # In a provider
+    body["tools"] = serialize_tool_definitions(options.tools, "openai", to_openai_tool)
+    ```
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..providers.types import ToolDefinition
+
+# Serialized forms kept across all providers and formats
+MAX_SERIALIZED_TOOLS = 1024
+
+
+def tool_definition_fingerprint(name: str, description: str, parameters: Any) -> str:
+    """Hash a tool definition; definitions equal as JSON get the same fingerprint."""
+    canonical = json.dumps(
+        [name, description, parameters],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ToolDefinitionSet:
+    """Definitions and fingerprints of a tool set, computed once."""
+
+    def __init__(self, tools: Dict[str, Any]) -> None:
+        """Build the definitions of tools.
+
+        Args:
+            tools: Tools by name; the names given here are the names the
+                model sees
+        """
+        self.tools = dict(tools)
+        self.definitions: List[ToolDefinition] = []
+        self._by_name: Dict[str, ToolDefinition] = {}
+        for name, tool in self.tools.items():
+            definition = tool.to_definition()
+            description = definition.get("description") or ""
+            parameters = definition.get("parameters") or {}
+            self._by_name[name] = ToolDefinition(
+                name=name,
+                description=description,
+                parameters=parameters,
+                fingerprint=tool_definition_fingerprint(name, description, parameters),
+            )
+            self.definitions.append(self._by_name[name])
+        self.fingerprint = hashlib.sha256(
+            "".join(d.fingerprint for d in self.definitions).encode("ascii")
+        ).hexdigest()
+        self._key = _tools_key(self.tools)
+
+    def __len__(self) -> int:
+        return len(self.definitions)
+
+    def matches(self, tools: Dict[str, Any]) -> bool:
+        """Return whether the set was built from the same tool objects."""
+        return _tools_key(tools) == self._key
+
+    def select(self, tools: Dict[str, Any]) -> List[ToolDefinition]:
+        """Definitions of a subset of the tools, e.g. a step's active tools.
+
+        Tools that are not part of the set are defined on the fly.
+        """
+        definitions = []
+        for name, tool in tools.items():
+            definition = self._by_name.get(name)
+            if definition is None or self.tools[name] is not tool:
+                definition = ToolDefinitionSet({name: tool}).definitions[0]
+            definitions.append(definition)
+        return definitions
+
+
+class _SerializedToolCache:
+    """Serialized tool definitions by format and fingerprint, least recently used first."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, str]) -> Tuple[bool, Any]:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, self._entries[key]
+
+    def put(self, key: Tuple[str, str], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_serialized = _SerializedToolCache(MAX_SERIALIZED_TOOLS)
+
+
+def serialize_tool_definitions(
+    definitions: Iterable[Any],
+    format: str,
+    serialize: Callable[[Any], Any],
+) -> List[Any]:
+    """Convert tool definitions to a provider's format, reusing earlier conversions.
+
+    Definitions with a fingerprint (see :class:`ToolDefinitionSet`) are
+    converted once per format; others are converted on every call. The
+    returned objects are shared and must not be modified.
+
+    Args:
+        definitions: Tool definitions of a request
+        format: Name of the provider format, e.g. ``"openai"``
+        serialize: Function converting one definition
+
+    Returns:
+        The converted definitions, in order
+    """
+    serialized = []
+    for definition in definitions:
+        fingerprint: Optional[str] = getattr(definition, "fingerprint", None)
+        if fingerprint is None:
+            serialized.append(serialize(definition))
+            continue
+        key = (format, fingerprint)
+        found, value = _serialized.get(key)
+        if not found:
+            value = serialize(definition)
+            _serialized.put(key, value)
+        serialized.append(value)
+    return serialized
+
+
+def get_serialized_tool_stats() -> Dict[str, int]:
+    """Hits, misses and size of the serialized tool definition cache."""
+    return {
+        "hits": _serialized.hits,
+        "misses": _serialized.misses,
+        "size": len(_serialized),
+    }
+
+
+def clear_serialized_tools() -> None:
+    """Forget all serialized tool definitions."""
+    _serialized.clear()
+
+
+def _tools_key(tools: Dict[str, Any]) -> Tuple[Tuple[str, int], ...]:
+    return tuple((name, id(tool)) for name, tool in tools.items())
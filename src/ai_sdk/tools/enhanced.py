@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, Generic, Type
+from typing import Any, Callable, Dict, List, Literal, Optional, TypeVar, Union, Generic, Type
 from pydantic import BaseModel
 
 from .core import ToolCallOptions, ToolExecuteFunction
+from .cache import ToolResultCache, run_tool_cached
+from .executors import run_tool_function
+from .limits import run_tool_with_limits
 from .schema_enhanced import FlexibleSchema, normalize_schema, validate_schema_input, extract_schema_info
 
 T = TypeVar("T")
@@ -97,6 +100,32 @@ class EnhancedTool(BaseModel, Generic[INPUT, OUTPUT]):
     result_converter: Optional[Callable[[OUTPUT], Any]] = None
     """Function to convert tool output for model consumption."""
     
+    # Execution limits (see ai_sdk.tools.limits)
+    timeout: Optional[float] = None
+    """Seconds a call may run before it fails with a timeout error."""
+    
+    max_concurrency: Optional[int] = None
+    """Calls of this tool allowed to run at once, across the whole process."""
+    
+    max_queue_wait: Optional[float] = None
+    """Seconds a call may wait for a free slot under ``max_concurrency``."""
+    
+    # Result caching (see ai_sdk.tools.cache)
+    idempotent: bool = False
+    """Whether calls with the same input return the same output; enables
+    the result cache."""
+    
+    cache_ttl: Optional[float] = None
+    """Seconds a cached output is reused (None: until evicted)."""
+    
+    cache: Optional[ToolResultCache] = None
+    """Cache for this tool's outputs (default: one of its own)."""
+    
+    # Execution mode (see ai_sdk.tools.executors)
+    execution_mode: Literal["inline", "thread", "process"] = "inline"
+    """Where a synchronous ``execute`` function runs: on the event loop, in
+    the shared thread pool or in the shared process pool."""
+    
     class Config:
         arbitrary_types_allowed = True
     
@@ -164,11 +193,13 @@ class EnhancedTool(BaseModel, Generic[INPUT, OUTPUT]):
         if self.streaming_callbacks:
             await self.streaming_callbacks.trigger_input_available(input_data, options)
         
-        # Execute the tool
-        if asyncio.iscoroutinefunction(self.execute):
-            result = await self.execute(input_data, options)
-        else:
-            result = self.execute(input_data, options)
+        # Execute the tool within its limits; idempotent tools reuse cached outputs
+        async def call() -> Any:
+            return await run_tool_function(self, self.execute, input_data, options)
+        
+        result, _ = await run_tool_cached(
+            self, input_data, lambda: run_tool_with_limits(self, call)
+        )
         
         # Validate output if schema is provided
         if self.output_schema:
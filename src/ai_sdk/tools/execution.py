@@ -9,6 +9,8 @@ from pydantic import ValidationError
 from ..errors.base import AISDKError
 from ..providers.types import Message, ToolCallContent
 from .core import Tool, ToolCall, ToolResult, ToolCallOptions
+from .cache import run_tool_cached
+from .limits import run_tool_with_limits
 
 
 async def execute_tools(
@@ -129,9 +131,18 @@ async def execute_tool_call(
             # Log but don't fail the tool execution
             pass
     
-    # Execute the tool
+    # Execute the tool within its time and concurrency limits
     try:
-        output = await tool.execute_async(tool_call.input, options)
+        output, cache_status = await run_tool_cached(
+            tool,
+            tool_call.input,
+            lambda: run_tool_with_limits(
+                tool,
+                lambda: tool.execute_async(tool_call.input, options),
+                tool_call.tool_name,
+            ),
+            tool_call.tool_name,
+        )
         
         return ToolResult(
             tool_call_id=tool_call.tool_call_id,
@@ -141,6 +152,7 @@ async def execute_tool_call(
             provider_executed=tool_call.provider_executed,
             dynamic=tool_call.dynamic,
             is_error=False,
+            metadata={"cache": cache_status} if cache_status else None,
         )
         
     except Exception as e:
@@ -0,0 +1,246 @@
+"""Thread and process pools for synchronous tools.
+
+A synchronous ``execute`` function runs on the event loop by default, which
+is fine for quick functions but stalls every other stream and tool call of
+the worker while a slow one runs. A tool can declare where its function
+runs with ``execution_mode``:
+
+- ``"inline"`` (default): call it on the event loop
+- ``"thread"``: run it in the SDK's shared thread pool (I/O-bound or
+  GIL-releasing work: blocking clients, file access, numpy/pandas)
+- ``"process"``: run it in the SDK's shared process pool (CPU-bound pure
+  Python work such as parsing)
+
+Async functions always run on the event loop, whatever the mode.
+
+In process mode the function, the tool input and the other positional
+arguments are pickled and sent to a worker process, so the function must be
+defined at module level and its input must be picklable. Keyword arguments
+that cannot be pickled (abort signals, callbacks and other process-local
+context) are not sent.
+
+Cancelling a call (an aborted agent step or a tool timeout) stops calls that
+are still queued from starting. A thread already running the function cannot
+be interrupted, but it can poll :func:`tool_cancelled` and return early; a
+process already running it finishes and its result is discarded.
+
+Example:
+    ```python
+    configure_tool_executors(max_threads=16, max_processes=4)
+
+    parse_pdf = tool(
+        "parse_pdf", "Extract text from a PDF", schema, execute=parse_pdf_fn,
+        execution_mode="process",
+    )
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import pickle
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..errors import InvalidArgumentError
+
+EXECUTION_MODES = ("inline", "thread", "process")
+
+_thread_pool: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+_max_threads: Optional[int] = None
+_max_processes: Optional[int] = None
+_executor_lock = threading.Lock()
+
+_cancel_event: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar(
+    "ai_sdk_tool_cancel_event", default=None
+)
+
+
+def configure_tool_executors(
+    max_threads: Optional[int] = None,
+    max_processes: Optional[int] = None,
+) -> None:
+    """Set the size of the shared tool pools.
+
+    Pools are created on first use. Pools that already exist are replaced;
+    calls running in them finish in the background.
+
+    Args:
+        max_threads: Threads of the thread pool (None: Python's default)
+        max_processes: Processes of the process pool (None: CPU count)
+    """
+    global _thread_pool, _process_pool, _max_threads, _max_processes
+    for argument, value in (("max_threads", max_threads), ("max_processes", max_processes)):
+        if value is not None and value < 1:
+            raise InvalidArgumentError(
+                f"{argument} must be at least 1", argument=argument, value=value
+            )
+    with _executor_lock:
+        old_pools = (_thread_pool, _process_pool)
+        _max_threads, _max_processes = max_threads, max_processes
+        _thread_pool = _process_pool = None
+    for pool in old_pools:
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+
+def get_tool_executor(execution_mode: str) -> Optional[Executor]:
+    """Get the shared pool of an execution mode (None for "inline")."""
+    global _thread_pool, _process_pool
+    if execution_mode == "inline":
+        return None
+    with _executor_lock:
+        if execution_mode == "thread":
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(
+                    max_workers=_max_threads, thread_name_prefix="ai-sdk-tool"
+                )
+            return _thread_pool
+        if execution_mode == "process":
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(max_workers=_max_processes)
+            return _process_pool
+    raise InvalidArgumentError(
+        f"Unknown tool execution mode '{execution_mode}', expected one of {EXECUTION_MODES}",
+        argument="execution_mode",
+        value=execution_mode,
+    )
+
+
+def shutdown_tool_executors(wait: bool = True) -> None:
+    """Shut down the shared tool pools; they are recreated on next use."""
+    global _thread_pool, _process_pool
+    with _executor_lock:
+        pools = (_thread_pool, _process_pool)
+        _thread_pool = _process_pool = None
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+def tool_cancelled() -> bool:
+    """Whether the tool call running in the current thread was cancelled.
+
+    Long-running functions in thread mode can poll this to stop early.
+    Always False outside a thread-mode tool call.
+    """
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+async def run_in_tool_executor(
+    execution_mode: str,
+    fn: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Call a tool function in the given execution mode.
+
+    Async functions are awaited on the event loop; awaitable results of
+    sync functions are awaited too.
+
+    Args:
+        execution_mode: "inline", "thread" or "process"
+        fn: The tool's execute function
+        *args: Positional arguments (the tool input first)
+        **kwargs: Keyword arguments (execution context)
+
+    Returns:
+        The function's result
+    """
+    if inspect.iscoroutinefunction(fn):
+        return await fn(*args, **kwargs)
+
+    executor = get_tool_executor(execution_mode)
+    if executor is None:
+        result = fn(*args, **kwargs)
+    elif execution_mode == "thread":
+        result = await _run_in_thread(executor, fn, args, kwargs)
+    else:
+        payload = _pickle_call(fn, args, kwargs)
+        result = await asyncio.get_running_loop().run_in_executor(
+            executor, _call_pickled, payload
+        )
+
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+async def run_tool_function(tool: Any, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a function of ``tool`` in the execution mode the tool declares.
+
+    Reads ``execution_mode`` from the tool (missing attribute: "inline").
+    """
+    return await run_in_tool_executor(
+        getattr(tool, "execution_mode", None) or "inline", fn, *args, **kwargs
+    )
+
+
+async def _run_in_thread(
+    executor: Executor,
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Any:
+    # The call sees the caller's context variables, plus its cancel event
+    cancel_event = threading.Event()
+    context = contextvars.copy_context()
+    context.run(_cancel_event.set, cancel_event)
+    future = asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(context.run, fn, *args, **kwargs)
+    )
+    try:
+        return await future
+    except asyncio.CancelledError:
+        cancel_event.set()
+        raise
+
+
+def _pickle_call(fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> bytes:
+    try:
+        return pickle.dumps((fn, args, kwargs))
+    except Exception:
+        pass
+
+    # Slow path: find what does not pickle
+    try:
+        pickle.dumps(fn)
+    except Exception as e:
+        raise InvalidArgumentError(
+            f"Tool function {getattr(fn, '__qualname__', fn)!r} cannot run in a process "
+            f"pool: it cannot be pickled ({e}). Define it at module level.",
+            argument="execute",
+            value=fn,
+        ) from e
+    for index, value in enumerate(args):
+        try:
+            pickle.dumps(value)
+        except Exception as e:
+            argument = "input" if index == 0 else f"args[{index}]"
+            raise InvalidArgumentError(
+                f"Tool {argument} cannot be sent to a process pool: it cannot be pickled ({e})",
+                argument=argument,
+                value=value,
+            ) from e
+    return pickle.dumps((fn, args, {
+        name: value for name, value in kwargs.items() if _picklable(value)
+    }))
+
+
+def _picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return False
+    return True
+
+
+def _call_pickled(payload: bytes) -> Any:
+    fn, args, kwargs = pickle.loads(payload)
+    return fn(*args, **kwargs)
@@ -0,0 +1,299 @@
+"""Time limits, bulkheads and metrics for tool execution.
+
+A tool can declare three limits:
+
+- ``timeout``: seconds a call may run before it fails with
+  :class:`~ai_sdk.errors.ToolTimeoutError`
+- ``max_concurrency``: calls of the tool running at once across the whole
+  process (all agents and requests share one :class:`ToolBulkhead` per tool)
+- ``max_queue_wait``: seconds a call may wait for a free slot before it fails
+
+Executors run tool calls through :func:`run_with_tool_limits`, which applies
+the limits and records queue wait and execution time per tool (see
+:func:`get_tool_metrics`). Timeouts cancel the tool's coroutine; a
+synchronous tool function cannot be interrupted, so slow ones should run in
+a thread or process pool (see :mod:`ai_sdk.tools.executors`).
+
+Example:
+    ```python
+    search = tool(
+        "search", "Search the web", schema, execute=search_fn,
+        timeout=10, max_concurrency=4, max_queue_wait=5,
+    )
+    ...
+    print(get_tool_metrics()["search"])
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from ..errors import InvalidArgumentError, ToolTimeoutError
+
+T = TypeVar("T")
+
+
+class ToolBulkhead:
+    """Limits how many calls of a tool run at once; others wait in FIFO order."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        """Initialize the bulkhead.
+
+        Args:
+            max_concurrency: Calls allowed to run at once
+        """
+        self._in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.max_concurrency = 1
+        self.set_limit(max_concurrency)
+
+    @property
+    def in_use(self) -> int:
+        """Number of calls holding a slot."""
+        return self._in_use
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot."""
+        return len(self._waiters)
+
+    def set_limit(self, max_concurrency: int) -> None:
+        """Change the number of calls allowed to run at once."""
+        if max_concurrency < 1:
+            raise InvalidArgumentError(
+                "max_concurrency must be at least 1",
+                argument="max_concurrency",
+                value=max_concurrency,
+            )
+        self.max_concurrency = max_concurrency
+        self._wake_waiters()
+
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a free slot.
+
+        Args:
+            timeout: Seconds to wait at most (None: no limit)
+
+        Returns:
+            True if a slot was acquired, False if the wait timed out
+        """
+        if self._in_use < self.max_concurrency and not self._waiters:
+            self._in_use += 1
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            done, _ = await asyncio.wait({waiter}, timeout=timeout)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        if not done:
+            self._abandon(waiter)
+            return False
+        return True
+
+    def release(self) -> None:
+        """Release a slot acquired with :meth:`acquire`."""
+        self._in_use -= 1
+        self._wake_waiters()
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+        elif waiter.done() and not waiter.cancelled():
+            # The slot was handed over just before we gave up
+            self.release()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_use < self.max_concurrency:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_use += 1
+                waiter.set_result(None)
+
+
+class _Timing:
+    """Count, total and maximum of a duration."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else None,
+            "max_ms": round(self.max * 1000, 3),
+            "total_ms": round(self.total * 1000, 3),
+        }
+
+
+class _ToolStats:
+    """Execution metrics of one tool."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.queue_timeouts = 0
+        self.queue_wait = _Timing()
+        self.execution = _Timing()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "queue_timeouts": self.queue_timeouts,
+            "queue_wait": self.queue_wait.summary(),
+            "execution": self.execution.summary(),
+        }
+
+
+_bulkheads: Dict[str, ToolBulkhead] = {}
+_stats: Dict[str, _ToolStats] = {}
+_registry_lock = threading.Lock()
+
+
+def get_tool_bulkhead(tool_name: str, max_concurrency: int) -> ToolBulkhead:
+    """Get the process-wide bulkhead of a tool.
+
+    The bulkhead is created on first use; a different ``max_concurrency``
+    on later calls changes its limit.
+    """
+    with _registry_lock:
+        bulkhead = _bulkheads.get(tool_name)
+        if bulkhead is None:
+            bulkhead = _bulkheads[tool_name] = ToolBulkhead(max_concurrency)
+            return bulkhead
+    if bulkhead.max_concurrency != max_concurrency:
+        bulkhead.set_limit(max_concurrency)
+    return bulkhead
+
+
+def get_tool_metrics(tool_name: Optional[str] = None) -> Dict[str, Any]:
+    """Return execution metrics per tool.
+
+    Each tool has ``calls``, ``errors``, ``timeouts``, ``queue_timeouts``
+    and ``queue_wait`` / ``execution`` summaries (count, mean, max and
+    total in ms).
+
+    Args:
+        tool_name: Return only this tool's metrics (empty dict if unknown)
+    """
+    with _registry_lock:
+        if tool_name is not None:
+            stats = _stats.get(tool_name)
+            return stats.summary() if stats else {}
+        return {name: stats.summary() for name, stats in _stats.items()}
+
+
+def reset_tool_metrics() -> None:
+    """Clear the metrics of all tools."""
+    with _registry_lock:
+        _stats.clear()
+
+
+def _stats_for(tool_name: str) -> _ToolStats:
+    with _registry_lock:
+        stats = _stats.get(tool_name)
+        if stats is None:
+            stats = _stats[tool_name] = _ToolStats()
+        return stats
+
+
+async def run_with_tool_limits(
+    tool_name: str,
+    call: Callable[[], Awaitable[T]],
+    *,
+    timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    max_queue_wait: Optional[float] = None,
+) -> T:
+    """Run a tool call within the tool's limits and record its metrics.
+
+    Args:
+        tool_name: Tool name; bulkheads and metrics are kept per name
+        call: Function starting the tool call
+        timeout: Seconds the call may run (None: no limit)
+        max_concurrency: Calls of this tool allowed to run at once in the
+            process (None: no limit)
+        max_queue_wait: Seconds to wait for a free slot (None: no limit)
+
+    Returns:
+        The call's result
+
+    Raises:
+        ToolTimeoutError: If the call waited or ran too long
+    """
+    stats = _stats_for(tool_name)
+    stats.calls += 1
+    bulkhead = get_tool_bulkhead(tool_name, max_concurrency) if max_concurrency else None
+
+    queued_at = time.perf_counter()
+    if bulkhead is not None and not await bulkhead.acquire(max_queue_wait):
+        stats.queue_wait.add(time.perf_counter() - queued_at)
+        stats.queue_timeouts += 1
+        raise ToolTimeoutError(
+            f"Tool '{tool_name}' waited more than {max_queue_wait}s for a free slot",
+            tool_name=tool_name,
+            timeout=max_queue_wait,
+            phase="queue",
+        )
+    started = time.perf_counter()
+    stats.queue_wait.add(started - queued_at)
+
+    try:
+        if timeout is None:
+            return await call()
+        try:
+            return await asyncio.wait_for(call(), timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise ToolTimeoutError(
+                f"Tool '{tool_name}' did not finish within {timeout}s",
+                tool_name=tool_name,
+                timeout=timeout,
+            ) from None
+    except BaseException as e:
+        if not isinstance(e, ToolTimeoutError) and isinstance(e, Exception):
+            stats.errors += 1
+        raise
+    finally:
+        stats.execution.add(time.perf_counter() - started)
+        if bulkhead is not None:
+            bulkhead.release()
+
+
+async def run_tool_with_limits(
+    tool: Any,
+    call: Callable[[], Awaitable[T]],
+    tool_name: Optional[str] = None,
+) -> T:
+    """Run a call of ``tool`` within the limits the tool declares.
+
+    Reads ``timeout``, ``max_concurrency`` and ``max_queue_wait`` from the
+    tool (missing attributes mean no limit).
+    """
+    return await run_with_tool_limits(
+        tool_name or getattr(tool, "name", None) or type(tool).__name__,
+        call,
+        timeout=getattr(tool, "timeout", None),
+        max_concurrency=getattr(tool, "max_concurrency", None),
+        max_queue_wait=getattr(tool, "max_queue_wait", None),
+    )
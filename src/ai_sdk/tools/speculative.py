@@ -0,0 +1,199 @@
+"""Speculative execution of tool calls while the model is still streaming.
+
+Tool call arguments stream in as ``tool-call-delta`` parts well before the
+model finishes its step, but tools normally run only once the step is
+complete. :class:`SpeculativeToolExecution` watches the stream instead: as
+soon as a call's arguments form complete JSON that is valid for the tool's
+input schema, it starts the call. When the step finishes, the executor takes
+the speculative result if the final call has the same tool and input, and
+discards it (cancelling the call if still running) otherwise.
+
+Only tools declared ``idempotent=True`` are started early: a call whose
+input turns out different must be safe to have run.
+
+Example:
+    ```python
+    from ai_sdk.core.tool_execution import execute_tools, speculative_tool_execution
+
+    speculation = speculative_tool_execution(tools, messages)
+    async for part in stream_text(model, messages=messages, tools=definitions):
+        speculation.observe(part)
+        ...
+    results = await execute_tools(tool_calls, tools, messages, speculation=speculation)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .cache import tool_cache_key
+from .schema import validate_tool_input
+
+# Starts a tool call: (tool_call_id, tool_name, input) -> output
+SpeculativeExecuteFunction = Callable[[str, str, Any], Awaitable[Any]]
+
+
+class _PendingCall:
+    """Arguments streamed so far for one tool call, and its speculative run."""
+
+    __slots__ = ("tool_call_id", "tool_name", "chunks", "input", "task")
+
+    def __init__(self, tool_call_id: str, tool_name: Optional[str]) -> None:
+        self.tool_call_id = tool_call_id
+        self.tool_name = tool_name
+        self.chunks: List[str] = []
+        self.input: Any = None
+        self.task: Optional[asyncio.Task] = None
+
+
+class SpeculativeToolExecution:
+    """Starts idempotent tool calls as soon as their streamed arguments are complete."""
+
+    def __init__(self, tools: Dict[str, Any], execute: SpeculativeExecuteFunction) -> None:
+        """Initialize speculative execution for one step.
+
+        Args:
+            tools: Available tools by name
+            execute: Function running a tool call, the same way the step's
+                executor would
+        """
+        self.tools = tools
+        self.execute = execute
+        self._calls: Dict[str, _PendingCall] = {}
+        self._last_call_id: Optional[str] = None
+        self.started = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def observe(self, part: Any) -> None:
+        """Feed a stream part; non tool call parts are ignored."""
+        part_type = _field(part, "type")
+        if part_type == "tool-call-start":
+            self._pending(_field(part, "tool_call_id"), _field(part, "tool_name"))
+        elif part_type == "tool-call-delta":
+            pending = self._pending(_field(part, "tool_call_id"), _field(part, "tool_name"))
+            delta = _field(part, "args_delta")
+            if pending is not None and delta:
+                self._add_delta(pending, delta)
+        elif part_type == "tool-call":
+            pending = self._pending(_field(part, "tool_call_id"), _field(part, "tool_name"))
+            args = _field(part, "args")
+            if args is None:
+                args = _field(part, "input")
+            if pending is not None and pending.task is None and isinstance(args, dict):
+                self._start(pending, args)
+
+    async def take(self, tool_call_id: str, tool_name: str, input: Any) -> Tuple[bool, Any]:
+        """Claim the speculative result of a finished tool call.
+
+        Args:
+            tool_call_id: ID of the final tool call
+            tool_name: Name of the final tool call
+            input: Final input of the call
+
+        Returns:
+            ``(True, output)`` if the call was started early with the same
+            tool and input, ``(False, None)`` otherwise; a mismatched run is
+            cancelled
+
+        Raises:
+            Exception: Whatever the speculative call raised
+        """
+        pending = self._calls.pop(tool_call_id, None)
+        if pending is None or pending.task is None:
+            return False, None
+        if pending.tool_name != tool_name or (
+            tool_cache_key(tool_name, pending.input) != tool_cache_key(tool_name, input)
+        ):
+            self._discard(pending)
+            return False, None
+        self.reused += 1
+        return True, await pending.task
+
+    def cancel(self) -> None:
+        """Discard all speculative calls that were not taken."""
+        for pending in self._calls.values():
+            if pending.task is not None:
+                self._discard(pending)
+        self._calls.clear()
+
+    def _pending(self, tool_call_id: Optional[str], tool_name: Optional[str]) -> Optional[_PendingCall]:
+        # Providers send the ID (and name) with the first part of a call only
+        if tool_call_id is None:
+            tool_call_id = self._last_call_id
+            if tool_call_id is None:
+                return None
+        pending = self._calls.get(tool_call_id)
+        if pending is None:
+            pending = self._calls[tool_call_id] = _PendingCall(tool_call_id, tool_name)
+        elif tool_name and pending.tool_name is None:
+            pending.tool_name = tool_name
+        self._last_call_id = tool_call_id
+        return pending
+
+    def _add_delta(self, pending: _PendingCall, delta: str) -> None:
+        pending.chunks.append(delta)
+        if pending.task is not None:
+            # More arguments after a complete object: the early input was wrong
+            if delta.strip():
+                self._discard(pending)
+            return
+        # Complete JSON objects end with "}"; skip parsing until one can
+        if not delta.rstrip().endswith("}"):
+            return
+        try:
+            args = json.loads("".join(pending.chunks))
+        except ValueError:
+            return
+        if isinstance(args, dict):
+            self._start(pending, args)
+
+    def _start(self, pending: _PendingCall, args: Dict[str, Any]) -> None:
+        tool_name = pending.tool_name
+        if tool_name is None:
+            return
+        tool = self.tools.get(tool_name)
+        if tool is None or not getattr(tool, "idempotent", False) or not _valid(tool, args):
+            return
+        pending.input = args
+        pending.task = asyncio.ensure_future(
+            self.execute(pending.tool_call_id, tool_name, args)
+        )
+        # A discarded call's error is never retrieved; don't warn about it
+        pending.task.add_done_callback(_consume_exception)
+        self.started += 1
+
+    def _discard(self, pending: _PendingCall) -> None:
+        assert pending.task is not None
+        pending.task.cancel()
+        pending.task = None
+        pending.input = None
+        self.discarded += 1
+
+
+def _field(part: Any, name: str) -> Any:
+    if isinstance(part, dict):
+        return part.get(name)
+    return getattr(part, name, None)
+
+
+def _valid(tool: Any, args: Dict[str, Any]) -> bool:
+    schema = getattr(tool, "input_schema", None)
+    try:
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            schema.model_validate(args)
+        elif isinstance(schema, dict):
+            validate_tool_input(args, schema)
+    except Exception:
+        return False
+    return True
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
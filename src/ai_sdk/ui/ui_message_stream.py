@@ -9,10 +9,12 @@ from __future__ import annotations
 import asyncio
 import json
 import uuid
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Protocol, Union
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Protocol, Union
 from abc import ABC, abstractmethod
 
 from .ui_messages import UIMessage
+from ..streaming.coalesce import coalesce_deltas
 from ..utils.id_generator import generate_id
 
 # Type aliases
@@ -40,10 +42,85 @@ class UIMessageStreamWriter(Protocol):
         """Merge another stream into this writer."""
         ...
     
+    async def drain(self) -> None:
+        """Wait until the stream's buffer has room again."""
+        ...
+    
     def on_error(self, error: Exception) -> str:
         """Handle errors and return error text."""
         ...
 
+class _ChunkChannel:
+    """Bounded chunk buffer shared by all producers of a stream.
+    
+    ``write`` never blocks (it is called from synchronous code), so the
+    buffer may exceed ``max_size`` by the chunks written synchronously;
+    ``put`` and ``drain`` wait until the consumer has caught up. The channel
+    closes when the last registered producer finishes.
+    """
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: Deque[UIMessageChunk] = deque()
+        self._getter: Optional[asyncio.Future] = None
+        self._putters: Deque[asyncio.Future] = deque()
+        self._producers = 0
+        self._closed = False
+    
+    def add_producer(self) -> None:
+        self._producers += 1
+    
+    def producer_done(self) -> None:
+        self._producers -= 1
+        if self._producers == 0:
+            self._closed = True
+            _wake(self._getter)
+    
+    def put_nowait(self, chunk: UIMessageChunk) -> None:
+        self._items.append(chunk)
+        _wake(self._getter)
+    
+    async def put(self, chunk: UIMessageChunk) -> None:
+        await self.drain()
+        self.put_nowait(chunk)
+    
+    async def drain(self) -> None:
+        while len(self._items) >= self.max_size:
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            finally:
+                if putter in self._putters:
+                    self._putters.remove(putter)
+    
+    async def get(self) -> Optional[UIMessageChunk]:
+        """Next chunk, or None once all producers are done and it is empty."""
+        while not self._items:
+            if self._closed:
+                return None
+            self._wake_putters()
+            self._getter = asyncio.get_running_loop().create_future()
+            try:
+                await self._getter
+            finally:
+                self._getter = None
+        chunk = self._items.popleft()
+        self._wake_putters()
+        return chunk
+    
+    def _wake_putters(self) -> None:
+        free = self.max_size - len(self._items)
+        while self._putters and free > 0:
+            _wake(self._putters.popleft())
+            free -= 1
+
+
+def _wake(future: Optional[asyncio.Future]) -> None:
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
 class UIMessageStream:
     """UI Message Stream for handling streaming UI messages."""
     
@@ -54,114 +131,85 @@ class UIMessageStream:
         original_messages: Optional[List[UIMessage]] = None,
         on_finish: Optional[UIMessageStreamOnFinishCallback] = None,
         generate_id_func: Optional[Callable[[], str]] = None,
+        buffer_size: int = 256,
     ):
         self.execute = execute
         self.on_error = on_error or (lambda e: str(e))
         self.original_messages = original_messages or []
         self.on_finish = on_finish
         self.generate_id_func = generate_id_func or generate_id
+        self.buffer_size = buffer_size
         self._message_id = self.generate_id_func()
         self._chunks: List[UIMessageChunk] = []
         self._controller: Optional[AsyncIterator[UIMessageChunk]] = None
         
     async def __aiter__(self) -> AsyncIterator[UIMessageChunk]:
-        """Async iterator for the stream."""
-        ongoing_promises: List[asyncio.Task] = []
+        """Async iterator for the stream.
         
-        # Create a queue for chunks
-        chunk_queue: asyncio.Queue[Optional[UIMessageChunk]] = asyncio.Queue()
+        All producers (``execute`` and merged streams) feed one bounded
+        buffer. Merged streams wait while it is full, and ``execute`` can do
+        the same with ``await writer.drain()``, so a slow consumer holds the
+        producers back instead of growing memory.
+        """
+        channel = _ChunkChannel(self.buffer_size)
+        tasks: List[asyncio.Task] = []
+        on_error = self.on_error
         
-        def safe_enqueue(chunk: UIMessageChunk) -> None:
-            """Safely enqueue a chunk."""
-            try:
-                chunk_queue.put_nowait(chunk)
-            except asyncio.QueueFull:
-                # Handle queue full scenario
-                pass
+        def run_producer(coro: Awaitable[None]) -> None:
+            async def producer():
+                try:
+                    await coro
+                except Exception as e:
+                    channel.put_nowait(ErrorChunk(on_error(e)))
+                finally:
+                    channel.producer_done()
+            
+            channel.add_producer()
+            tasks.append(asyncio.ensure_future(producer()))
         
         class Writer:
             """Writer implementation for the execute function."""
             
             def write(self, chunk: UIMessageChunk) -> None:
-                safe_enqueue(chunk)
+                channel.put_nowait(chunk)
             
             def merge(self, stream: AsyncIterator[UIMessageChunk]) -> None:
-                async def merge_task():
-                    try:
-                        async for chunk in stream:
-                            safe_enqueue(chunk)
-                    except Exception as e:
-                        safe_enqueue(ErrorChunk(self.on_error(e)))
+                async def forward():
+                    async for chunk in stream:
+                        await channel.put(chunk)
                 
-                task = asyncio.create_task(merge_task())
-                ongoing_promises.append(task)
+                run_producer(forward())
+            
+            async def drain(self) -> None:
+                await channel.drain()
             
             def on_error(self, error: Exception) -> str:
-                return self.on_error(error)
+                return on_error(error)
         
         writer = Writer()
         
-        # Execute the main function
+        # Execute the main function; the stream ends when it and every
+        # merged stream are done
+        channel.add_producer()
         try:
             result = self.execute(writer)
             if asyncio.iscoroutine(result):
-                async def execute_task():
-                    try:
-                        await result
-                    except Exception as e:
-                        safe_enqueue(ErrorChunk(self.on_error(e)))
-                    finally:
-                        # Signal completion
-                        chunk_queue.put_nowait(None)
-                
-                task = asyncio.create_task(execute_task())
-                ongoing_promises.append(task)
-            else:
-                # Signal completion for sync execution
-                chunk_queue.put_nowait(None)
+                run_producer(result)
         except Exception as e:
-            safe_enqueue(ErrorChunk(self.on_error(e)))
-            chunk_queue.put_nowait(None)
+            channel.put_nowait(ErrorChunk(on_error(e)))
+        finally:
+            channel.producer_done()
         
-        # Wait for all ongoing tasks and yield chunks
-        completion_signaled = False
-        while not completion_signaled or ongoing_promises:
-            try:
-                # Wait for either a chunk or task completion
-                done_tasks = []
-                if ongoing_promises:
-                    done, pending = await asyncio.wait(
-                        ongoing_promises + [asyncio.create_task(chunk_queue.get())],
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
-                    
-                    # Process completed tasks
-                    for task in done:
-                        if task in ongoing_promises:
-                            ongoing_promises.remove(task)
-                            done_tasks.append(task)
-                        else:
-                            # This is the chunk queue get task
-                            chunk = await task
-                            if chunk is None:
-                                completion_signaled = True
-                            else:
-                                yield chunk
-                    
-                    # Cancel pending chunk queue task if we have other work
-                    for task in pending:
-                        if task not in ongoing_promises:
-                            task.cancel()
-                else:
-                    # No ongoing tasks, just wait for chunks
-                    chunk = await chunk_queue.get()
-                    if chunk is None:
-                        completion_signaled = True
-                    else:
-                        yield chunk
-                        
-            except asyncio.CancelledError:
-                break
+        try:
+            while True:
+                chunk = await channel.get()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
         
         # Call finish callback if provided
         if self.on_finish:
@@ -191,6 +239,7 @@ def create_ui_message_stream(
     original_messages: Optional[List[UIMessage]] = None,
     on_finish: Optional[UIMessageStreamOnFinishCallback] = None,
     generate_id_func: Optional[Callable[[], str]] = None,
+    buffer_size: int = 256,
 ) -> UIMessageStream:
     """Create a UI message stream.
     
@@ -200,6 +249,7 @@ def create_ui_message_stream(
         original_messages: Original messages for persistence mode
         on_finish: Callback when stream finishes
         generate_id_func: Function to generate message IDs
+        buffer_size: Chunks buffered before merged streams wait for the consumer
         
     Returns:
         UIMessageStream instance
@@ -210,6 +260,7 @@ def create_ui_message_stream(
         original_messages=original_messages,
         on_finish=on_finish,
         generate_id_func=generate_id_func,
+        buffer_size=buffer_size,
     )
 
 async def create_ui_message_stream_response(
@@ -278,8 +329,24 @@ async def read_ui_message_stream(
 class JsonToSseTransformStream:
     """Transform JSON chunks to Server-Sent Events format."""
     
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        coalesce_window_ms: Optional[float] = None,
+        coalesce_max_chars: int = 2048,
+    ):
+        """Initialize the transform.
+        
+        Args:
+            coalesce_window_ms: If set, merge adjacent text, reasoning and tool
+                input deltas arriving within this window into one frame (see
+                :func:`ai_sdk.streaming.coalesce_deltas`)
+            coalesce_max_chars: Maximum merged delta size in characters
+        """
+        self._coalesce = (
+            coalesce_deltas(window_ms=coalesce_window_ms, max_chars=coalesce_max_chars)
+            if coalesce_window_ms
+            else None
+        )
     
     async def transform(
         self,
@@ -293,10 +360,19 @@ class JsonToSseTransformStream:
         Yields:
             SSE-formatted strings
         """
+        if self._coalesce is not None:
+            stream = self._coalesce(stream)
         async for chunk in stream:
-            chunk_json = json.dumps(chunk.__dict__)
+            chunk_json = json.dumps(_chunk_to_dict(chunk))
             yield f"data: {chunk_json}\n\n"
 
+
+def _chunk_to_dict(chunk: Any) -> Dict[str, Any]:
+    # Slotted stream parts have no __dict__
+    if hasattr(chunk, "__dict__"):
+        return chunk.__dict__
+    return chunk.model_dump()
+
 # Headers for UI message streams
 UI_MESSAGE_STREAM_HEADERS = {
     "X-AI-SDK-UI-Message-Stream": "true",
@@ -1,6 +1,14 @@
 """Utility functions for AI SDK Python."""
 
+from .abort import AbortController, AbortSignal, abortable_stream
 from .api_key import load_api_key, load_optional_setting
+from .concurrency import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    get_concurrency_limiter,
+    is_overload_error,
+    set_concurrency_limiter,
+)
 from .cosine_similarity import cosine_similarity
 from .delay import delay
 from .dict_utils import merge_dicts, remove_none_entries
@@ -47,4 +55,14 @@ __all__ = [
     
     # Async utilities
     "delay",
+    "AbortController",
+    "AbortSignal",
+    "abortable_stream",
+    
+    # Concurrency control
+    "AdaptiveConcurrencyLimiter",
+    "RateLimiter",
+    "get_concurrency_limiter",
+    "set_concurrency_limiter",
+    "is_overload_error",
 ]
\ No newline at end of file
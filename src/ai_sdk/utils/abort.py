@@ -0,0 +1,170 @@
+"""Abort signals for streamed generations.
+
+Closing a stream by simply no longer iterating it leaves the provider's HTTP
+response open until the async generator is garbage collected, and the model
+keeps generating (and billing) tokens in the meantime. An
+:class:`AbortController` stops a stream explicitly: ``abort()`` interrupts a
+pending read, and the stream closes its HTTP response before raising
+:class:`~ai_sdk.errors.AbortError` to the consumer.
+
+Example:
+    ```python
+    controller = AbortController()
+    stream = stream_text(model, prompt="Hi", abort_signal=controller.signal)
+
+    # Elsewhere, e.g. when the client disconnects
+    controller.abort("client disconnected")
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, List, Optional, TypeVar
+
+from ..errors import AbortError
+
+T = TypeVar("T")
+
+
+class AbortSignal:
+    """Signal that tells an operation to stop; created by an AbortController."""
+
+    def __init__(self) -> None:
+        self.aborted = False
+        self.reason: Any = None
+        self._listeners: List[Callable[[Any], None]] = []
+        self._waiters: List[asyncio.Future] = []
+
+    def add_listener(self, listener: Callable[[Any], None]) -> Callable[[], None]:
+        """Call ``listener(reason)`` when the signal is aborted.
+
+        The listener is called at once if the signal is already aborted.
+
+        Returns:
+            A function that removes the listener
+        """
+        if self.aborted:
+            listener(self.reason)
+            return lambda: None
+        self._listeners.append(listener)
+
+        def remove() -> None:
+            try:
+                self._listeners.remove(listener)
+            except ValueError:
+                pass
+
+        return remove
+
+    def throw_if_aborted(self) -> None:
+        """Raise AbortError if the signal is aborted."""
+        if self.aborted:
+            raise AbortError(reason=self.reason)
+
+    async def wait(self) -> Any:
+        """Wait until the signal is aborted and return the reason."""
+        if not self.aborted:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        return self.reason
+
+    def _abort(self, reason: Any) -> None:
+        self.aborted = True
+        self.reason = reason
+        listeners, self._listeners = self._listeners, []
+        for listener in listeners:
+            listener(reason)
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(reason)
+
+
+class AbortController:
+    """Creates an AbortSignal and aborts it."""
+
+    def __init__(self) -> None:
+        self.signal = AbortSignal()
+
+    def abort(self, reason: Any = None) -> None:
+        """Abort the signal; later calls have no effect.
+
+        Must be called from the thread running the event loop of the aborted
+        operations (use ``loop.call_soon_threadsafe`` from other threads).
+
+        Args:
+            reason: Why the operation was aborted, available as ``signal.reason``
+        """
+        if not self.signal.aborted:
+            self.signal._abort(reason)
+
+
+async def abortable_stream(
+    stream: AsyncIterator[T],
+    signal: Optional[AbortSignal],
+) -> AsyncIterator[T]:
+    """Iterate over ``stream`` until ``signal`` is aborted.
+
+    An abort during a pending read cancels that read, so the source closes its
+    HTTP response right away instead of when the next chunk arrives. The
+    source is always closed before this generator finishes.
+
+    Args:
+        stream: Source stream, e.g. a provider's ``stream()``
+        signal: Abort signal (None: iterate normally)
+
+    Yields:
+        The items of ``stream``
+
+    Raises:
+        AbortError: When the signal is aborted
+    """
+    if signal is None:
+        async for item in stream:
+            yield item
+        return
+
+    iterator = stream.__aiter__()
+    task = asyncio.current_task()
+    assert task is not None  # async generators always run inside a task
+    reading = False
+    interrupted = False
+
+    def on_abort(reason: Any) -> None:
+        nonlocal interrupted
+        # Only interrupt a read; between reads the abort is seen by the checks
+        if reading and not interrupted:
+            interrupted = True
+            task.cancel()
+
+    remove = signal.add_listener(on_abort)
+    try:
+        while True:
+            signal.throw_if_aborted()
+            reading = True
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            except asyncio.CancelledError:
+                if not interrupted:
+                    raise
+                # Task.uncancel() exists on Python 3.11+
+                uncancel = getattr(task, "uncancel", None)
+                if uncancel is not None:
+                    uncancel()
+                raise AbortError(reason=signal.reason) from None
+            finally:
+                reading = False
+            signal.throw_if_aborted()
+            yield item
+    finally:
+        remove()
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -0,0 +1,371 @@
+"""Adaptive concurrency limiting for AI SDK Python."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+import httpx
+
+from ..errors.base import APIError, InvalidArgumentError, RateLimitError
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD (additive increase, multiplicative decrease) concurrency limiter.
+
+    The limit grows by roughly ``increase_by`` per window of successful calls
+    while latency stays close to its long-term baseline, and is multiplied by
+    ``decrease_factor`` when a call is rate limited (429), fails with a 5xx
+    or timeout, or its latency exceeds ``latency_tolerance`` times the
+    baseline. Only one decrease is applied per window of in-flight calls, so
+    a burst of simultaneous 429s backs off once rather than collapsing the
+    limit to ``min_limit``.
+
+    Example:
+        ```python
+        limiter = get_concurrency_limiter("openai")
+        async with limiter.slot():
+            await model.do_embed(values=batch)
+        ```
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase_by: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent calls
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            increase_by: Limit increase per window of healthy calls
+            decrease_factor: Multiplier applied to the limit on overload
+            latency_tolerance: Latency ratio to baseline treated as overload
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise InvalidArgumentError(
+                "Limits must satisfy 1 <= min_limit <= max_limit",
+                argument="min_limit,max_limit",
+                value={"min_limit": min_limit, "max_limit": max_limit},
+            )
+        if not 0 < decrease_factor < 1:
+            raise InvalidArgumentError(
+                "decrease_factor must be between 0 and 1",
+                argument="decrease_factor",
+                value=decrease_factor,
+            )
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_by = increase_by
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # Short and long term latency averages (seconds)
+        self._latency_short: Optional[float] = None
+        self._latency_baseline: Optional[float] = None
+
+        # Calls started before the last decrease cannot trigger another one
+        self._started = 0
+        self._last_decrease_at = -1
+
+        self.successes = 0
+        self.overloads = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed to run concurrently."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def latency_baseline(self) -> Optional[float]:
+        """Long-term average latency of healthy calls, in seconds."""
+        return self._latency_baseline
+
+    async def acquire(self) -> int:
+        """Wait for a free slot.
+
+        Returns:
+            A ticket identifying when the call started, to pass to
+            :meth:`record_success` or :meth:`record_overload`.
+        """
+        if self._in_flight >= self.limit or self._waiters:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    # Slot was handed over just before cancellation
+                    self._in_flight -= 1
+                    self._wake_waiters()
+                raise
+        else:
+            self._in_flight += 1
+
+        self._started += 1
+        return self._started
+
+    def release(self) -> None:
+        """Release a slot acquired with :meth:`acquire`."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def record_success(self, latency: float, ticket: int = 0) -> None:
+        """Record a completed call and adapt the limit.
+
+        Args:
+            latency: Call duration in seconds
+            ticket: Value returned by :meth:`acquire`
+        """
+        self.successes += 1
+        self._latency_short = _ewma(self._latency_short, latency, 0.3)
+
+        if (
+            self._latency_baseline is not None
+            and self._latency_short > self._latency_baseline * self.latency_tolerance
+        ):
+            self._decrease(ticket)
+            return
+
+        self._latency_baseline = _ewma(self._latency_baseline, latency, 0.05)
+        self._limit = min(
+            float(self.max_limit), self._limit + self.increase_by / max(self._limit, 1.0)
+        )
+        self._wake_waiters()
+
+    def record_overload(self, ticket: int = 0) -> None:
+        """Record a rate limited, failed or timed out call.
+
+        Args:
+            ticket: Value returned by :meth:`acquire`
+        """
+        self.overloads += 1
+        self._decrease(ticket)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block and record its outcome.
+
+        Overload errors (see :func:`is_overload_error`) reduce the limit;
+        other errors are treated as neutral and re-raised unchanged.
+        """
+        ticket = await self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            if is_overload_error(e):
+                self.record_overload(ticket)
+            raise
+        else:
+            self.record_success(time.monotonic() - start, ticket)
+        finally:
+            self.release()
+
+    def _decrease(self, ticket: int) -> None:
+        if ticket and ticket <= self._last_decrease_at:
+            return
+        self._last_decrease_at = self._started
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        # Latency that triggered the decrease should not count against the next window
+        self._latency_short = self._latency_baseline
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+class RateLimiter:
+    """Token bucket limiting calls, and optionally tokens, per minute.
+
+    Calls are admitted in order at ``requests_per_minute``, with up to
+    ``burst`` calls at once after an idle period. Token usage is only known
+    once a call finishes, so it is recorded afterwards with
+    :meth:`record_tokens`; while the recorded usage exceeds
+    ``tokens_per_minute``, new calls wait until it has been paid back.
+
+    Example:
+        ```python
+        limiter = RateLimiter(requests_per_minute=500, tokens_per_minute=200_000)
+        await limiter.acquire()
+        result = await model.generate(options)
+        limiter.record_tokens(result.usage.total_tokens)
+        ```
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        *,
+        burst: Optional[float] = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Calls admitted per minute (None: no limit)
+            tokens_per_minute: Tokens that may be used per minute (None: no
+                limit)
+            burst: Calls admitted at once after an idle period (default: one
+                second's worth, at least 1)
+        """
+        for argument, value in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+            ("burst", burst),
+        ):
+            if value is not None and value <= 0:
+                raise InvalidArgumentError(
+                    f"{argument} must be positive", argument=argument, value=value
+                )
+
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.burst = burst if burst is not None else max(1.0, (requests_per_minute or 0) / 60)
+
+        self._requests = self.burst
+        self._tokens = tokens_per_minute or 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a call may start."""
+        async with self._lock:
+            while True:
+                wait = self._wait_time()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.requests_per_minute is not None:
+                self._requests -= 1
+
+    def record_tokens(self, tokens: int) -> None:
+        """Record the tokens a finished call used."""
+        if self.tokens_per_minute is not None:
+            self._refill()
+            self._tokens -= tokens
+
+    def _wait_time(self) -> float:
+        """Seconds until both buckets allow a call."""
+        self._refill()
+        wait = 0.0
+        if self.requests_per_minute is not None and self._requests < 1:
+            wait = (1 - self._requests) * 60 / self.requests_per_minute
+        if self.tokens_per_minute is not None and self._tokens < 0:
+            wait = max(wait, -self._tokens * 60 / self.tokens_per_minute)
+        return wait
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.requests_per_minute is not None:
+            self._requests = min(
+                self.burst, self._requests + elapsed * self.requests_per_minute / 60
+            )
+        if self.tokens_per_minute is not None:
+            self._tokens = min(
+                self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60
+            )
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Return whether an error indicates the provider is overloaded.
+
+    Rate limits (429), server errors (5xx) and timeouts count as overload.
+    """
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, APIError) and error.status_code is not None:
+        return error.status_code == 429 or error.status_code >= 500
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException))
+
+
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(
+    provider: Any,
+    **kwargs: Any,
+) -> AdaptiveConcurrencyLimiter:
+    """Get the process-wide limiter shared by all calls to a provider.
+
+    Args:
+        provider: Provider name, or a model/provider instance to derive it from
+        **kwargs: Limiter options, used only when the limiter is created
+
+    Returns:
+        The shared limiter for the provider
+    """
+    key = provider if isinstance(provider, str) else _provider_key(provider)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(**kwargs)
+            _limiters[key] = limiter
+        return limiter
+
+
+def set_concurrency_limiter(
+    provider: str,
+    limiter: Optional[AdaptiveConcurrencyLimiter],
+) -> None:
+    """Replace (or with ``None``, reset) the shared limiter for a provider."""
+    with _limiters_lock:
+        if limiter is None:
+            _limiters.pop(provider, None)
+        else:
+            _limiters[provider] = limiter
+
+
+def _provider_key(obj: Any) -> str:
+    """Derive a limiter key from a model or provider instance."""
+    for attr in ("provider_name", "name"):
+        try:
+            value = getattr(obj, attr)
+        except Exception:
+            continue
+        if isinstance(value, str):
+            return value
+    provider = getattr(obj, "provider", None)
+    if isinstance(provider, str):
+        return provider
+    if provider is not None and isinstance(getattr(provider, "name", None), str):
+        return provider.name
+    return type(obj).__name__
+
+
+def _ewma(current: Optional[float], value: float, alpha: float) -> float:
+    if current is None:
+        return value
+    return current + alpha * (value - current)
@@ -2,9 +2,9 @@
 
 import json
 import re
-from typing import Any, Dict, Literal, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Union
 
-from .secure_json import secure_json_parse
+from .secure_json import _filter_dangerous_keys, secure_json_parse
 
 
 def parse_partial_json(json_text: Optional[str]) -> Dict[str, Any]:
@@ -29,15 +29,17 @@ def parse_partial_json(json_text: Optional[str]) -> Dict[str, Any]:
     except (json.JSONDecodeError, SyntaxError):
         pass
     
-    # Try with repair
+    # Try with repair: parse as far as the input goes and close what is open
+    parser = IncrementalJSONParser()
+    parser.feed(json_text)
+    parser.finish()
+    if parser.failed or not parser.started:
+        return {"value": None, "state": "failed-parse"}
     try:
-        fixed_json = fix_json(json_text)
-        value = secure_json_parse(fixed_json)
-        return {"value": value, "state": "repaired-parse"}
-    except (json.JSONDecodeError, SyntaxError):
-        pass
-    
-    return {"value": None, "state": "failed-parse"}
+        value = _filter_dangerous_keys(parser.value)
+    except SyntaxError:
+        return {"value": None, "state": "failed-parse"}
+    return {"value": value, "state": "repaired-parse"}
 
 
 def fix_json(text: str) -> str:
@@ -112,4 +114,460 @@ def fix_json(text: str) -> str:
     text += '}' * max(0, brace_count)
     text += ']' * max(0, bracket_count)
     
-    return text
\ No newline at end of file
+    return text
+
+# Parser states
+_VALUE = 0          # expecting a value
+_STRING = 1         # inside a string (key or value)
+_TOKEN = 2          # inside a number or literal
+_AFTER_VALUE = 3    # expecting ',' or a closing bracket
+_KEY = 4            # expecting an object key or '}'
+_COLON = 5          # expecting ':'
+_DONE = 6           # root value complete
+_FAILED = 7         # invalid input
+_LEADING = 8        # skipping text before the root value
+
+_WHITESPACE = frozenset(" \t\n\r")
+_TOKEN_CHARS = frozenset("-+0123456789.eEtrufalsn")
+_STRING_SPECIAL = re.compile(r'["\\]')
+_LITERALS = {"true": True, "false": False, "null": None}
+_ESCAPES = {
+    '"': '"', "\\": "\\", "/": "/",
+    "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t",
+}
+_MISSING = object()
+
+JSONPatchOperation = Dict[str, Any]
+
+
+class IncrementalJSONParser:
+    """Resumable JSON parser for text that arrives in chunks.
+
+    Each call to :meth:`feed` consumes only the new text, so parsing a
+    streamed document costs O(total length) instead of re-parsing the whole
+    buffer per chunk. :attr:`value` is the partial value parsed so far:
+    open objects and arrays are included with their completed members,
+    strings are included while they are still streaming, and numbers and
+    literals once they are complete.
+
+    :attr:`value` is the parser's own partial tree, updated in place as text
+    arrives: each parsed value is inserted once, so reading it after every
+    chunk does not copy the containers that are still open. Copy it (e.g.
+    with ``copy.deepcopy``) to keep the value as of a given chunk.
+
+    Example:
+        ```python
+        parser = IncrementalJSONParser()
+        for chunk in ['{"name": "Ad', 'a", "tags": ["x"', ']}']:
+            if parser.feed(chunk):
+                print(parser.value)
+        # {'name': 'Ad'}
+        # {'name': 'Ada', 'tags': ['x']}
+        # {'name': 'Ada', 'tags': ['x']}
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        skip_until: Optional[str] = None,
+        allow_trailing_text: bool = False,
+        track_patches: bool = False,
+    ) -> None:
+        """Initialize the parser.
+
+        Args:
+            skip_until: Ignore any text before the first of these characters
+                (e.g. ``"{"`` to skip prose before a JSON object)
+            allow_trailing_text: Ignore text after the root value instead
+                of failing
+            track_patches: Record JSON-patch style operations describing each
+                change (see :meth:`take_patches`)
+        """
+        self.allow_trailing_text = allow_trailing_text
+        self.track_patches = track_patches
+        self.error: Optional[str] = None
+
+        self._skip_until = skip_until
+        self._state = _LEADING if skip_until else _VALUE
+        self._stack: List[list] = []   # [container, pending key] per open container
+        self._root: Any = _MISSING
+        self._tree: Any = _MISSING     # root container while it is still open
+        self._carry = ""               # incomplete escape sequence from the last chunk
+        self._string: List[str] = []
+        self._string_is_key = False
+        self._string_added = False     # whether the streaming string was reported
+        self._string_placed = False    # whether it is in its list (see value)
+        self._unreported: List[str] = []
+        self._high_surrogate = ""
+        self._token: List[str] = []
+        self._changed = False
+        self._patches: List[JSONPatchOperation] = []
+
+    @property
+    def started(self) -> bool:
+        """Whether the root value has started."""
+        return self._root is not _MISSING or bool(self._stack) or (
+            self._state in (_STRING, _TOKEN)
+        )
+
+    @property
+    def done(self) -> bool:
+        """Whether the root value is complete."""
+        return self._state == _DONE
+
+    @property
+    def failed(self) -> bool:
+        """Whether the input is not valid JSON."""
+        return self._state == _FAILED
+
+    @property
+    def value(self) -> Any:
+        """The (partial) value parsed so far, or ``None`` before it starts."""
+        if self._root is not _MISSING:
+            return self._root
+        if self._state == _STRING and not self._string_is_key:
+            text = self._streamed_string()
+            if not self._stack:
+                return text
+            self._place_string(text)
+        return None if self._tree is _MISSING else self._tree
+
+    def feed(self, text: str) -> bool:
+        """Consume the next chunk of text.
+
+        Args:
+            text: The new text (not the accumulated buffer)
+
+        Returns:
+            True if :attr:`value` changed
+        """
+        if self._carry:
+            text = self._carry + text
+            self._carry = ""
+        if text and self._state != _FAILED:
+            self._consume(text)
+            self._flush_string_patch()
+        changed, self._changed = self._changed, False
+        return changed
+
+    def finish(self) -> bool:
+        """Signal the end of input, completing a trailing number or literal.
+
+        A trailing literal prefix such as ``tru`` is completed to its literal.
+
+        Returns:
+            True if :attr:`value` changed
+        """
+        if self._state == _TOKEN:
+            token = "".join(self._token)
+            self._token = []
+            for literal, literal_value in _LITERALS.items():
+                if literal.startswith(token):
+                    self._commit(literal_value)
+                    break
+            else:
+                # Drop an incomplete exponent or fraction ("1.", "2e+")
+                trimmed = token.rstrip(".eE+-")
+                number = _parse_number(trimmed) if trimmed else None
+                if number is not None:
+                    self._commit(number)
+        changed, self._changed = self._changed, False
+        return changed
+
+    def take_patches(self) -> List[JSONPatchOperation]:
+        """Return and clear the operations recorded since the last call.
+
+        Operations follow RFC 6902 (``add`` with a JSON pointer ``path``),
+        plus ``{"op": "append", "path": ..., "value": text}`` for text
+        appended to a string that is still streaming.
+        """
+        patches, self._patches = self._patches, []
+        return patches
+
+    def _consume(self, text: str) -> None:
+        i = 0
+        n = len(text)
+        while i < n:
+            state = self._state
+
+            if state == _STRING:
+                match = _STRING_SPECIAL.search(text, i)
+                if match is None:
+                    self._append_string(text[i:])
+                    return
+                j = match.start()
+                if j > i:
+                    self._append_string(text[i:j])
+                if text[j] == '"':
+                    i = j + 1
+                    self._end_string()
+                    continue
+                i = self._read_escape(text, j)
+                if i < 0:
+                    return
+                continue
+
+            char = text[i]
+
+            if state == _TOKEN:
+                if char in _TOKEN_CHARS:
+                    self._token.append(char)
+                    i += 1
+                    continue
+                if not self._end_token():
+                    return
+                continue
+
+            if char in _WHITESPACE:
+                i += 1
+                continue
+
+            if state == _VALUE:
+                if char == '"':
+                    self._start_string(is_key=False)
+                elif char == "{":
+                    self._open({})
+                    self._state = _KEY
+                elif char == "[":
+                    self._open([])
+                    self._state = _VALUE
+                elif char == "]" and self._stack and self._stack[-1][0] == []:
+                    # Only an empty array closes here: "[1,]" is invalid
+                    self._close()
+                elif char in _TOKEN_CHARS:
+                    self._token = [char]
+                    self._state = _TOKEN
+                else:
+                    return self._fail(f"Unexpected character {char!r}")
+            elif state == _AFTER_VALUE:
+                container = self._stack[-1][0]
+                if char == ",":
+                    self._state = _KEY if isinstance(container, dict) else _VALUE
+                elif char == ("}" if isinstance(container, dict) else "]"):
+                    self._close()
+                else:
+                    return self._fail(f"Expected ',' or closing bracket, got {char!r}")
+            elif state == _KEY:
+                if char == '"':
+                    self._start_string(is_key=True)
+                elif char == "}" and not self._stack[-1][0]:
+                    # Only an empty object closes here: '{"a": 1,}' is invalid
+                    self._close()
+                else:
+                    return self._fail(f"Expected object key, got {char!r}")
+            elif state == _COLON:
+                if char != ":":
+                    return self._fail(f"Expected ':', got {char!r}")
+                self._state = _VALUE
+            elif state == _LEADING:
+                skip_until = self._skip_until or ""
+                positions = [p for p in (text.find(c, i) for c in skip_until) if p >= 0]
+                if not positions:
+                    return
+                i = min(positions)
+                self._state = _VALUE
+                continue
+            elif state == _DONE:
+                if not self.allow_trailing_text:
+                    return self._fail("Unexpected text after JSON value")
+                return
+            i += 1
+
+    # Strings
+
+    def _start_string(self, is_key: bool) -> None:
+        self._state = _STRING
+        self._string = []
+        self._string_is_key = is_key
+        self._string_added = False
+        self._string_placed = False
+        self._unreported = []
+        if not is_key:
+            self._mark_changed()
+
+    def _append_string(self, text: str) -> None:
+        if self._high_surrogate:
+            text = self._high_surrogate + text
+            self._high_surrogate = ""
+        self._string.append(text)
+        if not self._string_is_key:
+            if self.track_patches:
+                self._unreported.append(text)
+            self._mark_changed()
+
+    def _read_escape(self, text: str, start: int) -> int:
+        """Decode the escape at ``start``; returns the next index or -1 if incomplete."""
+        if start + 1 >= len(text):
+            self._carry = text[start:]
+            return -1
+        code = text[start + 1]
+        if code != "u":
+            decoded = _ESCAPES.get(code)
+            if decoded is None:
+                self._fail(f"Invalid escape \\{code}")
+                return -1
+            self._append_string(decoded)
+            return start + 2
+        if start + 6 > len(text):
+            self._carry = text[start:]
+            return -1
+        try:
+            codepoint = int(text[start + 2:start + 6], 16)
+        except ValueError:
+            self._fail("Invalid unicode escape")
+            return -1
+        if 0xD800 <= codepoint <= 0xDBFF:
+            if self._high_surrogate:
+                self._append_string("")
+            self._high_surrogate = chr(codepoint)
+        elif 0xDC00 <= codepoint <= 0xDFFF and self._high_surrogate:
+            high = ord(self._high_surrogate)
+            self._high_surrogate = ""
+            self._append_string(chr(0x10000 + ((high - 0xD800) << 10) + (codepoint - 0xDC00)))
+        else:
+            self._append_string(chr(codepoint))
+        return start + 6
+
+    def _end_string(self) -> None:
+        if self._high_surrogate:
+            self._append_string("")
+        text = "".join(self._string)
+        self._string = []
+        if self._string_is_key:
+            self._stack[-1][1] = text
+            self._state = _COLON
+            return
+        self._flush_string_patch(text)
+        self._commit(text, record=False)
+
+    def _flush_string_patch(self, text: Optional[str] = None) -> None:
+        """Report text added to a streaming string value since the last report.
+
+        Args:
+            text: The complete string when it has just ended
+        """
+        if not self.track_patches or self._state != _STRING or self._string_is_key:
+            return
+        if not self._string_added:
+            if text is None:
+                text = "".join(self._string)
+            self._patches.append({"op": "add", "path": self._pointer(), "value": text})
+            self._string_added = True
+        elif self._unreported:
+            self._patches.append({
+                "op": "append",
+                "path": self._pointer(),
+                "value": "".join(self._unreported),
+            })
+        self._unreported = []
+
+    # Numbers and literals
+
+    def _end_token(self) -> bool:
+        token = "".join(self._token)
+        self._token = []
+        if token in _LITERALS:
+            self._commit(_LITERALS[token])
+            return True
+        number = _parse_number(token)
+        if number is None:
+            self._fail(f"Invalid token {token!r}")
+            return False
+        self._commit(number)
+        return True
+
+    def _streamed_string(self) -> str:
+        # Keep the joined prefix so the next read only joins the new pieces;
+        # a pending high surrogate shows up once it is paired
+        if len(self._string) > 1:
+            self._string = ["".join(self._string)]
+        return self._string[0] if self._string else ""
+
+    def _place_string(self, text: str) -> None:
+        """Put the text of the streaming string value into its container."""
+        container, key = self._stack[-1]
+        if isinstance(container, dict):
+            container[key] = text
+        elif self._string_placed:
+            container[-1] = text
+        else:
+            container.append(text)
+            self._string_placed = True
+
+    # Containers
+
+    def _open(self, container: Any) -> None:
+        if self.track_patches:
+            self._patches.append({"op": "add", "path": self._pointer(), "value": type(container)()})
+        # Open containers are part of the tree; they are filled in place
+        if self._stack:
+            parent, key = self._stack[-1]
+            if isinstance(parent, dict):
+                parent[key] = container
+            else:
+                parent.append(container)
+        else:
+            self._tree = container
+        self._stack.append([container, None])
+        self._mark_changed()
+
+    def _close(self) -> None:
+        container, _ = self._stack.pop()
+        self._end_value(container)
+
+    def _commit(self, value: Any, record: bool = True) -> None:
+        if record and self.track_patches:
+            self._patches.append({"op": "add", "path": self._pointer(), "value": value})
+        if self._stack:
+            container, key = self._stack[-1]
+            if isinstance(container, dict):
+                container[key] = value
+            elif self._string_placed:
+                container[-1] = value
+            else:
+                container.append(value)
+        self._string_placed = False
+        self._end_value(value)
+
+    def _end_value(self, value: Any) -> None:
+        if self._stack:
+            self._stack[-1][1] = None
+            self._state = _AFTER_VALUE
+        else:
+            self._root = value
+            self._state = _DONE
+        self._mark_changed()
+
+    # Helpers
+
+    def _mark_changed(self) -> None:
+        self._changed = True
+
+    def _fail(self, message: str) -> None:
+        self._state = _FAILED
+        self.error = message
+
+    def _pointer(self) -> str:
+        """JSON pointer of the value currently being parsed."""
+        segments = []
+        last = len(self._stack) - 1
+        for depth, (container, key) in enumerate(self._stack):
+            if isinstance(container, dict):
+                segment = str(key)
+            else:
+                # Below the top, the open child is the last item
+                index = len(container)
+                if depth < last or self._string_placed:
+                    index -= 1
+                segment = str(index)
+            segments.append("/" + segment.replace("~", "~0").replace("/", "~1"))
+        return "".join(segments)
+
+
+def _parse_number(token: str) -> Optional[Union[int, float]]:
+    try:
+        number = json.loads(token)
+    except ValueError:
+        return None
+    return number if isinstance(number, (int, float)) else None
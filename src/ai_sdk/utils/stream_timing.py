@@ -0,0 +1,141 @@
+"""Latency metrics for streamed generations.
+
+A :class:`StreamTimer` observes the parts of one stream as they are
+consumed and reports:
+
+- ``time_to_first_byte_ms``: start until the first part of any type
+- ``time_to_first_token_ms``: start until the first content delta (text,
+  reasoning or tool call arguments)
+- ``inter_token_latency_ms``: summary and histogram of the gaps between
+  consecutive content deltas
+- ``tokens_per_second``: output tokens over the time from the first to the
+  last delta (output tokens come from the usage when known, otherwise the
+  number of deltas is used)
+- ``duration_ms``: start until the end of the stream
+
+Example:
+    ```python
+    timer = StreamTimer()
+    async for part in stream:
+        timer.observe(part)
+    print(timer.metrics())
+    ```
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from typing import Any, Dict, Optional
+
+# Part types that carry generated content
+TOKEN_PART_TYPES = frozenset({"text-delta", "reasoning-delta", "tool-call-delta"})
+
+# Upper bounds (ms) of the inter-token gap histogram buckets
+GAP_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+
+
+class StreamTimer:
+    """Records part arrival times of one stream."""
+
+    def __init__(self, start: Optional[float] = None):
+        """Initialize the timer.
+
+        Args:
+            start: ``time.perf_counter()`` value when the request was sent
+                (default: now)
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.first_part: Optional[float] = None
+        self.first_token: Optional[float] = None
+        self.last_token: Optional[float] = None
+        self.end: Optional[float] = None
+        self.token_parts = 0
+        self._gaps = array("d")
+
+    def observe(self, part: Any) -> None:
+        """Record the arrival of a part."""
+        now = time.perf_counter()
+        if self.first_part is None:
+            self.first_part = now
+        if _part_type(part) not in TOKEN_PART_TYPES:
+            return
+        if self.last_token is None:
+            self.first_token = now
+        else:
+            self._gaps.append(now - self.last_token)
+        self.last_token = now
+        self.token_parts += 1
+
+    def finish(self) -> None:
+        """Record the end of the stream."""
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    def metrics(self, output_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Return the metrics recorded so far.
+
+        Args:
+            output_tokens: Output token count from the usage, if known
+
+        Returns:
+            Dict of metrics; times are in milliseconds, missing values are None.
+            Before ``finish()``, the duration runs until now.
+        """
+        end = self.end if self.end is not None else time.perf_counter()
+        tokens = output_tokens if output_tokens is not None else self.token_parts
+        generation = (
+            self.last_token - self.first_token
+            if self.first_token is not None and self.last_token is not None
+            else 0.0
+        )
+        return {
+            "time_to_first_byte_ms": _ms_since(self.start, self.first_part),
+            "time_to_first_token_ms": _ms_since(self.start, self.first_token),
+            "duration_ms": _ms_since(self.start, end),
+            "token_parts": self.token_parts,
+            "tokens_per_second": round(tokens / generation, 2) if generation > 0 else None,
+            "inter_token_latency_ms": _gap_summary(self._gaps),
+        }
+
+
+def _part_type(part: Any) -> Optional[str]:
+    if isinstance(part, dict):
+        return part.get("type")
+    return getattr(part, "type", None)
+
+
+def _ms_since(start: float, at: Optional[float]) -> Optional[float]:
+    return None if at is None else round((at - start) * 1000, 3)
+
+
+def _gap_summary(gaps: array) -> Optional[Dict[str, Any]]:
+    if not gaps:
+        return None
+    ordered = sorted(gaps)
+    count = len(ordered)
+
+    def percentile(p: float) -> float:
+        return round(ordered[min(count - 1, math.ceil(p * count) - 1)] * 1000, 3)
+
+    histogram = {f"le_{bound}": 0 for bound in GAP_BUCKETS_MS}
+    histogram["inf"] = 0
+    bucket = 0
+    # Gaps are sorted, so the buckets fill in one pass
+    for gap in ordered:
+        gap_ms = gap * 1000
+        while bucket < len(GAP_BUCKETS_MS) and gap_ms > GAP_BUCKETS_MS[bucket]:
+            bucket += 1
+        key = f"le_{GAP_BUCKETS_MS[bucket]}" if bucket < len(GAP_BUCKETS_MS) else "inf"
+        histogram[key] += 1
+
+    return {
+        "count": count,
+        "mean": round(sum(ordered) / count * 1000, 3),
+        "p50": percentile(0.5),
+        "p90": percentile(0.9),
+        "p99": percentile(0.99),
+        "max": round(ordered[-1] * 1000, 3),
+        "histogram": histogram,
+    }
@@ -26,11 +26,14 @@ def get_potential_start_index(text: str, search_tag: str) -> Optional[int]:
         return index
     
     # Check for partial matches at the end of the buffer
-    # We need to check if the end of our text might be the beginning of the tag
-    for i in range(1, min(len(search_tag), len(text)) + 1):
-        suffix = text[-i:]
-        prefix = search_tag[:i]
-        if suffix == prefix:
-            return len(text) - i
+    # We need to check if the end of our text might be the beginning of the tag.
+    # Try the longest candidate first: for tags like "<<x", both "<" and "<<"
+    # can end the text, and the tag may start at the earlier one.
+    start = max(0, len(text) - len(search_tag) + 1)
+    index = text.find(search_tag[0], start)
+    while index != -1:
+        if search_tag.startswith(text[index:]):
+            return index
+        index = text.find(search_tag[0], index + 1)
     
     return None
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""Shared fixtures for the tool and agent tests."""
+
+import asyncio
+
+import pytest
+
+from ai_sdk.tools import Tool, ToolCall
+
+WEATHER_SCHEMA = {
+    "type": "object",
+    "properties": {"city": {"type": "string"}},
+    "required": ["city"],
+}
+
+
+@pytest.fixture
+def make_tool():
+    """Build a tool with an empty input schema around ``execute``."""
+    def make(name, execute, **options):
+        return Tool(name=name, description="", input_schema={}, execute=execute, **options)
+
+    return make
+
+
+@pytest.fixture
+def make_weather_tool():
+    """Build a ``get_weather`` tool that appends each call's city to ``calls``."""
+    def make(calls, delay=0.0, **options):
+        async def get_weather(input, **kwargs):
+            calls.append(input["city"])
+            await asyncio.sleep(delay)
+            return f"sunny in {input['city']}"
+
+        return Tool(
+            name="get_weather",
+            description="Current weather",
+            input_schema=WEATHER_SCHEMA,
+            execute=get_weather,
+            **options,
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_tool_call():
+    """Build a ToolCall of the named tool with keyword arguments as its input."""
+    def make(name, call_id="1", **input):
+        return ToolCall(tool_call_id=call_id, tool_name=name, input=input)
+
+    return make
+
+
+@pytest.fixture
+def make_tool_calls():
+    """Build one ToolCall per name, with IDs ``call-<i>`` and input ``{"n": i}``."""
+    def make(*names):
+        return [
+            ToolCall(tool_call_id=f"call-{i}", tool_name=name, input={"n": i})
+            for i, name in enumerate(names)
+        ]
+
+    return make
+
+
+@pytest.fixture
+def make_agent_tool_calls():
+    """Build the same calls in the agent's ``id``/``name``/``arguments`` form."""
+    def make(*names):
+        return [
+            {"id": f"call-{i}", "name": name, "arguments": {"n": i}}
+            for i, name in enumerate(names)
+        ]
+
+    return make
@@ -0,0 +1,199 @@
+"""Tests for aborting streams."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from ai_sdk import stream_text
+from ai_sdk.core.generate_object import stream_object
+from ai_sdk.errors import AbortError
+from ai_sdk.providers.openai import create_openai
+from ai_sdk.utils import AbortController, abortable_stream
+from pydantic import BaseModel
+
+
+class SlowChatServer:
+    """Local stand-in for the chat completions API that streams slowly.
+
+    Records when the client closes the connection.
+    """
+
+    def __init__(self, chunks=200, interval=0.05):
+        self.chunks = chunks
+        self.interval = interval
+        self.connected = asyncio.Event()
+        self.disconnected = asyncio.Event()
+        self.disconnected_at = None
+        self.chunks_sent = 0
+        self._server = None
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in head.decode().split("\r\n"):
+            name, _, value = line.partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        await reader.readexactly(length)
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        self.connected.set()
+        sender = asyncio.ensure_future(self._send(writer))
+        # The client sends nothing more; EOF means it closed the connection
+        await reader.read()
+        self.disconnected_at = time.perf_counter()
+        self.disconnected.set()
+        sender.cancel()
+        writer.close()
+
+    async def _send(self, writer):
+        try:
+            for i in range(self.chunks):
+                event = {"choices": [{"index": 0, "delta": {"content": f"tok{i} "}}]}
+                data = f"data: {json.dumps(event)}\n\n".encode()
+                writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                await writer.drain()
+                self.chunks_sent += 1
+                await asyncio.sleep(self.interval)
+        except ConnectionError:
+            pass
+
+
+class Answer(BaseModel):
+    text: str
+
+
+@pytest.mark.asyncio
+class TestAbortController:
+    async def test_abort_notifies_listeners_once(self):
+        """Listeners get the reason; aborting again has no effect."""
+        controller = AbortController()
+        reasons = []
+        controller.signal.add_listener(reasons.append)
+        removed = controller.signal.add_listener(lambda reason: reasons.append("removed"))
+        removed()
+
+        controller.abort("stop")
+        controller.abort("again")
+
+        assert controller.signal.aborted
+        assert reasons == ["stop"]
+        assert await controller.signal.wait() == "stop"
+        with pytest.raises(AbortError) as exc_info:
+            controller.signal.throw_if_aborted()
+        assert exc_info.value.reason == "stop"
+
+    async def test_abort_interrupts_pending_read(self):
+        """An abort during a read raises at once and closes the source."""
+        closed = asyncio.Event()
+
+        async def source():
+            try:
+                yield "first"
+                await asyncio.sleep(60)
+                yield "never"
+            finally:
+                closed.set()
+
+        controller = AbortController()
+        received = []
+
+        async def consume():
+            async for item in abortable_stream(source(), controller.signal):
+                received.append(item)
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.01)
+        controller.abort("client left")
+
+        with pytest.raises(AbortError):
+            await asyncio.wait_for(task, 1)
+        assert received == ["first"]
+        assert closed.is_set()
+
+    async def test_outside_cancellation_is_not_converted(self):
+        """Cancelling the consumer still raises CancelledError."""
+        async def source():
+            await asyncio.sleep(60)
+            yield "never"
+
+        async def consume():
+            async for _ in abortable_stream(source(), AbortController().signal):
+                pass
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.asyncio
+class TestAbortUpstream:
+    async def test_stream_text_abort_closes_connection(self):
+        """The server sees the connection drop right after the abort."""
+        async with SlowChatServer() as server:
+            model = create_openai(api_key="x", base_url=server.base_url).chat("gpt-4o")
+            controller = AbortController()
+            received = []
+
+            async def consume():
+                async for part in stream_text(
+                    model, prompt="Hi", abort_signal=controller.signal
+                ):
+                    received.append(part)
+
+            task = asyncio.ensure_future(consume())
+            await asyncio.wait_for(server.connected.wait(), 5)
+            while len(received) < 2:
+                await asyncio.sleep(0.005)
+
+            aborted_at = time.perf_counter()
+            controller.abort("client disconnected")
+            with pytest.raises(AbortError):
+                await asyncio.wait_for(task, 1)
+
+            await asyncio.wait_for(server.disconnected.wait(), 1)
+            # Well before the next chunk would have been sent
+            assert server.disconnected_at - aborted_at < server.interval
+            assert server.chunks_sent < server.chunks
+
+    async def test_stream_object_abort_closes_connection(self):
+        """Aborting stream_object raises AbortError instead of an ErrorPart."""
+        async with SlowChatServer() as server:
+            model = create_openai(api_key="x", base_url=server.base_url).chat("gpt-4o")
+            controller = AbortController()
+            parts = []
+
+            async def consume():
+                async for part in stream_object(
+                    model, schema=Answer, prompt="Hi", abort_signal=controller.signal
+                ):
+                    parts.append(part)
+
+            task = asyncio.ensure_future(consume())
+            await asyncio.wait_for(server.connected.wait(), 5)
+            while not parts:
+                await asyncio.sleep(0.005)
+
+            controller.abort()
+            with pytest.raises(AbortError):
+                await asyncio.wait_for(task, 1)
+            await asyncio.wait_for(server.disconnected.wait(), 1)
+            assert all(part.type != "error" for part in parts)
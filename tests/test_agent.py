@@ -1,11 +1,20 @@
 """Tests for the Agent system."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from ai_sdk import Agent, AgentSettings, tool
 from ai_sdk.providers.base import LanguageModel
-from ai_sdk.providers.types import Message, FinishReason, Usage
+from ai_sdk.providers.types import (
+    FinishReason,
+    GenerateResult,
+    Message,
+    TextContent,
+    ToolCallContent,
+    Usage,
+)
 from ai_sdk.core.generate_text import GenerateTextResult
 
 
@@ -204,3 +213,197 @@ def test_agent_generate_requires_input(mock_model):
         # happens before the async part, so we test this by creating the
         # generation options and checking the validation
         agent.stream()  # This should raise the error synchronously
+
+
+class StubLanguageModel(LanguageModel):
+    """Language model that is never called."""
+
+    def __init__(self):
+        super().__init__(provider="test", model_id="test-model")
+
+    async def generate(self, options):
+        raise NotImplementedError
+
+    async def stream(self, options):
+        raise NotImplementedError
+        yield
+
+
+class ScriptedGenerateModel(LanguageModel):
+    """Language model returning one scripted content list per request."""
+
+    def __init__(self, *replies):
+        super().__init__(provider="test", model_id="scripted-model")
+        self.replies = list(replies)
+        self.requests = []
+
+    async def generate(self, options):
+        self.requests.append(options)
+        content = self.replies[len(self.requests) - 1]
+        has_calls = any(isinstance(part, ToolCallContent) for part in content)
+        return GenerateResult(
+            content=content,
+            finish_reason=FinishReason.TOOL_CALLS if has_calls else FinishReason.STOP,
+            usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+
+    async def stream(self, options):
+        raise NotImplementedError
+        yield
+
+
+def _sleep_tool(name, delay, log, **flags):
+    """Tool that records its start and end and sleeps ``delay`` seconds."""
+    from ai_sdk.tools import Tool
+
+    async def execute(args):
+        log.append(("start", name, args["n"]))
+        await asyncio.sleep(delay)
+        log.append(("end", name, args["n"]))
+        return f"{name}-{args['n']}"
+
+    return Tool(name=name, description=name, input_schema={}, execute=execute, **flags)
+
+
+@pytest.mark.asyncio
+async def test_agent_executes_tool_calls_concurrently(make_agent_tool_calls):
+    """Independent tool calls overlap; messages keep the call order."""
+    log = []
+    agent = Agent(
+        model=StubLanguageModel(),
+        tools={
+            "slow": _sleep_tool("slow", 0.05, log),
+            "fast": _sleep_tool("fast", 0.01, log),
+        },
+    )
+    conversation = []
+
+    timing = await agent._execute_tools(
+        make_agent_tool_calls("slow", "fast", "slow", "fast"), conversation
+    )
+
+    assert [m.tool_call_id for m in conversation] == ["call-0", "call-1", "call-2", "call-3"]
+    assert [m.content for m in conversation] == ["slow-0", "fast-1", "slow-2", "fast-3"]
+    # All four calls start before the first one ends
+    assert [event for event, _, _ in log[:4]] == ["start"] * 4
+    assert {"tool_wall_ms", "tool_total_ms"} <= set(timing)
+
+
+@pytest.mark.asyncio
+async def test_agent_tool_concurrency_limits_and_flags(make_agent_tool_calls):
+    """max_tool_concurrency, sequential and exclusive tools are respected."""
+    log = []
+    agent = Agent(
+        model=StubLanguageModel(),
+        max_tool_concurrency=2,
+        tools={
+            "a": _sleep_tool("a", 0.01, log),
+            "seq": _sleep_tool("seq", 0.01, log, sequential=True),
+            "solo": _sleep_tool("solo", 0.01, log, exclusive=True),
+        },
+    )
+    conversation = []
+
+    await agent._execute_tools(
+        make_agent_tool_calls("a", "a", "a", "solo", "seq", "seq", "a"), conversation
+    )
+
+    running = 0
+    peak = 0
+    seq_running = 0
+    for event, name, n in log:
+        running += 1 if event == "start" else -1
+        peak = max(peak, running)
+        if name == "seq":
+            seq_running += 1 if event == "start" else -1
+            assert seq_running <= 1
+        if name == "solo" and event == "start":
+            assert running == 1
+    assert peak == 2
+    # Sequential calls run in call order
+    assert [n for event, name, n in log if name == "seq" and event == "start"] == [4, 5]
+    assert [m.tool_call_id for m in conversation] == [f"call-{i}" for i in range(7)]
+
+
+@pytest.mark.asyncio
+async def test_agent_tool_timeout_becomes_error_message(make_agent_tool_calls):
+    """A tool exceeding its timeout yields an error message for the model."""
+    log = []
+    agent = Agent(
+        model=StubLanguageModel(),
+        tools={
+            "hang": _sleep_tool("hang", 60, log, timeout=0.05),
+            "fast": _sleep_tool("fast", 0.01, log),
+        },
+    )
+    conversation = []
+
+    await asyncio.wait_for(
+        agent._execute_tools(make_agent_tool_calls("hang", "fast"), conversation), 1
+    )
+
+    assert conversation[0].content.startswith("Error: Tool 'hang' did not finish")
+    assert conversation[1].content == "fast-1"
+
+
+@pytest.mark.asyncio
+async def test_agent_runs_sync_tools_in_their_execution_mode(make_agent_tool_calls):
+    """Blocking sync tools in thread mode run side by side off the event loop."""
+    import threading
+    import time as time_module
+    from ai_sdk.tools import Tool
+
+    def blocking(args):
+        time_module.sleep(0.1)
+        return threading.current_thread().name
+
+    agent = Agent(
+        model=StubLanguageModel(),
+        tools={
+            "blocking": Tool(
+                name="blocking", description="", input_schema={},
+                execute=blocking, execution_mode="thread",
+            ),
+        },
+    )
+    conversation = []
+
+    started = asyncio.get_running_loop().time()
+    await agent._execute_tools(make_agent_tool_calls("blocking", "blocking"), conversation)
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert all(message.content.startswith("ai-sdk-tool") for message in conversation)
+    assert elapsed < 0.19
+
+
+@pytest.mark.asyncio
+async def test_multi_step_generate_runs_tool_calls_from_content(make_agent_tool_calls):
+    """Tool calls in a step's content run concurrently; results keep the call order."""
+    from ai_sdk.agent.agent import step_count_is
+
+    log = []
+    model = ScriptedGenerateModel(
+        [
+            ToolCallContent(tool_call_id="call-0", tool_name="slow", args={"n": 0}),
+            ToolCallContent(tool_call_id="call-1", tool_name="fast", args={"n": 1}),
+        ],
+        [TextContent(text="done")],
+    )
+    agent = Agent(
+        model=model,
+        stop_when=step_count_is(2),
+        tools={
+            "slow": _sleep_tool("slow", 0.05, log),
+            "fast": _sleep_tool("fast", 0.01, log),
+        },
+    )
+
+    run = await agent.multi_step_generate("go")
+
+    assert run["total_steps"] == 2
+    assert run["steps"][0].tool_calls == make_agent_tool_calls("slow", "fast")
+    assert [event for event, _, _ in log] == ["start", "start", "end", "end"]
+    tool_messages = [m for m in model.requests[1].messages if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_messages] == ["call-0", "call-1"]
+    assert [m.content for m in tool_messages] == ["slow-0", "fast-1"]
+    assert run["final_result"].text == "done"
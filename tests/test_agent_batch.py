@@ -0,0 +1,188 @@
+"""Tests for running agent sessions in batches."""
+
+import asyncio
+import json
+
+import pytest
+
+from ai_sdk.agent import (
+    Agent,
+    BatchSession,
+    FileBatchCheckpoint,
+    run_agent_batch,
+)
+from ai_sdk.agent.agent import step_count_is
+from ai_sdk.errors import InvalidArgumentError
+from ai_sdk.providers.base import LanguageModel
+from ai_sdk.providers.types import (
+    FinishReason,
+    GenerateResult,
+    TextContent,
+    ToolCallContent,
+    Usage,
+)
+from ai_sdk.tools import Tool
+from ai_sdk.utils.concurrency import RateLimiter
+
+
+class EchoModel(LanguageModel):
+    """Language model echoing the last user message, using 10 tokens per call."""
+
+    def __init__(self, delay=0.0, fail_on=None):
+        super().__init__(provider="echo", model_id="echo-model")
+        self.delay = delay
+        self.fail_on = fail_on
+        self.prompts = []
+        self.running = 0
+        self.peak = 0
+
+    async def generate(self, options):
+        prompt = options.messages[-1].content
+        self.prompts.append(prompt)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        if prompt == self.fail_on:
+            raise RuntimeError(f"cannot answer {prompt}")
+        return GenerateResult(
+            content=[TextContent(text=f"echo {prompt}")],
+            finish_reason=FinishReason.STOP,
+            usage=Usage(prompt_tokens=4, completion_tokens=6, total_tokens=10),
+        )
+
+    async def stream(self, options):
+        raise NotImplementedError
+        yield
+
+
+class LookupModel(EchoModel):
+    """Echo model that first looks up the user's prompt with the ``lookup`` tool."""
+
+    async def generate(self, options):
+        last = options.messages[-1]
+        if last.role != "user":
+            return await super().generate(options)
+        return GenerateResult(
+            content=[ToolCallContent(
+                tool_call_id="call-1", tool_name="lookup", args={"q": last.content}
+            )],
+            finish_reason=FinishReason.TOOL_CALLS,
+            usage=Usage(prompt_tokens=4, completion_tokens=6, total_tokens=10),
+        )
+
+
+LOOKUP_TOOL = Tool(
+    name="lookup", description="", input_schema={}, execute=lambda input: f"found {input['q']}"
+)
+
+
+@pytest.mark.asyncio
+class TestRunAgentBatch:
+    async def test_results_are_ordered_and_concurrency_is_capped(self):
+        """Sessions overlap up to the cap; results keep the session order."""
+        model = EchoModel(delay=0.01)
+        progress = []
+
+        results = await run_agent_batch(
+            Agent(model=model),
+            [f"q{i}" for i in range(10)],
+            max_concurrency=3,
+            on_progress=lambda p: progress.append((p.finished, p.in_flight)),
+        )
+
+        assert [r.text for r in results] == [f"echo q{i}" for i in range(10)]
+        assert [r.id for r in results] == [str(i) for i in range(10)]
+        assert all(r.status == "completed" and r.usage.total_tokens == 10 for r in results)
+        assert model.peak == 3
+        assert progress[0] == (0, 0)
+        assert progress[-1] == (10, 0)
+
+    async def test_failures_are_reported_per_session(self):
+        """A failing session does not stop the others and keeps its error."""
+        results = await run_agent_batch(
+            Agent(model=EchoModel(fail_on="bad")), ["good", "bad", "fine"]
+        )
+
+        assert [r.status for r in results] == ["completed", "failed", "completed"]
+        assert "cannot answer bad" in results[1].error
+
+    async def test_failure_after_the_first_step_fails_the_session(self, tmp_path):
+        """A session whose later model call fails is failed and not checkpointed."""
+        path = tmp_path / "batch.jsonl"
+        agent = Agent(
+            model=LookupModel(fail_on="found bad"),
+            tools={"lookup": LOOKUP_TOOL},
+            stop_when=step_count_is(2),
+        )
+
+        results = await run_agent_batch(
+            agent, ["good", "bad"], checkpoint=FileBatchCheckpoint(path)
+        )
+
+        assert [r.status for r in results] == ["completed", "failed"]
+        assert "cannot answer found bad" in results[1].error
+        saved = [json.loads(line)["id"] for line in path.read_text().splitlines()]
+        assert saved == ["0"]
+
+    async def test_budget_stops_scheduling(self):
+        """Once the cost budget is spent, remaining sessions are skipped."""
+        results = await run_agent_batch(
+            Agent(model=EchoModel()),
+            [f"q{i}" for i in range(6)],
+            max_concurrency=1,
+            max_cost=0.25,
+            cost_function=lambda model, usage: usage.total_tokens / 100,
+        )
+
+        assert [r.status for r in results] == ["completed"] * 3 + ["skipped"] * 3
+        assert sum(r.cost for r in results) == pytest.approx(0.3)
+
+    async def test_rate_limit_applies_per_provider(self):
+        """Model calls of a provider wait for its rate limiter."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await run_agent_batch(
+            Agent(model=EchoModel()),
+            ["a", "b", "c", "d"],
+            rate_limits={"echo": RateLimiter(requests_per_minute=3000, burst=1)},
+        )
+
+        assert loop.time() - start >= 0.055
+
+    async def test_checkpoint_resumes_completed_sessions(self, tmp_path):
+        """A rerun skips checkpointed sessions and tolerates a cut-off line."""
+        path = tmp_path / "batch.jsonl"
+        sessions = [BatchSession(id=name, prompt=name) for name in ("a", "b", "bad", "c")]
+
+        first = await run_agent_batch(
+            Agent(model=EchoModel(fail_on="bad")),
+            sessions,
+            checkpoint=FileBatchCheckpoint(path),
+        )
+        assert [r.status for r in first] == ["completed", "completed", "failed", "completed"]
+        saved = [json.loads(line)["id"] for line in path.read_text().splitlines()]
+        assert sorted(saved) == ["a", "b", "c"]
+
+        # Simulate a crash while writing the last line
+        with open(path, "a") as f:
+            f.write('{"index": 2, "id": "ba')
+
+        model = EchoModel()
+        second = await run_agent_batch(
+            Agent(model=model), sessions, checkpoint=FileBatchCheckpoint(path)
+        )
+
+        assert model.prompts == ["bad"]
+        assert [r.text for r in second] == ["echo a", "echo b", "echo bad", "echo c"]
+        assert [r.resumed for r in second] == [True, True, False, True]
+
+    async def test_rejects_duplicate_session_ids(self):
+        with pytest.raises(InvalidArgumentError):
+            await run_agent_batch(
+                Agent(model=EchoModel()),
+                [BatchSession(id="x", prompt="a"), BatchSession(id="x", prompt="b")],
+            )
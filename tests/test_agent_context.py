@@ -0,0 +1,123 @@
+"""Tests for token-budgeted agent context management."""
+
+import pytest
+
+from ai_sdk.agent import (
+    Agent,
+    ContextManager,
+    DropOldToolResults,
+    SummarizeHistory,
+    TruncateToolResults,
+    estimate_tokens,
+)
+from ai_sdk.providers.base import LanguageModel
+from ai_sdk.providers.types import (
+    FinishReason,
+    GenerateResult,
+    Message,
+    TextContent,
+    Usage,
+)
+
+
+class SummaryModel(LanguageModel):
+    """Language model that answers every request with a fixed summary."""
+
+    def __init__(self, summary="The user asked about the weather in Oslo; it is sunny."):
+        super().__init__(provider="test", model_id="summary-model")
+        self.summary = summary
+        self.requests = []
+
+    async def generate(self, options):
+        self.requests.append(options)
+        return GenerateResult(
+            content=[TextContent(text=self.summary)],
+            finish_reason=FinishReason.STOP,
+            usage=Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+        )
+
+    async def stream(self, options):
+        raise NotImplementedError
+        yield
+
+
+def _conversation(tool_outputs):
+    messages = [
+        Message(role="system", content="You are helpful."),
+        Message(role="user", content="Plan my trip."),
+    ]
+    for i, output in enumerate(tool_outputs):
+        messages.append(Message(role="assistant", content=f"Calling tool {i}"))
+        messages.append(Message(role="tool", content=output, tool_call_id=f"call-{i}"))
+    return messages
+
+
+@pytest.mark.asyncio
+class TestContextManager:
+    async def test_within_budget_is_unchanged(self):
+        """Conversations under the budget are passed through as they are."""
+        messages = _conversation(["short"])
+        compacted, stats = await ContextManager(max_tokens=1000).compact(messages)
+
+        assert compacted == messages
+        assert stats["tokens_saved"] == 0
+
+    async def test_large_tool_results_are_truncated(self):
+        """Outputs above the per-result limit keep their beginning."""
+        messages = _conversation(["x" * 8000, "y" * 100])
+        manager = ContextManager(
+            max_tokens=1000, strategies=[TruncateToolResults(max_tokens_per_result=100)]
+        )
+
+        compacted, stats = await manager.compact(messages)
+
+        assert compacted[3].content.startswith("x" * 400)
+        assert "7600 characters truncated" in compacted[3].content
+        assert compacted[5].content == "y" * 100
+        assert messages[3].content == "x" * 8000
+        assert stats["tokens_after"] <= 1000
+        assert stats["tokens_saved"] == stats["tokens_before"] - stats["tokens_after"]
+
+    async def test_old_tool_results_are_dropped_oldest_first(self):
+        """Only as many old outputs are dropped as needed; recent ones stay."""
+        messages = _conversation(["a" * 2000, "b" * 2000, "c" * 2000, "d" * 2000])
+        manager = ContextManager(
+            max_tokens=estimate_tokens(messages) - 400,
+            strategies=[DropOldToolResults(keep_last=1)],
+        )
+
+        compacted, _ = await manager.compact(messages)
+
+        contents = [m.content for m in compacted if m.role == "tool"]
+        assert contents[0] == "[Tool output removed to save context]"
+        assert contents[1:] == ["b" * 2000, "c" * 2000, "d" * 2000]
+
+    async def test_history_is_summarized(self):
+        """Earlier turns become one summary message; tool results stay with their calls."""
+        model = SummaryModel()
+        messages = _conversation(["sunny", "rainy", "windy"])
+        manager = ContextManager(max_tokens=10, strategies=[SummarizeHistory(model, keep_last=3)])
+
+        compacted, _ = await manager.compact(messages)
+
+        assert compacted[0] == messages[0]
+        assert compacted[1].content.endswith(model.summary)
+        # The tail moves back to the assistant message calling the first kept tool
+        assert [m.role for m in compacted[2:]] == ["assistant", "tool", "assistant", "tool"]
+        transcript = model.requests[0].messages[-1].content
+        assert "tool: sunny" in transcript and "rainy" not in transcript
+
+    async def test_agent_compacts_before_each_step(self):
+        """The agent compacts its conversation in place and reports the savings."""
+        agent = Agent(
+            model=SummaryModel(),
+            context_manager=ContextManager(
+                max_tokens=200, strategies=[TruncateToolResults(max_tokens_per_result=50)]
+            ),
+        )
+        conversation = _conversation(["z" * 4000])
+
+        settings = await agent._prepare_step(steps=[], step_number=0, messages=conversation)
+
+        assert len(conversation[3].content) < 300
+        assert settings["context_compaction"]["tokens_saved"] > 900
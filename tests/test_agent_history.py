@@ -0,0 +1,189 @@
+"""Tests for the agent's shared message history."""
+
+import pytest
+
+from ai_sdk.agent import Agent, ContextManager, MessageLog, TruncateToolResults
+from ai_sdk.agent.agent import StepResult, StopCondition, step_count_is
+from ai_sdk.providers.base import LanguageModel
+from ai_sdk.providers.types import (
+    FinishReason,
+    GenerateResult,
+    Message,
+    ProviderMetadata,
+    TextContent,
+    ToolCallContent,
+    Usage,
+)
+from ai_sdk.tools import Tool
+
+
+class CountingModel(LanguageModel):
+    """Language model replying "reply N" to its Nth request.
+
+    With ``tool_calls`` set, each reply also calls the ``note`` tool, so
+    the agent continues with another step.
+    """
+
+    def __init__(self, tool_calls=False):
+        super().__init__(provider="test", model_id="counting-model")
+        self.tool_calls = tool_calls
+        self.requests = []
+
+    async def generate(self, options):
+        self.requests.append(options)
+        content = [TextContent(text=f"reply {len(self.requests)}")]
+        if self.tool_calls:
+            content.append(ToolCallContent(
+                tool_call_id=f"call-{len(self.requests)}", tool_name="note", args={}
+            ))
+        return GenerateResult(
+            content=content,
+            finish_reason=FinishReason.TOOL_CALLS if self.tool_calls else FinishReason.STOP,
+            usage=Usage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+            provider_metadata=ProviderMetadata(data={"raw": "x" * 1000}),
+            response_metadata={"body": "x" * 1000},
+        )
+
+    async def stream(self, options):
+        raise NotImplementedError
+        yield
+
+
+def _message(text, role="user"):
+    return Message(role=role, content=text)
+
+
+def _text(message):
+    if isinstance(message.content, str):
+        return message.content
+    return "".join(part.text for part in message.content if part.type == "text")
+
+
+NOTE_TOOL = Tool(name="note", description="", input_schema={}, execute=lambda input: "noted")
+
+
+class TestMessageLog:
+    def test_views_keep_their_prefix(self):
+        """Appends are invisible to earlier views; rewrites do not affect them."""
+        log = MessageLog([_message("a")])
+        first = log.view()
+        log.append(_message("b"))
+        second = log.view()
+
+        log[:] = [_message("rewritten")]
+        log.append(_message("c"))
+
+        assert [m.content for m in first] == ["a"]
+        assert [m.content for m in second] == ["a", "b"]
+        assert second[-1].content == "b"
+        assert second.materialize() == [_message("a"), _message("b")]
+        assert [m.content for m in log] == ["rewritten", "c"]
+
+    def test_appends_share_one_list(self):
+        """Views taken between appends reference the same list."""
+        log = MessageLog()
+        views = []
+        for i in range(5):
+            log.append(_message(str(i)))
+            views.append(log.view())
+
+        assert len({id(view._messages) for view in views}) == 1
+        assert [len(view) for view in views] == [1, 2, 3, 4, 5]
+
+    def test_step_messages_serialize(self):
+        """A step's message view dumps as a list and validates back."""
+        log = MessageLog([_message("Hi")])
+        log.append(_message("Hello", role="assistant"))
+        step = StepResult(step_number=0, messages=log.view())
+        log.append(_message("later"))
+
+        restored = StepResult.model_validate_json(step.model_dump_json())
+
+        assert restored.messages == [_message("Hi"), _message("Hello", role="assistant")]
+        assert step.model_dump()["messages"][1]["content"] == "Hello"
+
+
+@pytest.mark.asyncio
+class TestAgentHistory:
+    async def test_steps_reference_the_growing_conversation(self):
+        """Each step sees the conversation up to its own reply."""
+        model = CountingModel(tool_calls=True)
+        agent = Agent(
+            model=model, tools={"note": NOTE_TOOL}, stop_when=step_count_is(3), max_steps=3
+        )
+
+        output = await agent.multi_step_generate("Hi")
+
+        steps = output["steps"]
+        assert [_text(m) for m in steps[0].messages] == ["Hi", "reply 1"]
+        assert [_text(m) for m in steps[2].messages] == [
+            "Hi", "reply 1", "noted", "reply 2", "noted", "reply 3"
+        ]
+        assert steps[1].materialize_messages() == output["conversation"][:4]
+        # The model saw the previous replies and tool results
+        assert len(model.requests[2].messages) == 5
+
+    async def test_text_reply_ends_the_run(self):
+        """A step without tool calls is the last one, whatever the stop condition."""
+        model = CountingModel()
+        agent = Agent(model=model, stop_when=step_count_is(5))
+
+        output = await agent.multi_step_generate("Hi")
+
+        assert output["total_steps"] == 1
+        assert len(model.requests) == 1
+        assert [m.role for m in output["conversation"]] == ["user", "assistant"]
+
+    async def test_callbacks_get_message_lists(self):
+        """prepare_step and stop conditions see plain lists they may change."""
+        seen = []
+
+        def prepare_step(context):
+            seen.append(context["messages"])
+            context["messages"].pop()
+
+        def stop(step_count, messages):
+            seen.append(messages)
+            return False
+
+        agent = Agent(model=CountingModel(), prepare_step=prepare_step, stop_when=StopCondition(stop))
+
+        output = await agent.multi_step_generate("Hi")
+
+        assert all(type(messages) is list for messages in seen)
+        assert [m.content for m in output["conversation"]] == ["Hi", "reply 1"]
+
+    async def test_compaction_does_not_rewrite_earlier_steps(self):
+        """Earlier steps keep the messages they were generated from."""
+        agent = Agent(
+            model=CountingModel(tool_calls=True),
+            tools={"note": NOTE_TOOL},
+            stop_when=step_count_is(2),
+            context_manager=ContextManager(
+                # Fits before the first step, not after its reply
+                max_tokens=112, strategies=[TruncateToolResults(max_tokens_per_result=5)]
+            ),
+        )
+        long_result = Message(role="tool", content="y" * 400, tool_call_id="call-1")
+
+        output = await agent.multi_step_generate(messages=[_message("Hi"), long_result])
+
+        assert output["steps"][0].messages[1].content == "y" * 400
+        assert len(output["steps"][1].messages[1].content) < 100
+
+    async def test_provider_payloads_can_be_dropped(self):
+        """Step results release raw provider data when asked to."""
+        seen = []
+        agent = Agent(
+            model=CountingModel(),
+            stop_when=step_count_is(2),
+            keep_provider_payloads=False,
+            on_step_finish=lambda step: seen.append(step.result.response_metadata),
+        )
+
+        output = await agent.multi_step_generate("Hi")
+
+        assert all(step.result.response_metadata is None for step in output["steps"])
+        assert all(step.result.provider_metadata is None for step in output["steps"])
+        assert output["steps"][0].result.text == "reply 1"
+        assert seen[0] == {"body": "x" * 1000}
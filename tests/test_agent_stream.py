@@ -0,0 +1,208 @@
+"""Tests for the agent's multi-step streaming loop."""
+
+import asyncio
+import json
+
+import pytest
+
+from ai_sdk.agent import Agent
+from ai_sdk.agent.agent import has_tool_call, step_count_is
+from ai_sdk.providers.base import LanguageModel
+from ai_sdk.providers.stream_parts import FastTextDelta, FastToolCallDelta
+from ai_sdk.providers.types import FinishPart, FinishReason, StreamPart, ToolCallContent, Usage
+from ai_sdk.tools import Tool
+
+
+def _usage(tokens):
+    return Usage(prompt_tokens=tokens, completion_tokens=tokens, total_tokens=2 * tokens)
+
+
+def _tool_call(call_id, name, args, chunk_size=5):
+    """Parts streaming one tool call, with its arguments split into chunks."""
+    parts = [StreamPart(type="tool-call-start", tool_call_id=call_id, tool_name=name)]
+    raw = json.dumps(args)
+    for start in range(0, len(raw), chunk_size):
+        parts.append(FastToolCallDelta(tool_call_id=call_id, args_delta=raw[start:start + chunk_size]))
+    return parts
+
+
+class ScriptedModel(LanguageModel):
+    """Language model streaming one scripted list of parts per request.
+
+    A float in a script pauses the stream for that many seconds.
+    """
+
+    def __init__(self, *scripts):
+        super().__init__(provider="test", model_id="scripted-model")
+        self.scripts = list(scripts)
+        self.requests = []
+
+    async def generate(self, options):
+        raise NotImplementedError
+
+    async def stream(self, options):
+        self.requests.append(options)
+        for part in self.scripts[len(self.requests) - 1]:
+            if isinstance(part, float):
+                await asyncio.sleep(part)
+            else:
+                yield part
+
+
+def _tool(name, execute, **options):
+    return Tool(name=name, description=name, input_schema={}, execute=execute, **options)
+
+
+async def _collect(stream):
+    return [part async for part in stream]
+
+
+@pytest.mark.asyncio
+class TestAgentStream:
+    async def test_runs_tools_and_continues_on_the_same_stream(self):
+        """Tool calls are executed and the next step streams from their results."""
+        async def weather(args):
+            return f"sunny in {args['city']}"
+
+        model = ScriptedModel(
+            [
+                FastTextDelta("Checking. "),
+                *_tool_call("call-1", "weather", {"city": "Paris"}),
+                FinishPart(finish_reason=FinishReason.TOOL_CALLS, usage=_usage(10)),
+            ],
+            [
+                FastTextDelta("It is sunny."),
+                FinishPart(finish_reason=FinishReason.STOP, usage=_usage(20)),
+            ],
+        )
+        agent = Agent(
+            model=model, tools={"weather": _tool("weather", weather)}, stop_when=step_count_is(5)
+        )
+
+        parts = await _collect(agent.stream("Weather in Paris?"))
+
+        types = [part.type for part in parts]
+        assert types[:3] == ["step-start", "text-delta", "tool-call-start"]
+        assert types[types.index("step-finish"):] == [
+            "step-finish", "tool-result", "step-start", "text-delta", "step-finish", "finish",
+        ]
+        tool_result = parts[types.index("tool-result")]
+        assert (tool_result.tool_call_id, tool_result.result) == ("call-1", "sunny in Paris")
+        assert not tool_result.is_error
+        assert parts[-1].usage.total_tokens == 60
+        assert parts[-1].finish_reason == FinishReason.STOP
+
+        second_request = model.requests[1].messages
+        assert [m.role for m in second_request] == ["user", "assistant", "tool"]
+        assert second_request[1].content[1] == ToolCallContent(
+            tool_call_id="call-1", tool_name="weather", args={"city": "Paris"}
+        )
+        assert second_request[2].content == "sunny in Paris"
+
+    async def test_tool_results_stream_as_calls_complete(self):
+        """A fast call's result comes first; messages keep the call order."""
+        async def wait(args):
+            await asyncio.sleep(args["seconds"])
+            return args["seconds"]
+
+        model = ScriptedModel(
+            [
+                *_tool_call("slow", "wait", {"seconds": 0.05}),
+                *_tool_call("fast", "wait", {"seconds": 0.0}),
+                FinishPart(finish_reason=FinishReason.TOOL_CALLS, usage=_usage(1)),
+            ],
+            [FinishPart(finish_reason=FinishReason.STOP, usage=_usage(1))],
+        )
+        agent = Agent(model=model, tools={"wait": _tool("wait", wait)}, stop_when=step_count_is(5))
+
+        parts = await _collect(agent.stream("Wait"))
+
+        results = [part.tool_call_id for part in parts if part.type == "tool-result"]
+        assert results == ["fast", "slow"]
+        assert [m.tool_call_id for m in model.requests[1].messages[2:]] == ["slow", "fast"]
+
+    @pytest.mark.parametrize("speculative", [True, False])
+    async def test_idempotent_tools_start_while_streaming(self, speculative):
+        """With speculative_tools, an idempotent call starts once its arguments are complete."""
+        calls = []
+
+        async def lookup(args):
+            calls.append(args["key"])
+            return args["key"].upper()
+
+        started_during_stream = []
+
+        async def check():
+            started_during_stream.append(list(calls))
+
+        class CheckingModel(ScriptedModel):
+            async def stream(self, options):
+                async for part in super().stream(options):
+                    yield part
+                if len(self.requests) == 1:
+                    await asyncio.sleep(0.01)
+                    await check()
+
+        model = CheckingModel(
+            [
+                *_tool_call("call-1", "lookup", {"key": "a"}),
+                FinishPart(finish_reason=FinishReason.TOOL_CALLS, usage=_usage(1)),
+            ],
+            [FinishPart(finish_reason=FinishReason.STOP, usage=_usage(1))],
+        )
+        agent = Agent(
+            model=model,
+            tools={"lookup": _tool("lookup", lookup, idempotent=True)},
+            stop_when=step_count_is(5),
+            speculative_tools=speculative,
+        )
+
+        parts = await _collect(agent.stream("Look up a"))
+
+        assert started_during_stream == [["a"] if speculative else []]
+        assert calls == ["a"]
+        assert [part.result for part in parts if part.type == "tool-result"] == ["A"]
+
+    async def test_stop_condition_skips_tool_execution(self):
+        """A met stop condition ends the stream before tools run."""
+        calls = []
+
+        async def record(args):
+            calls.append(args)
+
+        model = ScriptedModel(
+            [
+                *_tool_call("call-1", "record", {"n": 1}),
+                FinishPart(finish_reason=FinishReason.TOOL_CALLS, usage=_usage(1)),
+            ],
+        )
+        agent = Agent(
+            model=model, tools={"record": _tool("record", record)}, stop_when=has_tool_call("record")
+        )
+
+        parts = await _collect(agent.stream("Record"))
+
+        assert [part.type for part in parts][-2:] == ["step-finish", "finish"]
+        assert calls == []
+        assert len(model.requests) == 1
+
+    async def test_tool_errors_are_streamed(self):
+        """A failing tool yields an error result and the loop continues."""
+        async def broken(args):
+            raise RuntimeError("boom")
+
+        model = ScriptedModel(
+            [
+                *_tool_call("call-1", "broken", {}),
+                FinishPart(finish_reason=FinishReason.TOOL_CALLS, usage=_usage(1)),
+            ],
+            [FastTextDelta("Sorry."), FinishPart(finish_reason=FinishReason.STOP, usage=_usage(1))],
+        )
+        agent = Agent(model=model, tools={"broken": _tool("broken", broken)}, stop_when=step_count_is(5))
+
+        parts = await _collect(agent.stream("Try"))
+
+        tool_result = next(part for part in parts if part.type == "tool-result")
+        assert tool_result.is_error
+        assert "boom" in tool_result.result
+        assert len(model.requests) == 2
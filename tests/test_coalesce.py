@@ -0,0 +1,117 @@
+"""Tests for stream delta coalescing."""
+
+import asyncio
+import time
+
+import pytest
+
+from ai_sdk.errors import InvalidArgumentError
+from ai_sdk.providers.stream_parts import FastTextDelta, FastToolCallDelta
+from ai_sdk.providers.types import FinishPart, TextDelta, Usage
+from ai_sdk.streaming import coalesce_deltas
+
+
+async def _stream(parts, pause=0.0):
+    for part in parts:
+        if pause:
+            await asyncio.sleep(pause)
+        yield part
+
+
+async def _collect(transform, parts, pause=0.0):
+    return [part async for part in transform(_stream(parts, pause))]
+
+
+@pytest.mark.asyncio
+class TestCoalesceDeltas:
+    """Test merging of adjacent deltas."""
+
+    async def test_first_delta_passes_through_immediately(self):
+        """The first delta is not held back."""
+        async def slow_source():
+            yield FastTextDelta("Hello", id="1")
+            await asyncio.sleep(0.2)
+            yield FastTextDelta(" world", id="1")
+
+        transform = coalesce_deltas(window_ms=50)
+        start = time.perf_counter()
+        async for part in transform(slow_source()):
+            first_latency = time.perf_counter() - start
+            assert part.text_delta == "Hello"
+            break
+
+        assert first_latency < 0.05
+
+    async def test_burst_is_merged(self):
+        """A burst of deltas becomes the first delta plus one merged delta."""
+        deltas = [FastTextDelta(f"t{i} ", id="1") for i in range(50)]
+
+        parts = await _collect(coalesce_deltas(window_ms=1000), deltas)
+
+        assert [p.text_delta for p in parts] == ["t0 ", "".join(f"t{i} " for i in range(1, 50))]
+        assert all(p.id == "1" for p in parts)
+
+    async def test_window_bounds_latency(self):
+        """A merged delta is emitted when its window closes."""
+        async def source():
+            for i in range(3):
+                yield FastTextDelta(f"{i}", id="1")
+            await asyncio.sleep(0.3)
+            yield FastTextDelta("late", id="1")
+
+        times = []
+        start = time.perf_counter()
+        async for part in coalesce_deltas(window_ms=20)(source()):
+            times.append((part.text_delta, time.perf_counter() - start))
+
+        assert [text for text, _ in times] == ["0", "12", "late"]
+        assert times[1][1] < 0.15
+
+    async def test_other_parts_keep_order(self):
+        """Non-delta parts and deltas of other parts flush the merged delta."""
+        finish = FinishPart(
+            finish_reason="stop",
+            usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+        parts = [
+            FastTextDelta("a", id="1"),
+            FastTextDelta("b", id="1"),
+            FastTextDelta("c", id="1"),
+            FastToolCallDelta("call_1", args_delta='{"x"'),
+            FastToolCallDelta("call_1", args_delta=": 1}"),
+            FastTextDelta("d", id="2"),
+            finish,
+        ]
+
+        result = await _collect(coalesce_deltas(window_ms=1000), parts)
+
+        assert [getattr(p, "text_delta", None) or getattr(p, "args_delta", None) for p in result[:4]] == [
+            "a",
+            "bc",
+            '{"x": 1}',
+            "d",
+        ]
+        assert result[-1] is finish
+
+    async def test_pydantic_parts_and_strings(self):
+        """Pydantic deltas are copied with merged text; strings are joined."""
+        parts = await _collect(
+            coalesce_deltas(window_ms=1000), [TextDelta(text_delta=t) for t in "abc"]
+        )
+        assert [p.text_delta for p in parts] == ["a", "bc"]
+        assert isinstance(parts[1], TextDelta)
+
+        strings = await _collect(coalesce_deltas(window_ms=1000), list("abcd"))
+        assert strings == ["a", "bcd"]
+
+    async def test_max_chars(self):
+        """A merged delta is emitted once it reaches max_chars."""
+        parts = await _collect(coalesce_deltas(window_ms=1000, max_chars=4), list("abcdefghij"))
+
+        assert parts == ["a", "bcde", "fghi", "j"]
+
+    async def test_invalid_arguments(self):
+        with pytest.raises(InvalidArgumentError):
+            coalesce_deltas(window_ms=-1)
+        with pytest.raises(InvalidArgumentError):
+            coalesce_deltas(max_chars=0)
@@ -0,0 +1,221 @@
+"""Tests for adaptive concurrency limiting."""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+from ai_sdk.providers.base import EmbeddingModel
+from ai_sdk.core.embed import embed_many
+from ai_sdk.errors import APIError, InvalidArgumentError, RateLimitError
+from ai_sdk.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    get_concurrency_limiter,
+    is_overload_error,
+    set_concurrency_limiter,
+)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD limit adaptation."""
+
+    def test_additive_increase(self):
+        """Healthy calls grow the limit by about one per window."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=10)
+
+        for _ in range(2):
+            limiter.record_success(0.1)
+
+        assert limiter.limit == 2
+        for _ in range(4):
+            limiter.record_success(0.1)
+        assert limiter.limit >= 3
+
+    def test_multiplicative_decrease(self):
+        """Overload halves the limit, never below min_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=2)
+
+        limiter.record_overload()
+        assert limiter.limit == 4
+        limiter.record_overload()
+        limiter.record_overload()
+        assert limiter.limit == 2
+
+    def test_single_decrease_per_window(self):
+        """Calls started before a decrease do not decrease again."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        async def run():
+            tickets = [await limiter.acquire() for _ in range(4)]
+            for ticket in tickets:
+                limiter.record_overload(ticket)
+                limiter.release()
+
+        asyncio.run(run())
+        assert limiter.limit == 4
+
+    def test_rising_latency_decreases(self):
+        """Latency far above baseline is treated as overload."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2.0)
+        for _ in range(20):
+            limiter.record_success(0.1)
+        before = limiter.limit
+
+        for _ in range(5):
+            limiter.record_success(1.0)
+
+        assert limiter.limit < before
+
+    def test_invalid_limits(self):
+        """Inconsistent limits are rejected."""
+        with pytest.raises(InvalidArgumentError):
+            AdaptiveConcurrencyLimiter(min_limit=4, max_limit=2)
+
+
+@pytest.mark.asyncio
+class TestLimiterSlots:
+    """Test slot acquisition."""
+
+    async def test_slots_bound_concurrency(self):
+        """No more than `limit` blocks run at once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with limiter.slot():
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*[work() for _ in range(6)])
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    async def test_slot_records_rate_limit(self):
+        """A 429 inside a slot reduces the limit and is re-raised."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+        with pytest.raises(RateLimitError):
+            async with limiter.slot():
+                raise RateLimitError("slow down", status_code=429)
+
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+    async def test_cancelled_waiter_releases(self):
+        """Cancelling a queued waiter does not leak slots."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire()
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        assert limiter.in_flight == 0
+
+
+class TestRateLimiter:
+    """Test request and token rate limiting."""
+
+    async def test_requests_are_spaced(self):
+        """After the burst, calls start at the configured rate."""
+        limiter = RateLimiter(requests_per_minute=3000, burst=2)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        for _ in range(5):
+            await limiter.acquire()
+
+        # 2 immediately, then 3 more at 20ms intervals
+        assert loop.time() - start >= 0.055
+
+    async def test_token_debt_delays_next_call(self):
+        """Calls wait while recorded token usage exceeds the budget."""
+        limiter = RateLimiter(tokens_per_minute=60_000)
+        loop = asyncio.get_running_loop()
+
+        await limiter.acquire()
+        limiter.record_tokens(60_000 + 50)
+        start = loop.time()
+        await limiter.acquire()
+
+        assert loop.time() - start >= 0.045
+
+    def test_rejects_non_positive_rates(self):
+        with pytest.raises(InvalidArgumentError):
+            RateLimiter(requests_per_minute=0)
+
+
+class TestOverloadClassification:
+    """Test overload error detection."""
+
+    def test_classification(self):
+        assert is_overload_error(RateLimitError("limited"))
+        assert is_overload_error(APIError("busy", status_code=503))
+        assert is_overload_error(asyncio.TimeoutError())
+        assert not is_overload_error(APIError("bad request", status_code=400))
+        assert not is_overload_error(ValueError("bug"))
+
+
+class TestLimiterRegistry:
+    """Test per-provider limiter sharing."""
+
+    def test_shared_per_provider(self):
+        first = get_concurrency_limiter("registry-test")
+        assert get_concurrency_limiter("registry-test") is first
+        assert get_concurrency_limiter("registry-other") is not first
+
+        set_concurrency_limiter("registry-test", None)
+        assert get_concurrency_limiter("registry-test") is not first
+
+
+class ThrottlingEmbeddingModel(EmbeddingModel):
+    """Embedding model that rejects the first call with a 429."""
+
+    def __init__(self):
+        provider = MagicMock()
+        provider.name = "throttling"
+        super().__init__(provider=provider, model_id="mock-embedding")
+        self.max_embeddings_per_call = 1
+        self.calls = 0
+
+    async def do_embed(self, *, values, headers=None, extra_body=None):
+        self.calls += 1
+        if self.calls == 1:
+            raise RateLimitError("slow down", status_code=429)
+        return {"embeddings": [[1.0] for _ in values], "usage": {"tokens": 1}}
+
+
+@pytest.mark.asyncio
+class TestEmbedManyAdaptive:
+    """Test embed_many integration."""
+
+    async def test_embed_many_uses_shared_limiter(self, monkeypatch):
+        """embed_many backs off through the provider's shared limiter."""
+        monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        set_concurrency_limiter("throttling", limiter)
+        try:
+            model = ThrottlingEmbeddingModel()
+            result = await embed_many(model=model, values=["a", "b", "c"])
+        finally:
+            set_concurrency_limiter("throttling", None)
+
+        assert len(result.embeddings) == 3
+        assert limiter.overloads == 1
+        assert limiter.successes == 3
+
+
+_real_sleep = asyncio.sleep
+
+
+async def _no_sleep(delay, *args, **kwargs):
+    await _real_sleep(0)
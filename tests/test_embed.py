@@ -230,4 +230,86 @@ class TestEmbedManyResult:
         assert result.embeddings == embeddings
         assert result.usage == usage
         assert result.provider_metadata is None
-        assert result.response is None
\ No newline at end of file
+        assert result.response is None
+
+class EchoEmbeddingModel(EmbeddingModel):
+    """Embedding model that records every value it is asked to embed."""
+
+    def __init__(self):
+        provider = MagicMock()
+        provider.name = "mock"
+        super().__init__(provider=provider, model_id="mock-embedding")
+        self.embedded = []
+
+    async def do_embed(self, *, values, headers=None, extra_body=None):
+        self.embedded.extend(values)
+        return {
+            "embeddings": [[float(len(str(v))), 1.0] for v in values],
+            "usage": {"tokens": len(values) * 2},
+        }
+
+
+@pytest.mark.asyncio
+class TestEmbedManyDeduplication:
+    """Test deduplication of repeated values within embed_many."""
+
+    async def test_duplicates_embedded_once(self):
+        """Each unique value is sent to the provider once."""
+        model = EchoEmbeddingModel()
+        values = ["header", "body one", "header", "footer", "header", "footer"]
+
+        result = await embed_many(model=model, values=values)
+
+        assert model.embedded == ["header", "body one", "footer"]
+        assert result.values == values
+        assert len(result.embeddings) == 6
+        assert result.embeddings[0] == result.embeddings[2] == result.embeddings[4]
+        assert result.embeddings[3] == [6.0, 1.0]
+
+    async def test_usage_reports_billed_and_logical_counts(self):
+        """Usage distinguishes billed from logical values."""
+        model = EchoEmbeddingModel()
+
+        result = await embed_many(model=model, values=["a", "a", "b", "a"])
+
+        assert result.usage.tokens == 4
+        assert result.usage.billed_values == 2
+        assert result.usage.logical_values == 4
+        assert result.usage.deduplicated_values == 2
+
+    async def test_duplicate_vectors_are_independent(self):
+        """Modifying one fanned-out vector does not affect the others."""
+        model = EchoEmbeddingModel()
+
+        result = await embed_many(model=model, values=["a", "a"])
+        result.embeddings[1][0] = 99.0
+
+        assert result.embeddings[0][0] == 1.0
+
+    async def test_deduplicate_disabled(self):
+        """Deduplication can be turned off."""
+        model = EchoEmbeddingModel()
+
+        result = await embed_many(model=model, values=["a", "a"], deduplicate=False)
+
+        assert model.embedded == ["a", "a"]
+        assert result.usage.deduplicated_values == 0
+
+    async def test_unhashable_and_mixed_type_values(self):
+        """Unhashable values are embedded as-is; equal values of other types stay distinct."""
+        model = EchoEmbeddingModel()
+
+        result = await embed_many(model=model, values=[{"a": 1}, {"a": 1}, 1, 1.0])
+
+        assert len(model.embedded) == 4
+        assert len(result.embeddings) == 4
+
+    async def test_deduplication_across_batches(self):
+        """Duplicates spanning several batches are still collapsed."""
+        model = EchoEmbeddingModel()
+        model.max_embeddings_per_call = 2
+
+        result = await embed_many(model=model, values=["x", "y", "x", "z", "y", "w"])
+
+        assert sorted(model.embedded) == ["w", "x", "y", "z"]
+        assert [e[0] for e in result.embeddings] == [1.0] * 6
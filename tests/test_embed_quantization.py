@@ -0,0 +1,136 @@
+"""Tests for embedding truncation and quantization."""
+
+import math
+import random
+
+import pytest
+
+from ai_sdk.core.embed import EmbedManyResult, EmbeddingUsage
+from ai_sdk.core.embed_quantization import (
+    normalize_embedding,
+    quantize_binary,
+    quantize_embeddings,
+    quantize_int8,
+    truncate_embedding,
+)
+from ai_sdk.errors import InvalidArgumentError
+
+
+def _random_vectors(count, dimensions, seed=0):
+    rng = random.Random(seed)
+    return [
+        normalize_embedding([rng.gauss(0, 1) for _ in range(dimensions)])
+        for _ in range(count)
+    ]
+
+
+class TestTruncation:
+    """Test Matryoshka-style truncation."""
+
+    def test_truncate_renormalizes(self):
+        """Truncated vectors have unit length."""
+        truncated = truncate_embedding([3.0, 4.0, 12.0], 2)
+
+        assert truncated == pytest.approx([0.6, 0.8])
+
+    def test_truncate_without_normalize(self):
+        """Normalization can be disabled."""
+        assert truncate_embedding([3.0, 4.0, 12.0], 2, normalize=False) == [3.0, 4.0]
+
+    def test_truncate_invalid_dimensions(self):
+        """Dimensions outside the vector size are rejected."""
+        with pytest.raises(InvalidArgumentError):
+            truncate_embedding([1.0, 2.0], 3)
+
+    def test_embed_many_result_truncate(self):
+        """EmbedManyResult.truncate returns a truncated copy."""
+        result = EmbedManyResult(
+            values=["a", "b"],
+            embeddings=[[1.0, 0.0, 1.0], [0.0, 2.0, 2.0]],
+            usage=EmbeddingUsage(tokens=2),
+        )
+
+        truncated = result.truncate(2)
+
+        assert truncated.values == ["a", "b"]
+        assert truncated.embeddings == [[1.0, 0.0], [0.0, 1.0]]
+        assert result.embeddings[0] == [1.0, 0.0, 1.0]
+
+
+class TestQuantization:
+    """Test int8 and binary quantization."""
+
+    def test_int8_round_trip(self):
+        """int8 dequantization is close to the original vector."""
+        vectors = _random_vectors(5, 32)
+        quantized = quantize_int8(vectors)
+
+        restored = quantized.dequantize(2)
+
+        assert max(abs(a - b) for a, b in zip(restored, vectors[2])) < 0.01
+
+    def test_storage_sizes(self):
+        """Quantized storage is much smaller than float32."""
+        vectors = _random_vectors(10, 64)
+
+        int8 = quantize_int8(vectors)
+        binary = quantize_binary(vectors)
+
+        assert int8.float32_nbytes == 10 * 64 * 4
+        assert int8.nbytes == 10 * 64 + 10 * 4
+        assert binary.nbytes == 10 * 8
+        assert binary.compression_ratio == 32
+        assert len(binary.to_bytes(0)) == 8
+
+    def test_binary_similarity(self):
+        """Binary similarity counts matching sign bits."""
+        quantized = quantize_binary([[1.0, -1.0, 1.0, -1.0]])
+
+        assert quantized.similarities([1.0, -1.0, 1.0, -1.0]) == [1.0]
+        assert quantized.similarities([1.0, 1.0, 1.0, -1.0]) == [0.5]
+        assert quantized.similarities([-1.0, 1.0, -1.0, 1.0]) == [-1.0]
+
+    def test_int8_search_matches_exact(self):
+        """int8 search finds the exact nearest neighbour."""
+        vectors = _random_vectors(50, 32)
+        quantized = quantize_int8(vectors)
+
+        results = quantized.search(vectors[7], top_k=3)
+
+        assert results[0][0] == 7
+        assert results[0][1] == pytest.approx(1.0, abs=0.01)
+
+    def test_binary_search_with_rerank(self):
+        """Re-ranking with float vectors returns exact cosine scores."""
+        vectors = _random_vectors(50, 64)
+        quantized = quantize_binary(vectors)
+
+        results = quantized.search(vectors[3], top_k=5, rerank_embeddings=vectors)
+
+        assert len(results) == 5
+        assert results[0] == (3, pytest.approx(1.0))
+        scores = [score for _, score in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_query_dimension_mismatch(self):
+        """Queries must match the stored dimensions."""
+        quantized = quantize_int8([[0.1, 0.2]])
+
+        with pytest.raises(InvalidArgumentError):
+            quantized.search([0.1, 0.2, 0.3])
+
+    def test_unknown_method(self):
+        """Unknown quantization methods are rejected."""
+        with pytest.raises(InvalidArgumentError):
+            quantize_embeddings([[0.1]], "int4")
+
+    def test_embed_many_result_quantize(self):
+        """EmbedManyResult.quantize uses the requested method."""
+        result = EmbedManyResult(
+            values=["a"],
+            embeddings=[[0.5, -0.5]],
+            usage=EmbeddingUsage(tokens=1),
+        )
+
+        assert result.quantize("binary").method == "binary"
+        assert math.isclose(result.quantize().dequantize(0)[0], 0.5, abs_tol=0.01)
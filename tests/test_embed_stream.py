@@ -0,0 +1,200 @@
+"""Tests for streaming embedding functionality."""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import MagicMock
+
+from ai_sdk.providers.base import EmbeddingModel
+from ai_sdk.core.embed import (
+    EmbedStreamCheckpointState,
+    EmbedStreamItem,
+    FileEmbedStreamCheckpoint,
+    InMemoryEmbedStreamCheckpoint,
+    embed_stream,
+)
+from ai_sdk.errors import APIError, InvalidArgumentError
+
+
+class CountingEmbeddingModel(EmbeddingModel):
+    """Embedding model that embeds numbers as one-dimensional vectors."""
+
+    def __init__(self, max_embeddings_per_call=3, fail_on_call=None):
+        provider = MagicMock()
+        provider.name = "mock"
+        super().__init__(provider=provider, model_id="mock-embedding")
+        self.max_embeddings_per_call = max_embeddings_per_call
+        self.fail_on_call = fail_on_call
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def do_embed(self, *, values, headers=None, extra_body=None):
+        self.calls.append(list(values))
+        if self.fail_on_call == len(self.calls):
+            raise RuntimeError("provider unavailable")
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later batches finish first to exercise ordering
+        await asyncio.sleep(0.001 * (10 - len(self.calls) % 10))
+        self.in_flight -= 1
+
+        return {
+            "embeddings": [[float(v)] for v in values],
+            "usage": {"tokens": len(values)},
+        }
+
+
+async def _async_range(n):
+    for i in range(n):
+        yield i
+
+
+@pytest.mark.asyncio
+class TestEmbedStream:
+    """Test embed_stream functionality."""
+
+    async def test_ordered_results(self):
+        """Results are yielded in input order as (index, value, vector)."""
+        model = CountingEmbeddingModel()
+
+        items = [item async for item in embed_stream(model, range(10))]
+
+        assert [item.index for item in items] == list(range(10))
+        assert all(isinstance(item, EmbedStreamItem) for item in items)
+        index, value, embedding = items[4]
+        assert (index, value, embedding) == (4, 4, [4.0])
+        assert [len(call) for call in model.calls] == [3, 3, 3, 1]
+
+    async def test_unordered_results(self):
+        """Unordered mode yields every value exactly once."""
+        model = CountingEmbeddingModel()
+
+        items = [
+            item async for item in embed_stream(model, range(10), ordered=False)
+        ]
+
+        assert sorted(item.index for item in items) == list(range(10))
+
+    async def test_async_iterable_input(self):
+        """Async iterables are consumed lazily."""
+        model = CountingEmbeddingModel()
+
+        items = [item async for item in embed_stream(model, _async_range(5))]
+
+        assert [item.value for item in items] == list(range(5))
+
+    async def test_bounded_concurrency(self):
+        """No more than max_parallel_calls requests are in flight."""
+        model = CountingEmbeddingModel(max_embeddings_per_call=1)
+
+        async for _ in embed_stream(model, range(20), max_parallel_calls=2):
+            pass
+
+        assert model.max_in_flight <= 2
+
+    async def test_bounded_input_buffering(self):
+        """Input is only read a bounded number of batches ahead."""
+        model = CountingEmbeddingModel(max_embeddings_per_call=1)
+        consumed = []
+
+        def source():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        stream = embed_stream(
+            model, source(), max_parallel_calls=2, max_buffered_batches=1
+        )
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first.index == 0
+        assert len(consumed) <= 4
+
+    async def test_resume_from_checkpoint(self):
+        """A failed run resumes after the last committed batch."""
+        checkpoint = InMemoryEmbedStreamCheckpoint()
+        model = CountingEmbeddingModel(fail_on_call=3)
+
+        seen = []
+        with pytest.raises(APIError):
+            async for item in embed_stream(
+                model,
+                range(10),
+                max_parallel_calls=1,
+                max_retries=0,
+                checkpoint=checkpoint,
+            ):
+                seen.append(item.index)
+
+        assert seen == list(range(6))
+        assert (await checkpoint.load()).next_index == 6
+
+        model = CountingEmbeddingModel()
+        resumed = [
+            item.index
+            async for item in embed_stream(model, range(10), checkpoint=checkpoint)
+        ]
+
+        assert resumed == [6, 7, 8, 9]
+        assert model.calls == [[6, 7, 8], [9]]
+
+    async def test_file_checkpoint(self, tmp_path):
+        """File checkpoints persist progress as JSON."""
+        path = tmp_path / "progress.json"
+        checkpoint = FileEmbedStreamCheckpoint(path)
+        model = CountingEmbeddingModel()
+
+        async for _ in embed_stream(model, range(7), checkpoint=checkpoint):
+            pass
+
+        assert json.loads(path.read_text())["next_index"] == 7
+        state = await FileEmbedStreamCheckpoint(path).load()
+        assert state.is_committed(6)
+        assert not state.is_committed(7)
+
+    async def test_invalid_batch_size(self):
+        """Batch sizes above the model limit are rejected."""
+        model = CountingEmbeddingModel()
+
+        with pytest.raises(InvalidArgumentError):
+            async for _ in embed_stream(model, range(3), batch_size=10):
+                pass
+
+    async def test_none_values_rejected(self):
+        """None values raise an error."""
+        model = CountingEmbeddingModel()
+
+        with pytest.raises(InvalidArgumentError, match="Values cannot contain None"):
+            async for _ in embed_stream(model, ["a", None]):
+                pass
+
+
+class TestEmbedStreamCheckpointState:
+    """Test checkpoint state bookkeeping."""
+
+    def test_out_of_order_commits(self):
+        """Out-of-order ranges are merged once the gap closes."""
+        state = EmbedStreamCheckpointState()
+
+        state.commit([3, 4, 5])
+        assert state.next_index == 0
+        assert state.is_committed(4)
+        assert not state.is_committed(1)
+
+        state.commit([0, 1, 2])
+        assert state.next_index == 6
+        assert state.committed_ranges == []
+
+    def test_round_trip(self):
+        """State survives serialization."""
+        state = EmbedStreamCheckpointState()
+        state.commit([0, 1, 5])
+
+        restored = EmbedStreamCheckpointState.from_dict(state.to_dict())
+
+        assert restored.next_index == 2
+        assert restored.committed_ranges == [(5, 6)]
@@ -291,4 +291,77 @@ def test_middleware_factory_resolution():
         middleware=[middleware_factory]  # Factory function
     )
     
-    assert wrapped is not None
\ No newline at end of file
+    assert wrapped is not None
+
+@pytest.mark.asyncio
+async def test_telemetry_middleware_stream_timing():
+    """Stream telemetry measures token timing and is sent when the stream ends."""
+    from ai_sdk.providers.types import FinishPart
+
+    class SlowStreamModel(MockLanguageModel):
+        async def stream_text(self, params: dict):
+            async def stream():
+                await asyncio.sleep(0.02)
+                yield {"type": "stream-start"}
+                for word in ["Hello ", "there ", "friend"]:
+                    await asyncio.sleep(0.01)
+                    yield {"type": "text-delta", "text_delta": word}
+                yield FinishPart(
+                    finish_reason="stop",
+                    usage=Usage(prompt_tokens=5, completion_tokens=3, total_tokens=8),
+                )
+            return stream()
+
+    telemetry_data = []
+    middleware = telemetry_middleware(callback=telemetry_data.append)
+    wrapped = wrap_language_model(model=SlowStreamModel(), middleware=[middleware])
+
+    stream = await wrapped.stream_text({"messages": [{"role": "user", "content": "test"}]})
+    assert telemetry_data == []
+    parts = [part async for part in stream]
+
+    assert len(telemetry_data) == 1
+    data = telemetry_data[0]
+    assert data["status"] == "success"
+    assert data["output_tokens"] == 3
+    assert data["time_to_first_byte_ms"] >= 15
+    assert data["time_to_first_token_ms"] > data["time_to_first_byte_ms"]
+    assert data["duration_ms"] >= data["time_to_first_token_ms"]
+    assert data["inter_token_latency_ms"]["count"] == 2
+    assert sum(data["inter_token_latency_ms"]["histogram"].values()) == 2
+    assert data["tokens_per_second"] > 0
+
+    timing = parts[-1].provider_metadata.data["stream_timing"]
+    assert timing["token_parts"] == 3
+    assert timing["time_to_first_token_ms"] == data["time_to_first_token_ms"]
+
+
+@pytest.mark.asyncio
+async def test_extract_reasoning_middleware_stream():
+    """Tags split across deltas are removed and reasoning streams separately."""
+    from ai_sdk.middleware import extract_reasoning_middleware
+
+    deltas = ["Hi <th", "ink>plan", " this</thi", "nk>Answer", " <b>done</b> <", "t"]
+
+    class ThinkingModel(MockLanguageModel):
+        async def stream_text(self, params: dict):
+            async def stream():
+                for delta in deltas:
+                    yield {"type": "text-delta", "text_delta": delta}
+                yield {"type": "finish", "finish_reason": "stop"}
+            return stream()
+
+    middleware = extract_reasoning_middleware(tag_name="think", separator="\n")
+    wrapped = wrap_language_model(model=ThinkingModel(), middleware=[middleware])
+    stream = await wrapped.stream_text({"messages": [{"role": "user", "content": "test"}]})
+    parts = [part async for part in stream]
+
+    types = [part["type"] for part in parts]
+    assert types.index("reasoning-start") < types.index("reasoning-delta") < types.index("reasoning-end")
+    assert types[-1] == "finish"
+    reasoning = "".join(p["delta"] for p in parts if p["type"] == "reasoning-delta")
+    text = "".join(p["text_delta"] for p in parts if p["type"] == "text-delta")
+    assert reasoning == "plan this"
+    assert text == "Hi \nAnswer <b>done</b> <t"
+    # Text before a possible tag is not held back
+    assert parts[0] == {"type": "text-delta", "text_delta": "Hi "}
@@ -0,0 +1,259 @@
+"""Tests for incremental partial JSON parsing."""
+
+import json
+import random
+
+import pytest
+from pydantic import BaseModel
+
+from ai_sdk.core.generate_object import stream_object
+from ai_sdk.providers.types import FinishPart, TextDelta, Usage
+from ai_sdk.utils.partial_json import IncrementalJSONParser, parse_partial_json
+
+
+DOCUMENT = {
+    "name": "Ada é \U0001F600 \"quoted\" \\ /",
+    "tags": ["x", 1, 2.5e3, True, None, {"nested": []}],
+    "deep": {"k": {"v": -0.5}},
+    "empty": {},
+    "a/b~c": "",
+}
+
+
+def _feed_in_chunks(parser, text, seed):
+    rng = random.Random(seed)
+    snapshots = []
+    i = 0
+    while i < len(text):
+        size = rng.randint(1, 8)
+        if parser.feed(text[i:i + size]):
+            snapshots.append(parser.value)
+        i += size
+    parser.finish()
+    return snapshots
+
+
+def _apply_patches(document, patches):
+    for patch in patches:
+        segments = [
+            s.replace("~1", "/").replace("~0", "~") for s in patch["path"].split("/")[1:]
+        ]
+        if not segments:
+            document = patch["value"]
+            continue
+        target = document
+        for segment in segments[:-1]:
+            target = target[int(segment)] if isinstance(target, list) else target[segment]
+        last = segments[-1]
+        if patch["op"] == "append":
+            index = int(last) if isinstance(target, list) else last
+            target[index] += patch["value"]
+        elif isinstance(target, list):
+            target.insert(int(last), patch["value"])
+        else:
+            target[last] = patch["value"]
+    return document
+
+
+class TestIncrementalJSONParser:
+    """Test chunked parsing."""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_any_chunking_gives_same_result(self, indent):
+        """Arbitrary chunk boundaries (inside escapes too) parse identically."""
+        text = json.dumps(DOCUMENT, indent=indent)
+
+        for seed in range(50):
+            parser = IncrementalJSONParser()
+            _feed_in_chunks(parser, text, seed)
+
+            assert parser.done
+            assert parser.value == DOCUMENT
+
+    def test_partial_values(self):
+        """Partial strings and open containers are visible while streaming."""
+        parser = IncrementalJSONParser()
+
+        parser.feed('{"title": "Hel')
+        assert parser.value == {"title": "Hel"}
+
+        parser.feed('lo", "items": [1, ')
+        assert parser.value == {"title": "Hello", "items": [1]}
+
+        parser.feed('2], "count": 1')
+        assert parser.value == {"title": "Hello", "items": [1, 2]}
+
+        parser.feed("2}")
+        assert parser.value == {"title": "Hello", "items": [1, 2], "count": 12}
+        assert parser.done
+
+    def test_value_is_updated_in_place(self):
+        """Open containers are filled in place instead of copied per read."""
+        parser = IncrementalJSONParser()
+
+        parser.feed('{"items": [1, {"a": "x')
+        value = parser.value
+        items = value["items"]
+        parser.feed('y"}, 2')
+        parser.feed("]}")
+
+        assert parser.value is value
+        assert value["items"] is items
+        assert value == {"items": [1, {"a": "xy"}, 2]}
+
+    @pytest.mark.parametrize("text", ["[1,]", '{"a": 1,}', "[[],]", '{"a": {},}'])
+    def test_trailing_commas_fail(self, text):
+        """A comma must be followed by another member."""
+        parser = IncrementalJSONParser()
+
+        parser.feed(text)
+
+        assert parser.failed
+
+    def test_empty_containers(self):
+        """Empty arrays and objects still close."""
+        parser = IncrementalJSONParser()
+
+        parser.feed('{"a": [], "b": {}}')
+
+        assert parser.done
+        assert parser.value == {"a": [], "b": {}}
+
+    def test_patches_rebuild_document(self):
+        """Applying the recorded patches reproduces the final value."""
+        text = json.dumps(DOCUMENT)
+        parser = IncrementalJSONParser(track_patches=True)
+        rebuilt = None
+        rng = random.Random(3)
+        i = 0
+        while i < len(text):
+            size = rng.randint(1, 5)
+            parser.feed(text[i:i + size])
+            rebuilt = _apply_patches(rebuilt, parser.take_patches())
+            i += size
+
+        assert rebuilt == DOCUMENT
+
+    def test_patches_follow_snapshots_for_any_chunking(self):
+        """After every chunk, the patches so far rebuild the current value."""
+        text = json.dumps(DOCUMENT)
+        for seed in range(50):
+            rng = random.Random(seed)
+            parser = IncrementalJSONParser(track_patches=True)
+            rebuilt = None
+            i = 0
+            while i < len(text):
+                size = rng.randint(1, 12)
+                parser.feed(text[i:i + size])
+                rebuilt = _apply_patches(rebuilt, parser.take_patches())
+                assert rebuilt == parser.value
+                i += size
+
+            assert rebuilt == DOCUMENT
+
+    def test_string_patches_append(self):
+        """Streaming strings are reported as appended text."""
+        parser = IncrementalJSONParser(track_patches=True)
+
+        parser.feed('{"a": "he')
+        parser.take_patches()
+        parser.feed("llo")
+
+        assert parser.take_patches() == [{"op": "append", "path": "/a", "value": "llo"}]
+
+    def test_skip_leading_and_trailing_text(self):
+        """Prose and code fences around the object are ignored when allowed."""
+        parser = IncrementalJSONParser(skip_until="{", allow_trailing_text=True)
+
+        parser.feed('Sure! ```json\n{"ok": tr')
+        parser.feed("ue}\n```")
+
+        assert parser.value == {"ok": True}
+        assert parser.done
+
+    def test_invalid_input_fails(self):
+        """Invalid JSON puts the parser in a failed state."""
+        parser = IncrementalJSONParser()
+
+        parser.feed('{"a": 1 "b"')
+
+        assert parser.failed
+        assert parser.error
+
+    def test_finish_completes_trailing_tokens(self):
+        """finish() completes trailing numbers and literal prefixes."""
+        parser = IncrementalJSONParser()
+        parser.feed('[1.5, fal')
+
+        parser.finish()
+
+        assert parser.value == [1.5, False]
+
+
+class TestParsePartialJson:
+    """Test the parse_partial_json API."""
+
+    def test_states(self):
+        assert parse_partial_json(None) == {"value": None, "state": "undefined-input"}
+        assert parse_partial_json('{"a": 1}')["state"] == "successful-parse"
+        assert parse_partial_json('{"a": [1, "x') == {
+            "value": {"a": [1, "x"]},
+            "state": "repaired-parse",
+        }
+        assert parse_partial_json('{"a": 1} trailing')["state"] == "failed-parse"
+
+    def test_rejects_prototype_keys(self):
+        """Repaired values go through the prototype pollution filter."""
+        assert parse_partial_json('{"__proto__": {"x": 1')["state"] == "failed-parse"
+
+
+class Person(BaseModel):
+    name: str
+    age: int
+
+
+class ChunkedJSONModel:
+    """Language model that streams a fixed text in small chunks."""
+
+    def __init__(self, text, chunk_size=3):
+        self.text = text
+        self.chunk_size = chunk_size
+
+    async def stream(self, options):
+        for i in range(0, len(self.text), self.chunk_size):
+            yield TextDelta(text_delta=self.text[i:i + self.chunk_size])
+        yield FinishPart(
+            finish_reason="stop",
+            usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+
+
+@pytest.mark.asyncio
+class TestStreamObject:
+    """Test stream_object with the incremental parser."""
+
+    async def test_streams_partial_objects(self):
+        """Partial objects grow and the final object validates."""
+        model = ChunkedJSONModel('Here you go: {"name": "Ada Lovelace", "age": 36}')
+
+        parts = [part async for part in stream_object(model, schema=Person, prompt="p")]
+
+        objects = [part.object for part in parts if part.type == "object"]
+        assert objects[0] == {}
+        assert {"name": "Ada "} in objects
+        assert objects[-1] == {"name": "Ada Lovelace", "age": 36}
+        assert parts[-1].type == "finish"
+
+    async def test_include_patches(self):
+        """Object parts carry patches when requested."""
+        model = ChunkedJSONModel('{"name": "Ada", "age": 36}')
+
+        parts = [
+            part
+            async for part in stream_object(
+                model, schema=Person, prompt="p", include_patches=True
+            )
+        ]
+
+        patches = [op for part in parts if part.type == "object" for op in part.patch]
+        assert {"op": "add", "path": "/age", "value": 36} in patches
@@ -0,0 +1,159 @@
+"""Tests for resumable streams."""
+
+import asyncio
+
+import pytest
+
+from ai_sdk.errors import InvalidArgumentError, StreamResumeError
+from ai_sdk.providers.stream_parts import FastTextDelta
+from ai_sdk.streaming import (
+    InMemoryStreamStore,
+    ResumableStreamManager,
+    StreamEvent,
+    format_sse,
+    parse_last_event_id,
+)
+
+
+async def _parts(count, pause=0.0):
+    for i in range(count):
+        if pause:
+            await asyncio.sleep(pause)
+        yield FastTextDelta(f"t{i} ")
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+@pytest.mark.asyncio
+class TestResumableStream:
+    """Test replay and live following."""
+
+    async def test_events_have_increasing_ids(self):
+        """Events are numbered from 1."""
+        manager = ResumableStreamManager()
+        stream = manager.start("chat-1", _parts(5))
+
+        events = await _collect(stream.events())
+
+        assert [event.id for event in events] == [1, 2, 3, 4, 5]
+        assert [event.data.text_delta for event in events] == [f"t{i} " for i in range(5)]
+
+    async def test_resume_after_disconnect(self):
+        """A client reconnecting with its last id gets only the missed events."""
+        manager = ResumableStreamManager()
+        stream = await manager.open("chat-1", source_factory=lambda: _parts(10, pause=0.005))
+
+        first = []
+        async for event in stream.events():
+            first.append(event)
+            if len(first) == 3:
+                break
+
+        await asyncio.sleep(0.02)
+        resumed = await manager.open("chat-1", last_event_id=3)
+        rest = await _collect(resumed.events(3))
+
+        assert resumed is stream
+        assert [event.id for event in first + rest] == list(range(1, 11))
+
+    async def test_generation_runs_without_clients(self):
+        """The generation completes even when nobody is reading."""
+        produced = 0
+
+        async def source():
+            nonlocal produced
+            for i in range(5):
+                produced += 1
+                await asyncio.sleep(0)
+                yield i
+
+        manager = ResumableStreamManager()
+        stream = manager.start("chat-1", source())
+        await asyncio.sleep(0.05)
+
+        assert produced == 5
+        assert stream.done
+        assert [event.data for event in await _collect(stream.events(2))] == [2, 3, 4]
+
+    async def test_evicted_events(self):
+        """Resuming from before the replay buffer raises StreamResumeError."""
+        manager = ResumableStreamManager(InMemoryStreamStore(max_events=4))
+        stream = manager.start("chat-1", _parts(10))
+        await asyncio.sleep(0.01)
+
+        assert [event.id for event in await _collect(stream.events(6))] == [7, 8, 9, 10]
+        with pytest.raises(StreamResumeError):
+            await _collect(stream.events(2))
+
+    async def test_unknown_and_expired_streams(self):
+        """Completed streams expire after the ttl."""
+        manager = ResumableStreamManager(ttl=0.02)
+
+        with pytest.raises(StreamResumeError):
+            await manager.open("missing", last_event_id=3)
+
+        stream = manager.start("chat-1", _parts(2))
+        await _collect(stream.events())
+        assert manager.get("chat-1") is stream
+        assert await manager.store.read("chat-1", 0)
+
+        await asyncio.sleep(0.05)
+        assert manager.get("chat-1") is None
+        assert await manager.store.read("chat-1", 0) == []
+
+    async def test_source_error_reaches_every_reader(self):
+        """An error in the generation is raised to readers after replay."""
+        async def failing():
+            yield "a"
+            raise ValueError("boom")
+
+        manager = ResumableStreamManager()
+        stream = manager.start("chat-1", failing())
+
+        for _ in range(2):
+            events = []
+            with pytest.raises(ValueError, match="boom"):
+                async for event in stream.events():
+                    events.append(event)
+            assert [event.data for event in events] == ["a"]
+
+    async def test_cancel_stops_the_generation(self):
+        """Cancelling records an error for readers and cancels the task."""
+        manager = ResumableStreamManager()
+        stream = manager.start("chat-1", _parts(100, pause=0.01))
+        await asyncio.sleep(0.015)
+
+        await stream.cancel()
+
+        assert stream.done
+        assert stream._task.cancelled()
+        with pytest.raises(StreamResumeError, match="cancelled"):
+            await _collect(stream.events())
+
+
+@pytest.mark.asyncio
+class TestSseHelpers:
+    """Test SSE formatting and header parsing."""
+
+    async def test_format_sse(self):
+        async def events():
+            yield StreamEvent(1, "Hello")
+            yield StreamEvent(2, FastTextDelta("World"))
+
+        frames = await _collect(format_sse(events()))
+
+        assert frames == [
+            'id: 1\ndata: {"text": "Hello"}\n\n',
+            'id: 2\ndata: {"type": "text-delta", "text_delta": "World"}\n\n',
+        ]
+
+    async def test_parse_last_event_id(self):
+        assert parse_last_event_id(None) is None
+        assert parse_last_event_id("") is None
+        assert parse_last_event_id("42") == 42
+        with pytest.raises(InvalidArgumentError):
+            parse_last_event_id("abc")
+        with pytest.raises(InvalidArgumentError):
+            parse_last_event_id("-1")
@@ -0,0 +1,215 @@
+"""Tests for hybrid retrieval and reranking."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from ai_sdk.providers.base import EmbeddingModel, RerankingModel
+from ai_sdk.core.rerank import RerankCache, rerank
+from ai_sdk.core.retrieval import BM25Index, HybridRetriever, reciprocal_rank_fusion
+from ai_sdk.errors import InvalidArgumentError
+from ai_sdk.utils.concurrency import AdaptiveConcurrencyLimiter
+
+
+DOCUMENTS = [
+    "the cat sat on the mat",
+    "dogs are loyal animals",
+    "reset your password from the account settings page",
+    "cats and dogs can live together",
+]
+
+VOCABULARY = ["cat", "dog", "password", "account"]
+
+
+def _mock_provider(name):
+    provider = MagicMock()
+    provider.name = name
+    return provider
+
+
+class KeywordEmbeddingModel(EmbeddingModel):
+    """Embeds text as keyword presence counts."""
+
+    def __init__(self):
+        super().__init__(provider=_mock_provider("keyword"), model_id="keyword")
+        self.calls = 0
+
+    async def do_embed(self, *, values, headers=None, extra_body=None):
+        self.calls += 1
+        embeddings = [
+            [float(text.lower().count(word)) + 0.01 for word in VOCABULARY]
+            for text in values
+        ]
+        return {"embeddings": embeddings, "usage": {"tokens": len(values)}}
+
+
+class LengthRerankingModel(RerankingModel):
+    """Scores documents higher the shorter they are."""
+
+    def __init__(self, max_documents_per_call=1000):
+        super().__init__(provider=_mock_provider("length"), model_id="length")
+        self.max_documents_per_call = max_documents_per_call
+        self.calls = []
+
+    async def do_rerank(self, *, query, documents, top_n=None, provider_options=None, headers=None):
+        self.calls.append({"documents": list(documents), "top_n": top_n})
+        ranking = [
+            {"index": i, "relevance_score": 1.0 / (1 + len(document))}
+            for i, document in enumerate(documents)
+        ]
+        ranking.sort(key=lambda entry: -entry["relevance_score"])
+        if top_n is not None:
+            ranking = ranking[:top_n]
+        return {"ranking": ranking, "usage": {"search_units": 1}}
+
+
+class TestBM25Index:
+    """Test lexical scoring."""
+
+    def test_matching_documents_rank_first(self):
+        """Documents sharing rare query terms score highest."""
+        index = BM25Index(DOCUMENTS)
+
+        results = index.search("password settings")
+
+        assert results[0][0] == 2
+        assert len(results) == 1
+
+    def test_no_matches(self):
+        """Queries without known terms return nothing."""
+        index = BM25Index(DOCUMENTS)
+
+        assert index.search("quantum") == []
+
+    def test_incremental_add(self):
+        """Documents added later continue the index numbering."""
+        index = BM25Index(DOCUMENTS[:2])
+        index.add(DOCUMENTS[2:])
+
+        assert len(index) == 4
+        assert index.search("password")[0][0] == 2
+
+
+class TestReciprocalRankFusion:
+    """Test rank fusion."""
+
+    def test_agreement_wins(self):
+        """A document ranked well by both lists comes first."""
+        fused = reciprocal_rank_fusion([[1, 2, 3], [2, 3, 1]])
+
+        assert fused[0][0] == 2
+
+    def test_weights(self):
+        """Weights shift preference towards one list."""
+        fused = reciprocal_rank_fusion([[1], [2]], weights=[1.0, 0.1])
+
+        assert [index for index, _ in fused] == [1, 2]
+
+
+@pytest.mark.asyncio
+class TestRerank:
+    """Test provider reranking with batching and caching."""
+
+    async def test_batches_and_merges(self):
+        """Documents beyond the per-call limit are batched and merged."""
+        model = LengthRerankingModel(max_documents_per_call=2)
+        documents = ["aaaa", "a", "aaa", "aa", "aaaaa"]
+
+        result = await rerank(
+            model,
+            "q",
+            documents,
+            concurrency_limiter=AdaptiveConcurrencyLimiter(initial_limit=4),
+        )
+
+        assert len(model.calls) == 3
+        assert result.documents == ["a", "aa", "aaa", "aaaa", "aaaaa"]
+        assert result.usage == {"search_units": 3}
+
+    async def test_top_n_passed_to_single_batch(self):
+        """top_n is forwarded to the provider when one call suffices."""
+        model = LengthRerankingModel()
+
+        result = await rerank(model, "q", ["aaa", "a", "aa"], top_n=1)
+
+        assert model.calls[0]["top_n"] == 1
+        assert result.documents == ["a"]
+
+    async def test_cache_skips_scored_documents(self):
+        """Cached scores are not requested from the provider again."""
+        model = LengthRerankingModel()
+        cache = RerankCache()
+
+        await rerank(model, "q", ["a", "bb"], cache=cache)
+        result = await rerank(model, "q", ["a", "bb", "ccc"], cache=cache)
+
+        assert model.calls[1]["documents"] == ["ccc"]
+        assert result.cached_documents == 2
+        assert result.documents == ["a", "bb", "ccc"]
+
+    async def test_duplicate_documents_scored_once(self):
+        """Repeated documents are sent once and share a score."""
+        model = LengthRerankingModel()
+
+        result = await rerank(model, "q", ["x", "yy", "x"])
+
+        assert model.calls[0]["documents"] == ["x", "yy"]
+        assert [ranked.index for ranked in result.ranking] == [0, 2, 1]
+
+    async def test_empty_query_rejected(self):
+        """An empty query is invalid."""
+        with pytest.raises(InvalidArgumentError):
+            await rerank(LengthRerankingModel(), "", ["a"])
+
+
+@pytest.mark.asyncio
+class TestHybridRetriever:
+    """Test hybrid search."""
+
+    async def test_hybrid_search(self):
+        """Lexical and vector matches are fused."""
+        retriever = HybridRetriever(KeywordEmbeddingModel())
+        await retriever.add_documents(DOCUMENTS)
+
+        results = await retriever.search("password reset", top_k=2)
+
+        assert results[0].index == 2
+        assert results[0].lexical_score > 0
+        assert results[0].vector_score is not None
+
+    async def test_weighted_fusion(self):
+        """Weighted fusion ranks the matching document first."""
+        retriever = HybridRetriever(KeywordEmbeddingModel(), fusion="weighted")
+        await retriever.add_documents(DOCUMENTS)
+
+        results = await retriever.search("cat", top_k=1)
+
+        assert results[0].index in (0, 3)
+        assert results[0].score == pytest.approx(1.0)
+
+    async def test_query_embeddings_cached(self):
+        """Repeated queries do not embed again."""
+        model = KeywordEmbeddingModel()
+        retriever = HybridRetriever(model)
+        await retriever.add_documents(DOCUMENTS)
+
+        await retriever.search("dog")
+        await retriever.search("dog")
+
+        assert model.calls == 2  # documents + one query
+
+    async def test_rerank_candidates(self):
+        """A reranking model reorders the fused candidates."""
+        reranker = LengthRerankingModel()
+        retriever = HybridRetriever(KeywordEmbeddingModel(), reranking_model=reranker)
+        await retriever.add_documents(DOCUMENTS)
+
+        results = await retriever.search("dogs cats", top_k=2)
+
+        assert results[0].document == "dogs are loyal animals"
+        assert results[0].rerank_score is not None
+        assert len(results) == 2
+
+    async def test_invalid_fusion(self):
+        """Unknown fusion methods are rejected."""
+        with pytest.raises(InvalidArgumentError):
+            HybridRetriever(KeywordEmbeddingModel(), fusion="max")
@@ -313,5 +313,68 @@ class TestChunkDetectors:
         assert result == "A"
 
 
+@pytest.mark.asyncio
+class TestSmoothStreamScaling:
+    """Test linear-time chunking and adaptive pacing"""
+    
+    async def test_long_unbroken_text_is_linear(self):
+        """Text without boundaries, fed a character at a time, stays fast"""
+        async def single_chars():
+            for _ in range(100_000):
+                yield StreamPart(type="text-delta", text_delta="x", id="1")
+        
+        start = time.perf_counter()
+        parts = [part async for part in smooth_stream(delay_ms=None)(single_chars())]
+        
+        assert time.perf_counter() - start < 5
+        assert len(parts) == 1
+        assert len(parts[0].text_delta) == 100_000
+    
+    async def test_adaptive_keeps_text(self):
+        """Adaptive pacing yields the same chunks as fixed pacing"""
+        chunks = ["Hello wor", "ld, this is ", "a test\nwith lines"]
+        
+        async def source():
+            for chunk in chunks:
+                yield StreamPart(type="text-delta", text_delta=chunk, id="1")
+        
+        fixed = [p.text_delta async for p in smooth_stream(delay_ms=None)(source())]
+        adaptive = [p.text_delta async for p in smooth_stream(delay_ms=5, adaptive=True)(source())]
+        
+        assert adaptive == fixed
+    
+    async def test_adaptive_does_not_lag_upstream(self):
+        """Adaptive pacing finishes shortly after a slow upstream does"""
+        async def slow_source():
+            for _ in range(5):
+                await asyncio.sleep(0.02)
+                yield StreamPart(type="text-delta", text_delta="one two three four ", id="1")
+        
+        transform = smooth_stream(delay_ms=1000, adaptive=True)
+        start = time.perf_counter()
+        parts = [part async for part in transform(slow_source())]
+        elapsed = time.perf_counter() - start
+        
+        assert "".join(p.text_delta for p in parts) == "one two three four " * 5
+        # Fixed pacing would take 20 seconds here
+        assert elapsed < 0.5
+    
+    async def test_adaptive_spreads_chunks(self):
+        """Chunks from a burst are spread over the upstream interval"""
+        async def bursty_source():
+            for _ in range(4):
+                yield StreamPart(type="text-delta", text_delta="a b c d ", id="1")
+                await asyncio.sleep(0.05)
+        
+        times = []
+        async for _ in smooth_stream(delay_ms=100, adaptive=True)(bursty_source()):
+            times.append(time.perf_counter())
+        
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert len(times) == 16
+        # Later bursts are paced rather than emitted all at once
+        assert sum(1 for gap in gaps[4:] if gap > 0.003) >= 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
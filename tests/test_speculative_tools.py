@@ -0,0 +1,138 @@
+"""Tests for speculative tool execution during streaming."""
+
+import asyncio
+import time
+
+import pytest
+
+from ai_sdk.core.tool_execution import execute_tools, speculative_tool_execution
+from ai_sdk.providers.stream_parts import FastToolCallDelta
+from ai_sdk.tools import Tool, ToolResultCache
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"city": {"type": "string"}},
+    "required": ["city"],
+}
+
+
+def _stream(speculation, *deltas, call_id="call-1"):
+    speculation.observe({"type": "tool-call-start", "tool_call_id": call_id, "tool_name": "get_weather"})
+    for delta in deltas:
+        speculation.observe(FastToolCallDelta(tool_call_id=call_id, args_delta=delta))
+
+
+
+
+@pytest.mark.asyncio
+class TestSpeculativeToolExecution:
+    async def test_complete_arguments_start_the_call(self, make_weather_tool, make_tool_call):
+        """The call starts once the arguments are complete and its result is reused."""
+        calls = []
+        # A private cache, so speculation is what saves the second run
+        tools = {
+            "get_weather": make_weather_tool(calls, idempotent=True, cache=ToolResultCache())
+        }
+        speculation = speculative_tool_execution(tools, [])
+
+        _stream(speculation, '{"ci', 'ty": "Os')
+        await asyncio.sleep(0)
+        assert speculation.started == 0
+
+        _stream(speculation, 'lo"}')
+        await asyncio.sleep(0)
+        assert calls == ["Oslo"]
+
+        call = make_tool_call("get_weather", "call-1", city="Oslo")
+
+        results = await execute_tools([call], tools, [], speculation=speculation)
+
+        assert calls == ["Oslo"]
+        assert results[0].output == "sunny in Oslo"
+        assert results[0].metadata == {"speculative": True, "cache": "miss"}
+        assert speculation.reused == 1
+
+    async def test_mismatch_is_discarded(self, make_weather_tool, make_tool_call):
+        """A final call with different input runs normally."""
+        calls = []
+        tools = {
+            "get_weather": make_weather_tool(
+                calls, delay=0.05, idempotent=True, cache=ToolResultCache()
+            )
+        }
+        speculation = speculative_tool_execution(tools, [])
+
+        _stream(speculation, '{"city": "Oslo"}')
+        call = make_tool_call("get_weather", "call-1", city="Rome")
+        results = await execute_tools([call], tools, [], speculation=speculation)
+
+        assert results[0].output == "sunny in Rome"
+        assert results[0].metadata == {"cache": "miss"}
+        assert speculation.discarded == 1
+
+    async def test_only_valid_idempotent_calls_start(self, make_weather_tool):
+        """Non-idempotent tools and schema-invalid arguments are not started."""
+        calls = []
+        speculation = speculative_tool_execution(
+            {"get_weather": make_weather_tool(calls, cache=ToolResultCache())}, []
+        )
+        _stream(speculation, '{"city": "Oslo"}')
+
+        other = speculative_tool_execution(
+            {"get_weather": make_weather_tool(calls, idempotent=True, cache=ToolResultCache())},
+            [],
+        )
+        _stream(other, '{"town": "Oslo"}')
+        await asyncio.sleep(0)
+
+        assert calls == []
+        assert speculation.started == other.started == 0
+
+    async def test_untaken_calls_are_cancelled(self):
+        """Calls the step did not make are cancelled when tools finish."""
+        cancelled = []
+
+        async def hang(input, **kwargs):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(input["city"])
+                raise
+
+        tools = {
+            "get_weather": Tool(
+                name="get_weather", description="", input_schema=SCHEMA,
+                execute=hang, idempotent=True, cache=ToolResultCache(),
+            )
+        }
+        speculation = speculative_tool_execution(tools, [])
+
+        _stream(speculation, '{"city": "Oslo"}', call_id="call-1")
+        _stream(speculation, '{"city": "Rome"}', call_id="call-2")
+        await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(
+            execute_tools([], tools, [], speculation=speculation), 1
+        )
+        await asyncio.sleep(0.01)
+        assert sorted(cancelled) == ["Oslo", "Rome"]
+        assert speculation.discarded == 2
+
+    async def test_tool_latency_overlaps_the_stream(self, make_weather_tool, make_tool_call):
+        """The tool runs while the rest of the step is still streaming."""
+        calls = []
+        tools = {
+            "get_weather": make_weather_tool(
+                calls, delay=0.1, idempotent=True, cache=ToolResultCache()
+            )
+        }
+        speculation = speculative_tool_execution(tools, [])
+
+        started = time.perf_counter()
+        _stream(speculation, '{"city": "Oslo"}')
+        # The model keeps streaming text for a while after the tool call
+        await asyncio.sleep(0.1)
+        call = make_tool_call("get_weather", "call-1", city="Oslo")
+        await execute_tools([call], tools, [], speculation=speculation)
+
+        assert time.perf_counter() - started < 0.17
@@ -0,0 +1,151 @@
+"""Tests for stream fan-out."""
+
+import asyncio
+
+import pytest
+
+from ai_sdk.errors import InvalidArgumentError, SlowConsumerError
+from ai_sdk.providers.stream_parts import FastTextDelta
+from ai_sdk.streaming import StreamBroadcast, tee_stream
+
+
+async def _parts(count, pause=0.0):
+    for i in range(count):
+        if pause:
+            await asyncio.sleep(pause)
+        yield FastTextDelta(f"t{i} ")
+
+
+async def _collect(consumer, delay=0.0):
+    items = []
+    async for item in consumer:
+        items.append(item)
+        if delay:
+            await asyncio.sleep(delay)
+    return items
+
+
+@pytest.mark.asyncio
+class TestTeeStream:
+    """Test splitting a stream."""
+
+    async def test_every_consumer_gets_every_part(self):
+        """All consumers receive the same part objects in order."""
+        first, second, third = tee_stream(_parts(50), 3, buffer_size=4)
+
+        results = await asyncio.gather(_collect(first), _collect(second), _collect(third))
+
+        assert [p.text_delta for p in results[0]] == [f"t{i} " for i in range(50)]
+        assert all(a is b is c for a, b, c in zip(*results))
+
+    async def test_source_read_once(self):
+        """The source is iterated a single time."""
+        reads = 0
+
+        async def source():
+            nonlocal reads
+            for i in range(5):
+                reads += 1
+                yield i
+
+        consumers = tee_stream(source(), 2)
+        await asyncio.gather(*[_collect(c) for c in consumers])
+
+        assert reads == 5
+
+    async def test_block_applies_backpressure(self):
+        """With "block", the source waits for the slowest consumer."""
+        produced = 0
+
+        async def source():
+            nonlocal produced
+            for i in range(20):
+                produced += 1
+                yield i
+
+        fast, slow = tee_stream(source(), 2, buffer_size=2)
+        fast_task = asyncio.ensure_future(_collect(fast))
+        await asyncio.sleep(0.01)
+
+        assert produced <= 4
+        await _collect(slow)
+        assert len(await fast_task) == 20
+
+    async def test_source_error_propagates(self):
+        """An error in the source reaches every consumer."""
+        async def failing():
+            yield 1
+            raise ValueError("boom")
+
+        first, second = tee_stream(failing(), 2)
+
+        for consumer in (first, second):
+            with pytest.raises(ValueError, match="boom"):
+                await _collect(consumer)
+
+    async def test_invalid_arguments(self):
+        with pytest.raises(InvalidArgumentError):
+            tee_stream(_parts(1), 0)
+        with pytest.raises(InvalidArgumentError):
+            tee_stream(_parts(1), 2, policy="ignore")
+
+
+@pytest.mark.asyncio
+class TestSlowConsumerPolicies:
+    """Test drop and detach policies."""
+
+    async def test_drop_skips_parts_for_slow_consumer(self):
+        """A dropping consumer misses parts without slowing the others."""
+        broadcast = StreamBroadcast(_parts(30, pause=0.001))
+        fast = broadcast.subscribe()
+        slow = broadcast.subscribe(policy="drop", buffer_size=2)
+
+        fast_items, slow_items = await asyncio.gather(
+            _collect(fast), _collect(slow, delay=0.02)
+        )
+
+        assert len(fast_items) == 30
+        assert slow.dropped > 0
+        assert len(slow_items) + slow.dropped == 30
+
+    async def test_detach_removes_slow_consumer(self):
+        """A detached consumer drains its buffer, then raises."""
+        broadcast = StreamBroadcast(_parts(30, pause=0.001))
+        fast = broadcast.subscribe()
+        slow = broadcast.subscribe(policy="detach", buffer_size=2, name="logger")
+
+        async def collect_slow():
+            items = []
+            with pytest.raises(SlowConsumerError):
+                async for item in slow:
+                    items.append(item)
+                    await asyncio.sleep(0.05)
+            return items
+
+        fast_items, slow_items = await asyncio.gather(_collect(fast), collect_slow())
+
+        assert len(fast_items) == 30
+        assert slow.detached
+        assert 0 < len(slow_items) < 30
+        assert slow not in broadcast.consumers
+
+    async def test_closing_all_consumers_closes_source(self):
+        """The source is closed once no consumers remain."""
+        closed = False
+
+        async def source():
+            nonlocal closed
+            try:
+                for i in range(1000):
+                    yield i
+            finally:
+                closed = True
+
+        first, second = tee_stream(source(), 2, buffer_size=1)
+        await first.__anext__()
+        await first.aclose()
+        await second.__anext__()
+        await second.aclose()
+        await asyncio.sleep(0)
+
+        assert closed
@@ -0,0 +1,118 @@
+"""Tests for lightweight stream parts."""
+
+import pytest
+
+from ai_sdk.providers.stream_parts import (
+    FastReasoningDelta,
+    FastTextDelta,
+    FastToolCallDelta,
+    to_stream_part_model,
+    to_stream_part_models,
+)
+from ai_sdk.core.generate_text import stream_text
+from ai_sdk.providers.base import LanguageModel
+from ai_sdk.providers.types import FinishPart, ReasoningDelta, TextDelta, ToolCallDelta, Usage
+from ai_sdk.streaming.smooth_stream import smooth_stream
+
+
+class FastPartsModel(LanguageModel):
+    """Language model streaming fast text deltas."""
+
+    def __init__(self):
+        super().__init__(provider="test", model_id="fast-model")
+
+    async def generate(self, options):
+        raise NotImplementedError
+
+    async def stream(self, options):
+        yield FastTextDelta("Hel")
+        yield FastTextDelta("lo")
+        yield FinishPart(
+            finish_reason="stop",
+            usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+
+
+class TestFastStreamParts:
+    """Test slotted parts and their conversion."""
+
+    def test_same_attributes_as_models(self):
+        """Fast parts expose the type tag and attribute names of the models."""
+        part = FastTextDelta("Hello")
+
+        assert part.type == "text-delta"
+        assert part.text_delta == "Hello"
+        assert not hasattr(part, "__dict__")
+
+    def test_to_model(self):
+        """Conversion produces the equivalent Pydantic parts."""
+        assert FastTextDelta("a").to_model() == TextDelta(text_delta="a")
+        assert FastToolCallDelta("c1", args_delta="{").to_model() == ToolCallDelta(
+            tool_call_id="c1", args_delta="{"
+        )
+        assert FastReasoningDelta("r1", "think").to_model() == ReasoningDelta(
+            id="r1", delta="think"
+        )
+
+    def test_equality_and_dump(self):
+        """Parts compare by value and dump like models."""
+        assert FastTextDelta("a") == FastTextDelta("a")
+        assert FastTextDelta("a") != FastTextDelta("b")
+        assert FastTextDelta("a") == TextDelta(text_delta="a")
+        assert FastReasoningDelta("r1", "x").model_dump() == {
+            "type": "reasoning-delta",
+            "id": "r1",
+            "delta": "x",
+        }
+        assert FastTextDelta("a").model_dump(exclude_none=True) == {
+            "type": "text-delta",
+            "text_delta": "a",
+        }
+
+    def test_non_fast_parts_pass_through(self):
+        """Pydantic parts are returned unchanged."""
+        finish = FinishPart(
+            finish_reason="stop",
+            usage=Usage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+
+        assert to_stream_part_model(finish) is finish
+
+
+@pytest.mark.asyncio
+class TestStreamBoundaries:
+    """Test conversion at stream boundaries."""
+
+    async def test_to_stream_part_models(self):
+        """All fast parts in a stream become Pydantic models."""
+        async def source():
+            yield FastTextDelta("a")
+            yield FastReasoningDelta("r", "b")
+
+        parts = [part async for part in to_stream_part_models(source())]
+
+        assert isinstance(parts[0], TextDelta)
+        assert isinstance(parts[1], ReasoningDelta)
+
+    async def test_smooth_stream_keeps_text(self):
+        """smooth_stream emits text deltas that keep their text and id."""
+        async def source():
+            yield FastTextDelta("Hello wor", id="1")
+            yield FastTextDelta("ld again", id="1")
+
+        transform = smooth_stream(delay_ms=None)
+        parts = [part async for part in transform(source())]
+
+        assert "".join(part.text_delta for part in parts) == "Hello world again"
+        assert all(part.id == "1" for part in parts)
+
+    async def test_stream_text_yields_models(self):
+        """stream_text converts fast parts unless fast_parts is set."""
+        parts = [part async for part in stream_text(FastPartsModel(), prompt="Hi")]
+        fast = [
+            part async for part in stream_text(FastPartsModel(), prompt="Hi", fast_parts=True)
+        ]
+
+        assert isinstance(parts[0], TextDelta) and isinstance(parts[2], FinishPart)
+        assert isinstance(fast[0], FastTextDelta)
+        assert parts == fast
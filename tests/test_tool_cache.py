@@ -0,0 +1,153 @@
+"""Tests for the tool result cache."""
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from ai_sdk.core.tool_execution import execute_tools
+from ai_sdk.tools import EnhancedTool, ToolResultCache, run_tool_cached, tool_cache_key
+
+
+class CityInput(BaseModel):
+    city: str
+    units: str = "metric"
+
+
+class TestToolCacheKey:
+    def test_key_is_canonical(self):
+        """Key order and model vs dict do not change the key."""
+        a = tool_cache_key("t", {"city": "Oslo", "units": "metric"})
+        b = tool_cache_key("t", {"units": "metric", "city": "Oslo"})
+        c = tool_cache_key("t", CityInput(city="Oslo"))
+        assert a == b == c
+        assert a != tool_cache_key("other", {"city": "Oslo", "units": "metric"})
+        assert a != tool_cache_key("t", {"city": "Bergen", "units": "metric"})
+
+
+@pytest.mark.asyncio
+class TestToolResultCache:
+    async def test_idempotent_tool_outputs_are_reused(self, make_weather_tool, make_tool_call):
+        """Repeated calls hit the cache and report it in the metadata."""
+        calls = []
+        tools = {
+            "get_weather": make_weather_tool(
+                calls, delay=0.01, idempotent=True, cache=ToolResultCache()
+            )
+        }
+
+        first = await execute_tools([make_tool_call("get_weather", "1", city="Oslo")], tools, [])
+        second = await execute_tools([make_tool_call("get_weather", "2", city="Oslo")], tools, [])
+
+        assert len(calls) == 1
+        assert first[0].metadata == {"cache": "miss"}
+        assert second[0].metadata == {"cache": "hit"}
+        assert second[0].output == first[0].output
+        assert second[0].tool_call_id == "2"
+
+    async def test_concurrent_identical_calls_run_once(self, make_weather_tool, make_tool_call):
+        """Identical calls in flight share one execution."""
+        calls = []
+        tools = {
+            "get_weather": make_weather_tool(
+                calls, delay=0.01, idempotent=True, cache=ToolResultCache()
+            )
+        }
+
+        results = await execute_tools(
+            [
+                make_tool_call("get_weather", "1", city="Oslo"),
+                make_tool_call("get_weather", "2", city="Oslo"),
+                make_tool_call("get_weather", "3", city="Rome"),
+            ],
+            tools,
+            [],
+        )
+
+        assert len(calls) == 2
+        assert [r.metadata["cache"] for r in results] == ["miss", "shared", "miss"]
+
+    async def test_ttl_size_bound_and_errors(self):
+        """Entries expire, the cache stays bounded and failures are not cached."""
+        cache = ToolResultCache(max_size=2)
+        runs = []
+
+        async def run(value):
+            runs.append(value)
+            return value
+
+        await cache.get_or_run("a", lambda: run("a"), ttl=0.01)
+        await cache.get_or_run("b", lambda: run("b"))
+        await cache.get_or_run("c", lambda: run("c"))
+        assert len(cache) == 2
+        assert cache.get("a") == (False, None)
+
+        await asyncio.sleep(0.02)
+        _, status = await cache.get_or_run("b", lambda: run("b"))
+        assert status == "hit"
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_run("d", fail)
+        _, status = await cache.get_or_run("d", lambda: run("d"))
+        assert status == "miss"
+
+    async def test_non_idempotent_tools_are_not_cached(self, make_weather_tool, make_tool_call):
+        """Tools must opt in to caching."""
+        calls = []
+        tools = {"get_weather": make_weather_tool(calls, delay=0.01)}
+
+        results = await execute_tools(
+            [
+                make_tool_call("get_weather", "1", city="Oslo"),
+                make_tool_call("get_weather", "2", city="Oslo"),
+            ],
+            tools,
+            [],
+        )
+
+        assert len(calls) == 2
+        assert all(r.metadata is None for r in results)
+
+    async def test_same_named_tools_have_their_own_caches(
+        self, make_weather_tool, make_tool_call
+    ):
+        """By default a tool's outputs are only reused for that tool."""
+        first_calls, second_calls = [], []
+        first = {"get_weather": make_weather_tool(first_calls, idempotent=True)}
+        second = {"get_weather": make_weather_tool(second_calls, idempotent=True)}
+        call = make_tool_call("get_weather", city="Oslo")
+
+        await execute_tools([call], first, [])
+        results = await execute_tools([call], second, [])
+
+        assert first_calls == second_calls == ["Oslo"]
+        assert results[0].metadata == {"cache": "miss"}
+        assert first["get_weather"].cache is not second["get_weather"].cache
+
+    async def test_key_uses_the_validated_input(self):
+        """Inputs that validate to the same value share a cache entry."""
+        runs = []
+
+        async def run(input):
+            runs.append(input)
+            return input.city
+
+        weather = EnhancedTool(
+            name="get_weather",
+            description="",
+            input_schema=CityInput,
+            idempotent=True,
+        )
+
+        _, first = await run_tool_cached(
+            weather, {"city": "Oslo"}, lambda: run(CityInput(city="Oslo"))
+        )
+        _, second = await run_tool_cached(
+            weather, {"city": "Oslo", "units": "metric"}, lambda: run(CityInput(city="Oslo"))
+        )
+
+        assert (first, second) == ("miss", "hit")
+        assert len(runs) == 1
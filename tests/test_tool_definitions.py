@@ -0,0 +1,145 @@
+"""Tests for precomputed tool definitions and their serialized forms."""
+
+import pytest
+
+from ai_sdk.agent import Agent
+from ai_sdk.providers.base import LanguageModel
+from ai_sdk.providers.openai import create_openai
+from ai_sdk.providers.types import GenerateOptions, Message, ToolDefinition
+from ai_sdk.tools import (
+    Tool,
+    ToolDefinitionSet,
+    clear_serialized_tools,
+    get_serialized_tool_stats,
+    serialize_tool_definitions,
+    tool_definition_fingerprint,
+)
+
+
+class StubLanguageModel(LanguageModel):
+    """Language model that is never called."""
+
+    def __init__(self):
+        super().__init__(provider="test", model_id="test-model")
+
+    async def generate(self, options):
+        raise NotImplementedError
+
+    async def stream(self, options):
+        raise NotImplementedError
+        yield
+
+
+def _tool(name, schema=None):
+    return Tool(
+        name=name,
+        description=f"{name} tool",
+        input_schema=schema or {"type": "object", "properties": {"q": {"type": "string"}}},
+        execute=lambda input: input,
+    )
+
+
+@pytest.fixture(autouse=True)
+def serialized_tools():
+    clear_serialized_tools()
+    yield
+    clear_serialized_tools()
+
+
+class TestToolDefinitionSet:
+    def test_fingerprints_follow_the_definition(self):
+        """Equal definitions share a fingerprint regardless of key order."""
+        a = tool_definition_fingerprint("t", "d", {"type": "object", "required": ["q"]})
+        b = tool_definition_fingerprint("t", "d", {"required": ["q"], "type": "object"})
+        c = tool_definition_fingerprint("t", "d", {"type": "object", "required": []})
+        assert a == b != c
+
+        definitions = ToolDefinitionSet({"search": _tool("search"), "fetch": _tool("fetch")})
+        assert [d.name for d in definitions.definitions] == ["search", "fetch"]
+        assert all(d.fingerprint for d in definitions.definitions)
+        assert definitions.fingerprint == ToolDefinitionSet(definitions.tools).fingerprint
+
+    def test_select_reuses_definitions(self):
+        """A subset returns the set's definitions; unknown tools are built."""
+        search, fetch, other = _tool("search"), _tool("fetch"), _tool("other")
+        definitions = ToolDefinitionSet({"search": search, "fetch": fetch})
+
+        selected = definitions.select({"fetch": fetch, "other": other})
+
+        assert selected[0] is definitions.definitions[1]
+        assert selected[1].name == "other"
+
+
+class TestAgentToolDefinitions:
+    def test_definitions_are_reused_until_tools_change(self):
+        """Steps share definitions; add/remove/update and direct edits rebuild them."""
+        agent = Agent(model=StubLanguageModel(), tools={"search": _tool("search")})
+
+        first = agent._tool_definitions(agent.settings.tools)
+        assert agent._tool_definitions(agent.settings.tools) is first
+
+        agent.add_tool("fetch", _tool("fetch"))
+        second = agent._tool_definitions(agent.settings.tools)
+        assert [d.name for d in second] == ["search", "fetch"]
+        assert second[0].fingerprint == first[0].fingerprint
+
+        agent.remove_tool("fetch")
+        assert [d.name for d in agent._tool_definitions(agent.settings.tools)] == ["search"]
+
+        agent.update_settings(tools={"lookup": _tool("lookup")})
+        assert [d.name for d in agent._tool_definitions(agent.settings.tools)] == ["lookup"]
+
+        agent.settings.tools["lookup"] = _tool("lookup", {"type": "object"})
+        assert agent._tool_definitions(agent.settings.tools)[0].parameters == {"type": "object"}
+
+    def test_active_tools_use_the_cached_definitions(self):
+        agent = Agent(
+            model=StubLanguageModel(), tools={"search": _tool("search"), "fetch": _tool("fetch")}
+        )
+        all_definitions = agent._tool_definitions(agent.settings.tools)
+
+        active = agent._tool_definitions({"fetch": agent.settings.tools["fetch"]})
+
+        assert active == [all_definitions[1]]
+        assert active[0] is all_definitions[1]
+
+
+class TestSerializedTools:
+    def test_fingerprinted_definitions_are_serialized_once(self):
+        """Each fingerprinted definition is converted once per format."""
+        calls = []
+
+        def serialize(definition):
+            calls.append(definition.name)
+            return {"name": definition.name}
+
+        definitions = ToolDefinitionSet({"search": _tool("search")}).definitions
+        plain = [ToolDefinition(name="plain", description="", parameters={})]
+
+        first = serialize_tool_definitions(definitions + plain, "test", serialize)
+        second = serialize_tool_definitions(definitions + plain, "test", serialize)
+        serialize_tool_definitions(definitions, "other", serialize)
+
+        assert first == second == [{"name": "search"}, {"name": "plain"}]
+        assert second[0] is first[0]
+        assert calls == ["search", "plain", "plain", "search"]
+        assert get_serialized_tool_stats()["hits"] == 1
+
+    def test_openai_request_reuses_serialized_tools(self):
+        """The OpenAI provider sends the cached tool form on later requests."""
+        model = create_openai(api_key="x").chat("gpt-4o")
+        definitions = ToolDefinitionSet({"search": _tool("search")}).definitions
+        options = GenerateOptions(messages=[Message(role="user", content="hi")], tools=definitions)
+
+        first = model._convert_options_to_request(options)
+        second = model._convert_options_to_request(options.model_copy(deep=True))
+
+        assert first["tools"] == [{
+            "type": "function",
+            "function": {
+                "name": "search",
+                "description": "search tool",
+                "parameters": definitions[0].parameters,
+            },
+        }]
+        assert second["tools"][0] is first["tools"][0]
@@ -0,0 +1,146 @@
+"""Tests for running synchronous tools in thread and process pools."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from ai_sdk.core.tool_execution import execute_tools
+from ai_sdk.errors import InvalidArgumentError
+from ai_sdk.tools import (
+    EnhancedTool,
+    ToolCallOptions,
+    configure_tool_executors,
+    run_in_tool_executor,
+    shutdown_tool_executors,
+    tool_cancelled,
+)
+
+
+def count_primes(input, **kwargs):
+    """CPU-bound tool function; module level so it can be pickled."""
+    limit = input["limit"]
+    primes = [n for n in range(2, limit) if all(n % d for d in range(2, int(n ** 0.5) + 1))]
+    return {"count": len(primes), "pid": os.getpid()}
+
+
+@pytest.fixture(autouse=True)
+def tool_pools():
+    configure_tool_executors(max_threads=2, max_processes=2)
+    yield
+    shutdown_tool_executors()
+    configure_tool_executors()
+
+
+@pytest.mark.asyncio
+class TestToolExecutors:
+    async def test_thread_mode_keeps_the_loop_responsive(self, make_tool, make_tool_call):
+        """A blocking tool in thread mode does not stall other coroutines."""
+        def blocking(input, **kwargs):
+            time.sleep(0.2)
+            return threading.current_thread().name
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.ensure_future(ticker())
+        tools = {"blocking": make_tool("blocking", blocking, execution_mode="thread")}
+        results = await execute_tools([make_tool_call("blocking")], tools, [])
+        ticking.cancel()
+
+        assert results[0].output.startswith("ai-sdk-tool")
+        assert ticks >= 10
+
+    async def test_process_mode_runs_in_another_process(self, make_tool, make_tool_call):
+        """Picklable functions run in the process pool."""
+        tools = {"primes": make_tool("primes", count_primes, execution_mode="process")}
+
+        results = await execute_tools(
+            [
+                make_tool_call("primes", "1", limit=1000),
+                make_tool_call("primes", "2", limit=100),
+            ],
+            tools,
+            [],
+        )
+
+        assert [r.output["count"] for r in results] == [168, 25]
+        assert results[0].output["pid"] != os.getpid()
+
+    async def test_process_mode_rejects_unpicklable_functions(self, make_tool, make_tool_call):
+        """Local functions fail with an explanation instead of a pickling traceback."""
+        def local(input, **kwargs):
+            return input
+
+        tools = {"local": make_tool("local", local, execution_mode="process")}
+        results = await execute_tools([make_tool_call("local")], tools, [])
+        assert results[0].type == "error"
+        assert "cannot be pickled" in results[0].error
+
+        with pytest.raises(InvalidArgumentError) as exc_info:
+            await run_in_tool_executor("process", count_primes, {"limit": threading.Lock()})
+        assert exc_info.value.argument == "input"
+
+    async def test_process_mode_drops_unpicklable_context(self):
+        """Process-local keyword arguments are not sent to the worker."""
+        output = await run_in_tool_executor(
+            "process", count_primes, {"limit": 10}, abort_signal=threading.Lock()
+        )
+        assert output["count"] == 4
+
+    async def test_cancellation_reaches_running_and_queued_calls(self):
+        """Running thread calls see tool_cancelled(); queued calls never start."""
+        configure_tool_executors(max_threads=1)
+        started = []
+        stopped = threading.Event()
+
+        def poll(input, **kwargs):
+            started.append(input["n"])
+            while not tool_cancelled():
+                time.sleep(0.005)
+            stopped.set()
+
+        first = asyncio.ensure_future(run_in_tool_executor("thread", poll, {"n": 1}))
+        second = asyncio.ensure_future(run_in_tool_executor("thread", poll, {"n": 2}))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        second.cancel()
+        await asyncio.gather(first, second, return_exceptions=True)
+
+        assert await asyncio.get_running_loop().run_in_executor(None, stopped.wait, 1)
+        assert started == [1]
+
+    async def test_timeout_cancels_thread_call(self, make_tool, make_tool_call):
+        """A tool timeout signals the thread running the tool."""
+        stopped = threading.Event()
+
+        def slow(input, **kwargs):
+            while not tool_cancelled():
+                time.sleep(0.005)
+            stopped.set()
+
+        tools = {"slow": make_tool("slow", slow, execution_mode="thread", timeout=0.05)}
+        results = await execute_tools([make_tool_call("slow")], tools, [])
+
+        assert results[0].type == "error"
+        assert await asyncio.get_running_loop().run_in_executor(None, stopped.wait, 1)
+
+    async def test_enhanced_tool_execution_mode(self):
+        """EnhancedTool runs sync functions in the declared pool."""
+        def where(input, options):
+            return threading.current_thread().name
+
+        where_tool = EnhancedTool(
+            name="where", description="", input_schema={}, execute=where, execution_mode="thread"
+        )
+        output = await where_tool.execute_with_callbacks(
+            {}, ToolCallOptions(tool_call_id="1", messages=[])
+        )
+        assert output.startswith("ai-sdk-tool")
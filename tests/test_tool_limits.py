@@ -0,0 +1,125 @@
+"""Tests for tool timeouts, bulkheads and metrics."""
+
+import asyncio
+
+import pytest
+
+from ai_sdk.core.tool_execution import execute_tools
+from ai_sdk.errors import ToolTimeoutError
+from ai_sdk.tools import (
+    Tool,
+    ToolBulkhead,
+    get_tool_metrics,
+    reset_tool_metrics,
+    run_with_tool_limits,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    reset_tool_metrics()
+    yield
+    reset_tool_metrics()
+
+
+@pytest.mark.asyncio
+class TestToolLimits:
+    async def test_timeout_becomes_error_result(self, make_tool_calls):
+        """A hung tool fails with a timeout instead of stalling the step."""
+        async def hang(input, **kwargs):
+            await asyncio.sleep(60)
+
+        async def quick(input, **kwargs):
+            return "ok"
+
+        tools = {
+            "hang": Tool(name="hang", description="", input_schema={}, execute=hang, timeout=0.05),
+            "quick": Tool(name="quick", description="", input_schema={}, execute=quick),
+        }
+        calls = make_tool_calls("hang", "quick")
+
+        results = await asyncio.wait_for(execute_tools(calls, tools, []), 1)
+
+        assert results[0].type == "error"
+        assert "did not finish within 0.05s" in results[0].error
+        assert results[1].type == "result" and results[1].output == "ok"
+        metrics = get_tool_metrics("hang")
+        assert metrics["timeouts"] == 1
+        assert metrics["execution"]["max_ms"] < 500
+
+    async def test_max_concurrency_is_shared_across_sessions(self, make_tool_calls):
+        """Separate executions of the same tool share one bulkhead."""
+        running = 0
+        peak = 0
+
+        async def lookup(input, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return input["n"]
+
+        tools = {
+            "lookup": Tool(
+                name="lookup", description="", input_schema={}, execute=lookup, max_concurrency=2
+            )
+        }
+        sessions = await asyncio.gather(
+            execute_tools(make_tool_calls("lookup", "lookup", "lookup"), tools, []),
+            execute_tools(make_tool_calls("lookup", "lookup", "lookup"), tools, []),
+        )
+
+        assert peak == 2
+        assert [r.output for results in sessions for r in results] == [0, 1, 2, 0, 1, 2]
+        metrics = get_tool_metrics("lookup")
+        assert metrics["calls"] == 6
+        assert metrics["queue_wait"]["count"] == 6
+        # Four calls had to wait for a slot
+        assert metrics["queue_wait"]["max_ms"] >= 15
+        assert metrics["execution"]["count"] == 6
+
+    async def test_queue_wait_limit(self):
+        """Calls that cannot get a slot in time fail fast."""
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        first = asyncio.ensure_future(
+            run_with_tool_limits("slot", blocker, max_concurrency=1)
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(ToolTimeoutError) as exc_info:
+            await run_with_tool_limits(
+                "slot", blocker, max_concurrency=1, max_queue_wait=0.02
+            )
+        assert exc_info.value.phase == "queue"
+
+        release.set()
+        await first
+        metrics = get_tool_metrics("slot")
+        assert metrics["queue_timeouts"] == 1
+        assert metrics["calls"] == 2
+
+    async def test_bulkhead_hands_over_in_order(self):
+        """Waiters get slots in FIFO order; abandoned waits free nothing."""
+        bulkhead = ToolBulkhead(1)
+        order = []
+
+        assert await bulkhead.acquire()
+
+        async def waiter(name):
+            assert await bulkhead.acquire()
+            order.append(name)
+            bulkhead.release()
+
+        tasks = [asyncio.ensure_future(waiter(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        assert not await bulkhead.acquire(timeout=0.01)
+        assert bulkhead.queued == 3
+
+        bulkhead.release()
+        await asyncio.gather(*tasks)
+        assert order == ["a", "b", "c"]
+        assert bulkhead.in_use == 0
@@ -1,6 +1,7 @@
 """Tests for UI message streaming functionality."""
 
 import asyncio
+import json
 import pytest
 from typing import List
 
@@ -193,6 +194,66 @@ class TestUIMessageStream:
         assert len(chunks) >= 2
         assert any("Main stream" in getattr(c, 'text', '') for c in chunks)
 
+    
+    @pytest.mark.asyncio
+    async def test_merge_many_streams(self):
+        """Chunks from every merged stream are delivered, in order per stream."""
+        async def sub_stream(index):
+            for i in range(20):
+                await asyncio.sleep(0)
+                yield TextUIPart(type="text", text=f"{index}:{i}")
+        
+        def execute(writer: UIMessageStreamWriter) -> None:
+            for index in range(10):
+                writer.merge(sub_stream(index))
+        
+        chunks = [chunk async for chunk in create_ui_message_stream(execute=execute, buffer_size=4)]
+        
+        assert len(chunks) == 200
+        for index in range(10):
+            texts = [c.text for c in chunks if c.text.startswith(f"{index}:")]
+            assert texts == [f"{index}:{i}" for i in range(20)]
+    
+    @pytest.mark.asyncio
+    async def test_merged_streams_wait_for_slow_consumer(self):
+        """Merged streams are held back while the buffer is full."""
+        produced = 0
+        
+        async def sub_stream():
+            nonlocal produced
+            for i in range(100):
+                produced += 1
+                yield TextUIPart(type="text", text=str(i))
+        
+        def execute(writer: UIMessageStreamWriter) -> None:
+            writer.merge(sub_stream())
+        
+        stream = create_ui_message_stream(execute=execute, buffer_size=8)
+        iterator = stream.__aiter__()
+        await iterator.__anext__()
+        await asyncio.sleep(0.01)
+        
+        assert produced <= 10
+        rest = [chunk async for chunk in iterator]
+        assert len(rest) == 99
+    
+    @pytest.mark.asyncio
+    async def test_merged_stream_error(self):
+        """An error in a merged stream becomes an error chunk."""
+        async def failing():
+            yield TextUIPart(type="text", text="partial")
+            raise ValueError("sub failed")
+        
+        def execute(writer: UIMessageStreamWriter) -> None:
+            writer.merge(failing())
+        
+        stream = create_ui_message_stream(execute=execute, on_error=lambda e: f"Handled: {e}")
+        chunks = [chunk async for chunk in stream]
+        
+        assert chunks[0].text == "partial"
+        assert chunks[1].type == "error"
+        assert chunks[1].error_text == "Handled: sub failed"
+
 
 class TestJsonToSseTransform:
     """Test JSON to SSE transformation."""
@@ -214,6 +275,26 @@ class TestJsonToSseTransform:
         assert sse_lines[0].startswith("data: ")
         assert sse_lines[0].endswith("\n\n")
         assert "Hello SSE" in sse_lines[0]
+    
+    @pytest.mark.asyncio
+    async def test_sse_coalescing(self):
+        """Adjacent deltas are merged into fewer frames when coalescing."""
+        class TextDeltaChunk:
+            def __init__(self, delta):
+                self.type = "text-delta"
+                self.id = "t1"
+                self.delta = delta
+        
+        async def chunks():
+            for i in range(20):
+                yield TextDeltaChunk(f"w{i} ")
+        
+        transformer = JsonToSseTransformStream(coalesce_window_ms=1000)
+        frames = [frame async for frame in transformer.transform(chunks())]
+        
+        assert len(frames) == 2
+        texts = [json.loads(frame[len("data: "):])["delta"] for frame in frames]
+        assert "".join(texts) == "".join(f"w{i} " for i in range(20))
 
 
 @pytest.mark.asyncio